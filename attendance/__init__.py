@@ -6,21 +6,27 @@ KGU Attendance API 패키지
 
 from .api import AttendanceAPI
 from .http_client import AttendanceHTTPClient
+from .async_api import AsyncAttendanceAPI
+from .async_http_client import AsyncAttendanceHTTPClient
 from .enums import AttendanceStatus, LectureStatus, QRCodeStatus
 from .exceptions import (
     AttendanceAPIError,
     AttendanceError,
+    AttendanceTimeoutError,
     LoginError,
     QRCodeError,
     APIResponseError,
     SessionError,
     NotLoggedInError,
+    RateLimitError,
 )
 
 __all__ = [
     # API 클래스
     "AttendanceAPI",
     "AttendanceHTTPClient",
+    "AsyncAttendanceAPI",
+    "AsyncAttendanceHTTPClient",
     # 열거형
     "AttendanceStatus",
     "LectureStatus",
@@ -28,11 +34,13 @@ __all__ = [
     # 예외 클래스
     "AttendanceAPIError",
     "AttendanceError",
+    "AttendanceTimeoutError",
     "LoginError",
     "QRCodeError",
     "APIResponseError",
     "SessionError",
     "NotLoggedInError",
+    "RateLimitError",
 ]
 
 __version__ = "0.1.0"
@@ -10,18 +10,77 @@ import logging
 import re
 from typing import Dict, List, Any, Optional, Union, Tuple
 
+from kgu_library.core.http import RateLimiter, RetryPolicy, Transport
+from kgu_library.core.session import MemorySessionStore, SessionPool, SessionStore
+
 from .exceptions import (
     AttendanceError,
+    AttendanceTimeoutError,
     LoginError,
     NotLoggedInError,
     InvalidArgumentError,
     QrCodeError,
+    RateLimitError,
+)
+from .http_client import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    AttendanceHTTPClient,
 )
-from .http_client import AttendanceHTTPClient
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_date(
+    value: Optional[Union[str, datetime.date]], name: str
+) -> Optional[str]:
+    """
+    날짜 인자를 YYYY-MM-DD 문자열로 변환합니다.
+
+    Args:
+        value: YYYY-MM-DD 형식의 문자열 또는 datetime.date 객체 (None 허용)
+        name: 오류 메시지에 사용할 인자 이름
+
+    Returns:
+        YYYY-MM-DD 문자열 (값이 없으면 그대로 반환)
+
+    Raises:
+        InvalidArgumentError: 날짜 형식이 유효하지 않은 경우
+    """
+    if not value:
+        return value
+    if isinstance(value, datetime.date):
+        return value.strftime("%Y-%m-%d")
+    if not re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+        raise InvalidArgumentError(f"{name}는 YYYY-MM-DD 형식의 문자열이어야 합니다")
+    return value
+
+
+def _parse_qr_code_response(result_json: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    복호화된 QR 코드 응답에서 QR 코드 정보를 추출합니다.
+
+    Args:
+        result_json: 복호화된 응답
+
+    Returns:
+        QR 코드 정보 (출석 키, 유효 시간 등)
+
+    Raises:
+        QrCodeError: 응답이 실패를 나타내는 경우
+    """
+    if "xidedu" in result_json and result_json["xidedu"]["xmsg"] == "Ok":
+        qr_info = result_json["xidedu"]
+        return {
+            "qr_key": qr_info.get("qr_key", ""),
+            "validity": qr_info.get("validity", 60),  # 기본 60초
+            "timestamp": qr_info.get("timestamp", ""),
+        }
+
+    error_msg = result_json.get("xidedu", {}).get("xmsg", "알 수 없는 오류")
+    raise QrCodeError(f"QR 코드 조회 실패: {error_msg}")
+
+
 class AttendanceAPI:
     """
     경기대학교 전자출결 시스템 API 클래스
@@ -29,10 +88,198 @@ class AttendanceAPI:
     전자출결 시스템의 HTTP API를 래핑하여 사용하기 쉽게 제공합니다.
     """
 
-    def __init__(self):
-        """AttendanceAPI 초기화"""
-        self.client = AttendanceHTTPClient()
+    # 세션 저장소의 계정 키 접두사
+    SESSION_KEY_PREFIX = "attendance"
+
+    def __init__(
+        self,
+        transport=None,
+        session_store: Optional[SessionStore] = None,
+        user_id: Optional[str] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        deadline: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        AttendanceAPI 초기화
+
+        Args:
+            transport: 공유할 연결 풀(Transport) 또는 연결 풀 설정(TransportConfig)
+            session_store: 로그인 세션을 저장하고 불러올 저장소
+            user_id: 지정하면 session_store에 저장된 이 사용자의 세션을 불러옴
+            connect_timeout: 서버 연결 제한 시간(초)
+            read_timeout: 응답을 기다리는 제한 시간(초)
+            deadline: 요청 하나가 재시도를 포함해 끝나야 하는 전체 제한 시간(초)
+            retry: 일시적인 오류가 난 요청을 다시 보낼 정책
+            rate_limiter: 요청 전에 확인할 호스트별, 계정별 속도 제한
+        """
+        self.client = AttendanceHTTPClient(
+            transport=transport,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            deadline=deadline,
+            retry=retry,
+            rate_limiter=rate_limiter,
+        )
         self.user_info = None
+        self.session_store = session_store
+        if session_store is not None and user_id is not None:
+            self.restore_session(user_id)
+
+    @classmethod
+    def create_pool(
+        cls,
+        transport=None,
+        session_store: Optional[SessionStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        **pool_options,
+    ) -> SessionPool:
+        """
+        여러 계정의 AttendanceAPI를 관리하는 세션 풀 생성
+
+        풀의 모든 API 객체는 하나의 연결 풀(Transport)과 세션 저장소를 공유합니다.
+        인증 정보로는 비밀번호를 등록합니다 (pool.register(user_id, password)).
+
+        Args:
+            transport: 공유할 연결 풀(Transport) 또는 연결 풀 설정(TransportConfig)
+            session_store: 로그인 세션 저장소 (None이면 메모리 저장소)
+            rate_limiter: 모든 API 객체가 공유할 속도 제한
+            **pool_options: SessionPool에 넘길 옵션 (max_size, session_ttl, refresh_margin)
+
+        Returns:
+            계정별 AttendanceAPI를 빌려 주는 풀
+        """
+        transport = Transport.resolve(transport)
+        if session_store is None:
+            session_store = MemorySessionStore()
+
+        def factory(user_id: str) -> "AttendanceAPI":
+            return cls(
+                transport=transport,
+                session_store=session_store,
+                user_id=user_id,
+                rate_limiter=rate_limiter,
+            )
+
+        return SessionPool(
+            factory,
+            lambda api, user_id, password: api.ensure_login(user_id, password),
+            relogin=lambda api, user_id, password: api.login(user_id, password),
+            close=lambda api: api.save_session(),
+            **pool_options,
+        )
+
+    def time_limit(self, seconds: float):
+        """
+        with 문 안의 모든 API 호출이 seconds초 안에 끝나도록 제한합니다.
+
+        사용 예:
+            with api.time_limit(10):
+                api.ensure_login(user_id, password)
+                qr = api.get_qr_code()
+
+        Args:
+            seconds: 제한 시간(초)
+
+        Returns:
+            with 문에 사용할 컨텍스트 관리자 (시간이 초과되면 AttendanceTimeoutError 발생)
+        """
+        return self.client.time_limit(seconds)
+
+    def _session_key(self, user_id: str) -> str:
+        return f"{self.SESSION_KEY_PREFIX}:{user_id}"
+
+    def restore_session(self, user_id: str, max_age: Optional[float] = None) -> bool:
+        """
+        저장소에 저장된 로그인 세션 불러오기 (요청하지 않음)
+
+        Args:
+            user_id: 사용자 ID(학번)
+            max_age: 이 시간(초)보다 오래 전에 저장된 세션은 무시
+
+        Returns:
+            불러온 세션이 있는지 여부 (세션이 아직 유효한지는 validate_session()으로 확인)
+        """
+        if self.session_store is None:
+            return False
+        state = self.session_store.load(self._session_key(user_id), max_age)
+        if state is None or not state.get("user_info"):
+            return False
+
+        self.client.restore_state(state)
+        self.user_info = state["user_info"]
+        return True
+
+    def save_session(self) -> None:
+        """현재 로그인 세션을 저장소에 저장 (저장소가 없거나 로그인하지 않았으면 무시)"""
+        if self.session_store is None or not self.is_logged_in or not self.user_info:
+            return
+        state = self.client.export_state()
+        state["user_info"] = self.user_info
+        self.session_store.save(self._session_key(self.client.user_id), state)
+
+    def validate_session(self) -> bool:
+        """
+        현재 세션이 로그인된 상태인지 출석 통계 조회로 확인
+
+        Returns:
+            세션 유효 여부
+
+        Raises:
+            RateLimitError: 속도 제한으로 확인 요청을 보내지 못한 경우
+        """
+        if not self.is_logged_in:
+            return False
+
+        try:
+            stats_url = (
+                self.client.determine_server_url(self.user_info["user_id"])
+                + "rb_attend_status.php"
+            )
+            params = {"key": self.client.sencrypt(json.dumps({}))}
+            response = self.client.request("POST", stats_url, data=params)
+            if response.status_code != 200:
+                return False
+            # 세션이 만료되면 result 없이 오류 메시지만 반환됨
+            return "result" in self.client.decode_response(response.content)
+        except RateLimitError:
+            # 확인하지 못한 것을 세션 만료로 보지 않음
+            raise
+        except Exception as e:
+            logger.debug(f"세션 확인 실패: {e}")
+            return False
+
+    def ensure_login(
+        self,
+        user_id: str,
+        password: str,
+        max_age: Optional[float] = None,
+        validate: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        저장된 세션이 유효하면 그대로 사용하고, 아니면 다시 로그인
+
+        Args:
+            user_id: 사용자 ID(학번)
+            password: 비밀번호
+            max_age: 이 시간(초)보다 오래 전에 저장된 세션은 확인하지 않고 다시 로그인
+            validate: False이면 불러온 세션을 확인 요청 없이 그대로 사용
+                (max_age와 함께 사용하여 확인 요청도 줄일 때)
+
+        Returns:
+            사용자 정보
+
+        Raises:
+            LoginError: 로그인 실패 시
+        """
+        if (
+            (self.is_logged_in and self.client.user_id == user_id)
+            or self.restore_session(user_id, max_age)
+        ) and (not validate or self.validate_session()):
+            return self.user_info
+        return self.login(user_id, password)
 
     @property
     def is_logged_in(self) -> bool:
@@ -68,13 +315,18 @@ class AttendanceAPI:
                     "user_name": result.get("user_name", ""),
                     "student_id": result.get("student_id", ""),
                 }
+                try:
+                    self.save_session()
+                except Exception as e:
+                    # 세션 저장 실패는 로그인 결과에 영향을 주지 않음
+                    logger.warning(f"로그인 세션 저장 실패: {e}")
                 return self.user_info
             else:
                 error_msg = result.get("error", "알 수 없는 로그인 오류")
                 raise LoginError(f"로그인 실패: {error_msg}")
 
         except Exception as e:
-            if isinstance(e, LoginError):
+            if isinstance(e, (LoginError, AttendanceTimeoutError, RateLimitError)):
                 raise
             else:
                 logger.exception("로그인 중 예외 발생")
@@ -138,32 +390,19 @@ class AttendanceAPI:
             params = {"key": encrypted_data}
 
             # POST 요청 보내기
-            response = self.client.session.post(qr_url, data=params)
+            response = self.client.request("POST", qr_url, data=params)
 
             # 응답 확인
             if response.status_code == 200:
-                result = self.client.sdecrypt(response.text)
-                result_json = json.loads(result)
-
-                if "xidedu" in result_json and result_json["xidedu"]["xmsg"] == "Ok":
-                    qr_info = result_json["xidedu"]
-                    return {
-                        "qr_key": qr_info.get("qr_key", ""),
-                        "validity": qr_info.get("validity", 60),  # 기본 60초
-                        "timestamp": qr_info.get("timestamp", ""),
-                    }
-                else:
-                    error_msg = result_json.get("xidedu", {}).get(
-                        "xmsg", "알 수 없는 오류"
-                    )
-                    raise QrCodeError(f"QR 코드 조회 실패: {error_msg}")
+                result_json = self.client.decode_response(response.content)
+                return _parse_qr_code_response(result_json)
             else:
                 raise QrCodeError(
                     f"QR 코드 조회 실패: HTTP 상태 코드 {response.status_code}"
                 )
 
         except Exception as e:
-            if isinstance(e, QrCodeError):
+            if isinstance(e, (QrCodeError, AttendanceTimeoutError, RateLimitError)):
                 raise
             else:
                 logger.exception("QR 코드 조회 중 예외 발생")
@@ -193,21 +432,8 @@ class AttendanceAPI:
             raise NotLoggedInError("출석 내역을 조회하려면 먼저 로그인하세요")
 
         # 날짜 형식 변환
-        if from_date:
-            if isinstance(from_date, datetime.date):
-                from_date = from_date.strftime("%Y-%m-%d")
-            elif not re.match(r"^\d{4}-\d{2}-\d{2}$", from_date):
-                raise InvalidArgumentError(
-                    "from_date는 YYYY-MM-DD 형식의 문자열이어야 합니다"
-                )
-
-        if to_date:
-            if isinstance(to_date, datetime.date):
-                to_date = to_date.strftime("%Y-%m-%d")
-            elif not re.match(r"^\d{4}-\d{2}-\d{2}$", to_date):
-                raise InvalidArgumentError(
-                    "to_date는 YYYY-MM-DD 형식의 문자열이어야 합니다"
-                )
+        from_date = _normalize_date(from_date, "from_date")
+        to_date = _normalize_date(to_date, "to_date")
 
         try:
             # 현재 날짜를 기본값으로 사용
@@ -232,26 +458,40 @@ class AttendanceAPI:
             encrypted_data = self.client.sencrypt(json.dumps(request_data))
             params = {"key": encrypted_data}
 
-            # POST 요청 보내기
-            response = self.client.session.post(attendance_url, data=params)
-
-            # 응답 확인
-            if response.status_code == 200:
-                result = self.client.sdecrypt(response.text)
-                result_json = json.loads(result)
+            # POST 요청 보내기 (학기 전체 등 큰 응답은 스트리밍으로 수신)
+            response = self.client.request(
+                "POST", attendance_url, data=params, stream=True
+            )
 
-                if "result" in result_json and "record" in result_json["result"]:
-                    return result_json["result"]["record"]
+            # 응답 확인 (본문을 읽지 않은 응답도 연결을 풀에 돌려주도록 닫음)
+            try:
+                if response.status_code == 200:
+                    result_json = self.client.decode_response_stream(response)
+
+                    if "result" in result_json and "record" in result_json["result"]:
+                        return result_json["result"]["record"]
+                    else:
+                        logger.warning(
+                            "출석 내역이 없거나 응답 형식이 올바르지 않습니다"
+                        )
+                        return []
                 else:
-                    logger.warning("출석 내역이 없거나 응답 형식이 올바르지 않습니다")
-                    return []
-            else:
-                raise AttendanceError(
-                    f"출석 내역 조회 실패: HTTP 상태 코드 {response.status_code}"
-                )
+                    raise AttendanceError(
+                        f"출석 내역 조회 실패: HTTP 상태 코드 {response.status_code}"
+                    )
+            finally:
+                response.close()
 
         except Exception as e:
-            if isinstance(e, (NotLoggedInError, InvalidArgumentError)):
+            if isinstance(
+                e,
+                (
+                    NotLoggedInError,
+                    InvalidArgumentError,
+                    AttendanceTimeoutError,
+                    RateLimitError,
+                ),
+            ):
                 raise
             else:
                 logger.exception("출석 내역 조회 중 예외 발생")
@@ -299,12 +539,11 @@ class AttendanceAPI:
             params = {"key": encrypted_data}
 
             # POST 요청 보내기
-            response = self.client.session.post(notice_url, data=params)
+            response = self.client.request("POST", notice_url, data=params)
 
             # 응답 확인
             if response.status_code == 200:
-                result = self.client.sdecrypt(response.text)
-                result_json = json.loads(result)
+                result_json = self.client.decode_response(response.content)
 
                 if "result" in result_json and "notice" in result_json["result"]:
                     return result_json["result"]["notice"]
@@ -317,7 +556,15 @@ class AttendanceAPI:
                 )
 
         except Exception as e:
-            if isinstance(e, (NotLoggedInError, InvalidArgumentError)):
+            if isinstance(
+                e,
+                (
+                    NotLoggedInError,
+                    InvalidArgumentError,
+                    AttendanceTimeoutError,
+                    RateLimitError,
+                ),
+            ):
                 raise
             else:
                 logger.exception("공지사항 조회 중 예외 발생")
@@ -352,12 +599,11 @@ class AttendanceAPI:
             params = {"key": encrypted_data}
 
             # POST 요청 보내기
-            response = self.client.session.post(stats_url, data=params)
+            response = self.client.request("POST", stats_url, data=params)
 
             # 응답 확인
             if response.status_code == 200:
-                result = self.client.sdecrypt(response.text)
-                result_json = json.loads(result)
+                result_json = self.client.decode_response(response.content)
 
                 if "result" in result_json and "status" in result_json["result"]:
                     return result_json["result"]["status"]
@@ -370,7 +616,9 @@ class AttendanceAPI:
                 )
 
         except Exception as e:
-            if isinstance(e, NotLoggedInError):
+            if isinstance(
+                e, (NotLoggedInError, AttendanceTimeoutError, RateLimitError)
+            ):
                 raise
             else:
                 logger.exception("출석 통계 조회 중 예외 발생")
@@ -403,7 +651,15 @@ class AttendanceAPI:
             return results
 
         except Exception as e:
-            if isinstance(e, (NotLoggedInError, InvalidArgumentError)):
+            if isinstance(
+                e,
+                (
+                    NotLoggedInError,
+                    InvalidArgumentError,
+                    AttendanceTimeoutError,
+                    RateLimitError,
+                ),
+            ):
                 raise
             else:
                 logger.exception("사용자 검색 중 예외 발생")
@@ -436,7 +692,15 @@ class AttendanceAPI:
             return results
 
         except Exception as e:
-            if isinstance(e, (NotLoggedInError, InvalidArgumentError)):
+            if isinstance(
+                e,
+                (
+                    NotLoggedInError,
+                    InvalidArgumentError,
+                    AttendanceTimeoutError,
+                    RateLimitError,
+                ),
+            ):
                 raise
             else:
                 logger.exception("사용자 검색 중 예외 발생")
@@ -492,7 +756,15 @@ class AttendanceAPI:
             return result
 
         except Exception as e:
-            if isinstance(e, (NotLoggedInError, InvalidArgumentError)):
+            if isinstance(
+                e,
+                (
+                    NotLoggedInError,
+                    InvalidArgumentError,
+                    AttendanceTimeoutError,
+                    RateLimitError,
+                ),
+            ):
                 raise
             else:
                 logger.exception("친구 요청 보내기 중 예외 발생")
@@ -0,0 +1,384 @@
+"""
+전자출결 시스템 비동기 API 래퍼
+
+AttendanceAPI와 같은 메서드를 코루틴으로 제공하여, 하나의 이벤트 루프에서 여러 학생
+세션의 요청을 동시에 처리할 수 있습니다.
+"""
+
+import datetime
+import logging
+from typing import Dict, List, Any, Optional, Union
+
+from .api import _normalize_date, _parse_qr_code_response
+from .async_http_client import AsyncAttendanceHTTPClient
+from .http_client import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from .exceptions import (
+    AttendanceError,
+    LoginError,
+    NotLoggedInError,
+    InvalidArgumentError,
+    QrCodeError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAttendanceAPI:
+    """
+    경기대학교 전자출결 시스템 비동기 API 클래스
+
+    사용 예:
+        connector = aiohttp.TCPConnector(limit=100)
+        apis = [AsyncAttendanceAPI(connector=connector) for _ in accounts]
+        await asyncio.gather(
+            *(api.login(user_id, pw) for api, (user_id, pw) in zip(apis, accounts))
+        )
+        qr_codes = await asyncio.gather(*(api.get_qr_code() for api in apis))
+    """
+
+    def __init__(
+        self,
+        connector=None,
+        executor=None,
+        cookie_jar=None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ):
+        """
+        AsyncAttendanceAPI 초기화
+
+        Args:
+            connector: 여러 래퍼가 공유할 aiohttp 연결 풀 (None이면 전용 풀 생성)
+            executor: 암호화/복호화를 실행할 실행기 (None이면 이벤트 루프 기본 실행기)
+            cookie_jar: 사용할 aiohttp 쿠키 저장소 (None이면 기본 저장소)
+            connect_timeout: 서버 연결 제한 시간(초)
+            read_timeout: 응답을 기다리는 제한 시간(초)
+        """
+        self.client = AsyncAttendanceHTTPClient(
+            connector=connector,
+            executor=executor,
+            cookie_jar=cookie_jar,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+        self.user_info = None
+
+    @property
+    def is_logged_in(self) -> bool:
+        """
+        로그인 상태 확인
+
+        Returns:
+            로그인 상태 여부
+        """
+        return self.client.is_logged_in
+
+    async def close(self) -> None:
+        """HTTP 세션 종료"""
+        await self.client.close()
+
+    async def __aenter__(self) -> "AsyncAttendanceAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _request(self, endpoint: str, request_data: Dict[str, Any]) -> Any:
+        """
+        로그인한 사용자의 서버로 암호화된 요청을 보내고 응답을 복호화합니다.
+
+        Args:
+            endpoint: 서버 URL 이후의 경로
+            request_data: 요청 데이터
+
+        Returns:
+            복호화된 응답 객체
+
+        Raises:
+            AttendanceError: HTTP 상태 코드가 200이 아닌 경우
+        """
+        url = self.client.determine_server_url(self.user_info["user_id"]) + endpoint
+        status, body = await self.client.post_encrypted(url, request_data)
+        if status != 200:
+            raise AttendanceError(f"HTTP 상태 코드 {status}")
+        return await self.client.decode_response(body)
+
+    async def login(self, user_id: str, password: str) -> Dict[str, Any]:
+        """
+        사용자 계정으로 로그인
+
+        Args:
+            user_id: 사용자 ID(학번)
+            password: 비밀번호
+
+        Returns:
+            로그인 성공 시 반환되는 사용자 정보
+
+        Raises:
+            LoginError: 로그인 실패 시
+        """
+        try:
+            result = await self.client.login(user_id, password)
+
+            # 성공 여부 확인
+            if result.get("success", False):
+                self.user_info = {
+                    "user_id": result.get("user_id", ""),
+                    "user_name": result.get("user_name", ""),
+                    "student_id": result.get("student_id", ""),
+                }
+                return self.user_info
+            else:
+                error_msg = result.get("error", "알 수 없는 로그인 오류")
+                raise LoginError(f"로그인 실패: {error_msg}")
+
+        except Exception as e:
+            if isinstance(e, LoginError):
+                raise
+            else:
+                logger.exception("로그인 중 예외 발생")
+                raise LoginError(f"로그인 중 예외 발생: {str(e)}")
+
+    def logout(self) -> None:
+        """
+        로그아웃 처리
+
+        Raises:
+            AttendanceError: 로그아웃 실패 시
+        """
+        try:
+            self.client.logout()
+            self.user_info = None
+        except Exception as e:
+            logger.exception("로그아웃 중 예외 발생")
+            raise AttendanceError(f"로그아웃 중 예외 발생: {str(e)}")
+
+    def check_user_info(self) -> Dict[str, Any]:
+        """
+        현재 로그인된 사용자 정보 확인
+
+        Returns:
+            사용자 정보
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("사용자 정보를 확인하려면 먼저 로그인하세요")
+
+        return self.user_info
+
+    async def get_qr_code(self) -> Dict[str, Any]:
+        """
+        출석 QR 코드 정보 조회
+
+        Returns:
+            QR 코드 정보 (출석 키, 유효 시간 등)
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+            QrCodeError: QR 코드 조회 실패 시
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("QR 코드를 조회하려면 먼저 로그인하세요")
+
+        try:
+            result_json = await self._request("rb_qrcode.php", {"type": "qrcode"})
+            return _parse_qr_code_response(result_json)
+
+        except QrCodeError:
+            raise
+        except Exception as e:
+            logger.exception("QR 코드 조회 중 예외 발생")
+            raise QrCodeError(f"QR 코드 조회 중 예외 발생: {str(e)}")
+
+    async def get_attendance_list(
+        self,
+        from_date: Optional[Union[str, datetime.date]] = None,
+        to_date: Optional[Union[str, datetime.date]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        출석 내역 조회
+
+        Args:
+            from_date: 조회 시작 날짜 (YYYY-MM-DD 형식의 문자열 또는 datetime.date 객체)
+            to_date: 조회 종료 날짜 (YYYY-MM-DD 형식의 문자열 또는 datetime.date 객체)
+
+        Returns:
+            출석 내역 목록
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+            InvalidArgumentError: 날짜 형식이 유효하지 않은 경우
+            AttendanceError: 출석 내역 조회 실패 시
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("출석 내역을 조회하려면 먼저 로그인하세요")
+
+        # 날짜 형식 변환 (기본값: 오늘)
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        request_data = {
+            "from_date": _normalize_date(from_date, "from_date") or today,
+            "to_date": _normalize_date(to_date, "to_date") or today,
+        }
+
+        try:
+            result_json = await self._request("rb_attend_record.php", request_data)
+        except Exception as e:
+            logger.exception("출석 내역 조회 중 예외 발생")
+            raise AttendanceError(f"출석 내역 조회 중 예외 발생: {str(e)}")
+
+        if "result" in result_json and "record" in result_json["result"]:
+            return result_json["result"]["record"]
+
+        logger.warning("출석 내역이 없거나 응답 형식이 올바르지 않습니다")
+        return []
+
+    async def get_notices(self, page: int = 1, count: int = 10) -> List[Dict[str, Any]]:
+        """
+        공지사항 목록 조회
+
+        Args:
+            page: 조회할 페이지 번호 (1부터 시작)
+            count: 한 페이지당 가져올 항목 수
+
+        Returns:
+            공지사항 목록
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+            InvalidArgumentError: 인자가 유효하지 않은 경우
+            AttendanceError: 공지사항 조회 실패 시
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("공지사항을 조회하려면 먼저 로그인하세요")
+
+        if page < 1:
+            raise InvalidArgumentError("page는 1 이상이어야 합니다")
+        if count < 1:
+            raise InvalidArgumentError("count는 1 이상이어야 합니다")
+
+        try:
+            result_json = await self._request(
+                "rb_notice.php", {"page": page, "count": count}
+            )
+        except Exception as e:
+            logger.exception("공지사항 조회 중 예외 발생")
+            raise AttendanceError(f"공지사항 조회 중 예외 발생: {str(e)}")
+
+        if "result" in result_json and "notice" in result_json["result"]:
+            return result_json["result"]["notice"]
+
+        logger.warning("공지사항이 없거나 응답 형식이 올바르지 않습니다")
+        return []
+
+    async def get_attendance_statistics(self) -> Dict[str, Any]:
+        """
+        출석 통계 조회
+
+        Returns:
+            출석 통계 정보
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+            AttendanceError: 출석 통계 조회 실패 시
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("출석 통계를 조회하려면 먼저 로그인하세요")
+
+        try:
+            result_json = await self._request("rb_attend_status.php", {})
+        except Exception as e:
+            logger.exception("출석 통계 조회 중 예외 발생")
+            raise AttendanceError(f"출석 통계 조회 중 예외 발생: {str(e)}")
+
+        if "result" in result_json and "status" in result_json["result"]:
+            return result_json["result"]["status"]
+
+        logger.warning("출석 통계가 없거나 응답 형식이 올바르지 않습니다")
+        return {}
+
+    async def search_user_by_id(self, student_id: str) -> List[Dict[str, Any]]:
+        """
+        학번으로 사용자 검색
+
+        Args:
+            student_id: 검색할 학번
+
+        Returns:
+            검색된 사용자 목록
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+            InvalidArgumentError: 학번이 유효하지 않은 경우
+            AttendanceError: 사용자 검색 실패 시
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("사용자를 검색하려면 먼저 로그인하세요")
+
+        if not student_id or not isinstance(student_id, str):
+            raise InvalidArgumentError("유효한 학번을 입력하세요")
+
+        try:
+            return await self.client.search_user_by_id(student_id)
+        except Exception as e:
+            logger.exception("사용자 검색 중 예외 발생")
+            raise AttendanceError(f"사용자 검색 중 예외 발생: {str(e)}")
+
+    async def search_user_by_name(self, student_name: str) -> List[Dict[str, Any]]:
+        """
+        이름으로 사용자 검색
+
+        Args:
+            student_name: 검색할 이름
+
+        Returns:
+            검색된 사용자 목록
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+            InvalidArgumentError: 이름이 유효하지 않은 경우
+            AttendanceError: 사용자 검색 실패 시
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("사용자를 검색하려면 먼저 로그인하세요")
+
+        if not student_name or not isinstance(student_name, str):
+            raise InvalidArgumentError("유효한 이름을 입력하세요")
+
+        try:
+            return await self.client.search_user_by_name(student_name)
+        except Exception as e:
+            logger.exception("사용자 검색 중 예외 발생")
+            raise AttendanceError(f"사용자 검색 중 예외 발생: {str(e)}")
+
+    async def send_friend_request(self, user_info_num: Union[str, int]) -> bool:
+        """
+        친구 요청 보내기
+
+        Args:
+            user_info_num: 사용자 정보 번호 (문자열 또는 정수)
+
+        Returns:
+            친구 요청 성공 여부
+
+        Raises:
+            NotLoggedInError: 로그인되지 않은 경우
+            InvalidArgumentError: 사용자 정보 번호가 유효하지 않은 경우
+            AttendanceError: 친구 요청 실패 시
+        """
+        if not self.is_logged_in:
+            raise NotLoggedInError("친구 요청을 보내려면 먼저 로그인하세요")
+
+        # 정수형인 경우 문자열로 변환
+        if isinstance(user_info_num, int):
+            user_info_num = str(user_info_num)
+
+        if not user_info_num or not isinstance(user_info_num, str):
+            raise InvalidArgumentError("유효한 사용자 정보 번호를 입력하세요")
+
+        try:
+            return await self.client.send_friend_request(user_info_num)
+        except Exception as e:
+            logger.exception("친구 요청 보내기 중 예외 발생")
+            raise AttendanceError(f"친구 요청 보내기 중 예외 발생: {str(e)}")
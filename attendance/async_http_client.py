@@ -0,0 +1,340 @@
+"""
+전자출결 시스템과 통신하기 위한 비동기 HTTP 클라이언트
+
+aiohttp 기반으로 AttendanceHTTPClient와 같은 기능을 코루틴으로 제공합니다.
+요청 암호화와 응답 복호화는 실행기(executor)에서 수행하여 이벤트 루프를 막지 않으므로,
+한 프로세스에서 여러 학생 세션을 동시에 처리할 수 있습니다.
+aiohttp는 선택 의존성입니다 (pip install kgu_library[async]).
+"""
+
+import asyncio
+import functools
+import logging
+import urllib.parse
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp는 선택 의존성
+    aiohttp = None
+
+from .exceptions import HttpClientError, LoginError
+from .http_client import (
+    API_BASE_URL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    decode_response_content,
+    determine_server_url,
+    encrypt_request_data,
+    parse_login_response,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAttendanceHTTPClient:
+    """경기대학교 전자출결 시스템 비동기 HTTP 클라이언트
+
+    여러 클라이언트가 같은 connector(연결 풀)와 실행기를 공유할 수 있으며, 쿠키(로그인
+    세션)는 클라이언트마다 따로 관리됩니다. 암호화 함수는 모듈 수준 함수이므로
+    ProcessPoolExecutor를 넘겨 복호화를 다른 프로세스에서 수행할 수도 있습니다.
+    """
+
+    def __init__(
+        self,
+        connector: Optional["aiohttp.BaseConnector"] = None,
+        executor: Optional[Executor] = None,
+        cookie_jar: Optional["aiohttp.abc.AbstractCookieJar"] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ):
+        """
+        AsyncAttendanceHTTPClient 초기화
+
+        Args:
+            connector: 공유할 aiohttp 연결 풀 (None이면 클라이언트 전용 풀 생성)
+            executor: 암호화/복호화를 실행할 실행기 (None이면 이벤트 루프 기본 실행기)
+            cookie_jar: 사용할 쿠키 저장소 (None이면 aiohttp 기본 쿠키 저장소)
+            connect_timeout: 서버 연결 제한 시간(초)
+            read_timeout: 응답을 기다리는 제한 시간(초, 소켓 읽기 한 번 기준)
+
+        Raises:
+            ImportError: aiohttp가 설치되어 있지 않은 경우
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncAttendanceHTTPClient를 사용하려면 aiohttp를 설치하세요: "
+                "pip install kgu_library[async]"
+            )
+
+        self.connector = connector
+        self.executor = executor
+        self.cookie_jar = cookie_jar
+        # AttendanceHTTPClient와 같은 기준 (연결 풀을 기다리는 시간은 제한하지 않음)
+        self.timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        self.base_url = API_BASE_URL
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._is_logged_in = False
+        self._token = None
+        self.device_id = "Android"
+        self.mac_id = "Android"
+        self.mac_name = ""
+        self.user_id = None
+        self.user_name = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """aiohttp 세션 (이벤트 루프 안에서 처음 사용할 때 생성)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=self.connector is None,
+                cookie_jar=self.cookie_jar,
+                timeout=self.timeout,
+            )
+        return self._session
+
+    @property
+    def is_logged_in(self) -> bool:
+        """
+        로그인 상태 확인
+
+        Returns:
+            로그인 상태 여부
+        """
+        return self._is_logged_in
+
+    async def close(self) -> None:
+        """세션을 닫습니다. 공유 connector와 실행기는 닫지 않습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncAttendanceHTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def determine_server_url(self, user_id: Optional[str]) -> str:
+        """사용자 ID에 따라 서버 URL 결정"""
+        return determine_server_url(user_id, self.base_url)
+
+    async def _run_in_executor(self, func, *args) -> Any:
+        """CPU 작업을 실행기에서 수행하고 결과를 기다립니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    async def encrypt_request(self, data: Dict[str, Any]) -> str:
+        """
+        요청 데이터를 실행기에서 암호화합니다.
+
+        Args:
+            data: 요청 데이터
+
+        Returns:
+            16진수 암호문 문자열
+        """
+        return await self._run_in_executor(encrypt_request_data, data)
+
+    async def decode_response(self, content: bytes) -> Any:
+        """
+        암호화된 응답 본문을 실행기에서 복호화하고 JSON으로 파싱합니다.
+
+        Args:
+            content: 응답 본문
+
+        Returns:
+            파싱된 응답 객체
+
+        Raises:
+            ValueError: 16진수, 복호화 또는 JSON 형식이 올바르지 않은 경우
+        """
+        return await self._run_in_executor(decode_response_content, content)
+
+    async def post_encrypted(
+        self, url: str, request_data: Dict[str, Any]
+    ) -> Tuple[int, bytes]:
+        """
+        요청 데이터를 암호화하여 POST 요청을 보냅니다.
+
+        Args:
+            url: 요청 URL
+            request_data: 암호화할 요청 데이터
+
+        Returns:
+            (HTTP 상태 코드, 응답 본문) 튜플
+
+        Raises:
+            HttpClientError: HTTP 요청 실패 시
+        """
+        params = {"key": await self.encrypt_request(request_data)}
+        try:
+            async with self.session.post(url, data=params) as response:
+                return response.status, await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"POST 요청 실패: {url}, 오류: {str(e)}")
+            raise HttpClientError(f"POST 요청 실패: {str(e)}") from e
+
+    async def login(self, user_id: str, password: str) -> Dict[str, Any]:
+        """
+        사용자 계정으로 로그인합니다.
+
+        Args:
+            user_id: 사용자 ID(학번)
+            password: 비밀번호
+
+        Returns:
+            로그인 결과 (AttendanceHTTPClient.login과 같은 형식)
+
+        Raises:
+            LoginError: 로그인 실패 시
+        """
+        try:
+            logger.info(f"사용자 '{user_id}'로 로그인 시도 중...")
+            self.user_id = user_id
+
+            login_url = self.determine_server_url(user_id) + "rb_login.php"
+            login_data = {
+                "duser_id": user_id,
+                "duser_pw": urllib.parse.quote(password),  # URL 인코딩
+                "device_id": self.device_id,
+                "device_gubun": "Android",
+                "mac_id": self.mac_id,
+                "mac_name": urllib.parse.quote(
+                    self.mac_name if self.mac_name else user_id
+                ),
+                "receive": "1.0.0-Python-1.0",  # 앱 버전, 디바이스 모델, OS 버전
+            }
+
+            status, body = await self.post_encrypted(login_url, login_data)
+            if status != 200:
+                logger.error(f"로그인 실패: HTTP 상태 코드 {status}")
+                raise LoginError(f"HTTP 오류: {status}")
+
+            try:
+                result = parse_login_response(await self.decode_response(body))
+            except Exception as e:
+                logger.error(f"로그인 응답 처리 중 오류 발생: {e}")
+                return {"success": False, "error": str(e)}
+
+            if result["success"]:
+                logger.info("로그인 성공")
+                self.user_name = result["user_name"]
+                self._is_logged_in = True
+                self._token = result["user_id"]
+            else:
+                logger.error(f"로그인 실패: {result['error']}")
+            return result
+
+        except Exception as e:
+            logger.error(f"로그인 중 예외 발생: {str(e)}")
+            raise LoginError(f"로그인 중 예외 발생: {str(e)}") from e
+
+    def logout(self) -> None:
+        """로그아웃 처리"""
+        if self._is_logged_in:
+            # 세션 쿠키 삭제 및 상태 초기화
+            if self._session is not None:
+                self._session.cookie_jar.clear()
+            self._is_logged_in = False
+            self._token = None
+            self.user_id = None
+            self.user_name = None
+            logger.info("로그아웃 완료")
+
+    async def _perform_user_search(
+        self, request_data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        사용자 검색 내부 공통 로직
+
+        Args:
+            request_data: 검색 요청 데이터
+
+        Returns:
+            검색 결과 목록
+        """
+        if not self._is_logged_in:
+            logger.error("로그인이 필요합니다.")
+            return []
+
+        search_url = self.determine_server_url(self.user_id) + "e_c_new/find_friend"
+        status, body = await self.post_encrypted(search_url, request_data)
+
+        if status != 200:
+            logger.error(f"요청 실패: HTTP 상태 코드 {status}")
+            return []
+
+        try:
+            result_json = await self.decode_response(body)
+        except Exception as e:
+            logger.error(f"응답 처리 중 오류 발생: {e}")
+            return []
+
+        # 'result' -> 'find_friend'에서 검색 결과를 가져옴
+        if "result" in result_json and "find_friend" in result_json["result"]:
+            return result_json["result"]["find_friend"]
+
+        logger.error("검색 결과가 없거나 형식이 올바르지 않습니다.")
+        return []
+
+    async def search_user_by_id(self, student_id: str) -> List[Dict[str, Any]]:
+        """
+        학번으로 사용자 검색
+
+        Args:
+            student_id: 검색할 학번
+
+        Returns:
+            검색 결과 목록
+        """
+        return await self._perform_user_search({"sugang_student_id": student_id})
+
+    async def search_user_by_name(self, student_name: str) -> List[Dict[str, Any]]:
+        """
+        이름으로 사용자 검색
+
+        Args:
+            student_name: 검색할 이름
+
+        Returns:
+            검색 결과 목록
+        """
+        return await self._perform_user_search({"sugang_student_name": student_name})
+
+    async def send_friend_request(self, user_info_num) -> bool:
+        """친구 요청 보내기"""
+        if not self._is_logged_in:
+            logger.error("로그인이 필요합니다.")
+            return False
+
+        # 정수형인 경우 문자열로 변환
+        if isinstance(user_info_num, int):
+            user_info_num = str(user_info_num)
+
+        request_url = self.determine_server_url(self.user_id) + "e_c_new/ask_consent"
+        status, body = await self.post_encrypted(
+            request_url, {"sugang_user_info_num": user_info_num}
+        )
+
+        if status != 200:
+            logger.error(f"요청 실패: HTTP 상태 코드 {status}")
+            return False
+
+        try:
+            result_json = await self.decode_response(body)
+        except Exception as e:
+            logger.error(f"응답 처리 중 오류 발생: {e}")
+            return False
+
+        if "xidedu" in result_json and result_json["xidedu"]["xmsg"] == "Ok":
+            logger.info("친구 요청이 성공적으로 전송되었습니다.")
+            return True
+
+        error_msg = result_json.get("xidedu", {}).get("xmsg", "알 수 없는 오류")
+        logger.error(f"친구 요청 전송 실패: {error_msg}")
+        return False
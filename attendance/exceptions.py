@@ -29,6 +29,33 @@ class HttpClientError(AttendanceAPIError):
         super().__init__(message)
 
 
+class AttendanceTimeoutError(HttpClientError):
+    """요청 시간 초과 예외 (연결, 응답 읽기, 전체 제한 시간)"""
+
+    def __init__(
+        self,
+        message: str = "요청 시간이 초과되었습니다.",
+        phase: Optional[str] = None,
+        elapsed: Optional[float] = None,
+    ):
+        """
+        Args:
+            message: 오류 메시지
+            phase: 시간이 초과된 단계 ("connect", "read", "deadline")
+            elapsed: 요청을 시작한 뒤 지난 시간(초)
+        """
+        self.phase = phase
+        self.elapsed = elapsed
+        super().__init__(message)
+
+
+class RateLimitError(HttpClientError):
+    """요청 속도 제한으로 요청을 보내지 못한 경우의 예외"""
+
+    def __init__(self, message: str = "요청 속도 제한으로 요청을 보내지 못했습니다."):
+        super().__init__(message)
+
+
 class ResponseError(AttendanceAPIError):
     """API 응답 처리 중 발생하는 예외"""
 
@@ -4,25 +4,47 @@
 경기대학교 전자출결 시스템 API와 통신하기 위한 HTTP 클라이언트 클래스입니다.
 """
 
+import binascii
 import json
 import logging
+import math
 import re
+import threading
 import time
 import urllib.parse
-from typing import Dict, Any, Optional, Union
-from urllib.parse import urljoin
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
 
 import requests
-
+from urllib3.exceptions import ReadTimeoutError
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
+
+from kgu_library.core.http import (
+    NO_RETRY,
+    DeadlineExceeded,
+    RateLimiter,
+    RetryPolicy,
+    Transport,
+    TransportConfig,
+)
+from kgu_library.core.session import SessionState, dump_cookies, load_cookies
 from .exceptions import (
+    AttendanceTimeoutError,
     HttpClientError,
     LoginError,
+    RateLimitError,
     ResponseError,
 )
 from kgu_library.core.crypto import (
     hex_comma_str_to_bytes,
     bytes_to_hex_comma_str,
-    SeedCbcCipher,
+    get_seed_cipher,
+    SeedCbcDecryptor,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,6 +56,20 @@ DEBUG_MODE = False
 API_BASE_URL = "https://attend.kyonggi.ac.kr/attend/"
 USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 14_8 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 SAI/31.1"
 
+# SEED 암호화 키와 IV (모듈 로드 시 한 번만 변환)
+SEED_KEY = hex_comma_str_to_bytes("80,E3,4F,8F,08,10,70,F1,E9,F3,94,37,0A,D4,05,89")
+SEED_IV = hex_comma_str_to_bytes("20,8D,66,A7,30,A8,1A,81,6F,BA,D9,FA,36,10,25,01")
+
+# 16진수 본문 앞뒤에서 무시할 공백 바이트
+_HEX_WHITESPACE = b" \t\r\n"
+
+# 스트리밍 응답을 읽을 때의 조각 크기 (바이트)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 기본 연결 제한 시간과 응답 읽기(소켓 읽기 한 번) 제한 시간 (초)
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
 
 # 디버그 로그 출력 함수
 def debug_log(message):
@@ -41,12 +77,174 @@ def debug_log(message):
         print(message)
 
 
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    JSON 파싱 (orjson이 설치되어 있으면 orjson 사용)
+
+    Args:
+        data: JSON 바이트 또는 문자열
+
+    Returns:
+        파싱된 객체
+
+    Raises:
+        ValueError: JSON 형식이 올바르지 않은 경우
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encrypt_request_data(data: Dict[str, Any]) -> str:
+    """
+    요청 데이터를 JSON으로 직렬화하고 SEED로 암호화합니다.
+
+    인스턴스 상태를 쓰지 않는 모듈 함수이므로 스레드/프로세스 실행기에서도 호출할 수
+    있습니다.
+
+    Args:
+        data: 요청 데이터
+
+    Returns:
+        16진수 암호문 문자열 (요청의 key 파라미터 값)
+    """
+    cipher = get_seed_cipher(SEED_KEY, SEED_IV)
+    return cipher.encrypt(json.dumps(data).encode("utf-8")).hex()
+
+
+def decode_response_content(content: Union[bytes, bytearray, str]) -> Any:
+    """
+    암호화된 응답 본문을 복호화하고 JSON으로 파싱합니다.
+
+    16진수 본문을 복사하지 않고 디코딩하여 미리 할당한 bytearray에 바로 복호화한 뒤
+    문자열 변환 없이 JSON 파싱하여 중간 복사본을 줄입니다. 인스턴스 상태를 쓰지
+    않으므로 스레드/프로세스 실행기에서도 호출할 수 있습니다.
+
+    Args:
+        content: 응답 본문 (response.content 또는 response.text)
+
+    Returns:
+        파싱된 응답 객체
+
+    Raises:
+        ValueError: 16진수, 복호화 또는 JSON 형식이 올바르지 않은 경우
+    """
+    if isinstance(content, str):
+        # fromhex는 앞뒤 공백을 무시하고 바로 bytearray로 디코딩 (제자리 복호화)
+        ciphertext = buffer = bytearray.fromhex(content)
+    else:
+        # 앞뒤 공백은 복사 없이 memoryview 범위로 제외
+        view = memoryview(content)
+        start, end = 0, len(view)
+        while start < end and view[start] in _HEX_WHITESPACE:
+            start += 1
+        while end > start and view[end - 1] in _HEX_WHITESPACE:
+            end -= 1
+        ciphertext = binascii.unhexlify(view[start:end])
+        # 복호화 결과를 기록할 버퍼
+        buffer = bytearray(len(ciphertext))
+
+    cipher = get_seed_cipher(SEED_KEY, SEED_IV)
+    if not hasattr(cipher, "decrypt_into"):
+        return json_loads(cipher.decrypt(bytes(ciphertext)))
+
+    # 패딩 길이만큼 잘라냄
+    size = cipher.decrypt_into(ciphertext, buffer)
+    del buffer[size:]
+    return json_loads(buffer)
+
+
+def determine_server_url(user_id: Optional[str], base_url: str = API_BASE_URL) -> str:
+    """
+    사용자 ID에 따라 서버 URL 결정
+
+    Args:
+        user_id: 사용자 ID(학번)
+        base_url: 일반 사용자에게 사용할 기본 URL
+
+    Returns:
+        요청을 보낼 서버 URL
+    """
+    sitename = "kyonggi"
+    test_patterns = [
+        sitename.lower() + "prof",
+        sitename.lower() + "stud1",
+        sitename.lower() + "stud2",
+        sitename.lower() + "stud3",
+        sitename.lower() + "stud4",
+        sitename.lower() + "stud5",
+        sitename.lower() + "stud6",
+        sitename.lower() + "stud7",
+        sitename.lower() + "stud8",
+        sitename.lower() + "stud9",
+        sitename.lower() + "stud10",
+    ]
+
+    if user_id in test_patterns:
+        return "http://story.xidsys.co.kr:9090/attend/"
+    else:
+        return base_url
+
+
+def parse_login_response(response_json: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    복호화된 로그인 응답에서 로그인 결과를 만듭니다.
+
+    Args:
+        response_json: 복호화된 로그인 응답
+
+    Returns:
+        로그인 결과 (success가 True이면 사용자 정보 포함, 아니면 error 포함)
+    """
+    if "xidedu" in response_json and response_json["xidedu"]["xmsg"] == "Ok":
+        xuser_info = response_json.get("xuser", {})
+        return {
+            "success": True,
+            "user_id": xuser_info.get("USER_ID", ""),
+            "user_name": xuser_info.get("USER_NM", ""),
+            "student_id": xuser_info.get("USER_ID", ""),
+            "department": xuser_info.get("DEPT_NM", ""),
+            "grade": xuser_info.get("GRADE", ""),
+        }
+
+    error_msg = response_json.get("xidedu", {}).get("xmsg", "알 수 없는 오류")
+    return {"success": False, "error": error_msg}
+
+
 class AttendanceHTTPClient:
     """경기대학교 전자출결 시스템 HTTP 클라이언트"""
 
-    def __init__(self):
-        """AttendanceHTTPClient 초기화"""
-        self.session = requests.Session()
+    def __init__(
+        self,
+        transport: Optional[Union[Transport, TransportConfig]] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        deadline: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        AttendanceHTTPClient 초기화
+
+        Args:
+            transport: 여러 클라이언트가 공유할 연결 풀(Transport) 또는 이 클라이언트
+                전용 연결 풀 설정(TransportConfig). None이면 기본 설정을 사용합니다.
+            connect_timeout: 서버 연결 제한 시간(초)
+            read_timeout: 응답을 기다리는 제한 시간(초, 소켓 읽기 한 번 기준)
+            deadline: 요청 하나가 재시도를 포함해 끝나야 하는 전체 제한 시간(초)
+                (None이면 제한 없음, time_limit()으로 여러 요청에 걸친 제한도 지정 가능)
+            retry: 일시적인 오류가 난 요청을 다시 보낼 정책 (None이면 다시 보내지 않음)
+            rate_limiter: 요청을 보내기 전에 확인할 호스트별, 계정별(학번) 속도 제한
+        """
+        self.transport = Transport.resolve(transport)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.deadline = deadline
+        self.retry = retry if retry is not None else NO_RETRY
+        self.rate_limiter = rate_limiter
+        # time_limit()으로 지정한 제한 시각과 마지막 요청의 제한 시각 (스레드별)
+        self._local = threading.local()
+        self.session = self.transport.create_session()
         self.base_url = API_BASE_URL
         self._is_logged_in = False
         self._token = None
@@ -66,6 +264,142 @@ class AttendanceHTTPClient:
         """
         return self._is_logged_in
 
+    @property
+    def cipher(self):
+        """
+        요청/응답 암호화에 사용하는 SEED CBC 암호화 객체
+
+        키 스케줄은 프로세스 전체에서 한 번만 계산되어 모든 클라이언트가 공유합니다.
+
+        Returns:
+            SeedCbcCipher 객체
+        """
+        return get_seed_cipher(SEED_KEY, SEED_IV)
+
+    @contextmanager
+    def time_limit(self, seconds: float) -> Iterator[None]:
+        """
+        with 문 안에서 이 스레드가 보내는 모든 요청이 seconds초 안에 끝나도록 제한합니다.
+
+        여러 요청(예: 세션 확인 후 로그인)과 재시도, 스트리밍 응답 수신 시간을 모두
+        포함하며, 중첩하면 더 이른 제한 시각이 적용됩니다.
+
+        Args:
+            seconds: 제한 시간(초)
+
+        Raises:
+            AttendanceTimeoutError: 제한 시간 안에 요청을 마치지 못한 경우
+        """
+        previous = getattr(self._local, "deadline", None)
+        deadline = time.monotonic() + seconds
+        if previous is not None:
+            deadline = min(deadline, previous)
+        self._local.deadline = deadline
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+
+    def remaining(self) -> Optional[float]:
+        """
+        time_limit()으로 지정한 제한 시각까지 남은 시간
+
+        Returns:
+            남은 시간(초, 제한이 없으면 None)
+        """
+        deadline = getattr(self._local, "deadline", None)
+        return None if deadline is None else deadline - time.monotonic()
+
+    def _timeout(self, deadline: Optional[float]) -> Tuple[float, float]:
+        """제한 시각까지 남은 시간을 넘지 않는 (연결, 읽기) 제한 시간"""
+        if deadline is None:
+            return self.connect_timeout, self.read_timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded("전체 제한 시간 초과")
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+
+    def _acquire_rate_limit(
+        self, url: str, timeout: Optional[float], deadline: Optional[float]
+    ) -> None:
+        """속도 제한 토큰 사용 (전체 제한 시각까지만 기다림)"""
+        if self.rate_limiter is None:
+            return
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        host = urlsplit(url).hostname or ""
+        if not self.rate_limiter.acquire(host, self.user_id, timeout):
+            raise RateLimitError(f"요청 속도 제한으로 요청을 보내지 못했습니다: {host}")
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        rate_limit_timeout: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        속도 제한, 연결/읽기 제한 시간과 전체 제한 시각을 적용하여 요청을 보냅니다.
+
+        Args:
+            method: HTTP 메서드 ("GET" 또는 "POST")
+            url: 요청 URL
+            idempotent: 요청이 멱등한지 여부 (재시도 판단용, None이면 메서드로 판단)
+            rate_limit_timeout: 속도 제한 토큰을 기다릴 최대 시간(초, None이면 전체
+                제한 시각까지, 0이면 기다리지 않음)
+            **kwargs: requests에 넘길 인자 (data, params, stream 등)
+
+        Returns:
+            HTTP 응답 객체
+
+        Raises:
+            AttendanceTimeoutError: 연결, 응답 읽기 또는 전체 제한 시간이 초과된 경우
+            RateLimitError: 속도 제한 토큰을 사용하지 못한 경우
+            requests.RequestException: 그 밖의 요청 오류
+        """
+        started = time.monotonic()
+        deadline = getattr(self._local, "deadline", None)
+        if self.deadline is not None:
+            deadline = min(deadline or math.inf, started + self.deadline)
+        self._local.request_deadline = deadline
+        send_request = (
+            self.session.get if method.upper() == "GET" else self.session.post
+        )
+
+        def send() -> requests.Response:
+            # 재시도도 속도 제한을 지킴
+            self._acquire_rate_limit(url, rate_limit_timeout, deadline)
+            return send_request(url, timeout=self._timeout(deadline), **kwargs)
+
+        try:
+            return self.retry.call(method, url, send, idempotent, deadline=deadline)
+        except DeadlineExceeded as e:
+            # 재시도 중 제한 시각이 지나면 마지막 전송 오류를 원인으로 보고
+            raise self._timeout_error(e, started) from (e.__cause__ or e)
+        except requests.Timeout as e:
+            raise self._timeout_error(e, started) from e
+
+    def _timeout_error(
+        self, error: BaseException, started: float
+    ) -> AttendanceTimeoutError:
+        """requests 시간 초과 예외를 AttendanceTimeoutError로 변환"""
+        if isinstance(error, requests.ConnectTimeout):
+            phase = "connect"
+        elif isinstance(error, requests.ReadTimeout) or isinstance(
+            error.args[0] if error.args else None, ReadTimeoutError
+        ):
+            phase = "read"
+        else:
+            phase = "deadline"
+        elapsed = time.monotonic() - started
+        return AttendanceTimeoutError(
+            f"요청 시간 초과 ({phase}, {elapsed:.2f}초): {error}",
+            phase=phase,
+            elapsed=elapsed,
+        )
+
     def login(self, user_id: str, password: str) -> Dict[str, Any]:
         """
         사용자 계정으로 로그인합니다.
@@ -120,7 +454,7 @@ class AttendanceHTTPClient:
 
             # 로그인 요청 보내기
             debug_log(f"[DEBUG] 로그인 요청 전송 시작")
-            response = self.session.post(login_url, data=params)
+            response = self.request("POST", login_url, data=params)
             debug_log(f"[DEBUG] 응답 상태 코드: {response.status_code}")
             debug_log(f"[DEBUG] 응답 헤더: {dict(response.headers)}")
             debug_log(f"[DEBUG] 응답 내용 (처음 100자): {response.text[:100]}")
@@ -129,7 +463,7 @@ class AttendanceHTTPClient:
             if response.status_code == 200:
                 # 응답 처리
                 debug_log(f"[DEBUG] 응답 처리 시작")
-                result = self.process_login_response(response.text)
+                result = self.process_login_response(response.content)
                 debug_log(
                     f"[DEBUG] 로그인 처리 결과: {json.dumps(result, ensure_ascii=False)}"
                 )
@@ -138,88 +472,74 @@ class AttendanceHTTPClient:
                 logger.error(f"로그인 실패: HTTP 상태 코드 {response.status_code}")
                 raise LoginError(f"HTTP 오류: {response.status_code}")
 
+        except (AttendanceTimeoutError, RateLimitError):
+            raise
         except Exception as e:
             logger.error(f"로그인 중 예외 발생: {str(e)}")
             debug_log(f"[DEBUG] 로그인 중 예외 발생: {type(e).__name__}: {str(e)}")
             raise LoginError(f"로그인 중 예외 발생: {str(e)}")
 
-    def process_login_response(self, response_text):
+    def process_login_response(self, response_content):
         """로그인 응답 처리"""
         try:
             # 디버깅을 위한 로그 추가
-            debug_log(f"[DEBUG] 응답 데이터 (처음 100자): {response_text[:100]}")
+            debug_log(f"[DEBUG] 응답 데이터 (처음 100자): {response_content[:100]}")
 
             # 로그인 응답 복호화 및 처리
-            decrypted_response = self.sdecrypt(response_text)
-            debug_log(f"[DEBUG] 복호화된 응답 (처음 100자): {decrypted_response[:100]}")
-
-            response_json = json.loads(decrypted_response)
+            response_json = self.decode_response(response_content)
             debug_log(
                 f"[DEBUG] 응답 JSON: {json.dumps(response_json, ensure_ascii=False)}"
             )
 
             # 로그인 성공 여부 확인
-            if "xidedu" in response_json and response_json["xidedu"]["xmsg"] == "Ok":
-                # 사용자 정보 저장
-                xidedu_info = response_json["xidedu"]
-                xuser_info = response_json.get("xuser", {})
-                logger.info(f"로그인 성공: {xidedu_info['xmsg']}")
-
-                # 디버깅
-                debug_log(
-                    f"[DEBUG] xidedu 정보: {json.dumps(xidedu_info, ensure_ascii=False)}"
-                )
-                debug_log(
-                    f"[DEBUG] xuser 정보: {json.dumps(xuser_info, ensure_ascii=False)}"
-                )
+            result = parse_login_response(response_json)
+            if result["success"]:
+                logger.info("로그인 성공")
 
-                # 사용자 정보 저장 - xuser 필드에서 정보 추출
-                self.user_name = xuser_info.get("USER_NM", "")
+                # 사용자 정보 저장 - xuser 필드에서 추출한 정보
+                self.user_name = result["user_name"]
                 self._is_logged_in = True
-                self._token = xuser_info.get("USER_ID", "")
-                student_id = xuser_info.get("USER_ID", "")
-
-                return {
-                    "success": True,
-                    "user_id": xuser_info.get("USER_ID", ""),
-                    "user_name": xuser_info.get("USER_NM", ""),
-                    "student_id": student_id,
-                    "department": xuser_info.get("DEPT_NM", ""),
-                    "grade": xuser_info.get("GRADE", ""),
-                }
+                self._token = result["user_id"]
             else:
-                error_msg = response_json.get("xidedu", {}).get(
-                    "xmsg", "알 수 없는 오류"
-                )
-                logger.error(f"로그인 실패: {error_msg}")
-                debug_log(f"[DEBUG] 로그인 실패 메시지: {error_msg}")
-                return {"success": False, "error": error_msg}
+                logger.error(f"로그인 실패: {result['error']}")
+                debug_log(f"[DEBUG] 로그인 실패 메시지: {result['error']}")
+            return result
         except Exception as e:
             logger.error(f"로그인 응답 처리 중 오류 발생: {e}")
             debug_log(f"[DEBUG] 로그인 응답 처리 중 예외: {type(e).__name__}: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def export_state(self) -> SessionState:
+        """
+        로그인 세션 상태(쿠키와 사용자 정보)를 저장할 수 있는 형태로 반환합니다.
+
+        Returns:
+            JSON으로 직렬화할 수 있는 세션 상태
+        """
+        return {
+            "user_id": self.user_id,
+            "user_name": self.user_name,
+            "token": self._token,
+            "cookies": dump_cookies(self.session.cookies),
+        }
+
+    def restore_state(self, state: SessionState) -> None:
+        """
+        export_state()로 저장한 세션 상태를 불러와 로그인된 상태로 만듭니다.
+
+        Args:
+            state: 세션 상태
+        """
+        self.session.cookies.clear()
+        load_cookies(self.session.cookies, state.get("cookies", []))
+        self.user_id = state.get("user_id")
+        self.user_name = state.get("user_name")
+        self._token = state.get("token")
+        self._is_logged_in = True
+
     def determine_server_url(self, user_id):
         """사용자 ID에 따라 서버 URL 결정"""
-        sitename = "kyonggi"
-        test_patterns = [
-            sitename.lower() + "prof",
-            sitename.lower() + "stud1",
-            sitename.lower() + "stud2",
-            sitename.lower() + "stud3",
-            sitename.lower() + "stud4",
-            sitename.lower() + "stud5",
-            sitename.lower() + "stud6",
-            sitename.lower() + "stud7",
-            sitename.lower() + "stud8",
-            sitename.lower() + "stud9",
-            sitename.lower() + "stud10",
-        ]
-
-        if user_id in test_patterns:
-            return "http://story.xidsys.co.kr:9090/attend/"
-        else:
-            return self.base_url
+        return determine_server_url(user_id, self.base_url)
 
     def logout(self) -> None:
         """로그아웃 처리"""
@@ -235,16 +555,8 @@ class AttendanceHTTPClient:
     def sencrypt(self, plaintext):
         """문자열 암호화"""
         try:
-            # 암호화 키와 IV
-            key_str = "80,E3,4F,8F,08,10,70,F1,E9,F3,94,37,0A,D4,05,89"
-            iv_str = "20,8D,66,A7,30,A8,1A,81,6F,BA,D9,FA,36,10,25,01"
-
-            # 16진수 문자열을 바이트 배열로 변환
-            key = hex_comma_str_to_bytes(key_str)
-            iv = hex_comma_str_to_bytes(iv_str)
-
-            # SeedCbcCipher 클래스 사용
-            cipher = SeedCbcCipher(key=key, iv=iv)
+            # 프로세스 전역으로 공유되는 암호화 객체 사용
+            cipher = self.cipher
             encrypted_data = cipher.encrypt(plaintext.encode("utf-8"))
             return encrypted_data.hex()
         except Exception as e:
@@ -254,23 +566,74 @@ class AttendanceHTTPClient:
     def sdecrypt(self, ciphertext):
         """암호화된 문자열 복호화"""
         try:
-            # 암호화 키와 IV
-            key_str = "80,E3,4F,8F,08,10,70,F1,E9,F3,94,37,0A,D4,05,89"
-            iv_str = "20,8D,66,A7,30,A8,1A,81,6F,BA,D9,FA,36,10,25,01"
-
-            # 16진수 문자열을 바이트 배열로 변환
-            key = hex_comma_str_to_bytes(key_str)
-            iv = hex_comma_str_to_bytes(iv_str)
             encrypted_data = bytes.fromhex(ciphertext.strip())
 
-            # SeedCbcCipher 클래스 사용
-            cipher = SeedCbcCipher(key=key, iv=iv)
+            # 프로세스 전역으로 공유되는 암호화 객체 사용
+            cipher = self.cipher
             decrypted_data = cipher.decrypt(encrypted_data)
             return decrypted_data.decode("utf-8")
         except Exception as e:
             logger.error(f"복호화 오류: {e}")
             return ""
 
+    def decode_response(self, content: Union[bytes, str]) -> Any:
+        """
+        암호화된 응답 본문을 복호화하고 JSON으로 파싱합니다.
+
+        Args:
+            content: 응답 본문 (response.content 또는 response.text)
+
+        Returns:
+            파싱된 응답 객체
+
+        Raises:
+            ValueError: 16진수, 복호화 또는 JSON 형식이 올바르지 않은 경우
+        """
+        return decode_response_content(content)
+
+    def decode_response_stream(
+        self, response: requests.Response, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Any:
+        """
+        스트리밍 응답을 받는 대로 복호화하고 JSON으로 파싱합니다.
+
+        stream=True로 보낸 요청의 응답을 조각 단위로 읽어 복호화하므로, 큰 응답에서도
+        16진수 본문 전체를 메모리에 올리지 않고 수신과 복호화를 겹쳐 처리합니다.
+
+        Args:
+            response: stream=True로 받은 HTTP 응답 객체
+            chunk_size: 한 번에 읽을 바이트 수
+
+        Returns:
+            파싱된 응답 객체
+
+        Raises:
+            ValueError: 16진수, 복호화 또는 JSON 형식이 올바르지 않은 경우
+            AttendanceTimeoutError: 수신 중 읽기 또는 전체 제한 시간이 초과된 경우
+        """
+        decryptor = SeedCbcDecryptor(SEED_KEY, SEED_IV, hex_input=True)
+        plaintext = bytearray()
+        # request()로 보낸 마지막 요청의 제한 시각 (조각 사이마다 확인)
+        deadline = getattr(self._local, "request_deadline", None)
+        started = time.monotonic()
+
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                plaintext += decryptor.update(chunk)
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise requests.Timeout("응답 수신 중 전체 제한 시간 초과")
+            plaintext += decryptor.finalize()
+        except requests.RequestException as e:
+            if isinstance(e, requests.Timeout) or isinstance(
+                e.args[0] if e.args else None, ReadTimeoutError
+            ):
+                raise self._timeout_error(e, started) from e
+            raise
+        finally:
+            response.close()
+
+        return json_loads(plaintext)
+
     def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -291,8 +654,10 @@ class AttendanceHTTPClient:
         url = urljoin(self.base_url, endpoint)
         try:
             logger.debug(f"GET 요청: {url}, 파라미터: {params}")
-            response = self.session.get(url, params=params)
+            response = self.request("GET", url, params=params)
             return self._process_response(response)
+        except (AttendanceTimeoutError, RateLimitError):
+            raise
         except Exception as e:
             logger.error(f"GET 요청 실패: {url}, 오류: {str(e)}")
             raise HttpClientError(f"GET 요청 실패: {str(e)}")
@@ -322,11 +687,13 @@ class AttendanceHTTPClient:
             if data:
                 encrypted_data = self.sencrypt(json.dumps(data))
                 params = {"key": encrypted_data}
-                response = self.session.post(url, data=params)
+                response = self.request("POST", url, data=params)
             else:
-                response = self.session.post(url)
+                response = self.request("POST", url)
 
             return self._process_response(response)
+        except (AttendanceTimeoutError, RateLimitError):
+            raise
         except Exception as e:
             logger.error(f"POST 요청 실패: {url}, 오류: {str(e)}")
             raise HttpClientError(f"POST 요청 실패: {str(e)}")
@@ -355,9 +722,8 @@ class AttendanceHTTPClient:
             else:
                 # 복호화 시도
                 try:
-                    decrypted_text = self.sdecrypt(response.text)
-                    return json.loads(decrypted_text)
-                except:
+                    return self.decode_response(response.content)
+                except Exception:
                     # JSON이 아닌 경우, 텍스트 응답을 JSON 형식으로 파싱 시도
                     text = response.text.strip()
                     try:
@@ -396,28 +762,35 @@ class AttendanceHTTPClient:
         # 요청 파라미터 설정
         params = {"key": encrypted_data}
 
-        # POST 요청 보내기
-        response = self.session.post(search_url, data=params)
+        # POST 요청 보내기 (검색 결과가 길 수 있으므로 스트리밍으로 수신)
+        response = self.request("POST", search_url, data=params, stream=True)
 
-        # 응답 확인
-        if response.status_code == 200:
-            try:
-                # 결과 처리
-                result = self.sdecrypt(response.text)
-                result_json = json.loads(result)
-
-                # 'result' -> 'find_friend'에서 검색 결과를 가져옴
-                if "result" in result_json and "find_friend" in result_json["result"]:
-                    return result_json["result"]["find_friend"]
-                else:
-                    logger.error("검색 결과가 없거나 형식이 올바르지 않습니다.")
+        # 응답 확인 (본문을 읽지 않은 응답도 연결을 풀에 돌려주도록 닫음)
+        try:
+            if response.status_code == 200:
+                try:
+                    # 결과 처리
+                    result_json = self.decode_response_stream(response)
+
+                    # 'result' -> 'find_friend'에서 검색 결과를 가져옴
+                    if (
+                        "result" in result_json
+                        and "find_friend" in result_json["result"]
+                    ):
+                        return result_json["result"]["find_friend"]
+                    else:
+                        logger.error("검색 결과가 없거나 형식이 올바르지 않습니다.")
+                        return []
+                except AttendanceTimeoutError:
+                    raise
+                except Exception as e:
+                    logger.error(f"응답 처리 중 오류 발생: {e}")
                     return []
-            except Exception as e:
-                logger.error(f"응답 처리 중 오류 발생: {e}")
+            else:
+                logger.error(f"요청 실패: HTTP 상태 코드 {response.status_code}")
                 return []
-        else:
-            logger.error(f"요청 실패: HTTP 상태 코드 {response.status_code}")
-            return []
+        finally:
+            response.close()
 
     def search_user_by_id(self, student_id):
         """
@@ -470,14 +843,13 @@ class AttendanceHTTPClient:
         params = {"key": encrypted_data}
 
         # POST 요청 보내기
-        response = self.session.post(request_url, data=params)
+        response = self.request("POST", request_url, data=params)
 
         # 응답 확인
         if response.status_code == 200:
             try:
                 # 응답 데이터 복호화 및 처리
-                result = self.sdecrypt(response.text)
-                result_json = json.loads(result)
+                result_json = self.decode_response(response.content)
 
                 if "xidedu" in result_json and result_json["xidedu"]["xmsg"] == "Ok":
                     logger.info("친구 요청이 성공적으로 전송되었습니다.")
@@ -488,6 +860,8 @@ class AttendanceHTTPClient:
                     )
                     logger.error(f"친구 요청 전송 실패: {error_msg}")
                     return False
+            except AttendanceTimeoutError:
+                raise
             except Exception as e:
                 logger.error(f"응답 처리 중 오류 발생: {e}")
                 return False
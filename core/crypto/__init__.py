@@ -4,12 +4,51 @@
 이 모듈은 암호화 및 복호화 관련 유틸리티 기능들을 제공합니다.
 """
 
-from .utils import hex_comma_str_to_bytes, bytes_to_hex_comma_str, create_seed_cipher
-from kgu_library.KISA_SEED_128_CBC.seed import SeedCbcCipher
+from .engines import (
+    available_engines,
+    get_default_engine_name,
+    get_engine,
+    register_engine,
+    set_default_engine,
+)
+from .utils import (
+    hex_comma_str_to_bytes,
+    bytes_to_hex_comma_str,
+    create_seed_cipher,
+    get_seed_cipher,
+    clear_seed_cipher_cache,
+)
+from .batch import encrypt_many, decrypt_many
+from .seed import PySeedCbcCipher
+from .stream import SeedCbcDecryptor, SeedCbcEncryptor
 
 __all__ = [
     "hex_comma_str_to_bytes",
     "bytes_to_hex_comma_str",
     "create_seed_cipher",
+    "get_seed_cipher",
+    "clear_seed_cipher_cache",
+    "encrypt_many",
+    "decrypt_many",
+    "available_engines",
+    "get_default_engine_name",
+    "get_engine",
+    "register_engine",
+    "set_default_engine",
+    "PySeedCbcCipher",
+    "SeedCbcDecryptor",
+    "SeedCbcEncryptor",
     "SeedCbcCipher",
 ]
+
+
+def __getattr__(name: str):
+    """
+    SeedCbcCipher를 접근할 때마다 기본 엔진의 암호화 클래스로 찾습니다.
+
+    import할 때 한 번 정해 두지 않으므로 set_default_engine()으로 바꾼 엔진이
+    반영됩니다. (KISA 모듈이 없으면 내장 구현)
+    """
+    if name == "SeedCbcCipher":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
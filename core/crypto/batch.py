@@ -0,0 +1,174 @@
+"""
+SEED CBC 일괄 암호화/복호화 함수
+
+여러 메시지를 한 번에 암호화하거나 복호화합니다. 메시지 수가 임계값 이상이면
+프로세스 풀로 나누어 여러 CPU 코어에서 처리하고, 결과는 입력 순서대로 반환합니다.
+벡터화 엔진(numpy)은 실행기를 지정하지 않으면 현재 프로세스에서 일괄 처리합니다.
+"""
+
+import atexit
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+from .engines import get_default_engine_name, get_engine
+from .utils import get_seed_cipher
+
+# 메시지 수가 이 값보다 적으면 풀을 쓰지 않고 현재 프로세스에서 처리
+DEFAULT_PARALLEL_THRESHOLD = 64
+
+# 작업자 하나에 배분할 청크 수 (부하 분산용)
+_CHUNKS_PER_WORKER = 4
+
+_shared_pool: Optional[ProcessPoolExecutor] = None
+_shared_pool_lock = threading.Lock()
+
+
+def _encrypt_chunk(
+    engine: str, key: bytes, iv: bytes, payloads: List[bytes]
+) -> List[bytes]:
+    """메시지 묶음을 암호화합니다 (작업자 프로세스에서도 호출됨)."""
+    cipher = get_seed_cipher(key, iv, engine)
+    if hasattr(cipher, "encrypt_many"):
+        return cipher.encrypt_many(payloads)
+    return [cipher.encrypt(payload) for payload in payloads]
+
+
+def _decrypt_chunk(
+    engine: str, key: bytes, iv: bytes, payloads: List[bytes]
+) -> List[bytes]:
+    """메시지 묶음을 복호화합니다 (작업자 프로세스에서도 호출됨)."""
+    cipher = get_seed_cipher(key, iv, engine)
+    if hasattr(cipher, "decrypt_many"):
+        return cipher.decrypt_many(payloads)
+    return [cipher.decrypt(payload) for payload in payloads]
+
+
+def _get_shared_pool() -> ProcessPoolExecutor:
+    """프로세스 전역 공유 풀을 반환합니다 (최초 사용 시 생성)."""
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _shared_pool
+
+
+def shutdown_pool() -> None:
+    """공유 프로세스 풀을 종료합니다. 다음 호출 시 다시 생성됩니다."""
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.shutdown(wait=True)
+            _shared_pool = None
+
+
+atexit.register(shutdown_pool)
+
+
+def _run_many(
+    worker,
+    payloads: Sequence[bytes],
+    key: bytes,
+    iv: bytes,
+    threshold: int,
+    executor: Optional[Executor],
+    engine: Optional[str],
+    max_workers: Optional[int],
+) -> List[bytes]:
+    """메시지 목록을 청크로 나누어 실행기에서 처리하고 순서대로 합칩니다."""
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers는 1 이상이어야 합니다")
+    payloads = [bytes(payload) for payload in payloads]
+    key = bytes(key)
+    iv = bytes(iv)
+    if engine is None:
+        engine = get_default_engine_name()
+
+    # 벡터화 엔진은 실행기를 따로 지정하지 않으면 현재 프로세스에서 일괄 처리
+    vectorized = getattr(get_engine(engine), "VECTORIZED", False)
+    if len(payloads) < max(threshold, 1) or (vectorized and executor is None):
+        return worker(engine, key, iv, payloads)
+
+    if executor is None:
+        executor = _get_shared_pool()
+
+    # 공유 풀은 CPU 코어 수만큼 작업자를 사용
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, -(-len(payloads) // (workers * _CHUNKS_PER_WORKER)))
+
+    futures = [
+        executor.submit(worker, engine, key, iv, payloads[i : i + chunk_size])
+        for i in range(0, len(payloads), chunk_size)
+    ]
+
+    results: List[bytes] = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+
+def encrypt_many(
+    payloads: Sequence[bytes],
+    key: bytes,
+    iv: bytes,
+    threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+    executor: Optional[Executor] = None,
+    engine: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[bytes]:
+    """
+    여러 평문을 SEED CBC로 암호화합니다.
+
+    Args:
+        payloads: 암호화할 평문 바이트 목록
+        key: 16바이트 암호화 키
+        iv: 16바이트 초기화 벡터
+        threshold: 이 개수 이상일 때만 병렬 처리
+        executor: 사용할 실행기 (기본값: 공유 프로세스 풀)
+        engine: 사용할 SEED 엔진 이름 (None이면 기본 엔진)
+        max_workers: 실행기의 작업자 수 (청크 크기 계산용, None이면 CPU 코어 수)
+
+    Returns:
+        입력 순서와 같은 순서의 암호문 목록
+
+    Raises:
+        ValueError: max_workers가 1보다 작은 경우
+    """
+    return _run_many(
+        _encrypt_chunk, payloads, key, iv, threshold, executor, engine, max_workers
+    )
+
+
+def decrypt_many(
+    payloads: Sequence[bytes],
+    key: bytes,
+    iv: bytes,
+    threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+    executor: Optional[Executor] = None,
+    engine: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[bytes]:
+    """
+    여러 암호문을 SEED CBC로 복호화합니다.
+
+    Args:
+        payloads: 복호화할 암호문 바이트 목록
+        key: 16바이트 암호화 키
+        iv: 16바이트 초기화 벡터
+        threshold: 이 개수 이상일 때만 병렬 처리
+        executor: 사용할 실행기 (기본값: 공유 프로세스 풀)
+        engine: 사용할 SEED 엔진 이름 (None이면 기본 엔진)
+        max_workers: 실행기의 작업자 수 (청크 크기 계산용, None이면 CPU 코어 수)
+
+    Returns:
+        입력 순서와 같은 순서의 평문 목록
+
+    Raises:
+        ValueError: max_workers가 1보다 작은 경우
+    """
+    return _run_many(
+        _decrypt_chunk, payloads, key, iv, threshold, executor, engine, max_workers
+    )
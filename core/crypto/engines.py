@@ -0,0 +1,149 @@
+"""
+SEED CBC 암호화 엔진 레지스트리
+
+사용할 SEED 구현(엔진)을 이름으로 등록하고 선택합니다. 기본으로 다음 엔진이 등록됩니다.
+
+- kisa: KISA_SEED_128_CBC 서브모듈 (compile.sh로 빌드 필요)
+- numpy: NumPy 벡터화 구현 (numpy 설치 필요)
+- python: 순수 파이썬 구현 (항상 사용 가능)
+
+기본 엔진은 위 순서대로 사용 가능한 첫 엔진이며, 환경 변수 KGU_SEED_ENGINE 또는
+set_default_engine()으로 바꿀 수 있습니다.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+# 기본 엔진 선택 우선순위
+DEFAULT_ENGINE_ORDER = ("kisa", "numpy", "python")
+
+_loaders: Dict[str, Callable[[], type]] = {}
+_loaded: Dict[str, type] = {}
+_default_engine: Optional[str] = os.environ.get("KGU_SEED_ENGINE") or None
+_lock = threading.Lock()
+
+
+def register_engine(name: str, loader: Callable[[], type]) -> None:
+    """
+    SEED 엔진을 등록합니다.
+
+    Args:
+        name: 엔진 이름
+        loader: 암호화 클래스를 반환하는 함수 (의존성이 없으면 ImportError 발생)
+    """
+    with _lock:
+        _loaders[name] = loader
+        _loaded.pop(name, None)
+
+
+def _load_kisa() -> type:
+    from kgu_library.KISA_SEED_128_CBC.seed import SeedCbcCipher
+
+    return SeedCbcCipher
+
+
+def _load_numpy() -> type:
+    from .seed_numpy import NumpySeedCbcCipher
+
+    return NumpySeedCbcCipher
+
+
+def _load_python() -> type:
+    from .seed import PySeedCbcCipher
+
+    return PySeedCbcCipher
+
+
+register_engine("kisa", _load_kisa)
+register_engine("numpy", _load_numpy)
+register_engine("python", _load_python)
+
+
+def _try_load(name: str) -> Optional[type]:
+    """엔진 클래스를 불러옵니다. 불러올 수 없으면 None을 반환합니다."""
+    with _lock:
+        if name in _loaded:
+            return _loaded[name]
+        loader = _loaders.get(name)
+
+    if loader is None:
+        return None
+
+    try:
+        cipher_class = loader()
+    except ImportError:
+        return None
+
+    with _lock:
+        _loaded[name] = cipher_class
+    return cipher_class
+
+
+def available_engines() -> List[str]:
+    """
+    현재 환경에서 사용 가능한 엔진 이름 목록을 반환합니다.
+
+    Returns:
+        사용 가능한 엔진 이름 목록
+    """
+    return [name for name in list(_loaders) if _try_load(name) is not None]
+
+
+def get_default_engine_name() -> str:
+    """
+    기본 엔진 이름을 반환합니다.
+
+    Returns:
+        기본 엔진 이름
+
+    Raises:
+        RuntimeError: 사용 가능한 엔진이 없는 경우
+    """
+    if _default_engine is not None:
+        return _default_engine
+
+    for name in DEFAULT_ENGINE_ORDER:
+        if _try_load(name) is not None:
+            return name
+
+    raise RuntimeError("사용 가능한 SEED 엔진이 없습니다")
+
+
+def set_default_engine(name: Optional[str]) -> None:
+    """
+    기본 엔진을 지정합니다.
+
+    Args:
+        name: 엔진 이름 (None이면 우선순위에 따라 자동 선택)
+
+    Raises:
+        ValueError: 사용할 수 없는 엔진인 경우
+    """
+    global _default_engine
+
+    if name is not None and _try_load(name) is None:
+        raise ValueError(f"사용할 수 없는 SEED 엔진입니다: {name}")
+    _default_engine = name
+
+
+def get_engine(name: Optional[str] = None) -> type:
+    """
+    엔진 이름에 해당하는 SEED CBC 암호화 클래스를 반환합니다.
+
+    Args:
+        name: 엔진 이름 (None이면 기본 엔진)
+
+    Returns:
+        key/iv 인자로 생성하는 암호화 클래스
+
+    Raises:
+        ValueError: 사용할 수 없는 엔진인 경우
+    """
+    if name is None:
+        name = get_default_engine_name()
+
+    cipher_class = _try_load(name)
+    if cipher_class is None:
+        raise ValueError(f"사용할 수 없는 SEED 엔진입니다: {name}")
+    return cipher_class
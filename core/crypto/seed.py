@@ -0,0 +1,325 @@
+"""
+순수 파이썬 SEED-128-CBC 구현
+
+KISA SEED_128_CBC 모듈을 컴파일하지 않은 환경에서도 사용할 수 있는 내장 엔진입니다.
+KISA 모듈의 SeedCbcCipher와 같은 인터페이스(key/iv 생성자, encrypt/decrypt)를 제공하며,
+패딩은 PKCS#7을 사용합니다.
+"""
+
+from typing import List, Sequence, Tuple
+
+from .seed_tables import KC, SS0, SS1, SS2, SS3
+
+BLOCK_SIZE = 16
+
+_MASK = 0xFFFFFFFF
+
+
+def _g(x: int) -> int:
+    """SEED G 함수 (확장 S-box 테이블 조회)"""
+    return (
+        SS0[x & 0xFF]
+        ^ SS1[(x >> 8) & 0xFF]
+        ^ SS2[(x >> 16) & 0xFF]
+        ^ SS3[(x >> 24) & 0xFF]
+    )
+
+
+def expand_key(key: bytes) -> Tuple[int, ...]:
+    """
+    128비트 키로부터 32개의 라운드 키를 생성합니다.
+
+    Args:
+        key: 16바이트 암호화 키
+
+    Returns:
+        라운드 키 튜플 (K0, K1, ..., K31)
+
+    Raises:
+        ValueError: 키 길이가 16바이트가 아닌 경우
+    """
+    if len(key) != BLOCK_SIZE:
+        raise ValueError(f"SEED 키는 16바이트여야 합니다: {len(key)}바이트")
+
+    a = int.from_bytes(key[0:4], "big")
+    b = int.from_bytes(key[4:8], "big")
+    c = int.from_bytes(key[8:12], "big")
+    d = int.from_bytes(key[12:16], "big")
+
+    round_keys = []
+    for i in range(16):
+        round_keys.append(_g((a + c - KC[i]) & _MASK))
+        round_keys.append(_g((b - d + KC[i]) & _MASK))
+
+        if i % 2 == 0:
+            # A||B 를 8비트 오른쪽 회전
+            a, b = ((a >> 8) | (b << 24)) & _MASK, ((b >> 8) | (a << 24)) & _MASK
+        else:
+            # C||D 를 8비트 왼쪽 회전
+            c, d = ((c << 8) | (d >> 24)) & _MASK, ((d << 8) | (c >> 24)) & _MASK
+
+    return tuple(round_keys)
+
+
+def decryption_round_keys(round_keys: Sequence[int]) -> Tuple[int, ...]:
+    """
+    복호화용 라운드 키 순서를 반환합니다 (라운드 키 쌍의 역순).
+
+    Args:
+        round_keys: expand_key가 생성한 라운드 키
+
+    Returns:
+        복호화 순서로 정렬된 라운드 키 튜플
+    """
+    pairs = [round_keys[i : i + 2] for i in range(0, len(round_keys), 2)]
+    return tuple(k for pair in reversed(pairs) for k in pair)
+
+
+def process_block(round_keys: Sequence[int], block: bytes) -> bytes:
+    """
+    16바이트 블록 하나를 SEED로 처리합니다.
+
+    암호화 라운드 키를 주면 암호화, 복호화 라운드 키를 주면 복호화가 됩니다.
+
+    Args:
+        round_keys: 라운드 키 (암호화 또는 복호화 순서)
+        block: 16바이트 입력 블록
+
+    Returns:
+        16바이트 출력 블록
+    """
+    g = _g
+    l0 = int.from_bytes(block[0:4], "big")
+    l1 = int.from_bytes(block[4:8], "big")
+    r0 = int.from_bytes(block[8:12], "big")
+    r1 = int.from_bytes(block[12:16], "big")
+
+    for i in range(0, 32, 4):
+        # 왼쪽 절반 갱신: L ^= F(R, K[i], K[i+1])
+        t0 = r0 ^ round_keys[i]
+        t1 = g((r1 ^ round_keys[i + 1]) ^ t0)
+        t0 = g((t0 + t1) & _MASK)
+        t1 = g((t1 + t0) & _MASK)
+        l0 ^= (t0 + t1) & _MASK
+        l1 ^= t1
+
+        # 오른쪽 절반 갱신: R ^= F(L, K[i+2], K[i+3])
+        t0 = l0 ^ round_keys[i + 2]
+        t1 = g((l1 ^ round_keys[i + 3]) ^ t0)
+        t0 = g((t0 + t1) & _MASK)
+        t1 = g((t1 + t0) & _MASK)
+        r0 ^= (t0 + t1) & _MASK
+        r1 ^= t1
+
+    return (
+        r0.to_bytes(4, "big")
+        + r1.to_bytes(4, "big")
+        + l0.to_bytes(4, "big")
+        + l1.to_bytes(4, "big")
+    )
+
+
+def pkcs7_pad(data: bytes) -> bytes:
+    """PKCS#7 패딩을 추가합니다."""
+    pad_len = BLOCK_SIZE - len(data) % BLOCK_SIZE
+    return bytes(data) + bytes([pad_len]) * pad_len
+
+
+def pkcs7_unpad_length(data) -> int:
+    """
+    PKCS#7 패딩을 검증하고 패딩을 제외한 데이터 길이를 반환합니다.
+
+    Raises:
+        ValueError: 패딩이 올바르지 않은 경우
+    """
+    if not data or len(data) % BLOCK_SIZE:
+        raise ValueError("복호화 데이터 길이가 블록 크기의 배수가 아닙니다")
+
+    pad_len = data[-1]
+    if (
+        pad_len < 1
+        or pad_len > BLOCK_SIZE
+        or any(b != pad_len for b in data[-pad_len:])
+    ):
+        raise ValueError("PKCS#7 패딩이 올바르지 않습니다")
+
+    return len(data) - pad_len
+
+
+def _xor_block(a: bytes, b: bytes) -> bytes:
+    """16바이트 블록 두 개를 XOR 합니다."""
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(
+        BLOCK_SIZE, "big"
+    )
+
+
+class PySeedCbcCipher:
+    """순수 파이썬 SEED-128-CBC 암호화 클래스"""
+
+    # 여러 메시지를 한 번에 처리하는 벡터화 경로 제공 여부
+    VECTORIZED = False
+
+    def __init__(self, key: bytes, iv: bytes):
+        """
+        암호화 객체 초기화 (라운드 키는 생성 시 한 번만 계산)
+
+        Args:
+            key: 16바이트 암호화 키
+            iv: 16바이트 초기화 벡터
+
+        Raises:
+            ValueError: 키 또는 IV 길이가 올바르지 않은 경우
+        """
+        if len(iv) != BLOCK_SIZE:
+            raise ValueError(f"SEED IV는 16바이트여야 합니다: {len(iv)}바이트")
+
+        self.key = bytes(key)
+        self.iv = bytes(iv)
+        self.encryption_keys = expand_key(self.key)
+        self.decryption_keys = decryption_round_keys(self.encryption_keys)
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        """
+        평문을 암호화합니다 (PKCS#7 패딩 적용).
+
+        Args:
+            plaintext: 평문 바이트
+
+        Returns:
+            암호문 바이트
+        """
+        return self.encrypt_blocks(pkcs7_pad(plaintext), self.iv)
+
+    def decrypt(self, ciphertext: bytes) -> bytes:
+        """
+        암호문을 복호화하고 PKCS#7 패딩을 제거합니다.
+
+        Args:
+            ciphertext: 암호문 바이트
+
+        Returns:
+            평문 바이트
+
+        Raises:
+            ValueError: 암호문 길이 또는 패딩이 올바르지 않은 경우
+        """
+        if not ciphertext:
+            raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다")
+
+        plain = self.decrypt_blocks(ciphertext, self.iv)
+        return plain[: pkcs7_unpad_length(plain)]
+
+    def encrypt_blocks(self, data, iv: bytes) -> bytes:
+        """
+        블록 단위로 정렬된 데이터를 패딩 없이 CBC 암호화합니다.
+
+        스트리밍 처리처럼 메시지를 나누어 암호화할 때 사용하며, iv에는 직전
+        암호문 블록(처음에는 초기화 벡터)을 넘깁니다.
+
+        Args:
+            data: 길이가 16의 배수인 평문
+            iv: CBC 체인 블록
+
+        Returns:
+            암호문 바이트
+
+        Raises:
+            ValueError: 데이터 길이가 블록 크기의 배수가 아닌 경우
+        """
+        if len(data) % BLOCK_SIZE:
+            raise ValueError("데이터 길이가 블록 크기의 배수가 아닙니다")
+
+        keys = self.encryption_keys
+        chain = bytes(iv)
+        out = bytearray()
+
+        for i in range(0, len(data), BLOCK_SIZE):
+            chain = process_block(keys, _xor_block(data[i : i + BLOCK_SIZE], chain))
+            out += chain
+
+        return bytes(out)
+
+    def decrypt_blocks(self, data, iv: bytes) -> bytes:
+        """
+        블록 단위로 정렬된 암호문을 CBC 복호화합니다 (패딩 제거 없음).
+
+        Args:
+            data: 길이가 16의 배수인 암호문
+            iv: CBC 체인 블록 (직전 암호문 블록 또는 초기화 벡터)
+
+        Returns:
+            패딩을 포함한 평문 바이트
+
+        Raises:
+            ValueError: 암호문 길이가 블록 크기의 배수가 아닌 경우
+        """
+        if len(data) % BLOCK_SIZE:
+            raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다")
+
+        keys = self.decryption_keys
+        chain = bytes(iv)
+        out = bytearray()
+
+        for i in range(0, len(data), BLOCK_SIZE):
+            block = bytes(data[i : i + BLOCK_SIZE])
+            out += _xor_block(process_block(keys, block), chain)
+            chain = block
+
+        return bytes(out)
+
+    def decrypt_into(self, ciphertext, out: bytearray) -> int:
+        """
+        암호문을 미리 할당된 버퍼에 복호화합니다.
+
+        out에는 패딩을 포함한 평문이 기록되며, 반환값은 패딩을 제외한 평문 길이입니다.
+        out이 ciphertext와 같은 bytearray여도 됩니다 (제자리 복호화).
+
+        Args:
+            ciphertext: 암호문 (bytes, bytearray 또는 memoryview)
+            out: 암호문 길이 이상의 bytearray
+
+        Returns:
+            패딩을 제외한 평문 길이
+
+        Raises:
+            ValueError: 암호문 길이, 버퍼 크기 또는 패딩이 올바르지 않은 경우
+        """
+        size = len(ciphertext)
+        if not size or size % BLOCK_SIZE:
+            raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다")
+        if len(out) < size:
+            raise ValueError("출력 버퍼가 암호문보다 작습니다")
+
+        keys = self.decryption_keys
+        chain = self.iv
+
+        for i in range(0, size, BLOCK_SIZE):
+            block = bytes(ciphertext[i : i + BLOCK_SIZE])
+            out[i : i + BLOCK_SIZE] = _xor_block(process_block(keys, block), chain)
+            chain = block
+
+        return pkcs7_unpad_length(memoryview(out)[:size])
+
+    def encrypt_many(self, payloads: Sequence[bytes]) -> List[bytes]:
+        """
+        여러 평문을 암호화합니다.
+
+        Args:
+            payloads: 평문 바이트 목록
+
+        Returns:
+            입력 순서와 같은 순서의 암호문 목록
+        """
+        return [self.encrypt(payload) for payload in payloads]
+
+    def decrypt_many(self, payloads: Sequence[bytes]) -> List[bytes]:
+        """
+        여러 암호문을 복호화합니다.
+
+        Args:
+            payloads: 암호문 바이트 목록
+
+        Returns:
+            입력 순서와 같은 순서의 평문 목록
+        """
+        return [self.decrypt(payload) for payload in payloads]
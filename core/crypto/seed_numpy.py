@@ -0,0 +1,219 @@
+"""
+NumPy 기반 SEED-128-CBC 구현
+
+SS0~SS3 테이블을 NumPy 배열로 두고 여러 블록을 한 번에 처리합니다.
+CBC 암호화는 메시지 안에서는 순차적이지만 메시지끼리는 독립이므로 여러 메시지의
+같은 위치 블록을 묶어 처리하고, CBC 복호화는 모든 블록을 한 번에 처리합니다.
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from .seed import BLOCK_SIZE, PySeedCbcCipher, pkcs7_pad, pkcs7_unpad_length
+from .seed_tables import SS0, SS1, SS2, SS3
+
+_SS0 = np.array(SS0, dtype=np.uint32)
+_SS1 = np.array(SS1, dtype=np.uint32)
+_SS2 = np.array(SS2, dtype=np.uint32)
+_SS3 = np.array(SS3, dtype=np.uint32)
+
+# 이 블록 수 미만의 단일 메시지 복호화는 순수 파이썬 경로가 더 빠름
+_MIN_VECTOR_BLOCKS = 8
+
+
+def _g(x: np.ndarray) -> np.ndarray:
+    """벡터화된 SEED G 함수"""
+    return (
+        _SS0[x & 0xFF] ^ _SS1[(x >> 8) & 0xFF] ^ _SS2[(x >> 16) & 0xFF] ^ _SS3[x >> 24]
+    )
+
+
+def process_blocks(round_keys: Sequence[np.uint32], words: np.ndarray) -> np.ndarray:
+    """
+    (N, 4) 형태의 32비트 워드 배열로 표현된 N개 블록을 한 번에 처리합니다.
+
+    Args:
+        round_keys: 라운드 키 (암호화 또는 복호화 순서, np.uint32)
+        words: 빅엔디언 워드로 나눈 입력 블록 배열
+
+    Returns:
+        같은 형태의 출력 블록 배열
+    """
+    l0 = words[:, 0].copy()
+    l1 = words[:, 1].copy()
+    r0 = words[:, 2].copy()
+    r1 = words[:, 3].copy()
+
+    for i in range(0, 32, 4):
+        t0 = r0 ^ round_keys[i]
+        t1 = _g(r1 ^ round_keys[i + 1] ^ t0)
+        t0 = _g(t0 + t1)
+        t1 = _g(t1 + t0)
+        l0 ^= t0 + t1
+        l1 ^= t1
+
+        t0 = l0 ^ round_keys[i + 2]
+        t1 = _g(l1 ^ round_keys[i + 3] ^ t0)
+        t0 = _g(t0 + t1)
+        t1 = _g(t1 + t0)
+        r0 ^= t0 + t1
+        r1 ^= t1
+
+    return np.stack([r0, r1, l0, l1], axis=1)
+
+
+def _to_words(data) -> np.ndarray:
+    """바이트 데이터를 (N, 4) 워드 배열로 변환합니다."""
+    return np.frombuffer(data, dtype=">u4").astype(np.uint32).reshape(-1, 4)
+
+
+def _to_bytes(words: np.ndarray) -> bytes:
+    """(N, 4) 워드 배열을 바이트로 변환합니다."""
+    return words.astype(">u4").tobytes()
+
+
+class NumpySeedCbcCipher(PySeedCbcCipher):
+    """NumPy 벡터화 SEED-128-CBC 암호화 클래스"""
+
+    VECTORIZED = True
+
+    def __init__(self, key: bytes, iv: bytes):
+        """
+        암호화 객체 초기화
+
+        Args:
+            key: 16바이트 암호화 키
+            iv: 16바이트 초기화 벡터
+        """
+        super().__init__(key, iv)
+        self._enc_keys = [np.uint32(k) for k in self.encryption_keys]
+        self._dec_keys = [np.uint32(k) for k in self.decryption_keys]
+        self._iv_words = _to_words(self.iv)
+
+    def _decrypt_raw(self, ciphertext, iv_words: np.ndarray) -> np.ndarray:
+        """CBC 복호화 후 패딩을 제거하지 않은 평문 워드 배열을 반환합니다."""
+        words = _to_words(ciphertext)
+        chain = np.concatenate([iv_words, words[:-1]])
+        return process_blocks(self._dec_keys, words) ^ chain
+
+    def decrypt_blocks(self, data, iv: bytes) -> bytes:
+        """
+        블록 단위로 정렬된 암호문을 CBC 복호화합니다 (패딩 제거 없음).
+
+        모든 블록을 한 번에 복호화한 뒤 이전 암호문 블록과 XOR 합니다.
+
+        Args:
+            data: 길이가 16의 배수인 암호문
+            iv: CBC 체인 블록 (직전 암호문 블록 또는 초기화 벡터)
+
+        Returns:
+            패딩을 포함한 평문 바이트
+
+        Raises:
+            ValueError: 암호문 길이가 블록 크기의 배수가 아닌 경우
+        """
+        if len(data) < _MIN_VECTOR_BLOCKS * BLOCK_SIZE:
+            return super().decrypt_blocks(data, iv)
+        if len(data) % BLOCK_SIZE:
+            raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다")
+
+        return _to_bytes(self._decrypt_raw(data, _to_words(iv)))
+
+    def decrypt_into(self, ciphertext, out: bytearray) -> int:
+        """
+        암호문을 미리 할당된 버퍼에 복호화합니다.
+
+        결과를 out 위의 NumPy 뷰에 직접 기록하므로 중간 bytes 객체를 만들지 않습니다.
+
+        Args:
+            ciphertext: 암호문 (bytes, bytearray 또는 memoryview)
+            out: 암호문 길이 이상의 bytearray
+
+        Returns:
+            패딩을 제외한 평문 길이
+
+        Raises:
+            ValueError: 암호문 길이, 버퍼 크기 또는 패딩이 올바르지 않은 경우
+        """
+        size = len(ciphertext)
+        if size < _MIN_VECTOR_BLOCKS * BLOCK_SIZE:
+            return super().decrypt_into(ciphertext, out)
+        if size % BLOCK_SIZE:
+            raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다")
+        if len(out) < size:
+            raise ValueError("출력 버퍼가 암호문보다 작습니다")
+
+        plain = self._decrypt_raw(ciphertext, self._iv_words)
+        np.frombuffer(out, dtype=">u4", count=size // 4)[:] = plain.reshape(-1)
+        return pkcs7_unpad_length(memoryview(out)[:size])
+
+    def encrypt_many(self, payloads: Sequence[bytes]) -> List[bytes]:
+        """
+        여러 평문을 암호화합니다.
+
+        메시지마다 j번째 블록을 한 배열로 묶어 블록 위치 순서대로 처리합니다.
+
+        Args:
+            payloads: 평문 바이트 목록
+
+        Returns:
+            입력 순서와 같은 순서의 암호문 목록
+        """
+        if not payloads:
+            return []
+
+        padded = [pkcs7_pad(payload) for payload in payloads]
+        counts = np.array([len(p) // BLOCK_SIZE for p in padded])
+        max_blocks = int(counts.max())
+
+        # (메시지 수, 최대 블록 수, 4) 배열에 모든 평문 블록 배치
+        blocks = np.zeros((len(padded), max_blocks, 4), dtype=np.uint32)
+        for i, data in enumerate(padded):
+            blocks[i, : counts[i]] = _to_words(data)
+
+        chain = np.repeat(self._iv_words, len(padded), axis=0)
+        for j in range(max_blocks):
+            active = (counts > j)[:, None]
+            encrypted = process_blocks(self._enc_keys, blocks[:, j] ^ chain)
+            chain = np.where(active, encrypted, chain)
+            blocks[:, j] = chain
+
+        return [_to_bytes(blocks[i, : counts[i]]) for i in range(len(padded))]
+
+    def decrypt_many(self, payloads: Sequence[bytes]) -> List[bytes]:
+        """
+        여러 암호문을 복호화합니다.
+
+        모든 메시지의 블록을 하나의 배열로 합쳐 한 번에 복호화합니다.
+
+        Args:
+            payloads: 암호문 바이트 목록
+
+        Returns:
+            입력 순서와 같은 순서의 평문 목록
+
+        Raises:
+            ValueError: 암호문 길이 또는 패딩이 올바르지 않은 경우
+        """
+        if not payloads:
+            return []
+
+        for payload in payloads:
+            if not payload or len(payload) % BLOCK_SIZE:
+                raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다")
+
+        words = [_to_words(payload) for payload in payloads]
+        chains = [np.concatenate([self._iv_words, w[:-1]]) for w in words]
+        plain = _to_bytes(
+            process_blocks(self._dec_keys, np.concatenate(words))
+            ^ np.concatenate(chains)
+        )
+
+        results = []
+        offset = 0
+        for payload in payloads:
+            data = plain[offset : offset + len(payload)]
+            results.append(data[: pkcs7_unpad_length(data)])
+            offset += len(payload)
+        return results
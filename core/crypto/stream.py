@@ -0,0 +1,204 @@
+"""
+SEED CBC 스트리밍 암호화/복호화
+
+응답 본문을 모두 받기 전에 받은 만큼 복호화할 수 있도록 update()/finalize()
+방식의 점진적 CBC 암호화기와 복호화기를 제공합니다. 16진수 문자열 조각
+(response.iter_content()의 결과 등)도 그대로 넣을 수 있습니다.
+"""
+
+import binascii
+from typing import Optional, Union
+
+from .engines import available_engines, get_default_engine_name, get_engine
+from .seed import BLOCK_SIZE, pkcs7_pad, pkcs7_unpad_length
+from .utils import get_seed_cipher
+
+Chunk = Union[bytes, bytearray, memoryview, str]
+
+
+def _block_cipher(key: bytes, iv: bytes, engine: Optional[str]):
+    """블록 단위 API(encrypt_blocks/decrypt_blocks)를 제공하는 암호화 객체를 반환합니다."""
+    if engine is None:
+        engine = get_default_engine_name()
+        if not hasattr(get_engine(engine), "decrypt_blocks"):
+            # 블록 단위 API가 없는 엔진(kisa)은 내장 엔진으로 대체
+            engine = "numpy" if "numpy" in available_engines() else "python"
+
+    cipher = get_seed_cipher(key, iv, engine)
+    if not hasattr(cipher, "decrypt_blocks"):
+        raise ValueError(f"스트리밍을 지원하지 않는 SEED 엔진입니다: {engine}")
+    return cipher
+
+
+class _HexReader:
+    """16진수 조각을 받아 완성된 바이트만 돌려주는 도우미"""
+
+    def __init__(self):
+        self._pending = b""
+
+    def feed(self, chunk: Chunk) -> bytes:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("ascii")
+        # 공백/개행 제거 후, 홀수 개로 끝나는 마지막 글자는 다음 조각으로 넘김
+        data = self._pending + b"".join(bytes(chunk).split())
+        usable = len(data) - len(data) % 2
+        self._pending = data[usable:]
+        return binascii.unhexlify(data[:usable])
+
+    def close(self) -> None:
+        if self._pending:
+            raise ValueError("16진수 문자열의 길이가 홀수입니다")
+
+
+class SeedCbcDecryptor:
+    """점진적 SEED CBC 복호화기"""
+
+    def __init__(
+        self,
+        key: bytes,
+        iv: bytes,
+        hex_input: bool = False,
+        engine: Optional[str] = None,
+    ):
+        """
+        복호화기 초기화
+
+        Args:
+            key: 16바이트 암호화 키
+            iv: 16바이트 초기화 벡터
+            hex_input: True이면 update()에 16진수 문자열 조각을 받음
+            engine: 사용할 SEED 엔진 이름 (None이면 기본 엔진)
+        """
+        self._cipher = _block_cipher(key, iv, engine)
+        self._chain = bytes(iv)
+        self._buffer = bytearray()
+        self._hex = _HexReader() if hex_input else None
+        self._finalized = False
+
+    def update(self, chunk: Chunk) -> bytes:
+        """
+        암호문 조각을 넣고 지금까지 복호화할 수 있는 평문을 반환합니다.
+
+        패딩 제거를 위해 마지막 블록은 finalize()까지 보관합니다.
+
+        Args:
+            chunk: 암호문 조각 (hex_input이면 16진수 문자열 조각)
+
+        Returns:
+            새로 복호화된 평문 바이트 (없으면 빈 바이트)
+
+        Raises:
+            ValueError: finalize() 이후 호출하거나 16진수 형식이 올바르지 않은 경우
+        """
+        if self._finalized:
+            raise ValueError("이미 finalize()가 호출된 복호화기입니다")
+
+        self._buffer += self._hex.feed(chunk) if self._hex else chunk
+
+        # 마지막 한 블록은 남겨두고 완성된 블록만 복호화
+        ready = (len(self._buffer) - 1) // BLOCK_SIZE * BLOCK_SIZE
+        if ready <= 0:
+            return b""
+
+        blocks = bytes(self._buffer[:ready])
+        del self._buffer[:ready]
+
+        plain = self._cipher.decrypt_blocks(blocks, self._chain)
+        self._chain = blocks[-BLOCK_SIZE:]
+        return plain
+
+    def finalize(self) -> bytes:
+        """
+        남은 블록을 복호화하고 PKCS#7 패딩을 제거합니다.
+
+        Returns:
+            마지막 평문 바이트
+
+        Raises:
+            ValueError: 암호문 길이 또는 패딩이 올바르지 않은 경우
+        """
+        if self._finalized:
+            raise ValueError("이미 finalize()가 호출된 복호화기입니다")
+        self._finalized = True
+
+        if self._hex:
+            self._hex.close()
+        if len(self._buffer) != BLOCK_SIZE:
+            raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다")
+
+        plain = self._cipher.decrypt_blocks(bytes(self._buffer), self._chain)
+        self._buffer.clear()
+        return plain[: pkcs7_unpad_length(plain)]
+
+
+class SeedCbcEncryptor:
+    """점진적 SEED CBC 암호화기"""
+
+    def __init__(
+        self,
+        key: bytes,
+        iv: bytes,
+        hex_output: bool = False,
+        engine: Optional[str] = None,
+    ):
+        """
+        암호화기 초기화
+
+        Args:
+            key: 16바이트 암호화 키
+            iv: 16바이트 초기화 벡터
+            hex_output: True이면 암호문을 16진수 문자열(bytes)로 반환
+            engine: 사용할 SEED 엔진 이름 (None이면 기본 엔진)
+        """
+        self._cipher = _block_cipher(key, iv, engine)
+        self._chain = bytes(iv)
+        self._buffer = bytearray()
+        self._hex_output = hex_output
+        self._finalized = False
+
+    def _emit(self, data: bytes) -> bytes:
+        if not data:
+            return b""
+        encrypted = self._cipher.encrypt_blocks(data, self._chain)
+        self._chain = encrypted[-BLOCK_SIZE:]
+        return binascii.hexlify(encrypted) if self._hex_output else encrypted
+
+    def update(self, chunk: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        평문 조각을 넣고 완성된 블록의 암호문을 반환합니다.
+
+        Args:
+            chunk: 평문 조각
+
+        Returns:
+            새로 암호화된 암호문 (없으면 빈 바이트)
+
+        Raises:
+            ValueError: finalize() 이후 호출한 경우
+        """
+        if self._finalized:
+            raise ValueError("이미 finalize()가 호출된 암호화기입니다")
+
+        self._buffer += chunk
+        ready = len(self._buffer) // BLOCK_SIZE * BLOCK_SIZE
+        data = bytes(self._buffer[:ready])
+        del self._buffer[:ready]
+        return self._emit(data)
+
+    def finalize(self) -> bytes:
+        """
+        남은 평문에 PKCS#7 패딩을 붙여 암호화합니다.
+
+        Returns:
+            마지막 암호문
+
+        Raises:
+            ValueError: 이미 finalize()가 호출된 경우
+        """
+        if self._finalized:
+            raise ValueError("이미 finalize()가 호출된 암호화기입니다")
+        self._finalized = True
+
+        data = pkcs7_pad(bytes(self._buffer))
+        self._buffer.clear()
+        return self._emit(data)
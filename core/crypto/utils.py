@@ -2,6 +2,15 @@
 암호화 관련 유틸리티 함수
 """
 
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .engines import get_default_engine_name, get_engine
+
+# 엔진/키/IV 조합별 SEED CBC 암호화 객체 캐시 (프로세스 전역)
+_seed_cipher_cache: Dict[Tuple[str, bytes, bytes], Any] = {}
+_seed_cipher_cache_lock = threading.Lock()
+
 
 def hex_comma_str_to_bytes(hex_comma_str: str) -> bytes:
     """
@@ -33,20 +42,58 @@ def bytes_to_hex_comma_str(byte_data: bytes) -> str:
     return ",".join([f"{b:02X}" for b in byte_data])
 
 
-def create_seed_cipher(key_str: str, iv_str: str):
+def create_seed_cipher(key_str: str, iv_str: str, engine: Optional[str] = None):
     """
     SEED CBC 암호화 객체를 생성합니다.
 
     Args:
         key_str: 쉼표로 구분된 16진수 키 문자열
         iv_str: 쉼표로 구분된 16진수 IV 문자열
+        engine: 사용할 SEED 엔진 이름 (None이면 기본 엔진)
 
     Returns:
         SeedCbcCipher 객체
     """
-    from kgu_library.KISA_SEED_128_CBC.seed import SeedCbcCipher
-
     key = hex_comma_str_to_bytes(key_str)
     iv = hex_comma_str_to_bytes(iv_str)
 
-    return SeedCbcCipher(key=key, iv=iv)
+    return get_engine(engine)(key=key, iv=iv)
+
+
+def get_seed_cipher(key: bytes, iv: bytes, engine: Optional[str] = None):
+    """
+    키/IV 조합에 대해 공유되는 SEED CBC 암호화 객체를 반환합니다.
+
+    같은 키/IV로 처음 호출될 때만 객체를 생성(라운드 키 확장)하고,
+    이후에는 프로세스 전역 캐시에 보관된 객체를 재사용합니다.
+
+    Args:
+        key: 16바이트 암호화 키
+        iv: 16바이트 초기화 벡터
+        engine: 사용할 SEED 엔진 이름 (None이면 기본 엔진)
+
+    Returns:
+        SeedCbcCipher 객체
+    """
+    if engine is None:
+        engine = get_default_engine_name()
+
+    cache_key = (engine, bytes(key), bytes(iv))
+    cipher = _seed_cipher_cache.get(cache_key)
+    if cipher is not None:
+        return cipher
+
+    cipher_class = get_engine(engine)
+
+    with _seed_cipher_cache_lock:
+        cipher = _seed_cipher_cache.get(cache_key)
+        if cipher is None:
+            cipher = cipher_class(key=cache_key[1], iv=cache_key[2])
+            _seed_cipher_cache[cache_key] = cipher
+        return cipher
+
+
+def clear_seed_cipher_cache() -> None:
+    """공유 SEED CBC 암호화 객체 캐시를 비웁니다."""
+    with _seed_cipher_cache_lock:
+        _seed_cipher_cache.clear()
@@ -0,0 +1,38 @@
+"""
+HTTP 전송 계층 모듈
+
+이 모듈은 여러 API 클라이언트가 공유하는 HTTP 연결 풀 설정, 동일 요청 합치기, 요청
+재시도 정책, 요청 속도 제한을 제공합니다.
+"""
+
+from .ratelimit import (
+    BucketBackend,
+    FileBucketBackend,
+    MemoryBucketBackend,
+    RateLimiter,
+)
+from .retry import (
+    IDEMPOTENT_METHODS,
+    NO_RETRY,
+    AttemptRecord,
+    DeadlineExceeded,
+    RetryPolicy,
+)
+from .singleflight import SingleFlight
+from .transport import DEFAULT_TRANSPORT_CONFIG, Transport, TransportConfig
+
+__all__ = [
+    "AttemptRecord",
+    "BucketBackend",
+    "DEFAULT_TRANSPORT_CONFIG",
+    "DeadlineExceeded",
+    "FileBucketBackend",
+    "IDEMPOTENT_METHODS",
+    "MemoryBucketBackend",
+    "NO_RETRY",
+    "RateLimiter",
+    "RetryPolicy",
+    "SingleFlight",
+    "Transport",
+    "TransportConfig",
+]
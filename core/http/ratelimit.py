@@ -0,0 +1,295 @@
+"""
+클라이언트 측 요청 속도 제한 (토큰 버킷)
+
+호스트별, 계정별 토큰 버킷으로 요청 속도를 제한하여 서버의 요청 제한(throttling)에
+걸리지 않도록 합니다. 버킷은 초당 rate개씩 토큰이 차고 최대 burst개까지 쌓이며, 요청
+하나가 토큰 하나를 사용합니다. 호스트와 계정 버킷의 토큰은 함께 확인하여 둘 다 남아
+있을 때만 한꺼번에 사용합니다.
+
+버킷 상태는 기본적으로 프로세스 메모리(MemoryBucketBackend)에 두어 스레드끼리
+공유하며, 여러 프로세스가 함께 제한을 지켜야 하면 파일 잠금을 사용하는
+FileBucketBackend를 사용합니다.
+
+사용 예:
+    limiter = RateLimiter(rate=5, burst=10, account_rate=1, account_burst=3)
+    client = LibraryHTTPClient(rate_limiter=limiter)
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows에서는 파일 백엔드를 사용할 수 없음
+    fcntl = None
+
+# (버킷 키, 초당 채워지는 토큰 수, 최대 토큰 수)
+BucketSpec = Tuple[str, float, float]
+
+
+def _take(
+    states: Dict[str, List[float]],
+    buckets: Sequence[BucketSpec],
+    tokens: float,
+    now: float,
+) -> float:
+    """
+    버킷 상태를 갱신하고 모든 버킷에 토큰이 있으면 사용합니다.
+
+    Args:
+        states: 버킷 키 -> [남은 토큰 수, 마지막 갱신 시각] (제자리에서 수정)
+        buckets: 확인할 버킷 목록
+        tokens: 사용할 토큰 수
+        now: 현재 시각
+
+    Returns:
+        float: 0이면 토큰을 사용함, 양수이면 토큰이 찰 때까지 기다려야 할 시간(초)
+    """
+    levels = []
+    wait = 0.0
+    for key, rate, capacity in buckets:
+        state = states.get(key)
+        if state is None:
+            level = capacity
+        else:
+            level = min(capacity, state[0] + max(now - state[1], 0.0) * rate)
+        levels.append(level)
+        if level < tokens:
+            wait = max(wait, (tokens - level) / rate if rate > 0 else math.inf)
+
+    if wait > 0:
+        return wait
+    for (key, _, _), level in zip(buckets, levels):
+        states[key] = [level - tokens, now]
+    return 0.0
+
+
+def _prune(states: Dict[str, List[float]], now: float, max_idle: float) -> None:
+    """오랫동안 사용하지 않아 가득 찼을 버킷 상태를 지움"""
+    for key in [
+        key for key, (_, updated) in states.items() if now - updated > max_idle
+    ]:
+        del states[key]
+
+
+class BucketBackend(ABC):
+    """토큰 버킷 상태 저장소 기본 클래스"""
+
+    @abstractmethod
+    def take(self, buckets: Sequence[BucketSpec], tokens: float = 1.0) -> float:
+        """
+        모든 버킷에 토큰이 있으면 원자적으로 사용합니다.
+
+        Args:
+            buckets: 확인할 버킷 목록
+            tokens: 사용할 토큰 수
+
+        Returns:
+            float: 0이면 토큰을 사용함, 양수이면 기다려야 할 시간(초)
+        """
+        raise NotImplementedError
+
+
+class MemoryBucketBackend(BucketBackend):
+    """프로세스 메모리에 버킷 상태를 두는 저장소 (스레드끼리 공유)"""
+
+    def __init__(self, max_idle: float = 3600.0):
+        """
+        저장소 초기화
+
+        Args:
+            max_idle: 이 시간(초) 동안 쓰지 않은 버킷 상태는 지움
+        """
+        self.max_idle = max_idle
+        self._states: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._last_prune = time.monotonic()
+
+    def take(self, buckets: Sequence[BucketSpec], tokens: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_prune > self.max_idle:
+                _prune(self._states, now, self.max_idle)
+                self._last_prune = now
+            return _take(self._states, buckets, tokens, now)
+
+
+class FileBucketBackend(BucketBackend):
+    """파일 잠금으로 여러 프로세스가 버킷 상태를 공유하는 저장소 (POSIX 전용)"""
+
+    def __init__(self, path: str, max_idle: float = 3600.0):
+        """
+        저장소 초기화
+
+        Args:
+            path: 버킷 상태를 저장할 JSON 파일 경로 (없으면 생성)
+            max_idle: 이 시간(초) 동안 쓰지 않은 버킷 상태는 지움
+
+        Raises:
+            RuntimeError: fcntl을 사용할 수 없는 환경인 경우
+        """
+        if fcntl is None:
+            raise RuntimeError(
+                "FileBucketBackend는 fcntl이 있는 환경에서만 사용 가능합니다"
+            )
+        self.path = path
+        self.max_idle = max_idle
+        # 같은 프로세스의 스레드끼리는 파일 잠금 전에 이 잠금으로 순서를 정함
+        self._lock = threading.Lock()
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        os.close(fd)
+
+    def take(self, buckets: Sequence[BucketSpec], tokens: float = 1.0) -> float:
+        with self._lock, open(self.path, "r+", encoding="utf-8") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                data = f.read()
+                try:
+                    states = json.loads(data) if data else {}
+                except ValueError:
+                    # 손상된 상태는 버리고 가득 찬 버킷으로 다시 시작
+                    states = {}
+                # 여러 프로세스가 같은 시계를 보도록 벽시계 사용
+                now = time.time()
+                _prune(states, now, self.max_idle)
+                wait = _take(states, buckets, tokens, now)
+                if wait == 0:
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(states, f)
+                    f.flush()
+                return wait
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """호스트별, 계정별 토큰 버킷 요청 속도 제한"""
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        account_rate: Optional[float] = None,
+        account_burst: Optional[float] = None,
+        host_rates: Optional[Dict[str, Tuple[float, float]]] = None,
+        backend: Optional[BucketBackend] = None,
+    ):
+        """
+        속도 제한 초기화
+
+        Args:
+            rate: 호스트별 초당 요청 수
+            burst: 호스트별로 한꺼번에 보낼 수 있는 최대 요청 수 (None이면 rate와 같음)
+            account_rate: 계정별 초당 요청 수 (None이면 계정별 제한 없음)
+            account_burst: 계정별 최대 요청 수 (None이면 account_rate와 같음)
+            host_rates: 호스트 이름 -> (rate, burst) 호스트별 설정
+            backend: 버킷 상태 저장소 (None이면 프로세스 메모리)
+
+        Raises:
+            ValueError: 속도 설정이 올바르지 않은 경우
+        """
+        if rate <= 0 or (account_rate is not None and account_rate <= 0):
+            raise ValueError("rate는 0보다 커야 합니다")
+        if any(host_rate <= 0 for host_rate, _ in (host_rates or {}).values()):
+            raise ValueError("host_rates의 rate는 0보다 커야 합니다")
+
+        self.rate = rate
+        self.burst = max(burst if burst is not None else rate, 1.0)
+        self.account_rate = account_rate
+        self.account_burst = None
+        if account_rate is not None:
+            self.account_burst = max(
+                account_burst if account_burst is not None else account_rate, 1.0
+            )
+        self.host_rates = {
+            host: (host_rate, max(host_burst, 1.0))
+            for host, (host_rate, host_burst) in (host_rates or {}).items()
+        }
+        self.backend = backend if backend is not None else MemoryBucketBackend()
+        self.sleep = time.sleep
+
+    def buckets(self, host: str, account: Optional[str] = None) -> List[BucketSpec]:
+        """
+        요청 하나가 확인할 버킷 목록
+
+        Args:
+            host: 요청 호스트 이름
+            account: 계정 ID (None이면 호스트 버킷만)
+
+        Returns:
+            List[BucketSpec]: (버킷 키, rate, burst) 목록
+        """
+        rate, burst = self.host_rates.get(host, (self.rate, self.burst))
+        buckets = [(f"host:{host}", rate, burst)]
+        if account is not None and self.account_rate is not None:
+            buckets.append(
+                (f"account:{host}:{account}", self.account_rate, self.account_burst)
+            )
+        return buckets
+
+    def try_acquire(self, host: str, account: Optional[str] = None) -> bool:
+        """
+        기다리지 않고 토큰을 사용합니다 (지연에 민감한 예약 요청용).
+
+        Args:
+            host: 요청 호스트 이름
+            account: 계정 ID
+
+        Returns:
+            bool: 토큰을 사용했으면 True, 남은 토큰이 없으면 False
+        """
+        return self.backend.take(self.buckets(host, account)) == 0
+
+    def acquire(
+        self,
+        host: str,
+        account: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        토큰이 찰 때까지 기다렸다가 사용합니다.
+
+        Args:
+            host: 요청 호스트 이름
+            account: 계정 ID
+            timeout: 최대 대기 시간(초, None이면 계속 대기, 0이면 try_acquire와 같음)
+
+        Returns:
+            bool: 토큰을 사용했으면 True, timeout 안에 사용하지 못했으면 False
+        """
+        return self.take(host, account, timeout) == 0
+
+    def take(
+        self,
+        host: str,
+        account: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """
+        acquire와 같지만 실패하면 토큰이 찰 때까지 더 기다려야 할 시간을 반환합니다.
+
+        Args:
+            host: 요청 호스트 이름
+            account: 계정 ID
+            timeout: 최대 대기 시간(초, None이면 계속 대기, 0이면 기다리지 않음)
+
+        Returns:
+            float: 0이면 토큰을 사용함, 양수이면 다시 시도하기 전에 기다릴 시간(초)
+        """
+        buckets = self.buckets(host, account)
+        end = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.backend.take(buckets)
+            if wait == 0:
+                return 0.0
+            if end is not None:
+                remaining = end - time.monotonic()
+                if wait > remaining:
+                    return wait
+            self.sleep(wait)
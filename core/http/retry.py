@@ -0,0 +1,326 @@
+"""
+HTTP 요청 재시도 정책
+
+일시적인 오류(연결 실패, 429/5xx 응답)가 난 요청을 지수 백오프와 full jitter로 다시
+보냅니다. 대기 시간은 [0, min(backoff_max, backoff_base * 2^n)] 구간에서 무작위로 골라
+많은 클라이언트가 같은 순간에 다시 몰리지 않게 합니다.
+
+멱등하지 않은 요청(좌석 예약 POST 등)은 서버가 처리했을 수 있는 경우 다시 보내지 않습니다.
+연결 자체를 맺지 못한 경우나 서버가 처리하지 않았다고 알려 준 응답(429)만 다시 보냅니다.
+
+각 시도의 결과와 소요 시간은 AttemptRecord로 on_attempt 콜백에 전달됩니다.
+
+사용 예:
+    policy = RetryPolicy(max_attempts=4, on_attempt=lambda r: print(r))
+    client = LibraryHTTPClient(retry=policy)
+"""
+
+import random
+import time
+from email.utils import parsedate_tz, mktime_tz
+from typing import Callable, FrozenSet, Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+# 같은 요청을 여러 번 보내도 결과가 같은 HTTP 메서드
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class AttemptRecord:
+    """요청 시도 한 번의 기록"""
+
+    __slots__ = (
+        "method",
+        "url",
+        "attempt",
+        "latency",
+        "status_code",
+        "error",
+        "delay",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        latency: float,
+        status_code: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        delay: Optional[float] = None,
+    ):
+        """
+        기록 초기화
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            attempt: 시도 번호 (1부터)
+            latency: 요청을 보내고 응답(또는 예외)을 받기까지 걸린 시간(초)
+            status_code: 응답 상태 코드 (예외가 발생했으면 None)
+            error: 발생한 예외
+            delay: 다시 보내기 전 대기할 시간(초, 다시 보내지 않으면 None)
+        """
+        self.method = method
+        self.url = url
+        self.attempt = attempt
+        self.latency = latency
+        self.status_code = status_code
+        self.error = error
+        self.delay = delay
+
+    @property
+    def retried(self) -> bool:
+        """이 시도 뒤에 다시 보냈는지 여부"""
+        return self.delay is not None
+
+    def __repr__(self) -> str:
+        outcome = self.status_code if self.error is None else type(self.error).__name__
+        return (
+            f"AttemptRecord({self.method} {self.url} #{self.attempt}: {outcome}, "
+            f"{self.latency * 1000:.1f}ms, retried={self.retried})"
+        )
+
+
+class DeadlineExceeded(requests.Timeout):
+    """전체 제한 시각이 지나 요청을 (다시) 보내지 못함
+
+    재시도하려던 시도의 예외가 있으면 __cause__로 연결됩니다.
+    """
+
+
+def is_unsent_error(error: BaseException) -> bool:
+    """
+    요청이 서버에 전달되기 전에 실패한 예외인지 확인합니다 (연결 시간 초과, 연결 거부 등).
+
+    Args:
+        error: 요청 중 발생한 예외
+
+    Returns:
+        bool: 서버가 요청을 받지 못했음이 확실하면 True
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    # urllib3의 MaxRetryError.reason이나 원인 예외에 연결 실패가 있는지 확인
+    cause = error.args[0] if error.args else None
+    cause = getattr(cause, "reason", cause)
+    return isinstance(cause, NewConnectionError)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(mktime_tz(parsed) - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """지수 백오프와 full jitter를 사용하는 재시도 정책"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 5.0,
+        retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504}),
+        unprocessed_statuses: FrozenSet[int] = frozenset({429}),
+        respect_retry_after: bool = True,
+        on_attempt: Optional[Callable[[AttemptRecord], None]] = None,
+    ):
+        """
+        정책 초기화
+
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 시도 포함, 1이면 다시 보내지 않음)
+            backoff_base: 첫 재시도 대기 시간의 상한(초)
+            backoff_max: 재시도 대기 시간의 최대 상한(초)
+            retry_statuses: 멱등한 요청을 다시 보낼 응답 상태 코드
+            unprocessed_statuses: 서버가 요청을 처리하지 않았음을 뜻하여 멱등하지 않은
+                요청도 다시 보낼 상태 코드
+            respect_retry_after: 응답의 Retry-After 헤더를 대기 시간으로 사용
+                (backoff_max를 넘지 않음)
+            on_attempt: 시도가 끝날 때마다 AttemptRecord를 받을 함수
+
+        Raises:
+            ValueError: 설정 값이 올바르지 않은 경우
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts는 1 이상이어야 합니다")
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError("대기 시간은 0 이상이어야 합니다")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.unprocessed_statuses = frozenset(unprocessed_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.on_attempt = on_attempt
+        self.sleep = time.sleep
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, "
+            f"backoff_base={self.backoff_base}, backoff_max={self.backoff_max})"
+        )
+
+    def backoff(self, retry: int) -> float:
+        """
+        재시도 대기 시간을 full jitter로 계산합니다.
+
+        Args:
+            retry: 재시도 번호 (0부터)
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        cap = min(self.backoff_max, self.backoff_base * (2 ** min(retry, 32)))
+        return random.uniform(0, cap)
+
+    def should_retry(
+        self,
+        idempotent: bool,
+        response: Optional[requests.Response] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """
+        시도 결과를 보고 다시 보내도 되는지 판단합니다 (남은 횟수는 보지 않음).
+
+        Args:
+            idempotent: 요청이 멱등한지 여부
+            response: 받은 응답
+            error: 발생한 예외
+
+        Returns:
+            bool: 다시 보내도 되면 True
+        """
+        if error is not None:
+            if not isinstance(error, requests.RequestException) or isinstance(
+                error, DeadlineExceeded
+            ):
+                return False
+            # 읽기 시간 초과, 연결 끊김은 서버가 이미 처리했을 수 있음
+            return idempotent or is_unsent_error(error)
+
+        if response is None:
+            return False
+        status = response.status_code
+        if status in self.unprocessed_statuses:
+            return True
+        return idempotent and status in self.retry_statuses
+
+    def call(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], requests.Response],
+        idempotent: Optional[bool] = None,
+        on_attempt: Optional[Callable[[AttemptRecord], None]] = None,
+        deadline: Optional[float] = None,
+    ) -> requests.Response:
+        """
+        요청을 보내고, 정책에 따라 다시 보냅니다.
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL (기록용)
+            send: 요청을 한 번 보내 응답을 반환하는 함수
+            idempotent: 요청이 멱등한지 여부 (None이면 HTTP 메서드로 판단)
+            on_attempt: 정책의 on_attempt와 함께 AttemptRecord를 받을 함수
+            deadline: 모든 시도를 마쳐야 하는 time.monotonic() 기준 시각. 대기 후 이 시각을
+                넘기게 되면 다시 보내지 않고 DeadlineExceeded를 발생시킴
+
+        Returns:
+            requests.Response: 마지막 응답 (재시도 대상 상태 코드일 수 있음)
+
+        Raises:
+            DeadlineExceeded: 다시 보내야 하지만 제한 시각이 지난 경우
+            requests.RequestException: 마지막 시도에서 발생한 예외
+        """
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            attempt += 1
+            response = error = None
+            started = time.perf_counter()
+            try:
+                response = send()
+            except Exception as e:
+                error = e
+            latency = time.perf_counter() - started
+
+            delay = None
+            expired = False
+            if attempt < self.max_attempts and self.should_retry(
+                idempotent, response, error
+            ):
+                delay = self.backoff(attempt - 1)
+                if self.respect_retry_after and response is not None:
+                    retry_after = _parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                    if retry_after is not None:
+                        delay = min(max(delay, retry_after), self.backoff_max)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    delay = None
+                    expired = True
+
+            if self.on_attempt is not None or on_attempt is not None:
+                record = AttemptRecord(
+                    method,
+                    url,
+                    attempt,
+                    latency,
+                    status_code=None if response is None else response.status_code,
+                    error=error,
+                    delay=delay,
+                )
+                for callback in (self.on_attempt, on_attempt):
+                    if callback is not None:
+                        callback(record)
+
+            if response is not None and (delay is not None or expired):
+                # 다시 보내기 전에 연결을 풀에 돌려줌
+                response.close()
+            if expired:
+                raise _deadline_exceeded(attempt, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            self.sleep(delay)
+            if deadline is not None and time.monotonic() >= deadline:
+                # 대기가 예상보다 길어져 제한 시각을 넘긴 경우
+                raise _deadline_exceeded(attempt, response, error)
+
+
+def _deadline_exceeded(
+    attempt: int,
+    response: Optional[requests.Response],
+    error: Optional[BaseException],
+) -> DeadlineExceeded:
+    """재시도를 막은 제한 시각 초과 예외 (마지막 시도의 예외를 원인으로 연결)"""
+    outcome = type(error).__name__ if response is None else response.status_code
+    exceeded = DeadlineExceeded(
+        f"전체 제한 시간 초과 ({attempt}번 시도, 마지막 결과: {outcome})",
+        response=response,
+    )
+    exceeded.__cause__ = error
+    return exceeded
+
+
+# 다시 보내지 않는 정책 (LibraryHTTPClient 기본값)
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -0,0 +1,144 @@
+"""
+동일 요청 합치기 (single-flight)
+
+같은 키의 작업이 이미 진행 중이면 새로 실행하지 않고 진행 중인 작업의 결과를 함께
+받습니다. ttl을 지정하면 완료된 결과를 잠시 보관하여 짧은 시간에 몰린 요청도 한 번만
+실행하며, 만료된 결과는 새 작업을 시작할 때 정리합니다. 결과 객체는 호출한 모든 스레드가 공유하므로 수정하지 않아야 합니다.
+
+사용 예:
+    flight = SingleFlight(ttl=0.5)
+    data = flight.do(("GET", url), lambda: session.get(url).json())
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """진행 중이거나 보관 중인 작업"""
+
+    __slots__ = ("event", "result", "error", "expires")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.expires: Optional[float] = None  # 완료 후 결과 보관 만료 시각
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 작업만 실행하는 요청 합치기"""
+
+    def __init__(self, ttl: float = 0.0):
+        """
+        초기화
+
+        Args:
+            ttl: 완료된 결과를 보관할 시간(초, 0이면 진행 중인 작업만 공유)
+
+        Raises:
+            ValueError: ttl이 음수인 경우
+        """
+        if ttl < 0:
+            raise ValueError("ttl은 0 이상이어야 합니다")
+
+        self.ttl = ttl
+        self._calls: Dict[Hashable, _Call] = {}
+        # 보관한 결과의 (만료 시각, 키, 작업) (ttl이 같으므로 만료 시각 순서)
+        self._expiry: Deque[Tuple[float, Hashable, _Call]] = deque()
+        self._lock = threading.Lock()
+        self.executed = 0  # 실제로 실행한 작업 수
+        self.shared = 0  # 다른 호출의 결과를 함께 받은 횟수
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        key에 해당하는 작업을 실행하거나 진행 중인(보관 중인) 결과를 받습니다.
+
+        Args:
+            key: 같은 작업을 구분하는 키
+            fn: 실행할 작업
+
+        Returns:
+            작업 결과 (다른 호출과 같은 객체일 수 있음)
+
+        Raises:
+            fn이 발생시킨 예외 (진행 중인 작업을 기다린 호출에도 그대로 전달됨)
+        """
+        with self._lock:
+            now = time.monotonic()
+            call = self._calls.get(key)
+            if call is not None and call.expires is not None:
+                if now < call.expires:
+                    self.shared += 1
+                    return call.result
+                del self._calls[key]
+                call = None
+
+            leader = call is None
+            if leader:
+                self._prune(now)
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            # 실패한 결과는 보관하지 않음
+            call.error = e
+            self._finish(key, call, keep=False)
+            raise
+
+        self._finish(key, call, keep=self.ttl > 0)
+        return call.result
+
+    def _finish(self, key: Hashable, call: _Call, keep: bool) -> None:
+        """작업 완료 처리: 결과를 보관하거나 목록에서 빼고 기다리는 호출을 깨움"""
+        with self._lock:
+            if keep:
+                call.expires = time.monotonic() + self.ttl
+                self._expiry.append((call.expires, key, call))
+            elif self._calls.get(key) is call:
+                del self._calls[key]
+        call.event.set()
+
+    def _prune(self, now: float) -> None:
+        """만료된 보관 결과를 지움 (잠금을 잡은 상태에서 호출)"""
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            _, key, call = expiry.popleft()
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def __len__(self) -> int:
+        """진행 중이거나 보관 중인 작업 수 (만료되었지만 아직 정리하지 않은 결과 포함)"""
+        with self._lock:
+            return len(self._calls)
+
+    def forget(self, key: Hashable) -> None:
+        """
+        key의 보관 중인 결과를 지웁니다 (진행 중인 작업은 그대로 완료됨).
+
+        Args:
+            key: 지울 키
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.expires is not None:
+                del self._calls[key]
+
+    def clear(self) -> None:
+        """보관 중인 결과를 모두 지웁니다."""
+        with self._lock:
+            for key in [k for k, c in self._calls.items() if c.expires is not None]:
+                del self._calls[key]
+            self._expiry.clear()
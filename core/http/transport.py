@@ -0,0 +1,195 @@
+"""
+HTTP 연결 풀 설정
+
+requests.Session에 장착할 HTTPAdapter와 aiohttp 연결 풀(TCPConnector)을 같은 설정으로
+만듭니다. 하나의 Transport를 여러 클라이언트에 넘기면 쿠키(로그인 세션)는 클라이언트마다
+따로 두면서 TCP/TLS 연결은 함께 재사용합니다.
+
+사용 예:
+    transport = Transport(TransportConfig(pool_maxsize=32, pool_block=True))
+    clients = [LibraryHTTPClient(transport=transport) for _ in range(8)]
+"""
+
+from typing import Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp는 선택 의존성
+    aiohttp = None
+
+
+class TransportConfig:
+    """HTTP 연결 풀 설정"""
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keepalive_timeout: float = 15.0,
+        max_connections: int = 100,
+        host_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        연결 풀 설정 초기화
+
+        Args:
+            pool_connections: 연결 풀을 유지할 호스트 수
+            pool_maxsize: 호스트당 유지할 최대 연결 수
+            pool_block: True이면 풀이 가득 찼을 때 연결이 반환될 때까지 대기
+                (False이면 임시 연결을 새로 만들고 사용 후 버림)
+            keep_alive: False이면 요청마다 연결을 닫음
+            keepalive_timeout: 유휴 연결을 유지할 시간(초, aiohttp 전용)
+            max_connections: 전체 동시 연결 수 상한 (aiohttp 전용)
+            host_limits: 호스트별 최대 연결 수 (예: {"libgate.kyonggi.ac.kr": 4})
+
+        Raises:
+            ValueError: 연결 수가 1보다 작은 경우
+        """
+        limits = {"pool_connections": pool_connections, "pool_maxsize": pool_maxsize}
+        limits.update(host_limits or {})
+        for name, value in limits.items():
+            if value < 1:
+                raise ValueError(f"{name}의 연결 수는 1 이상이어야 합니다: {value}")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self.max_connections = max_connections
+        self.host_limits = dict(host_limits or {})
+
+    def __repr__(self) -> str:
+        return (
+            f"TransportConfig(pool_connections={self.pool_connections}, "
+            f"pool_maxsize={self.pool_maxsize}, pool_block={self.pool_block}, "
+            f"keep_alive={self.keep_alive}, host_limits={self.host_limits})"
+        )
+
+    def create_adapter(self, pool_maxsize: Optional[int] = None) -> HTTPAdapter:
+        """
+        설정에 맞는 requests HTTPAdapter를 만듭니다.
+
+        Args:
+            pool_maxsize: 호스트당 최대 연결 수 (None이면 설정값)
+
+        Returns:
+            HTTPAdapter 객체
+        """
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=pool_maxsize or self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def create_connector(self, **kwargs) -> "aiohttp.TCPConnector":
+        """
+        설정에 맞는 aiohttp 연결 풀을 만듭니다. 이벤트 루프 안에서 호출해야 합니다.
+
+        aiohttp는 호스트별 상한을 하나만 지원하므로 host_limits는 적용되지 않습니다.
+
+        Args:
+            **kwargs: TCPConnector에 그대로 넘길 추가 인자
+
+        Returns:
+            TCPConnector 객체
+
+        Raises:
+            ImportError: aiohttp가 설치되어 있지 않은 경우
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "create_connector를 사용하려면 aiohttp를 설치하세요: "
+                "pip install kgu_library[async]"
+            )
+
+        options = {
+            "limit": self.max_connections,
+            "limit_per_host": self.pool_maxsize,
+        }
+        if self.keep_alive:
+            options["keepalive_timeout"] = self.keepalive_timeout
+        else:
+            options["force_close"] = True
+        options.update(kwargs)
+        return aiohttp.TCPConnector(**options)
+
+
+# 클라이언트에 설정을 넘기지 않았을 때 사용하는 기본값 (requests 기본값과 동일)
+DEFAULT_TRANSPORT_CONFIG = TransportConfig()
+
+
+class Transport:
+    """여러 requests.Session이 공유할 수 있는 연결 풀"""
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        """
+        연결 풀 초기화
+
+        Args:
+            config: 연결 풀 설정 (None이면 기본 설정)
+        """
+        self.config = config or DEFAULT_TRANSPORT_CONFIG
+        self.adapter = self.config.create_adapter()
+        self.host_adapters = {
+            host: self.config.create_adapter(pool_maxsize=limit)
+            for host, limit in self.config.host_limits.items()
+        }
+
+    @classmethod
+    def resolve(
+        cls, transport: Optional[Union["Transport", TransportConfig]]
+    ) -> "Transport":
+        """
+        클라이언트 인자로 받은 값을 Transport로 변환합니다.
+
+        Args:
+            transport: 공유할 Transport, 전용 풀을 만들 TransportConfig, 또는 None
+
+        Returns:
+            Transport 객체 (Transport를 받으면 그대로 반환)
+        """
+        if isinstance(transport, Transport):
+            return transport
+        return cls(transport)
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """
+        세션에 연결 풀을 장착합니다.
+
+        Args:
+            session: 연결 풀을 장착할 세션
+
+        Returns:
+            같은 세션 객체
+        """
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        # requests는 가장 긴 접두사의 어댑터를 사용하므로 호스트별 풀이 우선 적용됨
+        for host, adapter in self.host_adapters.items():
+            session.mount(f"https://{host}", adapter)
+            session.mount(f"http://{host}", adapter)
+
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def create_session(self) -> requests.Session:
+        """
+        연결 풀이 장착된 새 세션을 만듭니다.
+
+        Returns:
+            requests.Session 객체
+        """
+        return self.mount(requests.Session())
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫습니다."""
+        self.adapter.close()
+        for adapter in self.host_adapters.values():
+            adapter.close()
@@ -0,0 +1,28 @@
+"""
+로그인 세션 저장 모듈
+
+이 모듈은 로그인 쿠키와 사용자 정보를 프로세스 밖에 저장하여 다시 로그인하지 않고
+세션을 이어 쓰는 기능과, 여러 계정의 로그인된 클라이언트를 관리하는 세션 풀을 제공합니다.
+"""
+
+from .pool import SessionPool
+from .store import (
+    FileSessionStore,
+    MemorySessionStore,
+    SessionState,
+    SessionStore,
+    SQLiteSessionStore,
+    dump_cookies,
+    load_cookies,
+)
+
+__all__ = [
+    "SessionState",
+    "SessionStore",
+    "MemorySessionStore",
+    "FileSessionStore",
+    "SQLiteSessionStore",
+    "dump_cookies",
+    "load_cookies",
+    "SessionPool",
+]
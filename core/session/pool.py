@@ -0,0 +1,345 @@
+"""
+여러 계정의 로그인된 클라이언트 풀
+
+계정마다 로그인된 클라이언트(LibraryAPIWrapper, AttendanceAPI 등)를 최대 max_size개까지
+보관하고, 넘치면 가장 오래 사용하지 않은 클라이언트부터 내보냅니다(LRU). 클라이언트는
+처음 빌려 갈 때 로그인하며, 백그라운드 스레드가 로그인 유효 시간이 끝나기 전에 다시
+로그인해 둡니다. 한 클라이언트는 한 번에 한 스레드만 빌려 갈 수 있습니다.
+
+사용 예:
+    pool = SessionPool(factory, login, max_size=200)
+    pool.register("202400000", credentials)
+    with pool.session("202400000") as api:
+        api.book_seat(101)
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _PoolEntry:
+    """풀에 보관 중인 계정별 클라이언트"""
+
+    __slots__ = ("account", "client", "lock", "logged_in_at", "in_use")
+
+    def __init__(self, account: str, client: Any):
+        self.account = account
+        self.client = client
+        # 클라이언트를 빌려 간 스레드가 가지는 잠금
+        self.lock = threading.Lock()
+        self.logged_in_at: Optional[float] = None  # time.monotonic()
+        self.in_use = 0  # 빌려 갔거나 빌리려고 기다리는 스레드 수
+
+
+class SessionPool:
+    """계정별 로그인된 클라이언트 풀 (LRU)"""
+
+    def __init__(
+        self,
+        factory: Callable[[str], Any],
+        login: Callable[[Any, str, Any], Any],
+        relogin: Optional[Callable[[Any, str, Any], Any]] = None,
+        close: Optional[Callable[[Any], None]] = None,
+        max_size: int = 256,
+        session_ttl: float = 1800.0,
+        refresh_margin: float = 300.0,
+    ):
+        """
+        풀 초기화
+
+        Args:
+            factory: 계정 ID로 로그인하지 않은 새 클라이언트를 만드는 함수
+            login: (클라이언트, 계정 ID, 인증 정보)로 로그인하는 함수 (처음 빌려 갈 때)
+            relogin: 유효 시간이 끝나기 전 다시 로그인하는 함수 (None이면 login 사용)
+            close: 풀에서 내보낸 클라이언트를 정리하는 함수 (세션 저장 등)
+            max_size: 보관할 최대 클라이언트 수
+            session_ttl: 로그인 세션이 유효하다고 보는 시간(초)
+            refresh_margin: 유효 시간이 이만큼(초) 남았을 때 백그라운드에서 다시 로그인
+
+        Raises:
+            ValueError: 크기나 시간 설정이 올바르지 않은 경우
+        """
+        if max_size < 1:
+            raise ValueError("max_size는 1 이상이어야 합니다")
+        if not 0 <= refresh_margin < session_ttl:
+            raise ValueError("0 <= refresh_margin < session_ttl 이어야 합니다")
+
+        self.factory = factory
+        self.login = login
+        self.relogin = relogin or login
+        self.close = close
+        self.max_size = max_size
+        self.session_ttl = session_ttl
+        self.refresh_margin = refresh_margin
+
+        self._credentials: Dict[str, Any] = {}
+        self._entries: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logins = 0  # 로그인(다시 로그인 포함) 횟수
+        self.evictions = 0  # 풀에서 내보낸 클라이언트 수
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, account: str) -> bool:
+        with self._lock:
+            return account in self._entries
+
+    @property
+    def accounts(self) -> List[str]:
+        """등록된 계정 ID 목록"""
+        with self._lock:
+            return list(self._credentials)
+
+    def register(self, account: str, credentials: Any) -> None:
+        """
+        계정의 인증 정보를 등록합니다. 클라이언트는 처음 빌려 갈 때 만듭니다.
+
+        Args:
+            account: 계정 ID
+            credentials: login/relogin 함수에 넘길 인증 정보
+        """
+        with self._lock:
+            self._credentials[account] = credentials
+
+    def unregister(self, account: str) -> None:
+        """
+        계정을 등록 해제하고, 사용 중이 아니면 클라이언트도 풀에서 내보냅니다.
+
+        Args:
+            account: 계정 ID
+        """
+        with self._lock:
+            self._credentials.pop(account, None)
+            entry = self._entries.get(account)
+            if entry is not None and entry.in_use == 0:
+                del self._entries[account]
+            else:
+                entry = None
+        if entry is not None:
+            self._close(entry)
+
+    def invalidate(self, account: str) -> None:
+        """
+        계정의 로그인 세션을 만료된 것으로 표시하여 다음에 빌려 갈 때 다시 로그인하게 합니다.
+
+        Args:
+            account: 계정 ID
+        """
+        with self._lock:
+            entry = self._entries.get(account)
+            if entry is not None:
+                entry.logged_in_at = None
+
+    def _expired(self, entry: _PoolEntry, margin: float = 0.0) -> bool:
+        return (
+            entry.logged_in_at is None
+            or time.monotonic() - entry.logged_in_at >= self.session_ttl - margin
+        )
+
+    def _login(self, entry: _PoolEntry, fn: Callable[[Any, str, Any], Any]) -> None:
+        """entry.lock을 가진 상태에서 로그인"""
+        with self._lock:
+            credentials = self._credentials[entry.account]
+        fn(entry.client, entry.account, credentials)
+        entry.logged_in_at = time.monotonic()
+        with self._lock:
+            self.logins += 1
+
+    def checkout(self, account: str, timeout: Optional[float] = None) -> Any:
+        """
+        계정의 로그인된 클라이언트를 빌립니다. 다 쓴 뒤 반드시 checkin()을 호출해야 합니다.
+
+        Args:
+            account: 계정 ID
+            timeout: 다른 스레드가 사용 중일 때 기다릴 최대 시간(초, None이면 계속 대기)
+
+        Returns:
+            로그인된 클라이언트
+
+        Raises:
+            KeyError: 등록되지 않은 계정인 경우
+            TimeoutError: timeout 안에 클라이언트를 빌리지 못한 경우
+            login 함수가 발생시킨 예외
+        """
+        with self._lock:
+            if account not in self._credentials:
+                raise KeyError(f"등록되지 않은 계정입니다: {account}")
+            entry = self._entries.get(account)
+            if entry is None:
+                entry = self._entries[account] = _PoolEntry(
+                    account, self.factory(account)
+                )
+            else:
+                self._entries.move_to_end(account)
+            entry.in_use += 1
+            evicted = self._evict_locked()
+
+        for old in evicted:
+            self._close(old)
+
+        if not entry.lock.acquire(timeout=-1 if timeout is None else timeout):
+            self._release_use(entry)
+            raise TimeoutError(f"계정 {account}의 클라이언트를 빌리지 못했습니다")
+
+        try:
+            if self._expired(entry):
+                self._login(entry, self.login)
+        except BaseException:
+            entry.lock.release()
+            self._release_use(entry)
+            raise
+        return entry.client
+
+    def checkin(self, account: str) -> None:
+        """
+        checkout()으로 빌린 클라이언트를 돌려줍니다.
+
+        Args:
+            account: 계정 ID
+        """
+        with self._lock:
+            entry = self._entries[account]
+        entry.lock.release()
+        self._release_use(entry)
+
+    @contextmanager
+    def session(self, account: str, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        with 문 안에서 계정의 로그인된 클라이언트를 빌립니다.
+
+        Args:
+            account: 계정 ID
+            timeout: 다른 스레드가 사용 중일 때 기다릴 최대 시간(초)
+
+        Yields:
+            로그인된 클라이언트
+        """
+        client = self.checkout(account, timeout)
+        try:
+            yield client
+        finally:
+            self.checkin(account)
+
+    def _release_use(self, entry: _PoolEntry) -> None:
+        """사용 표시를 해제하고, 풀이 넘쳐 있으면 내보냄"""
+        with self._lock:
+            entry.in_use -= 1
+            evicted = self._evict_locked()
+        for old in evicted:
+            self._close(old)
+
+    def _evict_locked(self) -> List[_PoolEntry]:
+        """(self._lock 안에서) 넘친 만큼 사용 중이 아닌 가장 오래된 클라이언트를 뺌"""
+        evicted = []
+        excess = len(self._entries) - self.max_size
+        if excess <= 0:
+            return evicted
+        # 모두 사용 중이면 잠시 max_size를 넘고, 돌려받을 때 다시 정리
+        for account, entry in list(self._entries.items()):
+            if excess <= 0:
+                break
+            if entry.in_use == 0:
+                del self._entries[account]
+                evicted.append(entry)
+                excess -= 1
+        self.evictions += len(evicted)
+        return evicted
+
+    def _close(self, entry: _PoolEntry) -> None:
+        if self.close is None:
+            return
+        try:
+            self.close(entry.client)
+        except Exception:
+            logger.exception(f"계정 {entry.account}의 클라이언트 정리 중 예외 발생")
+
+    def refresh_due(self) -> int:
+        """
+        유효 시간이 refresh_margin 이하로 남은 클라이언트를 다시 로그인시킵니다.
+        사용 중인 클라이언트는 건너뜁니다.
+
+        Returns:
+            int: 다시 로그인한 클라이언트 수
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+
+        refreshed = 0
+        for entry in entries:
+            if entry.logged_in_at is None or not self._expired(
+                entry, self.refresh_margin
+            ):
+                continue
+            if not entry.lock.acquire(blocking=False):
+                continue
+            try:
+                self._login(entry, self.relogin)
+                refreshed += 1
+            except KeyError:
+                # 그 사이에 등록 해제된 계정
+                pass
+            except Exception as e:
+                # 다음에 빌려 갈 때 다시 로그인하도록 표시
+                entry.logged_in_at = None
+                logger.warning(f"계정 {entry.account} 다시 로그인 실패: {e}")
+            finally:
+                entry.lock.release()
+        return refreshed
+
+    def run(self, interval: Optional[float] = None) -> None:
+        """
+        stop()이 호출될 때까지 주기적으로 refresh_due()를 실행합니다.
+
+        Args:
+            interval: 확인 간격(초, None이면 refresh_margin의 절반, 최소 1초)
+        """
+        if interval is None:
+            interval = max(self.refresh_margin / 2, 1.0)
+        while not self._stop_event.wait(interval):
+            self.refresh_due()
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """
+        백그라운드 스레드에서 다시 로그인을 시작합니다.
+
+        Args:
+            interval: 확인 간격(초)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.run, args=(interval,), name="SessionPool", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        백그라운드 다시 로그인을 멈춥니다.
+
+        Args:
+            timeout: 스레드 종료를 기다릴 최대 시간(초)
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def clear(self) -> None:
+        """사용 중이 아닌 클라이언트를 모두 풀에서 내보냅니다 (등록 정보는 유지)."""
+        with self._lock:
+            evicted = [e for e in self._entries.values() if e.in_use == 0]
+            for entry in evicted:
+                del self._entries[entry.account]
+        for entry in evicted:
+            self._close(entry)
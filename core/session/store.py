@@ -0,0 +1,258 @@
+"""
+로그인 세션 저장소
+
+로그인 후의 쿠키와 사용자 정보를 계정별로 저장해 두었다가 새 프로세스에서 다시
+불러옵니다. 세션 상태는 JSON으로 직렬화할 수 있는 딕셔너리이며, 저장소는 파일
+(FileSessionStore), SQLite(SQLiteSessionStore), 메모리(MemorySessionStore) 중에서
+고르거나 SessionStore를 상속해 직접 만들 수 있습니다.
+
+저장되는 쿠키는 로그인 정보와 같으므로 다른 사용자가 읽을 수 없는 위치에 두어야 합니다.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from requests.cookies import RequestsCookieJar
+
+logger = logging.getLogger(__name__)
+
+SessionState = Dict[str, Any]
+
+# 저장할 쿠키 속성
+_COOKIE_ATTRS = ("name", "value", "domain", "path", "secure", "expires")
+
+
+def dump_cookies(jar: RequestsCookieJar) -> List[Dict[str, Any]]:
+    """
+    쿠키 저장소의 쿠키를 JSON으로 직렬화할 수 있는 목록으로 변환합니다.
+
+    Args:
+        jar: requests 세션의 쿠키 저장소
+
+    Returns:
+        List[Dict[str, Any]]: 쿠키 속성 딕셔너리 목록
+    """
+    cookies = []
+    for cookie in jar:
+        data = {attr: getattr(cookie, attr) for attr in _COOKIE_ATTRS}
+        if cookie.has_nonstandard_attr("HttpOnly"):
+            data["rest"] = {"HttpOnly": None}
+        cookies.append(data)
+    return cookies
+
+
+def load_cookies(jar: RequestsCookieJar, cookies: List[Dict[str, Any]]) -> int:
+    """
+    dump_cookies()로 만든 목록을 쿠키 저장소에 넣습니다. 만료된 쿠키는 건너뜁니다.
+
+    Args:
+        jar: requests 세션의 쿠키 저장소
+        cookies: 쿠키 속성 딕셔너리 목록
+
+    Returns:
+        int: 넣은 쿠키 수
+    """
+    now = time.time()
+    loaded = 0
+    for data in cookies:
+        expires = data.get("expires")
+        if expires is not None and expires <= now:
+            continue
+        jar.set(**data)
+        loaded += 1
+    return loaded
+
+
+class SessionStore(ABC):
+    """세션 저장소 기본 클래스 (load_raw/save/delete를 구현하여 사용)"""
+
+    @abstractmethod
+    def load_raw(self, key: str) -> Optional[SessionState]:
+        """
+        저장된 세션 상태를 그대로 반환합니다.
+
+        Args:
+            key: 계정 키 (예: "library:202400000")
+
+        Returns:
+            Optional[SessionState]: 세션 상태 (없으면 None)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, key: str, state: SessionState) -> None:
+        """
+        세션 상태를 저장합니다. saved_at이 없으면 현재 시각을 기록합니다.
+
+        Args:
+            key: 계정 키
+            state: JSON으로 직렬화할 수 있는 세션 상태
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        세션 상태를 지웁니다 (없으면 아무것도 하지 않음).
+
+        Args:
+            key: 계정 키
+        """
+        raise NotImplementedError
+
+    def load(self, key: str, max_age: Optional[float] = None) -> Optional[SessionState]:
+        """
+        저장된 세션 상태를 불러옵니다.
+
+        Args:
+            key: 계정 키
+            max_age: 이 시간(초)보다 오래 전에 저장된 상태는 무시 (None이면 제한 없음)
+
+        Returns:
+            Optional[SessionState]: 세션 상태 (없거나 오래되었으면 None)
+        """
+        state = self.load_raw(key)
+        if state is None:
+            return None
+        if max_age is not None and time.time() - state.get("saved_at", 0) > max_age:
+            return None
+        return state
+
+    @staticmethod
+    def _stamp(state: SessionState) -> SessionState:
+        """저장 시각을 기록한 복사본"""
+        state = dict(state)
+        state.setdefault("saved_at", time.time())
+        return state
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 메모리에만 보관하는 세션 저장소 (테스트, 세션 풀 공유용)"""
+
+    def __init__(self):
+        self._states: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def load_raw(self, key: str) -> Optional[SessionState]:
+        with self._lock:
+            data = self._states.get(key)
+        return None if data is None else json.loads(data)
+
+    def save(self, key: str, state: SessionState) -> None:
+        # 저장 후 원본을 바꿔도 영향이 없도록 직렬화해서 보관
+        data = json.dumps(self._stamp(state), ensure_ascii=False)
+        with self._lock:
+            self._states[key] = data
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileSessionStore(SessionStore):
+    """계정마다 JSON 파일 하나에 저장하는 세션 저장소"""
+
+    def __init__(self, directory: str):
+        """
+        저장소 초기화
+
+        Args:
+            directory: 세션 파일을 저장할 디렉터리 (없으면 생성)
+        """
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        # 퍼센트 인코딩은 키마다 다른 파일 이름을 만들고 경로 구분자를 남기지 않음
+        filename = quote(key, safe="")
+        return os.path.join(self.directory, f"{filename}.json")
+
+    def load_raw(self, key: str) -> Optional[SessionState]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"세션 파일을 읽을 수 없어 무시합니다 ({key}): {e}")
+            return None
+
+    def save(self, key: str, state: SessionState) -> None:
+        # 임시 파일에 쓴 뒤 교체하여 다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록 함
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._stamp(state), f, ensure_ascii=False)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite 데이터베이스 파일 하나에 모든 계정을 저장하는 세션 저장소"""
+
+    def __init__(self, path: str):
+        """
+        저장소 초기화
+
+        Args:
+            path: 데이터베이스 파일 경로 (":memory:"이면 메모리 데이터베이스)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # 여러 스레드가 하나의 연결을 잠금으로 나눠 사용
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "key TEXT PRIMARY KEY, state TEXT NOT NULL, saved_at REAL NOT NULL)"
+            )
+        if path != ":memory:":
+            os.chmod(path, 0o600)
+
+    def load_raw(self, key: str) -> Optional[SessionState]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM sessions WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError as e:
+            logger.warning(f"세션 데이터를 읽을 수 없어 무시합니다 ({key}): {e}")
+            return None
+
+    def save(self, key: str, state: SessionState) -> None:
+        state = self._stamp(state)
+        data = json.dumps(state, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (key, state, saved_at) "
+                "VALUES (?, ?, ?)",
+                (key, data, state["saved_at"]),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
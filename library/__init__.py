@@ -4,12 +4,42 @@ KGU Library 패키지
 
 from .api import LibraryAPI, LibraryAPIWrapper
 from .http_client import LibraryHTTPClient
-from .enums import BookingStatus, SeatExtensionStatus
+from .async_api import AsyncLibraryAPIWrapper
+from .async_http_client import AsyncLibraryHTTPClient
+from .enums import BookingStatus, SeatChangeType, SeatExtensionStatus
+from .area_cache import AreaCache
+from .bulk import AccountBooking, BulkBooker, BulkBookingResult
+from .clock import ServerClock
+from .scheduler import BookingScheduler, ScheduledBooking
+from .models import Area, AreaView, Seat, SeatView
+from .spatial import SeatGridIndex
+from .snapshot import SeatSnapshot, SeatSnapshotStore, SnapshotDiff
+from .watcher import SeatChange, SeatWatcher
 
 __all__ = [
     "LibraryAPI",
     "LibraryAPIWrapper",
     "LibraryHTTPClient",
+    "AsyncLibraryAPIWrapper",
+    "AsyncLibraryHTTPClient",
     "BookingStatus",
     "SeatExtensionStatus",
+    "SeatChangeType",
+    "Area",
+    "Seat",
+    "AreaView",
+    "SeatView",
+    "AreaCache",
+    "BulkBooker",
+    "BulkBookingResult",
+    "AccountBooking",
+    "SeatGridIndex",
+    "ServerClock",
+    "BookingScheduler",
+    "ScheduledBooking",
+    "SeatSnapshot",
+    "SeatSnapshotStore",
+    "SnapshotDiff",
+    "SeatChange",
+    "SeatWatcher",
 ]
@@ -2,20 +2,336 @@
 KGU Library API 모듈
 """
 
+import itertools
+import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from kgu_library.core.http import RateLimiter, RetryPolicy, Transport
+from kgu_library.core.session import (
+    MemorySessionStore,
+    SessionPool,
+    SessionStore,
+    dump_cookies,
+    load_cookies,
+)
 
 from .enums import BookingStatus, SeatExtensionStatus
-from .exceptions import BookingError, SeatError, APIResponseError, LoginError
+from .exceptions import (
+    BookingError,
+    SeatError,
+    APIResponseError,
+    LibraryAPIError,
+    LoginError,
+    RateLimitError,
+)
 from .http_client import LibraryHTTPClient
+from .models import (
+    AREA_FIELDS,
+    SEAT_AREA_FIELDS,
+    SEAT_FIELDS,
+    Area,
+    AreaView,
+    Seat,
+    SeatView,
+)
+from .spatial import SeatGridIndex
+
+logger = logging.getLogger(__name__)
+
+# 다른 좌석으로 다시 시도하면 성공할 수 있는 (좌석 자체에 대한) 예약 실패 상태
+# 그 밖의 상태(USING_ANOTHER_SEAT, DAILY_LIMIT_REACHED, USER_RESTRICTED 등)는 계정이나
+# 운영 시간 문제이므로 다른 좌석을 시도해도 결과가 같음
+_SEAT_SPECIFIC_STATUSES = frozenset(
+    {
+        BookingStatus.NO_SEATS_AVAILABLE,
+        BookingStatus.SEAT_IN_USE,
+        BookingStatus.WAITING_FOR_SAME_SEAT_REASSIGNMENT,
+        BookingStatus.SAME_SEAT_RESERVATION_RESTRICTED,
+    }
+)
+
+
+def _map_fields(data: Dict, fields) -> Dict:
+    """API 응답 항목을 필드 정의 표에 따라 id를 포함한 딕셔너리로 변환"""
+    get = data.get
+    result = {"id": get("code")}
+    for name, key, default in fields:
+        result[name] = get(key, default)
+    return result
+
+
+def _map_area(area: Dict) -> Dict:
+    """구역 API 응답 항목을 구역 정보 딕셔너리로 변환"""
+    return _map_fields(area, AREA_FIELDS)
+
+
+def _map_seat(seat: Dict) -> Dict:
+    """좌석 API 응답 항목을 좌석 정보 딕셔너리로 변환"""
+    result = _map_fields(seat, SEAT_FIELDS)
+    # 구역 정보는 중첩된 area 객체에 있음
+    area = seat.get("area") or {}
+    for name, key, default in SEAT_AREA_FIELDS:
+        result[name] = area.get(key, default)
+    return result
+
+
+def _area_mapper(as_models: bool, lazy: bool):
+    """반환 형식 옵션에 맞는 구역 변환 함수 선택"""
+    if as_models and lazy:
+        raise ValueError("as_models와 lazy는 함께 사용할 수 없습니다")
+    if lazy:
+        return AreaView
+    return Area.from_json if as_models else _map_area
+
+
+def _seat_mapper(as_models: bool, lazy: bool):
+    """반환 형식 옵션에 맞는 좌석 변환 함수 선택"""
+    if as_models and lazy:
+        raise ValueError("as_models와 lazy는 함께 사용할 수 없습니다")
+    if lazy:
+        return SeatView
+    return Seat.from_json if as_models else _map_seat
+
+
+def _parse_booking_response(response: Dict) -> Tuple[BookingStatus, str]:
+    """좌석 예약 API 응답을 (상태 열거형, 상태 메시지) 튜플로 변환"""
+    # 기본 응답 검사 (success: false)
+    if not response.get("success", False):
+        return (
+            BookingStatus.API_ERROR,
+            f"API 오류: {response.get('message', '알 수 없는 오류')}",
+        )
+
+    # 코드 확인
+    code = response.get("data")
+
+    # 성공 코드 (1 또는 200) 특별 처리
+    if (
+        response.get("code") in [1, 200]
+        and response.get("status") in [1, 200]
+        and code in [1, 200]
+    ):
+        return BookingStatus.SUCCESS, "SUCCESS"
+
+    try:
+        # 직접 코드를 BookingStatus enum으로 변환
+        status = BookingStatus(code)
+        return status, status.name
+    except ValueError:
+        return BookingStatus.UNKNOWN_ERROR, f"UNKNOWN_ERROR (Code: {code})"
+
+
+def _candidate_id(candidate: Any) -> Any:
+    """예약 후보(좌석 ID 또는 좌석 객체)에서 좌석 ID를 꺼냄"""
+    if isinstance(candidate, (int, str)):
+        return candidate
+    return candidate["id"]
+
+
+def _build_seat_snapshot(library_id: int, results: List[Dict], elapsed: float) -> Dict:
+    """구역별 좌석 조회 결과를 하나의 스냅샷으로 합침"""
+    areas = {result["area"]["id"]: result for result in results}
+    return {
+        "library_id": library_id,
+        "areas": areas,
+        "total_available": sum(len(result["seats"]) for result in results),
+        "errors": {
+            area_id: result["error"]
+            for area_id, result in areas.items()
+            if result["error"] is not None
+        },
+        "elapsed": elapsed,
+    }
 
 
 class LibraryAPIWrapper:
     """경기대학교 도서관 좌석 예약 시스템 API 래퍼"""
 
-    def __init__(self):
-        """API 래퍼 초기화"""
-        self.client = LibraryHTTPClient()
+    # 세션 저장소의 계정 키 접두사
+    SESSION_KEY_PREFIX = "library"
+
+    def __init__(
+        self,
+        transport=None,
+        coalesce: bool = False,
+        coalesce_ttl: float = 0.0,
+        session_store: Optional[SessionStore] = None,
+        user_id: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """API 래퍼 초기화
+
+        Args:
+            transport: 공유할 연결 풀(Transport) 또는 연결 풀 설정(TransportConfig)
+            coalesce: True이면 여러 스레드의 동일한 조회 요청을 하나로 합침
+            coalesce_ttl: 합친 조회 응답을 보관할 시간(초)
+            session_store: 로그인 세션을 저장하고 불러올 저장소
+            user_id: 지정하면 session_store에 저장된 이 사용자의 세션을 불러옴
+            retry: 일시적인 오류가 난 요청을 다시 보낼 정책 (좌석 예약은 서버가 처리했을
+                수 있으면 다시 보내지 않음)
+            rate_limiter: 요청 전에 확인할 호스트별, 계정별 속도 제한 (좌석 예약은
+                기다리지 않고 토큰이 없으면 바로 실패)
+        """
+        self.client = LibraryHTTPClient(
+            transport=transport,
+            coalesce=coalesce,
+            coalesce_ttl=coalesce_ttl,
+            retry=retry,
+            rate_limiter=rate_limiter,
+        )
+        self.session_store = session_store
+        self.user_id: Optional[str] = None
+        if session_store is not None and user_id is not None:
+            self.restore_session(user_id)
+
+    @classmethod
+    def create_pool(
+        cls,
+        transport=None,
+        session_store: Optional[SessionStore] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        **pool_options,
+    ) -> SessionPool:
+        """여러 계정의 API 래퍼를 관리하는 세션 풀 생성
+
+        풀의 모든 래퍼는 하나의 연결 풀(Transport)과 세션 저장소를 공유합니다. 풀에서
+        내보낸 계정은 저장된 세션을 불러와 확인 요청 한 번으로 다시 사용할 수 있습니다.
+        인증 정보로는 이름을 등록합니다 (pool.register(user_id, name)).
+
+        Args:
+            transport: 공유할 연결 풀(Transport) 또는 연결 풀 설정(TransportConfig)
+            session_store: 로그인 세션 저장소 (None이면 메모리 저장소)
+            coalesce: True이면 각 래퍼에서 동일한 조회 요청을 하나로 합침
+            retry: 각 래퍼가 사용할 재시도 정책
+            rate_limiter: 모든 래퍼가 공유할 속도 제한
+            **pool_options: SessionPool에 넘길 옵션 (max_size, session_ttl, refresh_margin)
+
+        Returns:
+            SessionPool: 계정별 LibraryAPIWrapper를 빌려 주는 풀
+        """
+        transport = Transport.resolve(transport)
+        if session_store is None:
+            session_store = MemorySessionStore()
+
+        def factory(user_id: str) -> "LibraryAPIWrapper":
+            return cls(
+                transport=transport,
+                coalesce=coalesce,
+                session_store=session_store,
+                user_id=user_id,
+                retry=retry,
+                rate_limiter=rate_limiter,
+            )
+
+        def login(api: "LibraryAPIWrapper", user_id: str, name: str) -> None:
+            if not api.ensure_login(user_id, name):
+                raise LoginError(f"로그인 실패: {user_id}")
+
+        def relogin(api: "LibraryAPIWrapper", user_id: str, name: str) -> None:
+            if not api.login(user_id, name):
+                raise LoginError(f"로그인 실패: {user_id}")
+
+        return SessionPool(
+            factory,
+            login,
+            relogin=relogin,
+            close=lambda api: api.save_session(),
+            **pool_options,
+        )
+
+    def _session_key(self, user_id: str) -> str:
+        return f"{self.SESSION_KEY_PREFIX}:{user_id}"
+
+    def restore_session(self, user_id: str, max_age: Optional[float] = None) -> bool:
+        """저장소에 저장된 로그인 쿠키 불러오기 (요청하지 않음)
+
+        Args:
+            user_id: 사용자 ID
+            max_age: 이 시간(초)보다 오래 전에 저장된 세션은 무시
+
+        Returns:
+            bool: 불러온 세션이 있는지 여부 (세션이 아직 유효한지는 validate_session()으로 확인)
+        """
+        if self.session_store is None:
+            return False
+        state = self.session_store.load(self._session_key(user_id), max_age)
+        if state is None:
+            return False
+
+        self.client.session.cookies.clear()
+        load_cookies(self.client.session.cookies, state.get("cookies", []))
+        self.user_id = self.client.account = user_id
+        return True
+
+    def save_session(self) -> None:
+        """현재 로그인 쿠키를 저장소에 저장 (저장소나 로그인한 사용자가 없으면 무시)"""
+        if self.session_store is None or self.user_id is None:
+            return
+        self.session_store.save(
+            self._session_key(self.user_id),
+            {
+                "user_id": self.user_id,
+                "cookies": dump_cookies(self.client.session.cookies),
+            },
+        )
+
+    def validate_session(self) -> bool:
+        """현재 세션이 로그인된 상태인지 가벼운 조회(user/my-status)로 확인
+
+        Returns:
+            bool: 세션 유효 여부
+        """
+        try:
+            # 합쳐지거나 보관된 응답이 아닌 현재 세션의 응답이 필요함
+            response = self.client._get("user/my-status")
+        except LibraryAPIError:
+            return False
+        return bool(response.get("success"))
+
+    def ensure_login(
+        self,
+        user_id: str,
+        name: str,
+        max_age: Optional[float] = None,
+        validate: bool = True,
+    ) -> bool:
+        """저장된 세션이 유효하면 그대로 사용하고, 아니면 다시 로그인
+
+        Args:
+            user_id: 사용자 ID
+            name: 이름
+            max_age: 이 시간(초)보다 오래 전에 저장된 세션은 확인하지 않고 다시 로그인
+            validate: False이면 불러온 세션을 확인 요청 없이 그대로 사용
+                (max_age와 함께 사용하여 확인 요청도 줄일 때)
+
+        Returns:
+            bool: 로그인 상태 여부
+
+        Raises:
+            LoginError: 로그인 과정에서 오류 발생
+        """
+        if (self.user_id == user_id or self.restore_session(user_id, max_age)) and (
+            not validate or self.validate_session()
+        ):
+            return True
+        return self.login(user_id, name)
+
+    def _login_succeeded(self, user_id: str) -> bool:
+        """로그인 성공 처리: 사용자 ID를 기록하고 세션 저장"""
+        self.user_id = self.client.account = user_id
+        try:
+            self.save_session()
+        except Exception as e:
+            # 세션 저장 실패는 로그인 결과에 영향을 주지 않음
+            logger.warning(f"로그인 세션 저장 실패: {e}")
+        return True
 
     def login(self, user_id: str, name: str) -> bool:
         """도서관 시스템에 로그인
@@ -47,6 +363,7 @@ class LibraryAPIWrapper:
             try:
                 # POST 요청 직접 전송 (URL이 특별한 경로라서 post 메서드 대신 직접 호출)
                 login_url = f"{self.client.BASE_URL}/login_library"
+                self.client.acquire_rate_limit(login_url)
                 login_response = self.client.session.post(
                     login_url,
                     data=login_data,
@@ -61,14 +378,14 @@ class LibraryAPIWrapper:
                     try:
                         result = login_response.json()
                         if result.get("success", False):
-                            return True
+                            return self._login_succeeded(user_id)
                     except Exception:
                         # JSON이 아닌 경우에도 성공했을 수 있음 - 세션 쿠키를 확인
                         if any(
                             cookie.name == "CLI_ID"
                             for cookie in self.client.session.cookies
                         ):
-                            return True
+                            return self._login_succeeded(user_id)
 
                 return False
             except Exception as e:
@@ -112,6 +429,7 @@ class LibraryAPIWrapper:
             Tuple[BookingStatus, str]: (상태 열거형, 상태 메시지) 튜플
 
         Raises:
+            RateLimitError: 속도 제한 토큰이 없어 요청을 보내지 않은 경우
             BookingError: 예약 과정에서 오류 발생
         """
         try:
@@ -126,38 +444,170 @@ class LibraryAPIWrapper:
                 "Referer": f"{self.client.BASE_URL}/seat",
             }
 
-            # POST 요청 수행
+            # POST 요청 수행 (지연을 피하기 위해 속도 제한 토큰을 기다리지 않음)
             response = self.client.post(
-                "libraries/seat", json_data=json_data, headers=headers
+                "libraries/seat",
+                json_data=json_data,
+                headers=headers,
+                rate_limit_timeout=0,
             )
 
-            # 기본 응답 검사 (success: false)
-            if not response.get("success", False):
-                return (
-                    BookingStatus.API_ERROR,
-                    f"API 오류: {response.get('message', '알 수 없는 오류')}",
+            return _parse_booking_response(response)
+
+        except RateLimitError:
+            # 요청을 보내지 않았으므로 호출한 쪽이 wait_time 뒤에 다시 시도할 수 있음
+            raise
+        except Exception as e:
+            raise BookingError(f"좌석 예약 실패: {e}") from e
+
+    def book_nearest_seat(
+        self,
+        area_id: int,
+        seat_id: Optional[int] = None,
+        point: Optional[Tuple[float, float]] = None,
+        time_minutes: int = 30,
+        max_attempts: int = 5,
+        max_in_flight: int = 1,
+    ) -> Tuple[BookingStatus, str, Optional[SeatView]]:
+        """기준 좌석(또는 좌표)에서 가까운 빈 좌석부터 차례로 예약 시도
+
+        구역의 전체 좌석으로 공간 색인을 만들고, 빈 좌석을 거리 순서로
+        book_first_available에 넘겨 예약합니다. 기준 좌석이 비어 있으면 기준 좌석을
+        가장 먼저 시도합니다.
+
+        Args:
+            area_id: 구역 ID
+            seat_id: 기준 좌석 ID
+            point: 기준 좌표 (x, y) (seat_id 대신 사용)
+            time_minutes: 예약 시간 (분 단위)
+            max_attempts: 최대 예약 시도 횟수
+            max_in_flight: 동시에 보낼 최대 예약 요청 수
+
+        Returns:
+            Tuple[BookingStatus, str, Optional[SeatView]]:
+                (상태 열거형, 상태 메시지, 예약된 좌석) 튜플.
+                실패한 경우 좌석은 None입니다.
+
+        Raises:
+            ValueError: seat_id와 point 중 하나만 지정하지 않은 경우
+            SeatError: 좌석 정보 조회 중 오류가 발생했거나 기준 좌석이 구역에 없는 경우
+            BookingError: 예약 과정에서 오류 발생
+        """
+        if (seat_id is None) == (point is None):
+            raise ValueError("seat_id와 point 중 하나만 지정해야 합니다")
+
+        index = SeatGridIndex(self.get_seats(area_id, lazy=True))
+        if seat_id is not None:
+            if seat_id not in index:
+                raise SeatError(
+                    f"구역 {area_id}에 좌석 {seat_id}의 위치 정보가 없습니다"
                 )
+            point = index.center(seat_id)
 
-            # 코드 확인
-            code = response.get("data")
+        nearest = index.iter_nearest(*point, lambda seat: seat.is_available)
+        candidates = itertools.islice((seat for _, seat in nearest), max_attempts)
+        return self.book_first_available(candidates, time_minutes, max_in_flight)
 
-            # 성공 코드 (1 또는 200) 특별 처리
-            if (
-                response.get("code") in [1, 200]
-                and response.get("status") in [1, 200]
-                and code in [1, 200]
-            ):
-                return BookingStatus.SUCCESS, "SUCCESS"
+    def book_first_available(
+        self,
+        candidates: Iterable[Any],
+        time_minutes: int = 30,
+        max_in_flight: int = 1,
+    ) -> Tuple[BookingStatus, str, Optional[Any]]:
+        """후보 좌석을 순서대로 예약 시도하여 처음 성공한 좌석 반환
 
-            try:
-                # 직접 코드를 BookingStatus enum으로 변환
-                status = BookingStatus(code)
-                return status, status.name
-            except ValueError:
-                return BookingStatus.UNKNOWN_ERROR, f"UNKNOWN_ERROR (Code: {code})"
+        좌석이 이미 사용 중인 경우처럼 좌석 자체의 문제로 실패하면 바로 다음 후보를
+        시도하고, 다른 좌석 사용 중(USING_ANOTHER_SEAT), 일일 횟수 초과
+        (DAILY_LIMIT_REACHED), 이용 제한(USER_RESTRICTED)처럼 다른 좌석으로도 해결되지
+        않는 실패는 더 시도하지 않습니다.
 
-        except Exception as e:
-            raise BookingError(f"좌석 예약 실패: {e}") from e
+        max_in_flight가 2 이상이면 그 수만큼 예약 요청을 동시에 보내 앞선 요청의 응답을
+        기다리는 시간을 줄입니다. 서버는 한 사용자에게 좌석을 하나만 배정하므로 한 요청이
+        성공하면 나머지는 USING_ANOTHER_SEAT로 거절됩니다. 따라서 중단할 상태를 받아도
+        진행 중인 요청의 결과를 모두 확인한 뒤에 실패를 반환하며, 성공하면 나머지 요청을
+        기다리지 않고 바로 반환합니다.
+
+        속도 제한으로 보내지 못한 후보는 토큰이 찰 때까지 기다렸다가 다시 시도합니다.
+
+        Args:
+            candidates: 우선순위 순서의 좌석 ID 또는 좌석(딕셔너리, Seat, SeatView) 목록
+            time_minutes: 예약 시간 (분 단위)
+            max_in_flight: 동시에 보낼 최대 예약 요청 수
+
+        Returns:
+            Tuple[BookingStatus, str, Optional[Any]]:
+                (상태 열거형, 상태 메시지, 예약된 후보) 튜플.
+                실패한 경우 마지막으로 받은 상태와 None을 반환하며, 후보가 없으면
+                NO_SEATS_AVAILABLE을 반환합니다.
+
+        Raises:
+            ValueError: max_in_flight가 1보다 작은 경우
+            BookingError: 예약 요청 중 오류가 발생하고 성공한 요청이 없는 경우
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight는 1 이상이어야 합니다")
+
+        pending = iter(candidates)
+        # 속도 제한으로 보내지 못해 resume_at 이후에 다시 시도할 후보
+        deferred: Deque[Any] = deque()
+        resume_at = 0.0
+        status, message = BookingStatus.NO_SEATS_AVAILABLE, "NO_SEATS_AVAILABLE"
+        error: Optional[BookingError] = None
+        stopped = False
+        in_flight: Dict[Any, Any] = {}
+
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        try:
+            while True:
+                while not stopped and len(in_flight) < max_in_flight:
+                    if deferred:
+                        delay = resume_at - time.monotonic()
+                        if delay > 0:
+                            if in_flight:
+                                # 기다리는 동안 진행 중인 요청의 결과를 먼저 확인
+                                break
+                            time.sleep(delay)
+                        candidate = deferred.popleft()
+                    else:
+                        candidate = next(pending, None)
+                        if candidate is None:
+                            break
+                    future = executor.submit(
+                        self.book_seat, _candidate_id(candidate), time_minutes
+                    )
+                    in_flight[future] = candidate
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    candidate = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except RateLimitError as e:
+                        deferred.append(candidate)
+                        resume_at = max(resume_at, time.monotonic() + e.wait_time)
+                        continue
+                    except BookingError as e:
+                        # 요청이 서버에 도달했을 수 있으므로 더 시도하지 않음
+                        error = error or e
+                        stopped = True
+                        continue
+
+                    if result[0] == BookingStatus.SUCCESS:
+                        return result[0], result[1], candidate
+
+                    status, message = result
+                    if status not in _SEAT_SPECIFIC_STATUSES:
+                        stopped = True
+        finally:
+            # 성공 후 남은 요청은 결과를 기다리지 않음
+            executor.shutdown(wait=False)
+
+        if error is not None:
+            raise error
+        return status, message, None
 
     def cancel_seat(self, seat_id: int) -> bool:
         """좌석 예약 취소
@@ -183,8 +633,12 @@ class LibraryAPIWrapper:
             json_data = {}
 
             # POST 요청 수행
+            # 퇴실은 여러 번 보내도 결과가 같으므로 재시도 가능
             response = self.client.post(
-                f"libraries/leave/{seat_id}", json_data=json_data, headers=headers
+                f"libraries/leave/{seat_id}",
+                json_data=json_data,
+                headers=headers,
+                idempotent=True,
             )
 
             # 에러 체크
@@ -197,14 +651,28 @@ class LibraryAPIWrapper:
         except Exception as e:
             raise BookingError(f"좌석 취소 과정 오류: {e}") from e
 
-    def get_areas(self, library_id: int = 1) -> List[Dict]:
+    def get_areas(
+        self, library_id: int = 1, as_models: bool = False, lazy: bool = False
+    ) -> Union[List[Dict], List[Area], List[AreaView]]:
         """도서관 구역 정보 가져오기
 
         Args:
             library_id: 도서관 ID (기본값: 1 - 수원캠퍼스)
+            as_models: True이면 딕셔너리 대신 Area 객체 목록 반환
+            lazy: True이면 응답 딕셔너리를 복사하지 않는 AreaView 목록 반환
 
         Returns:
-            List[Dict]: 구역 정보 목록
+            List[Dict] | List[Area] | List[AreaView]: 구역 정보 목록
+
+        Raises:
+            ValueError: as_models와 lazy를 함께 지정한 경우
+            APIResponseError: API 응답 처리 중 오류 발생
+        """
+        mapper = _area_mapper(as_models, lazy)
+        return [mapper(area) for area in self._get_area_data(library_id)]
+
+    def _get_area_data(self, library_id: int) -> List[Dict]:
+        """구역 API 응답의 data 배열을 그대로 반환
 
         Raises:
             APIResponseError: API 응답 처리 중 오류 발생
@@ -214,91 +682,58 @@ class LibraryAPIWrapper:
 
         if response.get("success") and response.get("data"):
             # API 응답에서 data 배열 가져오기
-            areas_data = response.get("data")
-            areas = []
-
-            for area in areas_data:
-                # 모든 필드를 직접 매핑
-                area_info = {
-                    # 기본 정보
-                    "id": area.get("code"),
-                    "code": area.get("code"),
-                    "name": area.get("name"),
-                    "name_eng": area.get("nameEng"),
-                    # 좌석 정보
-                    "total_seats": area.get("cnt", 0),
-                    "available": area.get("available", 0),
-                    "in_use": area.get("inUse", 0),
-                    "fix": area.get("fix", 0),
-                    "disabled": area.get("disabled", 0),
-                    "fixed_seat": area.get("fixedSeat", 0),
-                    "normal": area.get("normal", 0),
-                    "unavailable": area.get("unavailable", 0),
-                    # 기능 허용 여부
-                    "note_book_yn": area.get("noteBookYN"),
-                    "keyboard_yn": area.get("keyboardYN"),
-                    "talk_yn": area.get("talkYN"),
-                    # 시간 설정
-                    "sc_ck_mi": area.get("scCkMi"),  # 체크인 간격(분)
-                    "max_mi": area.get("maxMi"),  # 최대 이용 시간(분)
-                    "max_renew_mi": area.get("maxRenewMi"),  # 최대 연장 시간(분)
-                    "start_time": area.get("startTm"),  # 운영 시작 시간
-                    "end_time": area.get("endTm"),  # 운영 종료 시간
-                    "week_start_time": area.get("wkStartTm"),  # 주중 운영 시작 시간
-                    "week_end_time": area.get("wkEndTm"),  # 주중 운영 종료 시간
-                    "week_setting": area.get("wkSetting"),  # 주간 설정
-                    "week_time_use_setting": area.get(
-                        "wkTimeUseSetting"
-                    ),  # 주간 시간 이용 설정
-                    "week_reserve_use_yn": area.get(
-                        "wkRsrvUseYn"
-                    ),  # 주간 예약 이용 여부
-                    # 이미지 정보
-                    "bg_image": area.get("bgImg"),  # 배경 이미지
-                    "preview_image": area.get("previewImg"),  # 미리보기 이미지
-                    "minimap_image": area.get("miniMapImg"),  # 미니맵 이미지
-                    "minimap_lib_image": area.get(
-                        "miniMapLibImg"
-                    ),  # 미니맵 도서관 이미지
-                    # 색상 정보
-                    "color": area.get("color"),
-                    # 휴일 정보
-                    "day_off": area.get("dayOff"),
-                    # 특별 이용 정보
-                    "va_name": area.get("vaName"),  # 특별 이용명
-                    "va_start_time": area.get("vaStartTime"),  # 특별 이용 시작 시간
-                    "va_end_time": area.get("vaEndTime"),  # 특별 이용 종료 시간
-                    "va_week_start_time": area.get(
-                        "vaWkStartTime"
-                    ),  # 특별 이용 주중 시작 시간
-                    "va_week_end_time": area.get(
-                        "vaWkEndTime"
-                    ),  # 특별 이용 주중 종료 시간
-                    "va_week_setting": area.get("vaWkSetting"),  # 특별 이용 주간 설정
-                    "va_week_time_use_setting": area.get(
-                        "vaWkTimeUseSetting"
-                    ),  # 특별 이용 주간 시간 이용 설정
-                    "va_week_reserve_use_yn": area.get(
-                        "vaWkRsrvUseYn"
-                    ),  # 특별 이용 주간 예약 이용 여부
-                }
-
-                areas.append(area_info)
-
-            return areas
+            return response.get("data")
         else:
             raise APIResponseError(
                 f"구역 정보를 가져오는데 실패했습니다: {response.get('message', '알 수 없는 오류')}"
             )
 
-    def get_available_seats(self, area_id: int = 1) -> List[Dict]:
+    def get_available_seats(
+        self, area_id: int = 1, as_models: bool = False, lazy: bool = False
+    ) -> Union[List[Dict], List[Seat], List[SeatView]]:
         """사용 가능한 좌석 목록 가져오기
 
         Args:
             area_id: 구역 ID
+            as_models: True이면 딕셔너리 대신 Seat 객체 목록 반환
+            lazy: True이면 응답 딕셔너리를 복사하지 않는 SeatView 목록 반환
+
+        Returns:
+            List[Dict] | List[Seat] | List[SeatView]: 사용 가능한 좌석 목록
+
+        Raises:
+            ValueError: as_models와 lazy를 함께 지정한 경우
+            SeatError: 좌석 정보 조회 중 오류 발생
+        """
+        mapper = _seat_mapper(as_models, lazy)
+        seats_data = self._get_seat_data(area_id)
+
+        # 좌석 목록에서 사용 가능한 좌석만 필터링
+        # seatTime이 null이면 예약 가능한 좌석
+        return [mapper(seat) for seat in seats_data if seat.get("seatTime") is None]
+
+    def get_seats(
+        self, area_id: int = 1, as_models: bool = False, lazy: bool = False
+    ) -> Union[List[Dict], List[Seat], List[SeatView]]:
+        """사용 중인 좌석을 포함한 구역의 전체 좌석 목록 가져오기
+
+        Args:
+            area_id: 구역 ID
+            as_models: True이면 딕셔너리 대신 Seat 객체 목록 반환
+            lazy: True이면 응답 딕셔너리를 복사하지 않는 SeatView 목록 반환
 
         Returns:
-            List[Dict]: 사용 가능한 좌석 목록
+            List[Dict] | List[Seat] | List[SeatView]: 전체 좌석 목록
+
+        Raises:
+            ValueError: as_models와 lazy를 함께 지정한 경우
+            SeatError: 좌석 정보 조회 중 오류 발생
+        """
+        mapper = _seat_mapper(as_models, lazy)
+        return [mapper(seat) for seat in self._get_seat_data(area_id)]
+
+    def _get_seat_data(self, area_id: int) -> List[Dict]:
+        """좌석 API 응답의 data 배열을 그대로 반환
 
         Raises:
             SeatError: 좌석 정보 조회 중 오류 발생
@@ -308,46 +743,7 @@ class LibraryAPIWrapper:
             response = self.client.get(f"libraries/seats/{area_id}")
 
             if response.get("success") and response.get("data"):
-                seats_data = response.get("data")
-                available_seats = []
-
-                # 좌석 목록에서 사용 가능한 좌석만 필터링
-                for seat in seats_data:
-                    # seatTime이 null이면 예약 가능한 좌석
-                    if seat.get("seatTime") is None:
-                        # 모든 필드 매핑
-                        seat_info = {
-                            # 기본 정보
-                            "id": seat.get("code"),
-                            "code": seat.get("code"),
-                            "name": seat.get("name"),
-                            "status": seat.get("status"),
-                            "disabled": seat.get("disabled"),
-                            "is_active": seat.get("isActive"),
-                            # 좌석 위치 정보
-                            "x": seat.get("x"),
-                            "y": seat.get("y"),
-                            "width": seat.get("width"),
-                            "height": seat.get("height"),
-                            "direction": seat.get("direction"),
-                            # 구역 정보
-                            "area_id": seat.get("area", {}).get("code"),
-                            "area_name": seat.get("area", {}).get("name", "알 수 없음"),
-                            # 사용 정보
-                            "seat_time": seat.get("seatTime"),
-                            "check_in": seat.get("checkIn"),
-                            "end_time": seat.get("endTime"),
-                            "user_name": seat.get("userName"),
-                            "user_id": seat.get("userId"),
-                            # 추가 정보
-                            "is_notebook": seat.get("isNotebook"),
-                            "is_disabled": seat.get("isDisabled"),
-                            "is_fixed_seat": seat.get("isFixedSeat"),
-                        }
-
-                        available_seats.append(seat_info)
-
-                return available_seats
+                return response.get("data")
             else:
                 raise SeatError(
                     f"좌석 정보를 가져오는데 실패했습니다: {response.get('message', '알 수 없는 오류')}"
@@ -356,6 +752,65 @@ class LibraryAPIWrapper:
         except Exception as e:
             raise SeatError(f"좌석 정보 요청 오류: {e}") from e
 
+    def get_all_available_seats(
+        self,
+        library_id: int = 1,
+        max_workers: Optional[int] = None,
+        as_models: bool = False,
+        lazy: bool = False,
+    ) -> Dict:
+        """모든 구역의 사용 가능한 좌석을 동시에 조회
+
+        구역 목록을 가져온 뒤 구역별 좌석 조회를 스레드 풀에서 동시에 수행합니다.
+        일부 구역 조회가 실패해도 나머지 구역의 결과는 그대로 반환합니다.
+
+        Args:
+            library_id: 도서관 ID (기본값: 1 - 수원캠퍼스)
+            max_workers: 동시에 조회할 구역 수 (None이면 연결 풀 크기와 구역 수 중 작은 값)
+            as_models: True이면 구역과 좌석을 Area/Seat 객체로 반환
+            lazy: True이면 구역과 좌석을 AreaView/SeatView로 반환
+
+        Returns:
+            Dict: 좌석 스냅샷
+                - library_id: 도서관 ID
+                - areas: 구역 ID별 {"area", "seats", "latency", "error"}
+                - total_available: 전체 사용 가능 좌석 수
+                - errors: 조회에 실패한 구역 ID별 오류 메시지
+                - elapsed: 전체 소요 시간(초)
+
+        Raises:
+            APIResponseError: 구역 목록 조회 중 오류 발생
+        """
+        started = time.perf_counter()
+        areas = self.get_areas(library_id, as_models=as_models, lazy=lazy)
+
+        def fetch(area: Dict) -> Dict:
+            area_started = time.perf_counter()
+            try:
+                seats = self.get_available_seats(
+                    area["id"], as_models=as_models, lazy=lazy
+                )
+                error = None
+            except SeatError as e:
+                seats, error = [], str(e)
+            return {
+                "area": area,
+                "seats": seats,
+                "latency": time.perf_counter() - area_started,
+                "error": error,
+            }
+
+        results = []
+        if areas:
+            # 연결 풀보다 많은 스레드는 연결을 기다리거나 임시 연결을 만들게 됨
+            workers = max_workers or min(
+                len(areas), self.client.transport.config.pool_maxsize
+            )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(fetch, areas))
+
+        return _build_seat_snapshot(library_id, results, time.perf_counter() - started)
+
 
 # 이전 버전과의 호환성을 위해 LibraryAPI 이름으로 래퍼 클래스 제공
 LibraryAPI = LibraryAPIWrapper
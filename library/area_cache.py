@@ -0,0 +1,160 @@
+"""
+KGU Library 구역 정보 캐시
+
+구역 정보 중 이름, 이미지, 운영 시간, 최대 이용/연장 시간, 주간 설정 같은 정적 필드는
+하루에 한 번 바뀔까 말까 하지만, 좌석 수(available, inUse 등)는 계속 바뀝니다.
+AreaCache는 정적 필드를 TTL 동안 보관하고, 그 사이의 조회에서는 좌석 수 필드만 변환해
+합칩니다.
+
+사용 예:
+    cache = AreaCache(api, ttl=3600)
+    counters = cache.get_counters(1)   # {구역 ID: {"available": ..., "in_use": ...}}
+    areas = cache.get_areas(1)         # get_areas()와 같은 형식
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .api import LibraryAPIWrapper, _map_fields
+from .models import AREA_COUNTER_FIELDS, AREA_STATIC_FIELDS
+
+
+def _map_counters(area: Dict) -> Dict[str, Any]:
+    """구역 API 응답 항목에서 좌석 수 필드만 변환"""
+    get = area.get
+    return {name: get(key, default) for name, key, default in AREA_COUNTER_FIELDS}
+
+
+class AreaCache:
+    """도서관별 구역 정적 정보 캐시"""
+
+    def __init__(self, api: LibraryAPIWrapper, ttl: float = 3600.0):
+        """
+        캐시 초기화
+
+        Args:
+            api: 구역 정보를 조회할 LibraryAPIWrapper
+            ttl: 정적 필드를 다시 변환하기 전까지 보관할 시간(초)
+
+        Raises:
+            ValueError: ttl이 음수인 경우
+        """
+        if ttl < 0:
+            raise ValueError("ttl은 0 이상이어야 합니다")
+
+        self.api = api
+        self.ttl = ttl
+        # 도서관 ID -> (정적 정보를 변환한 시각, 구역 ID -> 정적 필드)
+        self._static: Dict[int, Tuple[float, Dict[Any, Dict]]] = {}
+        self._counters: Dict[int, Dict[Any, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def _cached_static(self, library_id: int, codes: List[Any]) -> Optional[Dict]:
+        """만료되지 않았고 응답의 구역 구성과 같은 정적 정보 (없으면 None)"""
+        with self._lock:
+            entry = self._static.get(library_id)
+        if entry is None:
+            return None
+        loaded_at, static = entry
+        if time.monotonic() - loaded_at >= self.ttl or len(static) != len(codes):
+            return None
+        if any(code not in static for code in codes):
+            return None
+        return static
+
+    def _fetch(self, library_id: int, refresh: bool) -> Tuple[Dict, Dict]:
+        """구역 정보를 조회하고 (정적 정보, 좌석 수) 반환 (필요할 때만 정적 필드 변환)"""
+        areas_data = self.api._get_area_data(library_id)
+        codes = [area.get("code") for area in areas_data]
+        counters = {code: _map_counters(area) for code, area in zip(codes, areas_data)}
+
+        static = None if refresh else self._cached_static(library_id, codes)
+        with self._lock:
+            if static is None:
+                static = {
+                    code: _map_fields(area, AREA_STATIC_FIELDS)
+                    for code, area in zip(codes, areas_data)
+                }
+                self._static[library_id] = (time.monotonic(), static)
+            self._counters[library_id] = counters
+        return static, counters
+
+    def get_counters(self, library_id: int = 1) -> Dict[Any, Dict[str, Any]]:
+        """
+        구역별 좌석 수만 조회합니다.
+
+        Args:
+            library_id: 도서관 ID (기본값: 1 - 수원캠퍼스)
+
+        Returns:
+            Dict[Any, Dict[str, Any]]: 구역 ID -> 좌석 수 필드 (total_seats, available 등)
+
+        Raises:
+            APIResponseError: API 응답 처리 중 오류 발생
+        """
+        return self._fetch(library_id, refresh=False)[1]
+
+    def get_areas(self, library_id: int = 1, refresh: bool = False) -> List[Dict]:
+        """
+        캐시된 정적 필드와 새로 조회한 좌석 수를 합친 구역 정보 목록을 반환합니다.
+
+        Args:
+            library_id: 도서관 ID (기본값: 1 - 수원캠퍼스)
+            refresh: True이면 TTL과 관계없이 정적 필드도 다시 변환
+
+        Returns:
+            List[Dict]: LibraryAPIWrapper.get_areas()와 같은 형식의 구역 정보 목록
+
+        Raises:
+            APIResponseError: API 응답 처리 중 오류 발생
+        """
+        static, counters = self._fetch(library_id, refresh)
+        areas = []
+        for code, area_counters in counters.items():
+            area = dict(static[code])
+            area.update(area_counters)
+            areas.append(area)
+        return areas
+
+    def static(self, library_id: int = 1) -> Optional[Dict[Any, Dict]]:
+        """
+        보관 중인 정적 필드를 반환합니다 (요청하지 않음).
+
+        Args:
+            library_id: 도서관 ID
+
+        Returns:
+            Optional[Dict[Any, Dict]]: 구역 ID -> 정적 필드 (없으면 None)
+        """
+        with self._lock:
+            entry = self._static.get(library_id)
+        return None if entry is None else entry[1]
+
+    def last_counters(self, library_id: int = 1) -> Optional[Dict[Any, Dict]]:
+        """
+        마지막으로 조회한 좌석 수를 반환합니다 (요청하지 않음).
+
+        Args:
+            library_id: 도서관 ID
+
+        Returns:
+            Optional[Dict[Any, Dict]]: 구역 ID -> 좌석 수 필드 (없으면 None)
+        """
+        with self._lock:
+            return self._counters.get(library_id)
+
+    def invalidate(self, library_id: Optional[int] = None) -> None:
+        """
+        보관 중인 정보를 지웁니다.
+
+        Args:
+            library_id: 지울 도서관 ID (None이면 전체)
+        """
+        with self._lock:
+            if library_id is None:
+                self._static.clear()
+                self._counters.clear()
+            else:
+                self._static.pop(library_id, None)
+                self._counters.pop(library_id, None)
@@ -0,0 +1,310 @@
+"""
+KGU Library 비동기 API 모듈
+
+LibraryAPIWrapper와 같은 메서드를 코루틴으로 제공하여, 하나의 이벤트 루프에서
+여러 구역 조회나 여러 계정의 요청을 동시에 처리할 수 있습니다.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from .api import (
+    _build_seat_snapshot,
+    _area_mapper,
+    _parse_booking_response,
+    _seat_mapper,
+)
+from .async_http_client import AsyncLibraryHTTPClient
+from .enums import BookingStatus
+from .models import Area, AreaView, Seat, SeatView
+from .exceptions import BookingError, SeatError, APIResponseError, LoginError
+
+
+class AsyncLibraryAPIWrapper:
+    """경기대학교 도서관 좌석 예약 시스템 비동기 API 래퍼
+
+    사용 예:
+        connector = aiohttp.TCPConnector(limit=100)
+        async with AsyncLibraryAPIWrapper(connector=connector) as api:
+            await api.login("학번", "이름")
+            areas = await api.get_areas()
+            seats = await asyncio.gather(
+                *(api.get_available_seats(area["id"]) for area in areas)
+            )
+        await connector.close()
+    """
+
+    def __init__(self, connector=None, cookie_jar=None):
+        """API 래퍼 초기화
+
+        Args:
+            connector: 여러 래퍼가 공유할 aiohttp 연결 풀 (None이면 전용 풀 생성)
+            cookie_jar: 사용할 aiohttp 쿠키 저장소 (None이면 기본 저장소)
+        """
+        self.client = AsyncLibraryHTTPClient(connector=connector, cookie_jar=cookie_jar)
+
+    async def close(self) -> None:
+        """HTTP 세션 종료"""
+        await self.client.close()
+
+    async def __aenter__(self) -> "AsyncLibraryAPIWrapper":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def login(self, user_id: str, name: str) -> bool:
+        """도서관 시스템에 로그인
+
+        Args:
+            user_id: 사용자 ID
+            name: 이름 (실제 이름이 아닌 ID를 입력해도 로그인 가능)
+
+        Returns:
+            bool: 로그인 성공 여부
+
+        Raises:
+            LoginError: 로그인 과정에서 오류 발생
+        """
+        # 사용자 ID에 0 패딩 추가 (12자리)
+        user_id_padded = f"000000{user_id}"[-12:]
+
+        # 로그인 요청 데이터 준비
+        login_data = f"ID={user_id_padded}&STD_ID={user_id}&NAME={name}"
+
+        # 헤더 설정
+        login_headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Referer": "https://library.kyonggi.ac.kr/",
+        }
+
+        try:
+            login_url = f"{self.client.BASE_URL}/login_library"
+            async with self.client.session.post(
+                login_url,
+                data=login_data,
+                headers=login_headers,
+                allow_redirects=True,
+                ssl=False,
+            ) as login_response:
+                if login_response.status != 200:
+                    return False
+
+                body = await login_response.read()
+
+            # 응답이 JSON인지 확인
+            try:
+                if json.loads(body).get("success", False):
+                    return True
+            except Exception:
+                # JSON이 아닌 경우에도 성공했을 수 있음 - 세션 쿠키를 확인
+                if "CLI_ID" in self.client.cookies:
+                    return True
+
+            return False
+        except Exception as e:
+            raise LoginError(f"로그인 요청 실패: {e}") from e
+
+    async def check_my_status(self) -> Optional[Dict]:
+        """내 현재 예약 상태 확인하고 좌석 정보 반환
+
+        Returns:
+            Optional[Dict]: 좌석 정보 (없으면 None)
+
+        Raises:
+            APIResponseError: API 응답 처리 중 오류 발생
+        """
+        response = await self.client.get("user/my-status")
+
+        if response.get("success") and response.get("data"):
+            seat_info = response.get("data").get("mySeat")
+            if seat_info:
+                return seat_info
+
+        return None
+
+    async def book_seat(
+        self, seat_id: int, time_minutes: int = 30
+    ) -> Tuple[BookingStatus, str]:
+        """좌석 예약하기
+
+        Args:
+            seat_id: 좌석 ID
+            time_minutes: 예약 시간 (분 단위)
+
+        Returns:
+            Tuple[BookingStatus, str]: (상태 열거형, 상태 메시지) 튜플
+
+        Raises:
+            BookingError: 예약 과정에서 오류 발생
+        """
+        try:
+            response = await self.client.post(
+                "libraries/seat",
+                json_data={"seatId": seat_id, "time": time_minutes},
+                headers={"Referer": f"{self.client.BASE_URL}/seat"},
+            )
+            return _parse_booking_response(response)
+
+        except Exception as e:
+            raise BookingError(f"좌석 예약 실패: {e}") from e
+
+    async def cancel_seat(self, seat_id: int) -> bool:
+        """좌석 예약 취소
+
+        Args:
+            seat_id: 좌석 ID
+
+        Returns:
+            bool: 취소 성공 여부
+
+        Raises:
+            BookingError: 취소 과정에서 오류 발생
+        """
+        try:
+            headers = {
+                "Referer": f"{self.client.BASE_URL}/",
+                "Cache-Control": "no-cache",
+                "Pragma": "no-cache",
+            }
+            response = await self.client.post(
+                f"libraries/leave/{seat_id}", json_data={}, headers=headers
+            )
+
+            if "error" in response:
+                return False
+            return response.get("success", False)
+
+        except Exception as e:
+            raise BookingError(f"좌석 취소 과정 오류: {e}") from e
+
+    async def get_areas(
+        self, library_id: int = 1, as_models: bool = False, lazy: bool = False
+    ) -> Union[List[Dict], List[Area], List[AreaView]]:
+        """도서관 구역 정보 가져오기
+
+        Args:
+            library_id: 도서관 ID (기본값: 1 - 수원캠퍼스)
+            as_models: True이면 딕셔너리 대신 Area 객체 목록 반환
+            lazy: True이면 응답 딕셔너리를 복사하지 않는 AreaView 목록 반환
+
+        Returns:
+            List[Dict] | List[Area] | List[AreaView]: 구역 정보 목록
+
+        Raises:
+            ValueError: as_models와 lazy를 함께 지정한 경우
+            APIResponseError: API 응답 처리 중 오류 발생
+        """
+        response = await self.client.get(f"libraries/lib-status/{library_id}")
+
+        if response.get("success") and response.get("data"):
+            mapper = _area_mapper(as_models, lazy)
+            return [mapper(area) for area in response.get("data")]
+        else:
+            raise APIResponseError(
+                f"구역 정보를 가져오는데 실패했습니다: {response.get('message', '알 수 없는 오류')}"
+            )
+
+    async def get_available_seats(
+        self, area_id: int = 1, as_models: bool = False, lazy: bool = False
+    ) -> Union[List[Dict], List[Seat], List[SeatView]]:
+        """사용 가능한 좌석 목록 가져오기
+
+        Args:
+            area_id: 구역 ID
+            as_models: True이면 딕셔너리 대신 Seat 객체 목록 반환
+            lazy: True이면 응답 딕셔너리를 복사하지 않는 SeatView 목록 반환
+
+        Returns:
+            List[Dict] | List[Seat] | List[SeatView]: 사용 가능한 좌석 목록
+
+        Raises:
+            ValueError: as_models와 lazy를 함께 지정한 경우
+            SeatError: 좌석 정보 조회 중 오류 발생
+        """
+        mapper = _seat_mapper(as_models, lazy)
+        seats_data = await self._get_seat_data(area_id)
+
+        # seatTime이 null이면 예약 가능한 좌석
+        return [mapper(seat) for seat in seats_data if seat.get("seatTime") is None]
+
+    async def get_seats(
+        self, area_id: int = 1, as_models: bool = False, lazy: bool = False
+    ) -> Union[List[Dict], List[Seat], List[SeatView]]:
+        """사용 중인 좌석을 포함한 구역의 전체 좌석 목록 가져오기
+
+        Args:
+            area_id: 구역 ID
+            as_models: True이면 딕셔너리 대신 Seat 객체 목록 반환
+            lazy: True이면 응답 딕셔너리를 복사하지 않는 SeatView 목록 반환
+
+        Returns:
+            List[Dict] | List[Seat] | List[SeatView]: 전체 좌석 목록
+
+        Raises:
+            ValueError: as_models와 lazy를 함께 지정한 경우
+            SeatError: 좌석 정보 조회 중 오류 발생
+        """
+        mapper = _seat_mapper(as_models, lazy)
+        return [mapper(seat) for seat in await self._get_seat_data(area_id)]
+
+    async def _get_seat_data(self, area_id: int) -> List[Dict]:
+        """좌석 API 응답의 data 배열을 그대로 반환
+
+        Raises:
+            SeatError: 좌석 정보 조회 중 오류 발생
+        """
+        try:
+            response = await self.client.get(f"libraries/seats/{area_id}")
+
+            if response.get("success") and response.get("data"):
+                return response.get("data")
+            else:
+                raise SeatError(
+                    f"좌석 정보를 가져오는데 실패했습니다: {response.get('message', '알 수 없는 오류')}"
+                )
+
+        except Exception as e:
+            raise SeatError(f"좌석 정보 요청 오류: {e}") from e
+
+    async def get_all_available_seats(
+        self, library_id: int = 1, as_models: bool = False, lazy: bool = False
+    ) -> Dict:
+        """모든 구역의 사용 가능한 좌석을 동시에 조회
+
+        LibraryAPIWrapper.get_all_available_seats와 같은 형식의 스냅샷을 반환합니다.
+
+        Args:
+            library_id: 도서관 ID (기본값: 1 - 수원캠퍼스)
+            as_models: True이면 구역과 좌석을 Area/Seat 객체로 반환
+            lazy: True이면 구역과 좌석을 AreaView/SeatView로 반환
+
+        Returns:
+            Dict: 좌석 스냅샷 (areas, total_available, errors, elapsed 포함)
+
+        Raises:
+            APIResponseError: 구역 목록 조회 중 오류 발생
+        """
+        started = time.perf_counter()
+        areas = await self.get_areas(library_id, as_models=as_models, lazy=lazy)
+
+        async def fetch(area: Dict) -> Dict:
+            area_started = time.perf_counter()
+            try:
+                seats = await self.get_available_seats(
+                    area["id"], as_models=as_models, lazy=lazy
+                )
+                error = None
+            except SeatError as e:
+                seats, error = [], str(e)
+            return {
+                "area": area,
+                "seats": seats,
+                "latency": time.perf_counter() - area_started,
+                "error": error,
+            }
+
+        results = await asyncio.gather(*(fetch(area) for area in areas))
+        return _build_seat_snapshot(library_id, results, time.perf_counter() - started)
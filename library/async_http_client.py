@@ -0,0 +1,190 @@
+"""
+KGU Library 비동기 HTTP 클라이언트 모듈
+
+aiohttp 기반으로 LibraryHTTPClient와 같은 get/post 인터페이스를 코루틴으로 제공합니다.
+aiohttp는 선택 의존성입니다 (pip install kgu_library[async]).
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp는 선택 의존성
+    aiohttp = None
+
+from .exceptions import APIResponseError
+from .http_client import LibraryHTTPClient
+
+# 요청 제한 시간 (초) - LibraryHTTPClient와 동일
+DEFAULT_TIMEOUT = 10
+
+
+class AsyncLibraryHTTPClient:
+    """경기대학교 도서관 시스템 비동기 HTTP 클라이언트
+
+    여러 클라이언트가 같은 connector(연결 풀)를 공유할 수 있으며, 쿠키(로그인 세션)는
+    클라이언트마다 따로 관리됩니다.
+    """
+
+    BASE_URL = LibraryHTTPClient.BASE_URL
+
+    def __init__(
+        self,
+        connector: Optional["aiohttp.BaseConnector"] = None,
+        cookie_jar: Optional["aiohttp.abc.AbstractCookieJar"] = None,
+    ):
+        """비동기 HTTP 클라이언트 초기화
+
+        Args:
+            connector: 공유할 aiohttp 연결 풀 (None이면 클라이언트 전용 풀 생성)
+            cookie_jar: 사용할 쿠키 저장소 (None이면 aiohttp 기본 쿠키 저장소)
+
+        Raises:
+            ImportError: aiohttp가 설치되어 있지 않은 경우
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncLibraryHTTPClient를 사용하려면 aiohttp를 설치하세요: "
+                "pip install kgu_library[async]"
+            )
+
+        self.connector = connector
+        self.cookie_jar = cookie_jar
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "ko-KR,ko;q=0.9",
+            "Origin": self.BASE_URL,
+            "Pragma": "no-cache",
+        }
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """aiohttp 세션 (이벤트 루프 안에서 처음 사용할 때 생성)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=self.connector is None,
+                cookie_jar=self.cookie_jar,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+            )
+        return self._session
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """현재 세션 쿠키 (이름 -> 값)"""
+        if self._session is None:
+            return {}
+        return {cookie.key: cookie.value for cookie in self._session.cookie_jar}
+
+    async def close(self) -> None:
+        """세션을 닫습니다. 공유 connector는 닫지 않습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncLibraryHTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _merge_headers(
+        self, headers: Optional[Dict[str, str]], json_body: bool = False
+    ) -> Dict[str, str]:
+        """기본 헤더와 커스텀 헤더 병합"""
+        default_headers = {
+            "Host": "libgate.kyonggi.ac.kr",
+            "Accept": "application/json, text/plain, */*",
+            "Referer": f"{self.BASE_URL}/seat",
+        }
+        if json_body:
+            default_headers["Content-Type"] = "application/json"
+        return {**default_headers, **(headers or {})}
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict:
+        """GET 요청 수행
+
+        Args:
+            endpoint: API 엔드포인트 (BASE_URL 이후)
+            params: 요청 파라미터
+            headers: 요청 헤더
+
+        Returns:
+            Dict: API 응답 JSON
+
+        Raises:
+            APIResponseError: API 요청 또는 응답 처리 중 오류 발생
+        """
+        try:
+            full_url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+            async with self.session.get(
+                full_url, params=params, headers=self._merge_headers(headers), ssl=False
+            ) as response:
+                if response.status == 200:
+                    try:
+                        return json.loads(await response.read())
+                    except ValueError as e:
+                        raise APIResponseError(
+                            f"응답을 JSON으로 변환할 수 없습니다: {e}"
+                        ) from e
+                else:
+                    raise APIResponseError(
+                        f"API 요청 실패: 상태 코드 {response.status}"
+                    )
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise APIResponseError(f"API 요청 오류: {e}") from e
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Any = None,
+        json_data: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict:
+        """POST 요청 수행
+
+        Args:
+            endpoint: API 엔드포인트 (BASE_URL 이후)
+            data: 요청 데이터 (form-data)
+            json_data: 요청 JSON 데이터
+            headers: 요청 헤더
+
+        Returns:
+            Dict: API 응답 JSON
+
+        Raises:
+            APIResponseError: API 요청 또는 응답 처리 중 오류 발생
+        """
+        try:
+            full_url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+            async with self.session.post(
+                full_url,
+                data=data,
+                json=json_data,
+                headers=self._merge_headers(headers, json_data is not None),
+                ssl=False,
+            ) as response:
+                if response.status == 200:
+                    try:
+                        return json.loads(await response.read())
+                    except ValueError:
+                        # JSON 파싱에 실패했지만 상태 코드가 200인 경우, 빈 객체로 처리
+                        return {"success": True}
+                else:
+                    raise APIResponseError(
+                        f"API 요청 실패: 상태 코드 {response.status}"
+                    )
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise APIResponseError(f"API 요청 오류: {e}") from e
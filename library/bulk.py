@@ -0,0 +1,282 @@
+"""
+KGU Library 여러 계정 동시 예약 모듈
+
+스터디룸의 붙어 있는 좌석 여러 개처럼 여러 계정의 좌석을 한꺼번에 예약합니다. 계정마다
+후보 좌석 목록을 받아 제한된 수의 작업 스레드에서 동시에 로그인하고 예약하며, 한 좌석을
+두 계정이 동시에 예약하려 하지 않도록 시도할 좌석을 먼저 선점합니다.
+
+사용 예:
+    pool = LibraryAPIWrapper.create_pool()
+    for user_id, name in members:
+        pool.register(user_id, name)
+    seats = [101, 102, 103, 104, 105, 106]
+    result = BulkBooker(pool).book([(user_id, seats) for user_id, _ in members])
+    print(result.assignments, result.elapsed)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from kgu_library.core.session import SessionPool
+
+from .api import _SEAT_SPECIFIC_STATUSES, _candidate_id
+from .enums import BookingStatus
+from .exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# 다른 계정도 예약할 수 없는 좌석임을 뜻하는 상태 (선점을 풀지 않음)
+_SEAT_UNAVAILABLE_STATUSES = frozenset(
+    {BookingStatus.SUCCESS, BookingStatus.SEAT_IN_USE}
+)
+
+
+class AccountBooking:
+    """계정 하나의 예약 결과"""
+
+    __slots__ = (
+        "account",
+        "status",
+        "message",
+        "seat",
+        "attempts",
+        "login_time",
+        "booking_time",
+        "error",
+    )
+
+    def __init__(self, account: str):
+        """
+        결과 초기화
+
+        Args:
+            account: 계정 ID
+        """
+        self.account = account
+        self.status = BookingStatus.NO_SEATS_AVAILABLE
+        self.message = "NO_SEATS_AVAILABLE"
+        self.seat: Optional[Any] = None  # 예약된 후보
+        self.attempts = 0  # 보낸 예약 요청 수
+        self.login_time = 0.0  # 세션을 빌리고 로그인하는 데 걸린 시간(초)
+        self.booking_time = 0.0  # 예약 요청에 걸린 시간(초)
+        self.error: Optional[Exception] = None  # 로그인 또는 요청 중 발생한 예외
+
+    @property
+    def succeeded(self) -> bool:
+        """예약 성공 여부"""
+        return self.status == BookingStatus.SUCCESS
+
+    def __repr__(self) -> str:
+        seat = None if self.seat is None else _candidate_id(self.seat)
+        return (
+            f"AccountBooking({self.account!r}, {self.status.name}, seat={seat!r}, "
+            f"attempts={self.attempts})"
+        )
+
+
+class BulkBookingResult:
+    """여러 계정 예약 결과"""
+
+    __slots__ = ("results", "elapsed")
+
+    def __init__(self, results: List[AccountBooking], elapsed: float):
+        """
+        결과 초기화
+
+        Args:
+            results: 요청 순서대로의 계정별 결과
+            elapsed: 전체 소요 시간(초, 벽시계 기준)
+        """
+        self.results = results
+        self.elapsed = elapsed
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, account: str) -> AccountBooking:
+        for result in self.results:
+            if result.account == account:
+                return result
+        raise KeyError(account)
+
+    @property
+    def succeeded(self) -> List[AccountBooking]:
+        """예약에 성공한 계정의 결과"""
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> List[AccountBooking]:
+        """예약에 실패한 계정의 결과"""
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def assignments(self) -> Dict[str, Any]:
+        """계정 ID -> 예약된 좌석 ID"""
+        return {result.account: _candidate_id(result.seat) for result in self.succeeded}
+
+    @property
+    def statuses(self) -> Dict[str, BookingStatus]:
+        """계정 ID -> 최종 예약 상태"""
+        return {result.account: result.status for result in self.results}
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkBookingResult({len(self.succeeded)}/{len(self.results)} succeeded, "
+            f"elapsed={self.elapsed:.3f}s)"
+        )
+
+
+class BulkBooker:
+    """세션 풀의 여러 계정으로 좌석을 동시에 예약하는 엔진"""
+
+    def __init__(
+        self,
+        pool: SessionPool,
+        max_workers: int = 8,
+        checkout_timeout: Optional[float] = None,
+    ):
+        """
+        예약 엔진 초기화
+
+        Args:
+            pool: LibraryAPIWrapper.create_pool()로 만든 세션 풀 (계정 등록 필요)
+            max_workers: 동시에 로그인하고 예약할 최대 계정 수
+            checkout_timeout: 다른 작업이 계정을 사용 중일 때 기다릴 최대 시간(초)
+
+        Raises:
+            ValueError: max_workers가 1보다 작은 경우
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다")
+        self.pool = pool
+        self.max_workers = max_workers
+        self.checkout_timeout = checkout_timeout
+        self._lock = threading.Lock()
+
+    def _claim(self, claimed: Set[Any], seat_id: Any) -> bool:
+        """좌석을 선점 (이미 다른 계정이 선점했으면 False)"""
+        with self._lock:
+            if seat_id in claimed:
+                return False
+            claimed.add(seat_id)
+            return True
+
+    def _release(self, claimed: Set[Any], seat_id: Any) -> None:
+        with self._lock:
+            claimed.discard(seat_id)
+
+    def _request_seat(
+        self, claimed: Set[Any], api: Any, seat_id: Any, time_minutes: int
+    ) -> Optional[Tuple[BookingStatus, str]]:
+        """선점한 좌석을 예약 요청 (속도 제한으로 기다리는 사이 다른 계정이 선점하면 None)"""
+        while True:
+            try:
+                return api.book_seat(seat_id, time_minutes)
+            except RateLimitError as e:
+                # 요청을 보내지 않았으므로 기다리는 동안 선점을 풀어 다른 계정이 시도하게 함
+                self._release(claimed, seat_id)
+                time.sleep(e.wait_time)
+                if not self._claim(claimed, seat_id):
+                    return None
+
+    def _book_account(
+        self,
+        claimed: Set[Any],
+        account: str,
+        candidates: Iterable[Any],
+        time_minutes: int,
+    ) -> AccountBooking:
+        """한 계정으로 선점하지 않은 후보를 순서대로 예약 시도"""
+        result = AccountBooking(account)
+        started = time.perf_counter()
+        try:
+            api = self.pool.checkout(account, self.checkout_timeout)
+        except Exception as e:
+            result.login_time = time.perf_counter() - started
+            result.status = BookingStatus.API_ERROR
+            result.message = f"로그인 실패: {e}"
+            result.error = e
+            return result
+        result.login_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        try:
+            for candidate in candidates:
+                seat_id = _candidate_id(candidate)
+                if not self._claim(claimed, seat_id):
+                    continue
+
+                try:
+                    outcome = self._request_seat(claimed, api, seat_id, time_minutes)
+                except Exception as e:
+                    # 요청이 서버에 도달했을 수 있으므로 선점을 유지하고 중단
+                    result.attempts += 1
+                    result.status = BookingStatus.API_ERROR
+                    result.message = str(e)
+                    result.error = e
+                    break
+                if outcome is None:
+                    continue
+
+                result.attempts += 1
+                status, message = outcome
+                result.status, result.message = status, message
+                if status not in _SEAT_UNAVAILABLE_STATUSES:
+                    # 이 계정의 사정으로 실패한 좌석은 다른 계정이 시도할 수 있음
+                    self._release(claimed, seat_id)
+                if status == BookingStatus.SUCCESS:
+                    result.seat = candidate
+                    break
+                if status not in _SEAT_SPECIFIC_STATUSES:
+                    break
+        finally:
+            result.booking_time = time.perf_counter() - started
+            self.pool.checkin(account)
+        return result
+
+    def book(
+        self,
+        requests: Iterable[Tuple[str, Iterable[Any]]],
+        time_minutes: int = 30,
+    ) -> BulkBookingResult:
+        """
+        계정별 후보 좌석으로 동시에 예약합니다.
+
+        각 계정은 후보 중 다른 계정이 선점하지 않은 좌석을 순서대로 시도하며, 좌석이
+        이미 사용 중이면 다음 후보로 넘어가고 다른 좌석 사용 중, 일일 횟수 초과처럼
+        다른 좌석으로도 해결되지 않는 실패는 더 시도하지 않습니다. 모든 계정에 같은
+        후보 목록을 주면 서로 다른 좌석이 배정됩니다. 선점은 이 호출 안에서만
+        유지됩니다.
+
+        Args:
+            requests: (계정 ID, 우선순위 순서의 후보 좌석 목록) 쌍 목록
+            time_minutes: 예약 시간 (분 단위)
+
+        Returns:
+            BulkBookingResult: 요청 순서대로의 계정별 결과와 전체 소요 시간
+        """
+        requests = [(account, list(candidates)) for account, candidates in requests]
+        # 이번 호출에서 계정들이 시도 중이거나 시도한 좌석
+        claimed: Set[Any] = set()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, max(len(requests), 1))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._book_account, claimed, account, candidates, time_minutes
+                )
+                for account, candidates in requests
+            ]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        bulk = BulkBookingResult(results, elapsed)
+        logger.info(f"여러 계정 예약 완료: {bulk!r}")
+        return bulk
@@ -0,0 +1,174 @@
+"""
+KGU Library 서버 시계 추정
+
+응답의 Date 헤더(초 단위)와 요청을 보낸/받은 시각으로 서버 시계와 로컬 시계의 차이
+(offset = 서버 시각 - 로컬 시각)가 있을 수 있는 구간을 구하고, 표본마다 구간을
+교집합으로 좁힙니다. Date 헤더는 초 단위이지만, 초가 바뀌는 순간 근처에 도착하도록
+요청을 보내면 구간을 왕복 시간(RTT) 수준까지 줄일 수 있습니다 (BookingScheduler.sync).
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from email.utils import mktime_tz, parsedate_tz
+from typing import Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def parse_http_date(value: Optional[str]) -> Optional[float]:
+    """
+    HTTP Date 헤더 값을 유닉스 시각으로 변환합니다.
+
+    Args:
+        value: Date 헤더 값 (예: "Wed, 01 Jan 2025 00:00:00 GMT")
+
+    Returns:
+        Optional[float]: 유닉스 시각 (형식이 올바르지 않으면 None)
+    """
+    if not isinstance(value, str):
+        return None
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    try:
+        return float(mktime_tz(parsed))
+    except (OverflowError, ValueError):
+        return None
+
+
+class ServerClock:
+    """Date 헤더 표본으로 추정한 서버 시계"""
+
+    # Date 헤더의 해상도(초)
+    DATE_RESOLUTION = 1.0
+
+    def __init__(self, max_samples: int = 32):
+        """
+        서버 시계 초기화
+
+        Args:
+            max_samples: 왕복 시간 추정에 사용할 최근 표본 수
+        """
+        self._lock = threading.Lock()
+        self._lower: Optional[float] = None
+        self._upper: Optional[float] = None
+        self._rtts = deque(maxlen=max_samples)
+        self.samples = 0
+
+    def __repr__(self) -> str:
+        if self._lower is None:
+            return "ServerClock(samples=0)"
+        return (
+            f"ServerClock(offset={self.offset:+.3f}, "
+            f"uncertainty={self.uncertainty:.3f}, samples={self.samples})"
+        )
+
+    def add_sample(self, sent: float, received: float, server_time: float) -> None:
+        """
+        표본 하나를 반영합니다.
+
+        서버는 요청을 보낸 뒤 응답을 받기 전 어느 순간에 Date를 기록했으므로,
+        offset은 [server_time - received, server_time + 해상도 - sent) 구간에 있습니다.
+
+        Args:
+            sent: 요청을 보낸 로컬 시각 (time.time())
+            received: 응답을 받은 로컬 시각 (time.time())
+            server_time: 응답 Date 헤더의 시각 (초 단위로 내림된 값)
+        """
+        lower = server_time - received
+        upper = server_time + self.DATE_RESOLUTION - sent
+
+        with self._lock:
+            self.samples += 1
+            self._rtts.append(received - sent)
+            if self._lower is None or max(lower, self._lower) > min(upper, self._upper):
+                # 처음이거나 이전 추정과 맞지 않음 (서버 시계 조정 등) -> 새로 추정
+                if self._lower is not None:
+                    logger.debug(
+                        "서버 시계 표본이 이전 추정과 맞지 않아 다시 추정합니다"
+                    )
+                self._lower, self._upper = lower, upper
+            else:
+                self._lower = max(lower, self._lower)
+                self._upper = min(upper, self._upper)
+
+    def record_response(
+        self, sent: float, received: float, headers: Mapping[str, str]
+    ) -> bool:
+        """
+        HTTP 응답 헤더의 Date로 표본을 반영합니다.
+
+        Args:
+            sent: 요청을 보낸 로컬 시각 (time.time())
+            received: 응답을 받은 로컬 시각 (time.time())
+            headers: 응답 헤더
+
+        Returns:
+            bool: 표본 반영 여부 (Date 헤더가 없거나 올바르지 않으면 False)
+        """
+        server_time = parse_http_date(headers.get("Date"))
+        if server_time is None:
+            return False
+        self.add_sample(sent, received, server_time)
+        return True
+
+    @property
+    def bounds(self) -> Optional[Tuple[float, float]]:
+        """offset이 있을 수 있는 구간 (표본이 없으면 None)"""
+        with self._lock:
+            if self._lower is None:
+                return None
+            return self._lower, self._upper
+
+    @property
+    def offset(self) -> Optional[float]:
+        """추정 offset (서버 시각 - 로컬 시각, 표본이 없으면 None)"""
+        bounds = self.bounds
+        return None if bounds is None else (bounds[0] + bounds[1]) / 2
+
+    @property
+    def uncertainty(self) -> float:
+        """추정 offset의 최대 오차(초, 표본이 없으면 무한대)"""
+        bounds = self.bounds
+        return float("inf") if bounds is None else (bounds[1] - bounds[0]) / 2
+
+    @property
+    def rtt(self) -> Optional[float]:
+        """최근 표본 중 가장 짧은 왕복 시간(초, 표본이 없으면 None)"""
+        with self._lock:
+            return min(self._rtts) if self._rtts else None
+
+    def server_time(self, local_time: Optional[float] = None) -> float:
+        """
+        로컬 시각에 해당하는 서버 시각을 추정합니다.
+
+        Args:
+            local_time: 로컬 시각 (None이면 현재 시각)
+
+        Returns:
+            float: 추정 서버 시각 (표본이 없으면 로컬 시각 그대로)
+        """
+        if local_time is None:
+            local_time = time.time()
+        return local_time + (self.offset or 0.0)
+
+    def to_local(self, server_time: float) -> float:
+        """
+        서버 시각에 해당하는 로컬 시각을 추정합니다.
+
+        Args:
+            server_time: 서버 시각
+
+        Returns:
+            float: 추정 로컬 시각 (표본이 없으면 서버 시각 그대로)
+        """
+        return server_time - (self.offset or 0.0)
+
+    def reset(self) -> None:
+        """모든 표본을 지웁니다."""
+        with self._lock:
+            self._lower = self._upper = None
+            self._rtts.clear()
+            self.samples = 0
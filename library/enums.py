@@ -49,3 +49,11 @@ class SeatExtensionStatus(Enum):
     UNKNOWN_ERROR = 100  # 알 수 없는 오류
     API_ERROR = 101  # API 호출 오류 (success: false 등)
     INVALID_RESPONSE = 102  # 잘못된 응답 형식
+
+
+class SeatChangeType(Enum):
+    """좌석 상태 변화 종류 Enum"""
+
+    FREED = "freed"  # 사용 중이던 좌석이 비었음
+    TAKEN = "taken"  # 빈 좌석이 사용 중으로 바뀜
+    TIME_CHANGED = "time_changed"  # 사용 중인 좌석의 이용 시간이 바뀜 (연장 등)
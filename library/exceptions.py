@@ -31,3 +31,20 @@ class APIResponseError(LibraryAPIError):
     """API 응답 관련 예외"""
 
     pass
+
+
+class RateLimitError(APIResponseError):
+    """요청 속도 제한으로 요청을 보내지 못한 경우의 예외 (요청은 서버에 보내지 않음)"""
+
+    def __init__(
+        self,
+        message: str = "요청 속도 제한으로 요청을 보내지 못했습니다.",
+        wait_time: float = 0.0,
+    ):
+        """
+        Args:
+            message: 오류 메시지
+            wait_time: 토큰이 찰 때까지 기다려야 할 시간(초)
+        """
+        self.wait_time = wait_time
+        super().__init__(message)
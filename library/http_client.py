@@ -4,10 +4,23 @@ KGU Library HTTP 클라이언트 모듈
 
 import requests
 import json
+import time
 import urllib3
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Union
+from urllib.parse import urlsplit
 
-from .exceptions import LibraryAPIError, APIResponseError
+from kgu_library.core.http import (
+    NO_RETRY,
+    AttemptRecord,
+    RateLimiter,
+    RetryPolicy,
+    SingleFlight,
+    Transport,
+    TransportConfig,
+)
+from .clock import ServerClock
+from .exceptions import LibraryAPIError, APIResponseError, RateLimitError
 
 # SSL 경고 비활성화
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -18,9 +31,41 @@ class LibraryHTTPClient:
 
     BASE_URL = "https://libgate.kyonggi.ac.kr"
 
-    def __init__(self):
-        """HTTP 클라이언트 초기화"""
-        self.session = requests.Session()
+    def __init__(
+        self,
+        transport: Optional[Union[Transport, TransportConfig]] = None,
+        clock: Optional[ServerClock] = None,
+        coalesce: bool = False,
+        coalesce_ttl: float = 0.0,
+        retry: Optional[RetryPolicy] = None,
+        attempt_log_size: int = 256,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """HTTP 클라이언트 초기화
+
+        Args:
+            transport: 여러 클라이언트가 공유할 연결 풀(Transport) 또는 이 클라이언트
+                전용 연결 풀 설정(TransportConfig). None이면 기본 설정을 사용합니다.
+            clock: 응답 Date 헤더로 갱신할 서버 시계 (None이면 클라이언트 전용 시계)
+            coalesce: True이면 여러 스레드의 동일한 GET 요청을 하나로 합쳐 응답을 공유
+                (공유된 응답 딕셔너리는 수정하지 않아야 합니다)
+            coalesce_ttl: 합친 GET 응답을 보관할 시간(초, 0보다 크면 coalesce 사용)
+            retry: 일시적인 오류가 난 요청을 다시 보낼 정책 (None이면 다시 보내지 않음)
+            attempt_log_size: attempt_log에 보관할 최근 시도 기록 수
+            rate_limiter: 요청을 보내기 전에 확인할 호스트별, 계정별 속도 제한
+                (여러 클라이언트가 같은 객체를 공유하여 전체 속도를 제한)
+        """
+        self.transport = Transport.resolve(transport)
+        self.clock = clock if clock is not None else ServerClock()
+        self.single_flight = (
+            SingleFlight(ttl=coalesce_ttl) if coalesce or coalesce_ttl > 0 else None
+        )
+        self.retry = retry if retry is not None else NO_RETRY
+        # 최근 요청 시도별 상태 코드, 소요 시간 기록 (관측용)
+        self.attempt_log: Deque[AttemptRecord] = deque(maxlen=attempt_log_size)
+        self.rate_limiter = rate_limiter
+        self.account: Optional[str] = None  # 계정별 속도 제한에 사용할 계정 ID
+        self.session = self.transport.create_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
@@ -32,6 +77,48 @@ class LibraryHTTPClient:
         )
         self.session.verify = False
 
+    def acquire_rate_limit(self, url: str, timeout: Optional[float] = None) -> None:
+        """요청 속도 제한 토큰 사용 (제한이 없으면 무시)
+
+        Args:
+            url: 요청 URL (호스트별 제한에 사용)
+            timeout: 토큰을 기다릴 최대 시간(초, None이면 계속 대기, 0이면 기다리지 않음)
+
+        Raises:
+            RateLimitError: timeout 안에 토큰을 사용하지 못한 경우
+        """
+        if self.rate_limiter is None:
+            return
+        host = urlsplit(url).hostname or ""
+        wait = self.rate_limiter.take(host, self.account, timeout)
+        if wait > 0:
+            raise RateLimitError(
+                f"요청 속도 제한으로 요청을 보내지 못했습니다: {host}", wait_time=wait
+            )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        rate_limit_timeout: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """속도 제한과 재시도 정책에 따라 요청을 보내고 응답마다 서버 시계를 갱신"""
+
+        def send() -> requests.Response:
+            # 재시도도 속도 제한을 지킴
+            self.acquire_rate_limit(url, rate_limit_timeout)
+            sent = time.time()
+            request = self.session.get if method == "GET" else self.session.post
+            response = request(url, timeout=10, **kwargs)
+            self.clock.record_response(sent, time.time(), response.headers)
+            return response
+
+        return self.retry.call(
+            method, url, send, idempotent, on_attempt=self.attempt_log.append
+        )
+
     def get(
         self,
         endpoint: str,
@@ -40,6 +127,9 @@ class LibraryHTTPClient:
     ) -> Dict:
         """GET 요청 수행
 
+        coalesce를 사용하면 같은 엔드포인트, 파라미터, 헤더의 GET 요청이 진행 중일 때
+        새로 보내지 않고 진행 중인 요청의 응답(또는 예외)을 함께 받습니다.
+
         Args:
             endpoint: API 엔드포인트 (BASE_URL 이후)
             params: 요청 파라미터
@@ -50,7 +140,30 @@ class LibraryHTTPClient:
 
         Raises:
             APIResponseError: API 요청 또는 응답 처리 중 오류 발생
+            RateLimitError: 속도 제한 토큰을 사용하지 못한 경우
         """
+        if self.single_flight is None:
+            return self._get(endpoint, params, headers)
+
+        key = (
+            endpoint.lstrip("/"),
+            tuple(sorted(params.items())) if params else None,
+            tuple(sorted(headers.items())) if headers else None,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # 리스트 등 해시할 수 없는 파라미터가 있으면 합치지 않음
+            return self._get(endpoint, params, headers)
+        return self.single_flight.do(key, lambda: self._get(endpoint, params, headers))
+
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict:
+        """GET 요청을 실제로 전송 (get() 참고)"""
         if not headers:
             headers = {}
 
@@ -66,8 +179,8 @@ class LibraryHTTPClient:
 
         try:
             full_url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
-            response = self.session.get(
-                full_url, params=params, headers=merged_headers, timeout=10
+            response = self._send(
+                "GET", full_url, params=params, headers=merged_headers
             )
 
             if response.status_code == 200:
@@ -91,20 +204,29 @@ class LibraryHTTPClient:
         data: Any = None,
         json_data: Optional[Dict] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: bool = False,
+        rate_limit_timeout: Optional[float] = None,
     ) -> Dict:
         """POST 요청 수행
 
+        POST는 기본적으로 멱등하지 않은 요청으로 보고, 서버가 처리했을 수 있는 오류
+        (읽기 시간 초과, 5xx 응답 등) 후에는 재시도 정책이 있어도 다시 보내지 않습니다.
+
         Args:
             endpoint: API 엔드포인트 (BASE_URL 이후)
             data: 요청 데이터 (form-data)
             json_data: 요청 JSON 데이터
             headers: 요청 헤더
+            idempotent: 여러 번 보내도 결과가 같은 요청이면 True (GET처럼 다시 보냄)
+            rate_limit_timeout: 속도 제한 토큰을 기다릴 최대 시간(초, None이면 계속
+                대기, 0이면 기다리지 않고 RateLimitError 발생)
 
         Returns:
             Dict: API 응답 JSON
 
         Raises:
             APIResponseError: API 요청 또는 응답 처리 중 오류 발생
+            RateLimitError: rate_limit_timeout 안에 속도 제한 토큰을 사용하지 못한 경우
         """
         if not headers:
             headers = {}
@@ -125,8 +247,14 @@ class LibraryHTTPClient:
 
         try:
             full_url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
-            response = self.session.post(
-                full_url, data=data, json=json_data, headers=merged_headers, timeout=10
+            response = self._send(
+                "POST",
+                full_url,
+                idempotent,
+                rate_limit_timeout,
+                data=data,
+                json=json_data,
+                headers=merged_headers,
             )
 
             if response.status_code == 200:
@@ -0,0 +1,353 @@
+"""
+KGU Library 데이터 모델
+
+구역(Area)과 좌석(Seat) 정보를 __slots__ 객체로 표현합니다. 필드마다 딕셔너리를 만드는
+대신 고정된 슬롯에 값을 저장하므로, 모든 구역의 좌석 스냅샷을 오래 보관해도 메모리를
+적게 사용합니다. to_dict()로 기존 딕셔너리 형식을 그대로 얻을 수 있습니다.
+
+AreaView/SeatView는 응답 딕셔너리를 복사하지 않고 감싸기만 하며, 속성에 접근할 때만
+snake_case 이름을 camelCase 응답 키로 바꿔 값을 읽습니다.
+"""
+
+from typing import Any, Dict, Tuple
+
+# (속성 이름, API 응답 키, 기본값)
+FieldSpec = Tuple[str, str, Any]
+
+AREA_FIELDS: Tuple[FieldSpec, ...] = (
+    # 기본 정보
+    ("code", "code", None),
+    ("name", "name", None),
+    ("name_eng", "nameEng", None),
+    # 좌석 정보
+    ("total_seats", "cnt", 0),
+    ("available", "available", 0),
+    ("in_use", "inUse", 0),
+    ("fix", "fix", 0),
+    ("disabled", "disabled", 0),
+    ("fixed_seat", "fixedSeat", 0),
+    ("normal", "normal", 0),
+    ("unavailable", "unavailable", 0),
+    # 기능 허용 여부
+    ("note_book_yn", "noteBookYN", None),
+    ("keyboard_yn", "keyboardYN", None),
+    ("talk_yn", "talkYN", None),
+    # 시간 설정
+    ("sc_ck_mi", "scCkMi", None),  # 체크인 간격(분)
+    ("max_mi", "maxMi", None),  # 최대 이용 시간(분)
+    ("max_renew_mi", "maxRenewMi", None),  # 최대 연장 시간(분)
+    ("start_time", "startTm", None),  # 운영 시작 시간
+    ("end_time", "endTm", None),  # 운영 종료 시간
+    ("week_start_time", "wkStartTm", None),  # 주중 운영 시작 시간
+    ("week_end_time", "wkEndTm", None),  # 주중 운영 종료 시간
+    ("week_setting", "wkSetting", None),  # 주간 설정
+    ("week_time_use_setting", "wkTimeUseSetting", None),  # 주간 시간 이용 설정
+    ("week_reserve_use_yn", "wkRsrvUseYn", None),  # 주간 예약 이용 여부
+    # 이미지 정보
+    ("bg_image", "bgImg", None),  # 배경 이미지
+    ("preview_image", "previewImg", None),  # 미리보기 이미지
+    ("minimap_image", "miniMapImg", None),  # 미니맵 이미지
+    ("minimap_lib_image", "miniMapLibImg", None),  # 미니맵 도서관 이미지
+    # 색상 정보
+    ("color", "color", None),
+    # 휴일 정보
+    ("day_off", "dayOff", None),
+    # 특별 이용 정보
+    ("va_name", "vaName", None),  # 특별 이용명
+    ("va_start_time", "vaStartTime", None),  # 특별 이용 시작 시간
+    ("va_end_time", "vaEndTime", None),  # 특별 이용 종료 시간
+    ("va_week_start_time", "vaWkStartTime", None),  # 특별 이용 주중 시작 시간
+    ("va_week_end_time", "vaWkEndTime", None),  # 특별 이용 주중 종료 시간
+    ("va_week_setting", "vaWkSetting", None),  # 특별 이용 주간 설정
+    # 특별 이용 주간 시간 이용 설정
+    ("va_week_time_use_setting", "vaWkTimeUseSetting", None),
+    ("va_week_reserve_use_yn", "vaWkRsrvUseYn", None),  # 특별 이용 주간 예약 이용 여부
+)
+
+# 좌석 이용에 따라 계속 바뀌는 구역 필드 (나머지는 하루에 한 번 바뀔까 말까 한 정적 정보)
+AREA_COUNTER_NAMES = frozenset(
+    (
+        "total_seats",
+        "available",
+        "in_use",
+        "fix",
+        "disabled",
+        "fixed_seat",
+        "normal",
+        "unavailable",
+    )
+)
+AREA_COUNTER_FIELDS: Tuple[FieldSpec, ...] = tuple(
+    spec for spec in AREA_FIELDS if spec[0] in AREA_COUNTER_NAMES
+)
+AREA_STATIC_FIELDS: Tuple[FieldSpec, ...] = tuple(
+    spec for spec in AREA_FIELDS if spec[0] not in AREA_COUNTER_NAMES
+)
+
+SEAT_FIELDS: Tuple[FieldSpec, ...] = (
+    # 기본 정보
+    ("code", "code", None),
+    ("name", "name", None),
+    ("status", "status", None),
+    ("disabled", "disabled", None),
+    ("is_active", "isActive", None),
+    # 좌석 위치 정보
+    ("x", "x", None),
+    ("y", "y", None),
+    ("width", "width", None),
+    ("height", "height", None),
+    ("direction", "direction", None),
+    # 사용 정보
+    ("seat_time", "seatTime", None),
+    ("check_in", "checkIn", None),
+    ("end_time", "endTime", None),
+    ("user_name", "userName", None),
+    ("user_id", "userId", None),
+    # 추가 정보
+    ("is_notebook", "isNotebook", None),
+    ("is_disabled", "isDisabled", None),
+    ("is_fixed_seat", "isFixedSeat", None),
+)
+
+# 좌석 응답의 중첩된 area 객체에서 가져오는 필드
+SEAT_AREA_FIELDS: Tuple[FieldSpec, ...] = (
+    ("area_id", "code", None),
+    ("area_name", "name", "알 수 없음"),
+)
+
+
+class _SlottedModel:
+    """필드 정의 표로 만드는 읽기 전용 __slots__ 모델의 공통 기능"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} 객체는 수정할 수 없습니다")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} 객체는 수정할 수 없습니다")
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return self._values()
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        # copy/pickle 복원 시 읽기 전용 검사 우회
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @property
+    def id(self) -> Any:
+        """ID (code와 같은 값)"""
+        return self.code
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self._values()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.code!r}, name={self.name!r})"
+
+    def __getitem__(self, key: str) -> Any:
+        """기존 딕셔너리 방식 접근 (area["id"] 등) 지원"""
+        if key != "id" and key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """딕셔너리의 get()과 같은 방식으로 필드 값을 반환합니다."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        기존 API가 반환하던 딕셔너리 형식으로 변환합니다.
+
+        Returns:
+            Dict[str, Any]: id를 포함한 모든 필드
+        """
+        result = {"id": self.code}
+        for name in self.__slots__:
+            result[name] = getattr(self, name)
+        return result
+
+
+def _set_fields(obj: _SlottedModel, fields: Tuple[FieldSpec, ...], data: Dict):
+    """API 응답 항목의 값을 슬롯에 채움 (읽기 전용 검사 우회)"""
+    get = data.get
+    for name, key, default in fields:
+        object.__setattr__(obj, name, get(key, default))
+
+
+class Area(_SlottedModel):
+    """도서관 구역 정보"""
+
+    __slots__ = tuple(name for name, _, _ in AREA_FIELDS)
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "Area":
+        """
+        구역 API 응답 항목으로 구역 객체를 만듭니다.
+
+        Args:
+            data: libraries/lib-status 응답의 data 배열 항목
+
+        Returns:
+            Area: 구역 객체
+        """
+        area = cls.__new__(cls)
+        _set_fields(area, AREA_FIELDS, data)
+        return area
+
+
+class Seat(_SlottedModel):
+    """도서관 좌석 정보"""
+
+    __slots__ = tuple(name for name, _, _ in SEAT_FIELDS + SEAT_AREA_FIELDS)
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "Seat":
+        """
+        좌석 API 응답 항목으로 좌석 객체를 만듭니다.
+
+        Args:
+            data: libraries/seats 응답의 data 배열 항목
+
+        Returns:
+            Seat: 좌석 객체
+        """
+        seat = cls.__new__(cls)
+        _set_fields(seat, SEAT_FIELDS, data)
+        _set_fields(seat, SEAT_AREA_FIELDS, data.get("area") or {})
+        return seat
+
+    @property
+    def is_available(self) -> bool:
+        """예약 가능 여부 (seatTime이 null이면 예약 가능)"""
+        return self.seat_time is None
+
+
+class _LazyView:
+    """응답 딕셔너리를 감싸 접근할 때만 필드 값을 읽는 뷰의 공통 기능"""
+
+    __slots__ = ("_raw",)
+
+    # 속성 이름 -> (API 응답 키, 기본값)
+    _KEYS: Dict[str, Tuple[str, Any]] = {}
+    _MODEL = None
+
+    def __init__(self, raw: Dict):
+        """
+        뷰 초기화
+
+        Args:
+            raw: API 응답의 data 배열 항목 (복사하지 않음)
+        """
+        object.__setattr__(self, "_raw", raw)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            key, default = self._KEYS[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__} 객체에 {name} 속성이 없습니다"
+            ) from None
+        return self._raw.get(key, default)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} 객체는 수정할 수 없습니다")
+
+    def __reduce__(self):
+        # copy/pickle은 원본 딕셔너리로 뷰를 다시 만듦 (읽기 전용 검사 우회)
+        return type(self), (self._raw,)
+
+    @property
+    def raw(self) -> Dict:
+        """감싸고 있는 원본 응답 딕셔너리"""
+        return self._raw
+
+    @property
+    def id(self) -> Any:
+        """ID (code와 같은 값)"""
+        return self._raw.get("code")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._raw == other._raw
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, name={self.name!r})"
+
+    def __getitem__(self, key: str) -> Any:
+        """기존 딕셔너리 방식 접근 (area["id"] 등) 지원"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """딕셔너리의 get()과 같은 방식으로 필드 값을 반환합니다."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_model(self) -> _SlottedModel:
+        """
+        모든 필드를 읽어 __slots__ 모델 객체로 변환합니다.
+
+        Returns:
+            Area 또는 Seat 객체
+        """
+        return self._MODEL.from_json(self._raw)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        기존 API가 반환하던 딕셔너리 형식으로 변환합니다.
+
+        Returns:
+            Dict[str, Any]: id를 포함한 모든 필드
+        """
+        return self.to_model().to_dict()
+
+
+class AreaView(_LazyView):
+    """구역 응답 딕셔너리의 지연 변환 뷰 (Area와 같은 속성 제공)"""
+
+    __slots__ = ()
+    _KEYS = {name: (key, default) for name, key, default in AREA_FIELDS}
+    _MODEL = Area
+
+
+class SeatView(_LazyView):
+    """좌석 응답 딕셔너리의 지연 변환 뷰 (Seat와 같은 속성 제공)"""
+
+    __slots__ = ()
+    _KEYS = {name: (key, default) for name, key, default in SEAT_FIELDS}
+    _MODEL = Seat
+
+    @property
+    def area_id(self) -> Any:
+        """구역 ID"""
+        return (self._raw.get("area") or {}).get("code")
+
+    @property
+    def area_name(self) -> Any:
+        """구역 이름"""
+        return (self._raw.get("area") or {}).get("name", "알 수 없음")
+
+    @property
+    def is_available(self) -> bool:
+        """예약 가능 여부 (seatTime이 null이면 예약 가능)"""
+        return self._raw.get("seatTime") is None
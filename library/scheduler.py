@@ -0,0 +1,288 @@
+"""
+KGU Library 예약 시각 예약 모듈
+
+도서관이 문을 여는 순간처럼 정해진 서버 시각에 좌석 예약 요청이 서버에 도착하도록
+요청을 보냅니다. 서버 시계는 LibraryHTTPClient가 응답마다 기록하는 Date 헤더와 왕복
+시간으로 추정하고, 예약 직전에 연결과 로그인 세션을 미리 준비해 둡니다.
+
+사용 예:
+    scheduler = BookingScheduler(api, credentials=("202400000", "홍길동"))
+    result = scheduler.book_at(datetime(2025, 3, 4, 9, 0), [101, 102, 103])
+    print(result.status, result.arrival_error)
+"""
+
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Any, Iterable, Optional, Tuple, Union
+
+from .api import LibraryAPIWrapper
+from .enums import BookingStatus
+from .exceptions import LibraryAPIError, LoginError
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(초)보다 많이 남으면 sleep, 그 뒤로는 바쁜 대기로 시각을 맞춤
+_SPIN_THRESHOLD = 0.02
+
+
+def _sleep_until(deadline: float) -> None:
+    """로컬 시각 deadline(time.time())까지 대기 (마지막 구간은 바쁜 대기)"""
+    # 대기 중 시스템 시계가 조정되어도 흔들리지 않도록 perf_counter 기준으로 변환
+    end = time.perf_counter() + (deadline - time.time())
+    while True:
+        remaining = end - time.perf_counter()
+        if remaining <= 0:
+            return
+        if remaining > _SPIN_THRESHOLD:
+            time.sleep(remaining - _SPIN_THRESHOLD / 2)
+
+
+class ScheduledBooking:
+    """예약 시각 예약 결과"""
+
+    __slots__ = (
+        "status",
+        "message",
+        "seat",
+        "target",
+        "fired_at",
+        "offset",
+        "uncertainty",
+        "rtt",
+        "attempts",
+    )
+
+    def __init__(
+        self,
+        status: BookingStatus,
+        message: str,
+        seat: Optional[Any],
+        target: float,
+        fired_at: float,
+        offset: float,
+        uncertainty: float,
+        rtt: float,
+        attempts: int,
+    ):
+        """
+        결과 초기화
+
+        Args:
+            status: 최종 예약 상태
+            message: 최종 상태 메시지
+            seat: 예약된 후보 (실패하면 None)
+            target: 목표 서버 시각
+            fired_at: 첫 예약 요청을 보낸 로컬 시각
+            offset: 요청 당시 추정 offset (서버 시각 - 로컬 시각)
+            uncertainty: 요청 당시 offset의 최대 오차(초)
+            rtt: 요청 당시 추정 왕복 시간(초)
+            attempts: 예약 시도 횟수 (운영 시간 전 응답으로 다시 보낸 횟수 포함)
+        """
+        self.status = status
+        self.message = message
+        self.seat = seat
+        self.target = target
+        self.fired_at = fired_at
+        self.offset = offset
+        self.uncertainty = uncertainty
+        self.rtt = rtt
+        self.attempts = attempts
+
+    @property
+    def arrival_error(self) -> float:
+        """첫 요청이 서버에 도착한 추정 시각 - 목표 시각 (초, 양수면 늦음)"""
+        return self.fired_at + self.offset + self.rtt / 2 - self.target
+
+    def __repr__(self) -> str:
+        return (
+            f"ScheduledBooking({self.status.name}, "
+            f"arrival_error={self.arrival_error * 1000:+.1f}ms, "
+            f"uncertainty={self.uncertainty * 1000:.1f}ms, attempts={self.attempts})"
+        )
+
+
+class BookingScheduler:
+    """서버 시계에 맞춰 정해진 시각에 좌석을 예약하는 스케줄러"""
+
+    def __init__(
+        self,
+        api: LibraryAPIWrapper,
+        credentials: Optional[Tuple[str, str]] = None,
+        probe_endpoint: str = "user/my-status",
+        target_uncertainty: float = 0.03,
+    ):
+        """
+        스케줄러 초기화
+
+        Args:
+            api: 예약에 사용할 LibraryAPIWrapper
+            credentials: 예약 직전 다시 로그인할 (사용자 ID, 이름) (None이면 로그인 생략)
+            probe_endpoint: 시계 동기화와 연결 준비에 사용할 GET 엔드포인트
+            target_uncertainty: sync()가 목표로 하는 offset 최대 오차(초)
+        """
+        self.api = api
+        self.credentials = credentials
+        self.probe_endpoint = probe_endpoint
+        self.target_uncertainty = target_uncertainty
+
+    @property
+    def clock(self):
+        """api의 HTTP 클라이언트가 갱신하는 서버 시계"""
+        return self.api.client.clock
+
+    def _probe(self) -> None:
+        """탐색 요청 한 번 (응답 Date가 서버 시계에 반영되고 연결이 준비됨)"""
+        try:
+            # 합쳐지거나 보관된 응답은 시각 표본이 되지 않으므로 항상 새로 요청
+            self.api.client._get(self.probe_endpoint)
+        except LibraryAPIError as e:
+            # 응답 상태와 관계없이 Date 헤더는 이미 반영되었을 수 있음
+            logger.debug(f"시계 탐색 요청 실패: {e}")
+
+    def sync(self, probes: int = 8) -> Tuple[float, float]:
+        """
+        서버 시계 offset을 추정합니다.
+
+        추정 구간의 가운데를 기준으로 서버 시각의 초가 바뀌는 순간에 요청이 도착하도록
+        보내면, 응답 Date가 바뀌었는지에 따라 구간이 절반씩 줄어듭니다. 왕복 시간이
+        짧을수록 정밀해지며, 탐색 한 번에 최대 1초가 걸립니다.
+
+        Args:
+            probes: 최대 탐색 요청 수 (첫 요청 제외)
+
+        Returns:
+            Tuple[float, float]: (offset, 최대 오차) (초)
+
+        Raises:
+            LibraryAPIError: 서버 응답에서 Date 헤더를 얻지 못한 경우
+        """
+        self._probe()
+        if self.clock.bounds is None:
+            raise LibraryAPIError(
+                "서버 응답에 Date 헤더가 없어 시계를 맞출 수 없습니다"
+            )
+
+        for _ in range(probes):
+            if self.clock.uncertainty <= self.target_uncertainty:
+                break
+            offset, half_rtt = self.clock.offset, self.clock.rtt / 2
+            # 요청이 (추정) 서버 시각으로 다음 정각 초에 도착하도록 보낼 로컬 시각
+            boundary = math.ceil(time.time() + offset + half_rtt + 0.01)
+            _sleep_until(boundary - offset - half_rtt)
+            self._probe()
+
+        logger.info(f"서버 시계 동기화: {self.clock!r}")
+        return self.clock.offset, self.clock.uncertainty
+
+    def prewarm(self) -> None:
+        """
+        예약 직전 준비: 로그인 세션을 갱신하고 연결을 미리 열어 둡니다.
+
+        Raises:
+            LoginError: credentials로 로그인하지 못한 경우
+        """
+        if self.credentials is not None and not self.api.login(*self.credentials):
+            raise LoginError("예약 전 로그인에 실패했습니다")
+        self._probe()
+
+    def fire_time(self, target: float, margin: Optional[float] = None) -> float:
+        """
+        요청이 서버에 target 시각에 도착하도록 보낼 로컬 시각을 계산합니다.
+
+        Args:
+            target: 목표 서버 시각
+            margin: 목표보다 늦게 도착하도록 더할 여유(초, None이면 offset 최대 오차)
+
+        Returns:
+            float: 요청을 보낼 로컬 시각 (time.time() 기준)
+        """
+        clock = self.clock
+        if margin is None:
+            margin = clock.uncertainty if clock.bounds is not None else 0.0
+        return clock.to_local(target) - (clock.rtt or 0.0) / 2 + margin
+
+    def book_at(
+        self,
+        target: Union[datetime, float],
+        candidates: Iterable[Any],
+        time_minutes: int = 30,
+        max_in_flight: int = 1,
+        sync: bool = True,
+        prewarm: float = 2.0,
+        margin: Optional[float] = None,
+        retry_window: float = 1.0,
+        retry_interval: float = 0.05,
+    ) -> ScheduledBooking:
+        """
+        서버 시각 target에 예약 요청이 도착하도록 후보 좌석 예약을 시도합니다.
+
+        운영 시간 전(BEFORE_OPERATION_HOURS) 응답을 받으면 retry_window 동안
+        retry_interval 간격으로 다시 보냅니다.
+
+        Args:
+            target: 목표 서버 시각 (datetime 또는 유닉스 시각)
+            candidates: 우선순위 순서의 좌석 ID 또는 좌석 목록
+            time_minutes: 예약 시간 (분 단위)
+            max_in_flight: 동시에 보낼 최대 예약 요청 수
+            sync: True이면 offset 오차가 목표보다 클 때 먼저 sync() 실행
+            prewarm: 요청 몇 초 전에 prewarm()을 실행할지 (0이면 생략)
+            margin: 목표보다 늦게 도착하도록 더할 여유(초, None이면 offset 최대 오차)
+            retry_window: 운영 시간 전 응답을 다시 시도할 시간(초)
+            retry_interval: 다시 시도하는 간격(초)
+
+        Returns:
+            ScheduledBooking: 예약 결과와 달성한 시각 정보
+
+        Raises:
+            LoginError: 예약 전 로그인에 실패한 경우
+            BookingError: 예약 과정에서 오류 발생
+            LibraryAPIError: 시계 동기화에 필요한 Date 헤더를 얻지 못한 경우
+        """
+        if isinstance(target, datetime):
+            target = target.timestamp()
+        candidates = list(candidates)
+
+        if sync and self.clock.uncertainty > self.target_uncertainty:
+            self.sync()
+
+        if prewarm > 0:
+            prewarm_at = self.fire_time(target, margin) - prewarm
+            if prewarm_at > time.time():
+                _sleep_until(prewarm_at)
+            self.prewarm()
+
+        # prewarm 응답으로 추정이 바뀌었을 수 있으므로 다시 계산
+        clock = self.clock
+        fire_at = self.fire_time(target, margin)
+        offset, uncertainty, rtt = clock.offset or 0.0, clock.uncertainty, clock.rtt
+        _sleep_until(fire_at)
+
+        fired_at = time.time()
+        attempts = 0
+        while True:
+            attempts += 1
+            status, message, seat = self.api.book_first_available(
+                candidates, time_minutes, max_in_flight
+            )
+            if (
+                status != BookingStatus.BEFORE_OPERATION_HOURS
+                or time.time() + retry_interval > fired_at + retry_window
+            ):
+                break
+            time.sleep(retry_interval)
+
+        result = ScheduledBooking(
+            status,
+            message,
+            seat,
+            target,
+            fired_at,
+            offset,
+            uncertainty,
+            rtt or 0.0,
+            attempts,
+        )
+        logger.info(f"예약 시각 예약 결과: {result!r}")
+        return result
@@ -0,0 +1,288 @@
+"""
+KGU Library 좌석 스냅샷 저장소
+
+구역별 좌석 목록을 좌석 코드로 색인하고 좌석마다 지문(fingerprint)을 저장해 두어,
+새 목록이 들어오면 한 번의 순회(O(n))로 추가/삭제/변경된 좌석을 구합니다.
+history_size를 지정하면 지난 스냅샷을 링 버퍼에 보관하여 다시 재생할 수 있습니다.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import SEAT_FIELDS
+
+# 지문 계산에 사용할 좌석 필드 (중첩된 area는 구역 코드만 사용)
+_FIELD_NAMES = tuple(name for name, _, _ in SEAT_FIELDS)
+_FIELD_KEYS = tuple(key for _, key, _ in SEAT_FIELDS)
+
+
+def _is_mapped(seat: Dict) -> bool:
+    """get_seats()/get_available_seats()가 변환한 딕셔너리인지 (응답 항목이 아닌지)"""
+    return "seat_time" in seat
+
+
+def _seat_values(seat: Any) -> Tuple[Tuple[Any, ...], Any]:
+    """좌석의 SEAT_FIELDS 값과 구역 코드 (응답 항목, 변환된 딕셔너리, Seat, SeatView)"""
+    if isinstance(seat, dict):
+        if _is_mapped(seat):
+            return tuple(seat.get(name) for name in _FIELD_NAMES), seat.get("area_id")
+        area_code = (seat.get("area") or {}).get("code")
+        return tuple(seat.get(key) for key in _FIELD_KEYS), area_code
+    return tuple(getattr(seat, name) for name in _FIELD_NAMES), seat.area_id
+
+
+def _seat_code(seat: Any) -> Any:
+    """좌석 코드"""
+    return seat.get("code") if isinstance(seat, dict) else seat.code
+
+
+def _is_available(seat: Any) -> bool:
+    """예약 가능 여부 (seatTime이 null이면 예약 가능)"""
+    if isinstance(seat, dict):
+        return seat.get("seat_time" if _is_mapped(seat) else "seatTime") is None
+    return seat.is_available
+
+
+def seat_fingerprint(seat: Any) -> int:
+    """
+    좌석의 지문을 계산합니다. 값이 같은 좌석은 형식에 관계없이 같은 지문을 가집니다.
+
+    Args:
+        seat: 좌석 API 응답 항목, get_seats()가 변환한 딕셔너리, Seat 또는 SeatView
+
+    Returns:
+        int: 지문 값
+    """
+    values, area_code = _seat_values(seat)
+    try:
+        return hash((values, area_code))
+    except TypeError:
+        # 해시할 수 없는 값(리스트 등)이 섞인 경우
+        return hash(repr((values, area_code)))
+
+
+class SeatSnapshot:
+    """한 시점의 구역 좌석 스냅샷"""
+
+    __slots__ = ("area_id", "taken_at", "seats", "fingerprints")
+
+    def __init__(
+        self,
+        area_id: int,
+        taken_at: float,
+        seats: Dict[Any, Any],
+        fingerprints: Dict[Any, int],
+    ):
+        """
+        스냅샷 초기화
+
+        Args:
+            area_id: 구역 ID
+            taken_at: 조회 시각 (time.time())
+            seats: 좌석 코드 -> update()에 넘긴 좌석 항목
+            fingerprints: 좌석 코드 -> 지문
+        """
+        self.area_id = area_id
+        self.taken_at = taken_at
+        self.seats = seats
+        self.fingerprints = fingerprints
+
+    def __len__(self) -> int:
+        return len(self.seats)
+
+    def __contains__(self, code: Any) -> bool:
+        return code in self.seats
+
+    def __repr__(self) -> str:
+        return f"SeatSnapshot(area_id={self.area_id}, seats={len(self.seats)})"
+
+    def available_codes(self) -> List[Any]:
+        """예약 가능한(seatTime이 null인) 좌석 코드 목록"""
+        return [code for code, seat in self.seats.items() if _is_available(seat)]
+
+
+class SnapshotDiff:
+    """두 스냅샷 사이의 변화"""
+
+    __slots__ = ("added", "removed", "changed")
+
+    def __init__(
+        self,
+        added: Dict[Any, Any],
+        removed: Dict[Any, Any],
+        changed: Dict[Any, Tuple[Any, Any]],
+    ):
+        """
+        변화 정보 초기화
+
+        Args:
+            added: 새로 생긴 좌석 (코드 -> 좌석)
+            removed: 사라진 좌석 (코드 -> 이전 좌석)
+            changed: 값이 바뀐 좌석 (코드 -> (이전 좌석, 새 좌석))
+        """
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"SnapshotDiff(added={len(self.added)}, removed={len(self.removed)}, "
+            f"changed={len(self.changed)})"
+        )
+
+
+def diff_snapshots(
+    previous: Optional[SeatSnapshot], current: SeatSnapshot
+) -> SnapshotDiff:
+    """
+    두 스냅샷을 좌석 코드와 지문으로 비교합니다 (O(n)).
+
+    Args:
+        previous: 이전 스냅샷 (None이면 모든 좌석이 추가된 것으로 봄)
+        current: 새 스냅샷
+
+    Returns:
+        SnapshotDiff: 추가/삭제/변경된 좌석
+    """
+    if previous is None:
+        return SnapshotDiff(dict(current.seats), {}, {})
+
+    added = {}
+    changed = {}
+    old_fingerprints = previous.fingerprints
+    for code, fingerprint in current.fingerprints.items():
+        old = old_fingerprints.get(code)
+        if old is None:
+            added[code] = current.seats[code]
+        elif old != fingerprint:
+            changed[code] = (previous.seats[code], current.seats[code])
+
+    removed = {
+        code: seat
+        for code, seat in previous.seats.items()
+        if code not in current.fingerprints
+    }
+    return SnapshotDiff(added, removed, changed)
+
+
+class SeatSnapshotStore:
+    """구역별 최신 좌석 스냅샷과 (선택적으로) 지난 스냅샷 기록 저장소"""
+
+    def __init__(self, history_size: int = 0):
+        """
+        저장소 초기화
+
+        Args:
+            history_size: 구역마다 보관할 지난 스냅샷 수 (0이면 최신 스냅샷만 보관)
+
+        Raises:
+            ValueError: history_size가 음수인 경우
+        """
+        if history_size < 0:
+            raise ValueError("history_size는 0 이상이어야 합니다")
+
+        self.history_size = history_size
+        self._latest: Dict[int, SeatSnapshot] = {}
+        self._history: Dict[int, deque] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self, area_id: int, seats: Iterable[Any], taken_at: Optional[float] = None
+    ) -> SnapshotDiff:
+        """
+        구역의 새 좌석 목록을 저장하고 이전 스냅샷과의 변화를 반환합니다.
+
+        Args:
+            area_id: 구역 ID
+            seats: 좌석 목록 (사용 중인 좌석 포함). API 응답 항목,
+                get_seats()/get_available_seats()의 딕셔너리, Seat, SeatView 모두 가능
+            taken_at: 조회 시각 (None이면 현재 시각)
+
+        Returns:
+            SnapshotDiff: 이전 스냅샷과의 변화 (처음이면 모든 좌석이 added)
+        """
+        by_code = {}
+        fingerprints = {}
+        for seat in seats:
+            code = _seat_code(seat)
+            by_code[code] = seat
+            fingerprints[code] = seat_fingerprint(seat)
+
+        snapshot = SeatSnapshot(
+            area_id,
+            time.time() if taken_at is None else taken_at,
+            by_code,
+            fingerprints,
+        )
+
+        with self._lock:
+            previous = self._latest.get(area_id)
+            self._latest[area_id] = snapshot
+            if self.history_size:
+                history = self._history.get(area_id)
+                if history is None:
+                    history = self._history[area_id] = deque(maxlen=self.history_size)
+                history.append(snapshot)
+
+        return diff_snapshots(previous, snapshot)
+
+    def get(self, area_id: int) -> Optional[SeatSnapshot]:
+        """
+        구역의 최신 스냅샷을 반환합니다.
+
+        Args:
+            area_id: 구역 ID
+
+        Returns:
+            Optional[SeatSnapshot]: 최신 스냅샷 (없으면 None)
+        """
+        with self._lock:
+            return self._latest.get(area_id)
+
+    def history(self, area_id: int) -> List[SeatSnapshot]:
+        """
+        구역의 보관된 스냅샷 목록을 오래된 순서로 반환합니다.
+
+        Args:
+            area_id: 구역 ID
+
+        Returns:
+            List[SeatSnapshot]: 스냅샷 목록
+        """
+        with self._lock:
+            return list(self._history.get(area_id, ()))
+
+    def replay(self, area_id: int) -> Iterator[Tuple[SeatSnapshot, SnapshotDiff]]:
+        """
+        보관된 스냅샷을 차례로 재생하며 직전 스냅샷과의 변화를 함께 돌려줍니다.
+
+        Args:
+            area_id: 구역 ID
+
+        Yields:
+            (스냅샷, 직전 스냅샷과의 변화) 튜플. 첫 스냅샷은 모든 좌석이 added입니다.
+        """
+        previous = None
+        for snapshot in self.history(area_id):
+            yield snapshot, diff_snapshots(previous, snapshot)
+            previous = snapshot
+
+    def clear(self, area_id: Optional[int] = None) -> None:
+        """
+        저장된 스냅샷을 지웁니다.
+
+        Args:
+            area_id: 지울 구역 ID (None이면 전체)
+        """
+        with self._lock:
+            if area_id is None:
+                self._latest.clear()
+                self._history.clear()
+            else:
+                self._latest.pop(area_id, None)
+                self._history.pop(area_id, None)
@@ -0,0 +1,264 @@
+"""
+KGU Library 좌석 공간 색인
+
+좌석의 위치(x, y, width, height)로 균일 격자 색인을 만들어, 목록 전체를 다시 훑지 않고
+가장 가까운 좌석이나 사각형 범위 안의 좌석을 찾습니다. 좌석은 get_seats/
+get_available_seats가 반환하는 딕셔너리, Seat, SeatView 중 어느 형식이든 사용할 수
+있습니다.
+"""
+
+import heapq
+import math
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+Point = Tuple[float, float]
+
+
+def seat_center(seat: Any) -> Point:
+    """
+    좌석의 중심 좌표를 계산합니다.
+
+    Args:
+        seat: 좌석 (딕셔너리, Seat 또는 SeatView)
+
+    Returns:
+        (x, y) 중심 좌표
+    """
+    return (
+        (seat["x"] or 0) + (seat["width"] or 0) / 2,
+        (seat["y"] or 0) + (seat["height"] or 0) / 2,
+    )
+
+
+class SeatGridIndex:
+    """좌석 중심 좌표의 균일 격자 색인"""
+
+    def __init__(self, seats: Iterable[Any], cell_size: Optional[float] = None):
+        """
+        색인 생성
+
+        Args:
+            seats: 좌석 목록 (위치 정보가 없는 좌석은 제외)
+            cell_size: 격자 한 칸의 크기 (None이면 좌석 크기로 추정)
+
+        Raises:
+            ValueError: cell_size가 0 이하인 경우
+        """
+        self._seats: Dict[Any, Any] = {}
+        self._centers: Dict[Any, Point] = {}
+        widths = []
+
+        for seat in seats:
+            if seat["x"] is None or seat["y"] is None:
+                continue
+            code = seat["id"]
+            self._seats[code] = seat
+            self._centers[code] = seat_center(seat)
+            if seat["width"]:
+                widths.append(seat["width"])
+
+        if cell_size is None:
+            # 한 칸에 좌석이 몇 개 들어가도록 좌석 폭의 중앙값의 두 배 사용
+            widths.sort()
+            cell_size = widths[len(widths) // 2] * 2 if widths else 50.0
+        if cell_size <= 0:
+            raise ValueError("cell_size는 0보다 커야 합니다")
+        self.cell_size = float(cell_size)
+
+        self._cells: Dict[Tuple[int, int], List[Any]] = {}
+        for code, point in self._centers.items():
+            self._cells.setdefault(self._cell(point), []).append(code)
+
+        if self._cells:
+            xs = [cx for cx, _ in self._cells]
+            ys = [cy for _, cy in self._cells]
+            self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self._bounds = (0, 0, -1, -1)
+
+    def __len__(self) -> int:
+        return len(self._seats)
+
+    def __contains__(self, code: Any) -> bool:
+        return code in self._seats
+
+    def _cell(self, point: Point) -> Tuple[int, int]:
+        return (
+            math.floor(point[0] / self.cell_size),
+            math.floor(point[1] / self.cell_size),
+        )
+
+    def _clamp_cell(self, value: float, low: int, high: int) -> int:
+        """좌표의 칸 번호를 [low, high]로 제한 (무한대 좌표도 처리)"""
+        scaled = value / self.cell_size
+        if scaled <= low:
+            return low
+        if scaled >= high:
+            return high
+        return math.floor(scaled)
+
+    def get(self, code: Any) -> Optional[Any]:
+        """좌석 코드로 좌석을 찾습니다 (없으면 None)."""
+        return self._seats.get(code)
+
+    def center(self, code: Any) -> Point:
+        """
+        좌석의 중심 좌표를 반환합니다.
+
+        Raises:
+            KeyError: 색인에 없는 좌석인 경우
+        """
+        return self._centers[code]
+
+    def _ring(self, cx: int, cy: int, radius: int) -> Iterator[Tuple[int, int]]:
+        """(cx, cy)에서 체비쇼프 거리가 radius인 격자 칸 (색인 범위 안만)"""
+        min_x, min_y, max_x, max_y = self._bounds
+        if radius == 0:
+            yield cx, cy
+            return
+        for x in range(max(cx - radius, min_x), min(cx + radius, max_x) + 1):
+            for y in (cy - radius, cy + radius):
+                if min_y <= y <= max_y:
+                    yield x, y
+        for y in range(max(cy - radius + 1, min_y), min(cy + radius - 1, max_y) + 1):
+            for x in (cx - radius, cx + radius):
+                if min_x <= x <= max_x:
+                    yield x, y
+
+    def iter_nearest(
+        self, x: float, y: float, predicate: Optional[Callable[[Any], bool]] = None
+    ) -> Iterator[Tuple[float, Any]]:
+        """
+        (x, y)에서 가까운 순서로 좌석을 하나씩 돌려줍니다.
+
+        가까운 격자 칸부터 고리 모양으로 넓혀 가며 찾으므로, 앞쪽 몇 개만 사용하면
+        먼 칸의 좌석은 보지 않습니다.
+
+        Args:
+            x: 기준 x 좌표
+            y: 기준 y 좌표
+            predicate: 포함할 좌석을 고르는 함수 (None이면 전체)
+
+        Yields:
+            (거리, 좌석) 튜플
+        """
+        if not self._cells:
+            return
+
+        cx, cy = self._cell((x, y))
+        min_x, min_y, max_x, max_y = self._bounds
+        # 기준 칸에서 색인의 가장 먼 칸까지의 고리 수
+        max_radius = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy)
+
+        heap: List[Tuple[float, Any]] = []
+        for radius in range(max_radius + 1):
+            for cell in self._ring(cx, cy, radius):
+                for code in self._cells.get(cell, ()):
+                    seat = self._seats[code]
+                    if predicate is not None and not predicate(seat):
+                        continue
+                    px, py = self._centers[code]
+                    heapq.heappush(heap, (math.hypot(px - x, py - y), code))
+
+            # radius+1번째 고리 밖의 좌석은 radius * cell_size보다 가까울 수 없음
+            bound = radius * self.cell_size
+            while heap and heap[0][0] <= bound:
+                distance, code = heapq.heappop(heap)
+                yield distance, self._seats[code]
+
+        while heap:
+            distance, code = heapq.heappop(heap)
+            yield distance, self._seats[code]
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> List[Any]:
+        """
+        (x, y)에서 가장 가까운 좌석 k개를 찾습니다.
+
+        Args:
+            x: 기준 x 좌표
+            y: 기준 y 좌표
+            k: 찾을 좌석 수
+            predicate: 포함할 좌석을 고르는 함수 (None이면 전체)
+
+        Returns:
+            List[Any]: 가까운 순서의 좌석 목록
+        """
+        result = []
+        for _, seat in self.iter_nearest(x, y, predicate):
+            if len(result) >= k:
+                break
+            result.append(seat)
+        return result
+
+    def nearest_to_seat(
+        self,
+        seat_id: Any,
+        k: int = 1,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> List[Any]:
+        """
+        좌석에서 가장 가까운 다른 좌석 k개를 찾습니다.
+
+        Args:
+            seat_id: 기준 좌석 ID
+            k: 찾을 좌석 수
+            predicate: 포함할 좌석을 고르는 함수 (None이면 전체)
+
+        Returns:
+            List[Any]: 가까운 순서의 좌석 목록 (기준 좌석 제외)
+
+        Raises:
+            KeyError: 색인에 없는 좌석인 경우
+        """
+        x, y = self._centers[seat_id]
+
+        def accept(seat: Any) -> bool:
+            return seat["id"] != seat_id and (predicate is None or predicate(seat))
+
+        return self.nearest(x, y, k, accept)
+
+    def within(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> List[Any]:
+        """
+        중심 좌표가 사각형 안에 있는 좌석을 찾습니다.
+
+        Args:
+            x1, y1: 사각형의 한 꼭짓점
+            x2, y2: 사각형의 반대쪽 꼭짓점
+            predicate: 포함할 좌석을 고르는 함수 (None이면 전체)
+
+        Returns:
+            List[Any]: 범위 안의 좌석 목록
+        """
+        left, right = min(x1, x2), max(x1, x2)
+        top, bottom = min(y1, y2), max(y1, y2)
+        # 색인 범위 밖의 칸은 비어 있으므로 순회할 칸을 색인 범위로 제한
+        min_x, min_y, max_x, max_y = self._bounds
+        min_cx = self._clamp_cell(left, min_x, max_x)
+        max_cx = self._clamp_cell(right, min_x, max_x)
+        min_cy = self._clamp_cell(top, min_y, max_y)
+        max_cy = self._clamp_cell(bottom, min_y, max_y)
+
+        result = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for code in self._cells.get((cx, cy), ()):
+                    px, py = self._centers[code]
+                    if not (left <= px <= right and top <= py <= bottom):
+                        continue
+                    seat = self._seats[code]
+                    if predicate is None or predicate(seat):
+                        result.append(seat)
+        return result
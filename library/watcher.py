@@ -0,0 +1,322 @@
+"""
+KGU Library 좌석 감시 모듈
+
+여러 구역의 좌석 목록을 주기적으로 조회하여 이전 스냅샷과 비교하고, 바뀐 좌석만
+구독자에게 알립니다. 구역마다 최근 조회 중 변화가 있었던 비율(변동성)이 높으면 조회
+간격을 줄이고, 조용한 구역은 간격을 늘려 서버 부하를 줄입니다.
+
+사용 예:
+    watcher = SeatWatcher(api, area_ids=[19, 20])
+    watcher.subscribe(lambda change: print(change), change_types=[SeatChangeType.FREED])
+    watcher.start()
+    ...
+    watcher.stop()
+"""
+
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .api import LibraryAPIWrapper
+from .enums import SeatChangeType
+from .exceptions import SeatError
+from .models import SeatView
+from .snapshot import SeatSnapshotStore, SnapshotDiff
+
+logger = logging.getLogger(__name__)
+
+
+class SeatChange:
+    """좌석 상태 변화 이벤트"""
+
+    __slots__ = ("type", "area_id", "seat", "previous_time", "detected_at")
+
+    def __init__(
+        self,
+        change_type: SeatChangeType,
+        area_id: int,
+        seat: SeatView,
+        previous_time: Optional[object],
+        detected_at: float,
+    ):
+        """
+        이벤트 초기화
+
+        Args:
+            change_type: 변화 종류
+            area_id: 구역 ID
+            seat: 변화 후 좌석 정보
+            previous_time: 변화 전 seatTime 값
+            detected_at: 변화를 감지한 시각 (time.time())
+        """
+        self.type = change_type
+        self.area_id = area_id
+        self.seat = seat
+        self.previous_time = previous_time
+        self.detected_at = detected_at
+
+    @property
+    def seat_id(self) -> int:
+        """좌석 ID"""
+        return self.seat.id
+
+    def __repr__(self) -> str:
+        return (
+            f"SeatChange({self.type.name}, area_id={self.area_id}, "
+            f"seat_id={self.seat_id})"
+        )
+
+
+def seat_changes(
+    diff: SnapshotDiff,
+) -> List[Tuple[SeatChangeType, Dict, Optional[object]]]:
+    """
+    스냅샷 변화 중 좌석 사용 상태(seatTime) 변화만 골라 분류합니다.
+
+    Args:
+        diff: 좌석 스냅샷 저장소가 반환한 변화
+
+    Returns:
+        [(변화 종류, 새 좌석 응답 항목, 이전 seatTime)] 목록.
+        새로 생기거나 사라진 좌석, seatTime이 그대로인 좌석은 포함하지 않습니다.
+    """
+    changes = []
+    for old, new in diff.changed.values():
+        old_time = old.get("seatTime")
+        seat_time = new.get("seatTime")
+        if old_time == seat_time:
+            continue
+
+        if seat_time is None:
+            changes.append((SeatChangeType.FREED, new, old_time))
+        elif old_time is None:
+            changes.append((SeatChangeType.TAKEN, new, old_time))
+        else:
+            changes.append((SeatChangeType.TIME_CHANGED, new, old_time))
+
+    return changes
+
+
+class _AreaState:
+    """구역별 감시 상태"""
+
+    __slots__ = ("interval", "history", "last_polled", "errors")
+
+    def __init__(self, interval: float, history_size: int):
+        self.interval = interval
+        # 최근 조회마다 변화가 있었는지 여부
+        self.history = deque(maxlen=history_size)
+        self.last_polled: Optional[float] = None
+        self.errors = 0
+
+
+class SeatWatcher:
+    """구역별 좌석 변화 감시기"""
+
+    def __init__(
+        self,
+        api: LibraryAPIWrapper,
+        area_ids: Iterable[int],
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        history_size: int = 10,
+        smoothing: float = 0.5,
+        store: Optional[SeatSnapshotStore] = None,
+    ):
+        """
+        감시기 초기화
+
+        Args:
+            api: 로그인된 LibraryAPIWrapper
+            area_ids: 감시할 구역 ID 목록
+            min_interval: 가장 짧은 조회 간격(초)
+            max_interval: 가장 긴 조회 간격(초)
+            history_size: 변동성 계산에 사용할 최근 조회 횟수
+            smoothing: 조회 간격을 목표 간격으로 옮기는 비율 (1이면 바로 목표 간격)
+            store: 좌석 스냅샷을 저장할 저장소 (None이면 감시기 전용 저장소 생성)
+
+        Raises:
+            ValueError: 간격 설정이 올바르지 않은 경우
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("0 < min_interval <= max_interval 이어야 합니다")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing은 0보다 크고 1 이하여야 합니다")
+
+        self.api = api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.store = store if store is not None else SeatSnapshotStore()
+        self._areas = {
+            area_id: _AreaState(min_interval, history_size) for area_id in area_ids
+        }
+        self._subscribers: List[
+            Tuple[Callable, Optional[frozenset], Optional[frozenset]]
+        ] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def area_ids(self) -> List[int]:
+        """감시 중인 구역 ID 목록"""
+        return list(self._areas)
+
+    def subscribe(
+        self,
+        callback: Callable[[SeatChange], None],
+        change_types: Optional[Iterable[SeatChangeType]] = None,
+        area_ids: Optional[Iterable[int]] = None,
+    ) -> Callable[[], None]:
+        """
+        좌석 변화 이벤트를 구독합니다.
+
+        Args:
+            callback: 변화마다 호출할 함수 (감시 스레드에서 호출됨)
+            change_types: 받을 변화 종류 (None이면 전부)
+            area_ids: 받을 구역 ID (None이면 전부)
+
+        Returns:
+            Callable[[], None]: 호출하면 구독을 취소하는 함수
+        """
+        entry = (
+            callback,
+            frozenset(change_types) if change_types is not None else None,
+            frozenset(area_ids) if area_ids is not None else None,
+        )
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def interval(self, area_id: int) -> float:
+        """구역의 현재 조회 간격(초)"""
+        return self._areas[area_id].interval
+
+    def volatility(self, area_id: int) -> float:
+        """구역의 최근 조회 중 변화가 있었던 비율 (0.0 ~ 1.0)"""
+        history = self._areas[area_id].history
+        return sum(history) / len(history) if history else 0.0
+
+    def _dispatch(self, changes: List[SeatChange]) -> None:
+        """구독 조건에 맞는 구독자에게 이벤트 전달"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for change in changes:
+            for callback, change_types, area_ids in subscribers:
+                if change_types is not None and change.type not in change_types:
+                    continue
+                if area_ids is not None and change.area_id not in area_ids:
+                    continue
+                try:
+                    callback(change)
+                except Exception:
+                    logger.exception("좌석 변화 구독자 처리 중 예외 발생")
+
+    def poll(self, area_id: int) -> List[SeatChange]:
+        """
+        구역을 한 번 조회하고 변화를 구독자에게 전달합니다.
+
+        처음 조회한 구역은 기준 스냅샷만 저장하고 이벤트를 만들지 않습니다.
+        조회에 실패하면 이전 스냅샷을 유지하고 조회 간격을 두 배로 늘립니다.
+
+        Args:
+            area_id: 조회할 구역 ID
+
+        Returns:
+            List[SeatChange]: 감지한 변화 목록
+        """
+        state = self._areas[area_id]
+        state.last_polled = time.monotonic()
+
+        try:
+            seats = self.api.get_seats(area_id, lazy=True)
+        except SeatError as e:
+            state.errors += 1
+            state.interval = min(self.max_interval, state.interval * 2)
+            logger.warning(f"구역 {area_id} 좌석 조회 실패: {e}")
+            return []
+
+        is_baseline = self.store.get(area_id) is None
+        diff = self.store.update(area_id, [seat.raw for seat in seats])
+        if is_baseline:
+            return []
+
+        found = seat_changes(diff)
+
+        # 변동성 0이면 max_interval, 1이면 min_interval을 목표로 조회 간격을 옮김
+        state.history.append(bool(found))
+        target = self.max_interval - (
+            self.max_interval - self.min_interval
+        ) * self.volatility(area_id)
+        state.interval += (target - state.interval) * self.smoothing
+
+        detected_at = time.time()
+        changes = [
+            SeatChange(change_type, area_id, SeatView(seat), previous_time, detected_at)
+            for change_type, seat, previous_time in found
+        ]
+        self._dispatch(changes)
+        return changes
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        stop()이 호출될 때까지 (또는 duration초 동안) 구역들을 일정에 따라 조회합니다.
+
+        Args:
+            duration: 실행 시간(초, None이면 stop()까지)
+        """
+        now = time.monotonic()
+        deadline = now + duration if duration is not None else None
+        schedule = [(now, area_id) for area_id in self._areas]
+        heapq.heapify(schedule)
+
+        while schedule and not self._stop_event.is_set():
+            due, area_id = schedule[0]
+            wait = due - time.monotonic()
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+            if wait > 0 and self._stop_event.wait(wait):
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            if due > time.monotonic():
+                continue
+
+            heapq.heappop(schedule)
+            self.poll(area_id)
+            heapq.heappush(
+                schedule, (time.monotonic() + self._areas[area_id].interval, area_id)
+            )
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 감시를 시작합니다."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="SeatWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        감시를 멈춥니다.
+
+        Args:
+            timeout: 감시 스레드 종료를 기다릴 최대 시간(초)
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -14,6 +14,11 @@ setup(
         "requests>=2.25.0",
         "urllib3>=1.26.0",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.17"],
+        "orjson": ["orjson>=3.0"],
+        "async": ["aiohttp>=3.8"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
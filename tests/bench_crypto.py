@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+"""
+암호화 모듈 성능 측정 스크립트
+
+kgu_library.core.crypto의 주요 함수와 전자출결 sencrypt/sdecrypt를 여러 데이터
+크기(64B ~ 1MB)로 실행하여 처리량(MB/s), 호출당 지연 시간 백분위수, 메모리 할당량을
+측정합니다. --json 옵션으로 결과를 파일로 저장하여 릴리스 간 성능을 비교할 수 있습니다.
+
+사용 예:
+    python bench_crypto.py
+    python bench_crypto.py --engine numpy --sizes 64 4096 --json bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+# 모듈 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from kgu_library.core.crypto import (
+    available_engines,
+    bytes_to_hex_comma_str,
+    create_seed_cipher,
+    get_default_engine_name,
+    hex_comma_str_to_bytes,
+    set_default_engine,
+)
+
+DEFAULT_SIZES = [64, 1024, 16 * 1024, 256 * 1024, 1024 * 1024]
+
+KEY_STR = "80,E3,4F,8F,08,10,70,F1,E9,F3,94,37,0A,D4,05,89"
+IV_STR = "20,8D,66,A7,30,A8,1A,81,6F,BA,D9,FA,36,10,25,01"
+
+
+def percentile(samples, pct):
+    """정렬된 표본에서 백분위수를 구합니다 (최근접 순위 방식)."""
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def measure(func, arg, size, min_runs, min_seconds):
+    """
+    함수를 반복 실행하여 지연 시간과 메모리 할당량을 측정합니다.
+
+    Args:
+        func: 측정할 함수 (인자 하나)
+        arg: 함수 인자
+        size: 처리량 계산에 사용할 데이터 크기 (바이트)
+        min_runs: 최소 실행 횟수
+        min_seconds: 최소 측정 시간 (초)
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    # 워밍업 (캐시, 지연 로딩 제외)
+    func(arg)
+
+    # 한 번 호출 동안의 메모리 할당량
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    func(arg)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    allocated_blocks = sum(max(stat.count_diff, 0) for stat in stats)
+
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < min_runs or time.perf_counter() - started < min_seconds:
+        t0 = time.perf_counter()
+        func(arg)
+        samples.append(time.perf_counter() - t0)
+
+    samples.sort()
+    mean = statistics.mean(samples)
+    return {
+        "runs": len(samples),
+        "mean_us": mean * 1e6,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p90_us": percentile(samples, 90) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+        "mb_per_s": size / mean / 1e6 if mean > 0 else 0.0,
+        "peak_alloc_bytes": peak,
+        "alloc_blocks": allocated_blocks,
+    }
+
+
+def build_cases(size):
+    """데이터 크기별 측정 대상 목록을 만듭니다."""
+    from kgu_library.attendance.http_client import AttendanceHTTPClient
+
+    data = os.urandom(size)
+    hex_comma = bytes_to_hex_comma_str(data)
+    cipher = create_seed_cipher(KEY_STR, IV_STR)
+    ciphertext = cipher.encrypt(data)
+
+    client = AttendanceHTTPClient()
+    # 실제 응답처럼 JSON 문자열 사용 (decode_response가 파싱할 수 있도록)
+    text = json.dumps({"data": "a" * max(size - 12, 0)})
+    encrypted_text = client.sencrypt(text)
+
+    return [
+        ("hex_comma_str_to_bytes", hex_comma_str_to_bytes, hex_comma),
+        ("bytes_to_hex_comma_str", bytes_to_hex_comma_str, data),
+        ("SeedCbcCipher.encrypt", cipher.encrypt, data),
+        ("SeedCbcCipher.decrypt", cipher.decrypt, ciphertext),
+        ("sencrypt", client.sencrypt, text),
+        ("sdecrypt", client.sdecrypt, encrypted_text),
+        ("decode_response", client.decode_response, encrypted_text.encode()),
+    ]
+
+
+def run_benchmarks(sizes, min_runs, min_seconds):
+    """모든 측정을 실행하고 결과 목록을 반환합니다."""
+    results = []
+
+    # 키 스케줄 비용 (크기와 무관)
+    result = measure(
+        lambda _: create_seed_cipher(KEY_STR, IV_STR), None, 0, min_runs, min_seconds
+    )
+    results.append({"name": "create_seed_cipher", "size": 0, **result})
+
+    for size in sizes:
+        for name, func, arg in build_cases(size):
+            result = measure(func, arg, size, min_runs, min_seconds)
+            results.append({"name": name, "size": size, **result})
+
+    return results
+
+
+def print_results(results):
+    """결과를 표 형태로 출력합니다."""
+    header = (
+        f"{'name':<24}{'size':>9}{'runs':>7}{'MB/s':>10}"
+        f"{'p50(us)':>12}{'p90(us)':>12}{'p99(us)':>12}"
+        f"{'peak(B)':>11}{'blocks':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['name']:<24}{r['size']:>9}{r['runs']:>7}{r['mb_per_s']:>10.2f}"
+            f"{r['p50_us']:>12.1f}{r['p90_us']:>12.1f}{r['p99_us']:>12.1f}"
+            f"{r['peak_alloc_bytes']:>11}{r['alloc_blocks']:>8}"
+        )
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="kgu_library 암호화 성능 측정")
+
+    parser.add_argument(
+        "--engine",
+        choices=available_engines(),
+        help="사용할 SEED 엔진 (기본값: 자동 선택)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="측정할 데이터 크기 목록 (바이트)",
+    )
+    parser.add_argument("--min-runs", type=int, default=5, help="최소 실행 횟수")
+    parser.add_argument(
+        "--min-seconds", type=float, default=1.0, help="측정 대상별 최소 측정 시간(초)"
+    )
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.engine:
+        set_default_engine(args.engine)
+
+    results = run_benchmarks(args.sizes, args.min_runs, args.min_seconds)
+    print(f"SEED 엔진: {get_default_engine_name()}\n")
+    print_results(results)
+
+    if args.json:
+        report = {
+            "engine": get_default_engine_name(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
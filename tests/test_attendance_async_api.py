@@ -0,0 +1,152 @@
+"""
+AsyncAttendanceAPI 테스트 코드
+"""
+
+import asyncio
+import json
+import unittest
+
+try:
+    from aiohttp import CookieJar, web
+    from aiohttp.test_utils import TestServer
+except ImportError:  # aiohttp는 선택 의존성
+    web = None
+
+from kgu_library.attendance import AsyncAttendanceAPI, AttendanceHTTPClient
+from kgu_library.attendance.exceptions import (
+    HttpClientError,
+    LoginError,
+    NotLoggedInError,
+)
+from kgu_library.attendance.http_client import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+)
+
+
+@unittest.skipIf(web is None, "aiohttp가 설치되어 있지 않습니다")
+class TestAsyncAttendanceAPI(unittest.IsolatedAsyncioTestCase):
+    """AsyncAttendanceAPI 테스트 클래스 (암호화 응답을 보내는 로컬 테스트 서버 사용)"""
+
+    async def asyncSetUp(self):
+        """테스트 서버 및 API 래퍼 설정"""
+        self.crypto = AttendanceHTTPClient()
+        self.requests = []
+
+        def encrypted(data):
+            return web.Response(
+                text=self.crypto.sencrypt(json.dumps(data, ensure_ascii=False))
+            )
+
+        async def handle(request):
+            form = await request.post()
+            data = json.loads(self.crypto.sdecrypt(form["key"]))
+            name = request.match_info["name"]
+            self.requests.append((name, data))
+
+            if name == "rb_login.php":
+                if data["duser_pw"] != "password":
+                    return encrypted({"xidedu": {"xmsg": "비밀번호 오류"}})
+                return encrypted(
+                    {
+                        "xidedu": {"xmsg": "Ok"},
+                        "xuser": {"USER_ID": data["duser_id"], "USER_NM": "테스트"},
+                    }
+                )
+            if name == "rb_qrcode.php":
+                await asyncio.sleep(0.05)
+                return encrypted({"xidedu": {"xmsg": "Ok", "qr_key": "QR-1"}})
+            if name == "rb_attend_record.php":
+                return encrypted({"result": {"record": [data]}})
+            return web.Response(status=404)
+
+        app = web.Application()
+        app.router.add_post("/attend/{name}", handle)
+
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url("/attend/"))
+
+    async def asyncTearDown(self):
+        """서버 종료"""
+        await self.server.close()
+
+    def create_api(self, **kwargs) -> AsyncAttendanceAPI:
+        """테스트 서버를 가리키는 API 래퍼 생성"""
+        api = AsyncAttendanceAPI(cookie_jar=CookieJar(unsafe=True), **kwargs)
+        api.client.base_url = self.base_url
+        return api
+
+    async def test_login_and_qr_code(self):
+        """로그인 후 QR 코드 조회"""
+        async with self.create_api() as api:
+            user_info = await api.login("202400000", "password")
+            qr = await api.get_qr_code()
+
+        self.assertEqual(user_info["user_name"], "테스트")
+        self.assertEqual(qr["qr_key"], "QR-1")
+        self.assertEqual(self.requests[0][1]["duser_id"], "202400000")
+
+    async def test_login_failure(self):
+        """로그인 실패 시 LoginError 발생"""
+        async with self.create_api() as api:
+            with self.assertRaises(LoginError):
+                await api.login("202400000", "wrong")
+            self.assertFalse(api.is_logged_in)
+
+    async def test_timeouts(self):
+        """동기 클라이언트와 같은 제한 시간을 쓰고, 응답이 늦으면 HttpClientError 발생"""
+        async with self.create_api() as api:
+            timeout = api.client.session.timeout
+            self.assertEqual(timeout.sock_connect, DEFAULT_CONNECT_TIMEOUT)
+            self.assertEqual(timeout.sock_read, DEFAULT_READ_TIMEOUT)
+
+        async with self.create_api(read_timeout=0.01) as api:
+            with self.assertRaises(HttpClientError):
+                # 테스트 서버가 0.05초 뒤에 응답
+                await api.client.post_encrypted(self.base_url + "rb_qrcode.php", {})
+
+    async def test_requires_login(self):
+        """로그인 전 호출 시 NotLoggedInError 발생"""
+        async with self.create_api() as api:
+            with self.assertRaises(NotLoggedInError):
+                await api.get_qr_code()
+
+    async def test_attendance_list_dates(self):
+        """출석 내역 조회 시 날짜가 암호화되어 전송"""
+        async with self.create_api() as api:
+            await api.login("202400000", "password")
+            records = await api.get_attendance_list("2024-03-01", "2024-03-31")
+
+        self.assertEqual(
+            records, [{"from_date": "2024-03-01", "to_date": "2024-03-31"}]
+        )
+
+    async def test_concurrent_sessions(self):
+        """여러 학생 세션을 동시에 처리"""
+        apis = [self.create_api() for _ in range(8)]
+        try:
+            await asyncio.gather(
+                *(
+                    api.login(f"2024000{i:02d}", "password")
+                    for i, api in enumerate(apis)
+                )
+            )
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            results = await asyncio.gather(*(api.get_qr_code() for api in apis))
+            elapsed = loop.time() - started
+        finally:
+            await asyncio.gather(*(api.close() for api in apis))
+
+        # 각 요청이 50ms 걸리므로 순차 실행이면 0.4초 이상 소요
+        self.assertLess(elapsed, 0.3)
+        self.assertEqual([r["qr_key"] for r in results], ["QR-1"] * 8)
+        self.assertEqual(
+            [api.user_info["user_id"] for api in apis],
+            [f"2024000{i:02d}" for i in range(8)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
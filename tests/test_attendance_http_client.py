@@ -0,0 +1,259 @@
+"""
+AttendanceHTTPClient 테스트 코드
+"""
+
+import json
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from urllib.parse import urlsplit
+
+import requests
+
+from kgu_library.attendance.api import AttendanceAPI
+from kgu_library.attendance.exceptions import (
+    AttendanceError,
+    AttendanceTimeoutError,
+    LoginError,
+    RateLimitError,
+)
+from kgu_library.attendance.http_client import AttendanceHTTPClient
+from kgu_library.core.http import RateLimiter, RetryPolicy
+
+
+class TestAttendanceHTTPClient(unittest.TestCase):
+    """AttendanceHTTPClient 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.client = AttendanceHTTPClient()
+        self.payload = {
+            "xidedu": {"xmsg": "Ok"},
+            "result": {"record": [{"lecture": "자료구조", "status": 1}] * 20},
+        }
+
+    def encrypted_body(self, data) -> bytes:
+        """서버 응답 형식(16진수 암호문)의 본문 생성"""
+        return self.client.sencrypt(json.dumps(data, ensure_ascii=False)).encode()
+
+    def test_sencrypt_sdecrypt_roundtrip(self):
+        """sencrypt/sdecrypt 왕복 테스트"""
+        plaintext = json.dumps({"type": "qrcode", "이름": "테스트"}, ensure_ascii=False)
+
+        self.assertEqual(
+            self.client.sdecrypt(self.client.sencrypt(plaintext)), plaintext
+        )
+
+    def test_decode_response(self):
+        """암호화된 응답 본문 복호화 및 파싱 테스트"""
+        body = self.encrypted_body(self.payload)
+
+        # bytes, 문자열, 앞뒤 공백 모두 처리
+        self.assertEqual(self.client.decode_response(body), self.payload)
+        self.assertEqual(self.client.decode_response(body.decode()), self.payload)
+        self.assertEqual(self.client.decode_response(b" " + body + b"\n"), self.payload)
+        self.assertEqual(
+            self.client.decode_response(bytearray(body + b"\r\n")), self.payload
+        )
+        self.assertEqual(
+            self.client.decode_response(" " + body.decode() + "\n"), self.payload
+        )
+
+    def test_decode_response_invalid(self):
+        """잘못된 응답 본문은 ValueError 발생"""
+        with self.assertRaises(ValueError):
+            self.client.decode_response(b"not-hex")
+
+    def test_decode_response_stream(self):
+        """스트리밍 응답 복호화 테스트"""
+        body = self.encrypted_body(self.payload)
+        response = MagicMock()
+        response.iter_content.return_value = [
+            body[i : i + 100] for i in range(0, len(body), 100)
+        ]
+
+        self.assertEqual(self.client.decode_response_stream(response), self.payload)
+        response.close.assert_called_once()
+
+    @patch("requests.Session.post")
+    def test_stream_failure_closes_response(self, mock_post):
+        """스트리밍 요청이 실패 응답을 받아도 응답을 닫는지 테스트"""
+        response = MagicMock(status_code=500)
+        mock_post.return_value = response
+        self.client._is_logged_in = True
+        self.client.user_id = "202400000"
+
+        self.assertEqual(self.client.search_user_by_id("202400001"), [])
+        response.close.assert_called_once()
+
+        api = AttendanceAPI()
+        api.client = self.client
+        api.user_info = {"user_id": "202400000"}
+        response.reset_mock()
+        with self.assertRaises(AttendanceError):
+            api.get_attendance_list("2024-03-01", "2024-03-31")
+        response.close.assert_called_once()
+        response.iter_content.assert_not_called()
+
+    def test_process_response_encrypted(self):
+        """_process_response 암호화 응답 처리 테스트"""
+        response = MagicMock()
+        response.headers = {"Content-Type": "text/html"}
+        response.content = self.encrypted_body(self.payload)
+
+        self.assertEqual(self.client._process_response(response), self.payload)
+
+    def test_process_response_plain_text(self):
+        """_process_response 평문 응답 처리 테스트"""
+        response = MagicMock()
+        response.headers = {"Content-Type": "text/html"}
+        response.content = b"hello"
+        response.text = "hello"
+
+        self.assertEqual(self.client._process_response(response), {"text": "hello"})
+
+    @patch("requests.Session.post")
+    def test_login_success(self, mock_post):
+        """로그인 성공 테스트"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = self.encrypted_body(
+            {
+                "xidedu": {"xmsg": "Ok"},
+                "xuser": {"USER_ID": "202400000", "USER_NM": "테스트"},
+            }
+        )
+        mock_post.return_value = mock_response
+
+        result = self.client.login("202400000", "password")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["user_name"], "테스트")
+        self.assertTrue(self.client.is_logged_in)
+
+        # 요청 데이터는 암호화되어 전송
+        args, kwargs = mock_post.call_args
+        self.assertIn("rb_login.php", args[0])
+        login_data = json.loads(self.client.sdecrypt(kwargs["data"]["key"]))
+        self.assertEqual(login_data["duser_id"], "202400000")
+
+
+class TestAttendanceTimeouts(unittest.TestCase):
+    """AttendanceHTTPClient 제한 시간 테스트 클래스"""
+
+    @patch("requests.Session.post")
+    def test_connect_read_timeouts(self, mock_post):
+        """모든 요청에 (연결, 읽기) 제한 시간을 넘기는지 테스트"""
+        client = AttendanceHTTPClient(connect_timeout=2, read_timeout=7)
+        mock_post.return_value = MagicMock(status_code=200)
+        client.request("POST", "https://example.com/a", data={"key": "x"})
+        self.assertEqual(mock_post.call_args[1]["timeout"], (2, 7))
+
+        # 전체 제한 시간보다 길게 기다리지 않음
+        with client.time_limit(1):
+            client.request("POST", "https://example.com/a")
+        connect, read = mock_post.call_args[1]["timeout"]
+        self.assertLessEqual(connect, 1)
+        self.assertLessEqual(read, 1)
+        self.assertIsNone(client.remaining())
+
+    @patch("requests.Session.post")
+    def test_timeout_errors(self, mock_post):
+        """시간 초과가 단계별 AttendanceTimeoutError로 전달되는지 테스트"""
+        client = AttendanceHTTPClient()
+
+        mock_post.side_effect = requests.ConnectTimeout("connect")
+        with self.assertRaises(AttendanceTimeoutError) as ctx:
+            client.post("rb_notice.php", {"page": 1})
+        self.assertEqual(ctx.exception.phase, "connect")
+
+        # 로그인 실패(LoginError)로 감싸지 않음
+        mock_post.side_effect = requests.ReadTimeout("read")
+        with self.assertRaises(AttendanceTimeoutError) as ctx:
+            client.login("202400000", "password")
+        self.assertEqual(ctx.exception.phase, "read")
+        self.assertNotIsInstance(ctx.exception, LoginError)
+
+        # 제한 시각이 지나면 요청을 보내지 않음
+        mock_post.reset_mock()
+        with client.time_limit(0):
+            with self.assertRaises(AttendanceTimeoutError) as ctx:
+                client.post("rb_notice.php")
+        self.assertEqual(ctx.exception.phase, "deadline")
+        mock_post.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_deadline_spans_retries(self, mock_get):
+        """전체 제한 시간이 재시도를 포함하는지 테스트"""
+        policy = RetryPolicy(max_attempts=100, backoff_base=0.02, backoff_max=0.02)
+        # 백오프 대기가 제한 시각을 넘기도록 고정 (재시도 여부가 시점에 좌우되지 않음)
+        policy.sleep = lambda delay: time.sleep(0.06)
+        client = AttendanceHTTPClient(deadline=0.05, retry=policy)
+        reset = requests.ConnectionError("reset")
+        mock_get.side_effect = reset
+
+        with self.assertRaises(AttendanceTimeoutError) as ctx:
+            client.request("GET", "https://example.com/a")
+        self.assertEqual(ctx.exception.phase, "deadline")
+        self.assertIs(ctx.exception.__cause__, reset)
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_stream_deadline(self):
+        """스트리밍 응답 수신 중에도 전체 제한 시각을 확인하는지 테스트"""
+        client = AttendanceHTTPClient()
+        body = client.sencrypt(json.dumps({"result": {}})).encode()
+
+        def slow_chunks():
+            for i in range(0, len(body), 16):
+                time.sleep(0.02)
+                yield body[i : i + 16]
+
+        response = MagicMock()
+        response.iter_content.return_value = slow_chunks()
+        with patch("requests.Session.post", return_value=response):
+            with client.time_limit(0.03):
+                client.request("POST", "https://example.com/a", stream=True)
+                with self.assertRaises(AttendanceTimeoutError):
+                    client.decode_response_stream(response)
+        response.close.assert_called_once()
+
+    @patch("requests.Session.post")
+    def test_rate_limit_within_deadline(self, mock_post):
+        """속도 제한 토큰을 전체 제한 시각까지만 기다리는지 테스트"""
+        mock_post.return_value = MagicMock(status_code=200)
+        client = AttendanceHTTPClient(rate_limiter=RateLimiter(rate=0.01, burst=1))
+        client.request("POST", "https://attend.kyonggi.ac.kr/attend/a")
+
+        started = time.monotonic()
+        with client.time_limit(0.05):
+            with self.assertRaises(RateLimitError):
+                client.request("POST", "https://attend.kyonggi.ac.kr/attend/a")
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("requests.Session.post")
+    def test_api_rate_limit_not_wrapped(self, mock_post):
+        """AttendanceAPI가 RateLimitError를 다른 예외로 감싸지 않는지 테스트"""
+        limiter = RateLimiter(rate=0.01, burst=1)
+        api = AttendanceAPI(rate_limiter=limiter)
+        api.client._is_logged_in = True
+        api.client.user_id = "202400000"
+        api.user_info = {"user_id": "202400000"}
+        # 요청할 호스트의 토큰을 모두 사용
+        for url in (api.client.base_url, api.client.determine_server_url("202400000")):
+            limiter.try_acquire(urlsplit(url).hostname)
+
+        with api.client.time_limit(1):
+            with self.assertRaises(RateLimitError):
+                api.get_qr_code()
+            with self.assertRaises(RateLimitError):
+                api.get_attendance_list("2024-03-01", "2024-03-31")
+            with self.assertRaises(RateLimitError):
+                api.client.post("rb_notice.php")
+            with self.assertRaises(RateLimitError):
+                api.login("202400000", "password")
+        mock_post.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,27 @@
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 from kgu_library.core.crypto import (
     hex_comma_str_to_bytes,
     bytes_to_hex_comma_str,
     create_seed_cipher,
+    get_seed_cipher,
+    clear_seed_cipher_cache,
+    encrypt_many,
+    decrypt_many,
+    available_engines,
+    get_engine,
+    set_default_engine,
+    PySeedCbcCipher,
     SeedCbcCipher,
+    SeedCbcDecryptor,
+    SeedCbcEncryptor,
 )
+from kgu_library.core import crypto
+from kgu_library.core.crypto.seed import expand_key, process_block
 
 
 class TestCrypto(unittest.TestCase):
@@ -81,6 +96,190 @@ class TestCrypto(unittest.TestCase):
         # 결과 검증
         self.assertEqual(decrypted.decode("utf-8"), plaintext)
 
+    def test_get_seed_cipher_is_cached(self):
+        """get_seed_cipher 캐시 재사용 테스트"""
+        key = hex_comma_str_to_bytes("80,E3,4F,8F,08,10,70,F1,E9,F3,94,37,0A,D4,05,89")
+        iv = hex_comma_str_to_bytes("20,8D,66,A7,30,A8,1A,81,6F,BA,D9,FA,36,10,25,01")
+        clear_seed_cipher_cache()
+
+        # 같은 키/IV는 같은 객체, 다른 IV는 다른 객체
+        cipher = get_seed_cipher(key, iv)
+        self.assertIs(get_seed_cipher(key, iv), cipher)
+        self.assertIsNot(get_seed_cipher(key, bytes(16)), cipher)
+
+        # 캐시를 비우면 새 객체 생성
+        clear_seed_cipher_cache()
+        self.assertIsNot(get_seed_cipher(key, iv), cipher)
+
+    def test_encrypt_decrypt_many(self):
+        """일괄 암호화/복호화 순서 보존 테스트"""
+        key = hex_comma_str_to_bytes("80,E3,4F,8F,08,10,70,F1,E9,F3,94,37,0A,D4,05,89")
+        iv = hex_comma_str_to_bytes("20,8D,66,A7,30,A8,1A,81,6F,BA,D9,FA,36,10,25,01")
+        payloads = [f"메시지 {i}".encode("utf-8") * (i % 5 + 1) for i in range(20)]
+        cipher = get_seed_cipher(key, iv)
+
+        # 임계값 미만: 현재 프로세스에서 처리
+        encrypted = encrypt_many(payloads, key, iv)
+        self.assertEqual(encrypted, [cipher.encrypt(p) for p in payloads])
+
+        # 임계값 이상: 실행기로 분산 처리
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            decrypted = decrypt_many(encrypted, key, iv, threshold=1, executor=executor)
+        self.assertEqual(decrypted, payloads)
+
+        # 작업자 수로 청크 크기를 정함 (작업자당 4개 청크)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with patch.object(executor, "submit", wraps=executor.submit) as submit:
+                decrypted = decrypt_many(
+                    encrypted, key, iv, threshold=1, executor=executor, max_workers=1
+                )
+        self.assertEqual(decrypted, payloads)
+        self.assertEqual(submit.call_count, 4)
+
+        with self.assertRaises(ValueError):
+            encrypt_many(payloads, key, iv, threshold=1, max_workers=0)
+
+
+class TestSeedEngines(unittest.TestCase):
+    """내장 SEED 엔진 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.key = bytes(range(16, 32))
+        self.iv = bytes(range(100, 116))
+        self.payloads = [
+            bytes(range(n % 256)) * (n // 256 + 1) for n in (0, 1, 15, 16, 17, 300)
+        ]
+
+    def test_block_test_vector(self):
+        """RFC 4269 테스트 벡터 (키 0, 평문 00..0F)"""
+        result = process_block(expand_key(bytes(16)), bytes(range(16)))
+        self.assertEqual(result.hex(), "5ebac6e0054e166819aff1cc6d346cdb")
+
+    def test_python_engine_roundtrip(self):
+        """순수 파이썬 엔진 왕복 테스트"""
+        cipher = PySeedCbcCipher(key=self.key, iv=self.iv)
+
+        for payload in self.payloads:
+            encrypted = cipher.encrypt(payload)
+            self.assertEqual(len(encrypted) % 16, 0)
+            self.assertEqual(cipher.decrypt(encrypted), payload)
+
+    def test_decrypt_into(self):
+        """미리 할당된 버퍼로의 복호화 테스트"""
+        for name in available_engines():
+            cipher = get_engine(name)(key=self.key, iv=self.iv)
+            if not hasattr(cipher, "decrypt_into"):
+                continue
+
+            for payload in self.payloads:
+                with self.subTest(engine=name, size=len(payload)):
+                    # 제자리 복호화
+                    buffer = bytearray(cipher.encrypt(payload))
+                    size = cipher.decrypt_into(buffer, buffer)
+                    self.assertEqual(bytes(buffer[:size]), payload)
+
+    def test_invalid_padding(self):
+        """잘못된 패딩 복호화 시 ValueError 발생"""
+        cipher = PySeedCbcCipher(key=self.key, iv=self.iv)
+
+        with self.assertRaises(ValueError):
+            cipher.decrypt(b"\x00" * 15)
+
+    def test_engines_agree(self):
+        """사용 가능한 모든 엔진의 결과가 같은지 테스트"""
+        reference = PySeedCbcCipher(key=self.key, iv=self.iv)
+        expected = reference.encrypt_many(self.payloads)
+
+        for name in available_engines():
+            cipher = get_engine(name)(key=self.key, iv=self.iv)
+            with self.subTest(engine=name):
+                self.assertEqual([cipher.encrypt(p) for p in self.payloads], expected)
+                self.assertEqual([cipher.decrypt(c) for c in expected], self.payloads)
+
+    def test_default_engine_alias(self):
+        """SeedCbcCipher가 set_default_engine()으로 바꾼 엔진을 따르는지 테스트"""
+        with patch("kgu_library.core.crypto.engines._default_engine", None):
+            for name in available_engines():
+                set_default_engine(name)
+                with self.subTest(engine=name):
+                    self.assertIs(crypto.SeedCbcCipher, get_engine(name))
+                    self.assertIsInstance(
+                        create_seed_cipher(
+                            bytes_to_hex_comma_str(self.key),
+                            bytes_to_hex_comma_str(self.iv),
+                        ),
+                        crypto.SeedCbcCipher,
+                    )
+
+        with self.assertRaises(AttributeError):
+            crypto.UnknownCipher
+
+    def test_numpy_engine_batch(self):
+        """NumPy 엔진 일괄 처리 테스트"""
+        if "numpy" not in available_engines():
+            self.skipTest("numpy가 설치되어 있지 않습니다")
+
+        cipher = get_engine("numpy")(key=self.key, iv=self.iv)
+        reference = PySeedCbcCipher(key=self.key, iv=self.iv)
+
+        encrypted = cipher.encrypt_many(self.payloads)
+        self.assertEqual(encrypted, reference.encrypt_many(self.payloads))
+        self.assertEqual(cipher.decrypt_many(encrypted), self.payloads)
+
+        # 여러 블록으로 된 긴 메시지는 벡터화 경로로 복호화
+        long_payload = bytes(range(256)) * 4
+        self.assertEqual(cipher.decrypt(reference.encrypt(long_payload)), long_payload)
+
+
+class TestSeedStreaming(unittest.TestCase):
+    """SEED CBC 스트리밍 암호화/복호화 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.key = bytes(range(16))
+        self.iv = bytes(range(16, 32))
+        self.cipher = PySeedCbcCipher(key=self.key, iv=self.iv)
+        self.plaintext = "출석 기록 ".encode("utf-8") * 100
+
+    def feed(self, stream, data, size):
+        """데이터를 size 크기 조각으로 나누어 넣은 결과"""
+        out = b"".join(
+            stream.update(data[i : i + size]) for i in range(0, len(data), size)
+        )
+        return out + stream.finalize()
+
+    def test_decryptor_hex_chunks(self):
+        """16진수 조각 단위 복호화 테스트"""
+        body = self.cipher.encrypt(self.plaintext).hex().upper() + "\n"
+
+        for size in (1, 7, 32, 33, 1000, len(body)):
+            with self.subTest(chunk_size=size):
+                decryptor = SeedCbcDecryptor(self.key, self.iv, hex_input=True)
+                self.assertEqual(self.feed(decryptor, body, size), self.plaintext)
+
+    def test_encryptor_matches_one_shot(self):
+        """스트리밍 암호화 결과가 일괄 암호화와 같은지 테스트"""
+        expected = self.cipher.encrypt(self.plaintext)
+
+        for size in (1, 16, 50):
+            with self.subTest(chunk_size=size):
+                encryptor = SeedCbcEncryptor(self.key, self.iv)
+                self.assertEqual(self.feed(encryptor, self.plaintext, size), expected)
+
+        encryptor = SeedCbcEncryptor(self.key, self.iv, hex_output=True)
+        self.assertEqual(
+            self.feed(encryptor, self.plaintext, 64), expected.hex().encode()
+        )
+
+    def test_decryptor_truncated_input(self):
+        """잘린 암호문은 finalize()에서 ValueError 발생"""
+        decryptor = SeedCbcDecryptor(self.key, self.iv)
+        decryptor.update(self.cipher.encrypt(self.plaintext)[:-3])
+
+        with self.assertRaises(ValueError):
+            decryptor.finalize()
+
 
 if __name__ == "__main__":
     unittest.main()
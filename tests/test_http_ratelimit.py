@@ -0,0 +1,84 @@
+"""
+요청 속도 제한 테스트 코드
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from kgu_library.core.http import BucketBackend, FileBucketBackend, RateLimiter
+
+HOST = "libgate.kyonggi.ac.kr"
+
+
+class TestRateLimiter(unittest.TestCase):
+    """RateLimiter 테스트 클래스"""
+
+    def test_burst_and_refill(self):
+        """burst만큼 바로 보내고 이후 rate에 맞춰 채워지는지 테스트"""
+        limiter = RateLimiter(rate=20, burst=3)
+        self.assertEqual(
+            [limiter.try_acquire(HOST) for _ in range(4)], [True] * 3 + [False]
+        )
+        # 호스트마다 따로 제한
+        self.assertTrue(limiter.try_acquire("attend.kyonggi.ac.kr"))
+
+        time.sleep(0.06)
+        self.assertTrue(limiter.try_acquire(HOST))
+        self.assertFalse(limiter.try_acquire(HOST))
+
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(host_rates={HOST: (0, 5)})
+        # 호스트별 burst도 1보다 작으면 1로 맞춤 (토큰이 영원히 모자라지 않음)
+        limiter = RateLimiter(host_rates={HOST: (20, 0.5)})
+        self.assertTrue(limiter.try_acquire(HOST))
+
+        with self.assertRaises(TypeError):
+            BucketBackend()
+
+    def test_account_bucket_is_atomic(self):
+        """계정 버킷이 비어 거절되면 호스트 토큰도 사용하지 않는지 테스트"""
+        limiter = RateLimiter(rate=1, burst=2, account_rate=1, account_burst=1)
+        self.assertTrue(limiter.try_acquire(HOST, "a"))
+        self.assertFalse(limiter.try_acquire(HOST, "a"))
+        # 거절된 요청은 호스트 토큰을 쓰지 않았으므로 하나가 남아 있음
+        self.assertTrue(limiter.try_acquire(HOST, "b"))
+        self.assertFalse(limiter.try_acquire(HOST, "c"))
+
+        limiter = RateLimiter(rate=100, host_rates={HOST: (1, 1)})
+        self.assertTrue(limiter.try_acquire(HOST))
+        self.assertFalse(limiter.try_acquire(HOST))
+
+    def test_acquire_waits(self):
+        """acquire()가 토큰이 찰 때까지 기다리고 timeout을 지키는지 테스트"""
+        limiter = RateLimiter(rate=20, burst=1)
+        self.assertTrue(limiter.acquire(HOST))
+
+        self.assertFalse(limiter.acquire(HOST, timeout=0.01))
+        started = time.monotonic()
+        self.assertTrue(limiter.acquire(HOST, timeout=1))
+        self.assertGreater(time.monotonic() - started, 0.03)
+
+    def test_file_backend_shared(self):
+        """파일 백엔드를 쓰는 limiter끼리 (다른 프로세스처럼) 버킷을 공유하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "buckets.json")
+            first = RateLimiter(rate=0.1, burst=2, backend=FileBucketBackend(path))
+            second = RateLimiter(rate=0.1, burst=2, backend=FileBucketBackend(path))
+
+            self.assertTrue(first.try_acquire(HOST))
+            self.assertTrue(second.try_acquire(HOST))
+            self.assertFalse(first.try_acquire(HOST))
+            self.assertFalse(second.try_acquire(HOST))
+
+            # 손상된 파일은 가득 찬 버킷으로 다시 시작
+            with open(path, "w") as f:
+                f.write("{")
+            self.assertTrue(first.try_acquire(HOST))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+재시도 정책 테스트 코드
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from kgu_library.core.http import DeadlineExceeded, RetryPolicy
+from kgu_library.core.http.retry import is_unsent_error
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """RetryPolicy 테스트 클래스"""
+
+    def make_policy(self, **kwargs):
+        records = []
+        policy = RetryPolicy(on_attempt=records.append, **kwargs)
+        policy.sleeps = []
+        policy.sleep = policy.sleeps.append
+        return policy, records
+
+    def test_backoff_full_jitter(self):
+        """대기 시간이 [0, min(max, base * 2^n)] 안에서 고르게 뽑히는지 테스트"""
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=1.0)
+        for retry, cap in [(0, 0.1), (2, 0.4), (10, 1.0), (1000, 1.0)]:
+            delays = [policy.backoff(retry) for _ in range(200)]
+            self.assertTrue(all(0 <= delay <= cap for delay in delays))
+            self.assertLess(min(delays), cap / 4)
+            self.assertGreater(max(delays), cap * 3 / 4)
+
+    def test_retries_until_success(self):
+        """일시적인 오류 후 성공할 때까지 다시 보내고 시도를 기록하는지 테스트"""
+        policy, records = self.make_policy(max_attempts=4)
+        responses = [Mock(status_code=503, headers={}), Mock(status_code=200)]
+        send = Mock(side_effect=[requests.ConnectionError("reset")] + responses)
+
+        self.assertIs(policy.call("GET", "https://x/a", send), responses[1])
+        self.assertEqual(send.call_count, 3)
+        self.assertEqual(len(policy.sleeps), 2)
+        responses[0].close.assert_called_once_with()
+        self.assertEqual([r.attempt for r in records], [1, 2, 3])
+        self.assertEqual([r.status_code for r in records], [None, 503, 200])
+        self.assertIsInstance(records[0].error, requests.ConnectionError)
+        self.assertFalse(records[-1].retried)
+        self.assertTrue(all(r.latency >= 0 for r in records))
+
+    def test_gives_up(self):
+        """최대 횟수를 넘으면 마지막 응답이나 예외를 전달하는지 테스트"""
+        policy, _ = self.make_policy(max_attempts=2)
+        last = Mock(status_code=500, headers={})
+        send = Mock(side_effect=[Mock(status_code=500, headers={}), last])
+        self.assertIs(policy.call("GET", "u", send), last)
+
+        send = Mock(side_effect=requests.ReadTimeout("timeout"))
+        with self.assertRaises(requests.ReadTimeout):
+            policy.call("GET", "u", send)
+        self.assertEqual(send.call_count, 2)
+
+        # 요청 예외가 아닌 오류는 다시 보내지 않음
+        send = Mock(side_effect=ValueError("bug"))
+        with self.assertRaises(ValueError):
+            policy.call("GET", "u", send)
+        self.assertEqual(send.call_count, 1)
+
+    def test_non_idempotent(self):
+        """멱등하지 않은 요청은 서버가 받지 않은 경우에만 다시 보내는지 테스트"""
+        policy = RetryPolicy()
+        unsent = requests.ConnectionError(
+            MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+        )
+        self.assertTrue(is_unsent_error(unsent))
+        self.assertTrue(is_unsent_error(requests.ConnectTimeout("connect")))
+        self.assertFalse(is_unsent_error(requests.ConnectionError("reset")))
+        self.assertFalse(is_unsent_error(requests.ReadTimeout("read")))
+
+        self.assertTrue(policy.should_retry(False, error=unsent))
+        self.assertFalse(policy.should_retry(False, error=requests.ReadTimeout("r")))
+        self.assertTrue(policy.should_retry(True, error=requests.ReadTimeout("r")))
+        self.assertFalse(policy.should_retry(False, Mock(status_code=503)))
+        self.assertTrue(policy.should_retry(False, Mock(status_code=429)))
+        self.assertFalse(policy.should_retry(True, Mock(status_code=404)))
+
+        policy, records = self.make_policy(max_attempts=3)
+        send = Mock(side_effect=requests.ReadTimeout("timeout"))
+        with self.assertRaises(requests.ReadTimeout):
+            policy.call("POST", "u", send)
+        self.assertEqual(send.call_count, 1)
+        with self.assertRaises(requests.ReadTimeout):
+            policy.call("POST", "u", send, idempotent=True)
+        self.assertEqual(send.call_count, 4)
+
+    def test_retry_after(self):
+        """Retry-After 헤더를 대기 시간으로 사용하되 backoff_max를 넘지 않는지 테스트"""
+        policy, _ = self.make_policy(max_attempts=3, backoff_base=0, backoff_max=2)
+        send = Mock(
+            side_effect=[
+                Mock(status_code=429, headers={"Retry-After": "1"}),
+                Mock(status_code=429, headers={"Retry-After": "60"}),
+                Mock(status_code=200),
+            ]
+        )
+        policy.call("POST", "u", send)
+        self.assertEqual(policy.sleeps, [1.0, 2])
+
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @patch("kgu_library.core.http.retry.time")
+    def test_deadline(self, mock_time):
+        """제한 시각 때문에 다시 보내지 못하면 항상 DeadlineExceeded를 발생시키는지 테스트"""
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.perf_counter.side_effect = lambda: clock[0]
+        policy, records = self.make_policy(
+            max_attempts=5, backoff_base=1, backoff_max=1
+        )
+        policy.backoff = lambda retry: 1.0
+        reset = requests.ConnectionError("reset")
+
+        # 대기 전에 제한 시각을 넘길 것이 확실한 경우
+        send = Mock(side_effect=reset)
+        with self.assertRaises(DeadlineExceeded) as ctx:
+            policy.call("GET", "u", send, deadline=0.5)
+        self.assertIs(ctx.exception.__cause__, reset)
+        self.assertEqual(send.call_count, 1)
+        self.assertFalse(records[-1].retried)
+
+        # 대기가 예상보다 길어져 제한 시각을 넘긴 경우
+        def oversleep(delay):
+            clock[0] += delay + 1
+
+        policy.sleep = oversleep
+        send = Mock(side_effect=reset)
+        with self.assertRaises(DeadlineExceeded) as ctx:
+            policy.call("GET", "u", send, deadline=clock[0] + 1.5)
+        self.assertIs(ctx.exception.__cause__, reset)
+        self.assertEqual(send.call_count, 1)
+
+        # 재시도할 응답도 제한 시각이 지나면 연결을 돌려주고 예외 발생
+        response = Mock(status_code=503, headers={})
+        with self.assertRaises(DeadlineExceeded) as ctx:
+            policy.call("GET", "u", Mock(return_value=response), deadline=clock[0])
+        self.assertIs(ctx.exception.response, response)
+        response.close.assert_called_once_with()
+
+        # 다시 보낼 필요가 없으면 제한 시각과 관계없이 그대로 전달
+        ok = Mock(status_code=200)
+        self.assertIs(policy.call("GET", "u", Mock(return_value=ok), deadline=0), ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
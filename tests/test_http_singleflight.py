@@ -0,0 +1,101 @@
+"""
+SingleFlight 테스트 코드
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from kgu_library.core.http import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """SingleFlight 테스트 클래스"""
+
+    def run_concurrently(self, flight, fn, count=8, key="key"):
+        """count개의 스레드가 동시에 같은 키로 do()를 호출"""
+        barrier = threading.Barrier(count)
+
+        def call():
+            barrier.wait()
+            return flight.do(key, fn)
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(call) for _ in range(count)]
+        return futures
+
+    def test_concurrent_calls_share_result(self):
+        """동시에 들어온 같은 키의 호출이 한 번만 실행되는지 테스트"""
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"success": True}
+
+        futures = self.run_concurrently(flight, slow)
+        results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.executed, 1)
+        self.assertEqual(flight.shared, 7)
+
+        # ttl이 없으면 완료 후에는 다시 실행
+        flight.do("key", slow)
+        self.assertEqual(len(calls), 2)
+
+    def test_error_shared_and_not_kept(self):
+        """예외가 기다리던 호출에도 전달되고 보관되지 않는지 테스트"""
+        flight = SingleFlight(ttl=10)
+
+        def failing():
+            time.sleep(0.1)
+            raise ValueError("실패")
+
+        futures = self.run_concurrently(flight, failing, count=4)
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result()
+        self.assertEqual(flight.executed, 1)
+
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+
+    def test_ttl(self):
+        """ttl 동안 완료된 결과를 재사용하는지 테스트"""
+        flight = SingleFlight(ttl=0.05)
+        counter = iter(range(100))
+
+        first = flight.do("key", lambda: next(counter))
+        self.assertEqual(flight.do("key", lambda: next(counter)), first)
+        self.assertNotEqual(flight.do("other", lambda: next(counter)), first)
+
+        time.sleep(0.06)
+        self.assertNotEqual(flight.do("key", lambda: next(counter)), first)
+
+        flight.forget("key")
+        self.assertEqual(flight.do("key", lambda: "new"), "new")
+        flight.clear()
+        self.assertEqual(flight.do("key", lambda: "after clear"), "after clear")
+
+        with self.assertRaises(ValueError):
+            SingleFlight(ttl=-1)
+
+    def test_expired_results_pruned(self):
+        """다시 요청하지 않는 키의 만료된 결과도 새 작업을 시작할 때 지우는지 테스트"""
+        flight = SingleFlight(ttl=0.02)
+        for i in range(50):
+            flight.do(f"url{i}", lambda: i)
+        self.assertEqual(len(flight), 50)
+
+        time.sleep(0.03)
+        flight.do("url0", lambda: "again")
+        self.assertEqual(len(flight), 1)
+        flight.do("new", lambda: "new")
+        self.assertEqual(len(flight), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
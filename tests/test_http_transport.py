@@ -0,0 +1,98 @@
+"""
+HTTP 연결 풀 설정 테스트 코드
+"""
+
+import unittest
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp는 선택 의존성
+    aiohttp = None
+
+from kgu_library.attendance import AttendanceHTTPClient
+from kgu_library.core.http import Transport, TransportConfig
+from kgu_library.library import LibraryHTTPClient
+
+
+class TestTransport(unittest.TestCase):
+    """Transport/TransportConfig 테스트 클래스"""
+
+    def test_adapter_config(self):
+        """설정값이 HTTPAdapter 연결 풀에 반영"""
+        config = TransportConfig(pool_connections=4, pool_maxsize=32, pool_block=True)
+        adapter = Transport(config).adapter
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+
+    def test_invalid_limits(self):
+        """연결 수가 1보다 작으면 ValueError 발생"""
+        with self.assertRaises(ValueError):
+            TransportConfig(pool_maxsize=0)
+        with self.assertRaises(ValueError):
+            TransportConfig(host_limits={"example.com": 0})
+
+    def test_shared_transport(self):
+        """같은 Transport를 받은 클라이언트는 연결 풀을 공유하고 쿠키는 분리"""
+        transport = Transport(TransportConfig(pool_maxsize=16))
+        first = LibraryHTTPClient(transport=transport)
+        second = AttendanceHTTPClient(transport=transport)
+
+        url = "https://libgate.kyonggi.ac.kr/seat"
+        self.assertIs(first.session.get_adapter(url), transport.adapter)
+        self.assertIs(second.session.get_adapter(url), transport.adapter)
+        self.assertIsNot(first.session.cookies, second.session.cookies)
+
+    def test_config_creates_private_pool(self):
+        """TransportConfig를 받으면 클라이언트 전용 연결 풀 생성"""
+        config = TransportConfig(pool_maxsize=8)
+        first = LibraryHTTPClient(transport=config)
+        second = LibraryHTTPClient(transport=config)
+
+        self.assertIsNot(first.transport, second.transport)
+        self.assertEqual(first.transport.adapter._pool_maxsize, 8)
+
+    def test_host_limits(self):
+        """호스트별 연결 풀이 기본 풀보다 우선 적용"""
+        transport = Transport(TransportConfig(host_limits={"libgate.kyonggi.ac.kr": 2}))
+        session = transport.create_session()
+
+        host_adapter = session.get_adapter("https://libgate.kyonggi.ac.kr/seat")
+        self.assertEqual(host_adapter._pool_maxsize, 2)
+        self.assertIs(session.get_adapter("https://example.com/"), transport.adapter)
+
+    def test_keep_alive_disabled(self):
+        """keep_alive=False이면 Connection: close 헤더 추가"""
+        client = LibraryHTTPClient(transport=TransportConfig(keep_alive=False))
+        self.assertEqual(client.session.headers["Connection"], "close")
+
+        client = LibraryHTTPClient()
+        self.assertNotEqual(client.session.headers.get("Connection"), "close")
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp가 설치되어 있지 않습니다")
+class TestTransportConnector(unittest.IsolatedAsyncioTestCase):
+    """aiohttp 연결 풀 생성 테스트 클래스"""
+
+    async def test_create_connector(self):
+        """설정값이 TCPConnector에 반영"""
+        connector = TransportConfig(
+            pool_maxsize=5, max_connections=50
+        ).create_connector()
+        try:
+            self.assertEqual(connector.limit, 50)
+            self.assertEqual(connector.limit_per_host, 5)
+            self.assertFalse(connector.force_close)
+        finally:
+            await connector.close()
+
+        connector = TransportConfig(keep_alive=False).create_connector()
+        try:
+            self.assertTrue(connector.force_close)
+        finally:
+            await connector.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 LibraryAPIWrapper 테스트 코드
 """
 
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 import json
@@ -195,6 +196,75 @@ class TestLibraryAPIWrapper(unittest.TestCase):
         # 결과 검증
         self.assertFalse(result)
 
+    @patch("kgu_library.library.api.LibraryAPIWrapper.book_seat")
+    def test_book_first_available(self, mock_book_seat):
+        """후보 좌석 순차 예약 테스트 (좌석 문제는 다음 후보, 계정 문제는 중단)"""
+        mock_book_seat.side_effect = [
+            (BookingStatus.SEAT_IN_USE, "SEAT_IN_USE"),
+            (BookingStatus.NO_SEATS_AVAILABLE, "NO_SEATS_AVAILABLE"),
+            (BookingStatus.SUCCESS, "SUCCESS"),
+        ]
+        candidates = [101, {"id": 102}, {"id": 103}, 104]
+
+        status, _, seat = self.api.book_first_available(candidates, 60)
+
+        self.assertEqual(status, BookingStatus.SUCCESS)
+        self.assertEqual(seat, {"id": 103})
+        self.assertEqual(
+            [call.args for call in mock_book_seat.call_args_list],
+            [(101, 60), (102, 60), (103, 60)],
+        )
+
+        mock_book_seat.reset_mock()
+        mock_book_seat.side_effect = [
+            (BookingStatus.DAILY_LIMIT_REACHED, "DAILY_LIMIT_REACHED")
+        ]
+        status, _, seat = self.api.book_first_available([101, 102])
+        self.assertEqual(status, BookingStatus.DAILY_LIMIT_REACHED)
+        self.assertIsNone(seat)
+        self.assertEqual(mock_book_seat.call_count, 1)
+
+        # 후보가 없는 경우
+        status, _, seat = self.api.book_first_available([])
+        self.assertEqual(status, BookingStatus.NO_SEATS_AVAILABLE)
+        self.assertIsNone(seat)
+
+        with self.assertRaises(ValueError):
+            self.api.book_first_available([101], max_in_flight=0)
+
+    @patch("kgu_library.library.api.LibraryAPIWrapper.book_seat")
+    def test_book_first_available_in_flight(self, mock_book_seat):
+        """동시 예약 요청 중 늦게 도착한 성공 응답을 반환하는지 테스트"""
+        other_answered = threading.Event()
+
+        def fake_book_seat(seat_id, time_minutes):
+            if seat_id == 101:
+                # 102의 USING_ANOTHER_SEAT 응답이 먼저 도착한 뒤 성공 응답
+                other_answered.wait(5)
+                return BookingStatus.SUCCESS, "SUCCESS"
+            other_answered.set()
+            return BookingStatus.USING_ANOTHER_SEAT, "USING_ANOTHER_SEAT"
+
+        mock_book_seat.side_effect = fake_book_seat
+
+        status, _, seat = self.api.book_first_available(
+            [101, 102, 103], max_in_flight=2
+        )
+
+        self.assertEqual(status, BookingStatus.SUCCESS)
+        self.assertEqual(seat, 101)
+        # 중단 상태를 받은 뒤에는 새 후보를 보내지 않음
+        self.assertNotIn(103, [call.args[0] for call in mock_book_seat.call_args_list])
+
+    @patch("kgu_library.library.api.LibraryAPIWrapper.book_seat")
+    def test_book_first_available_error(self, mock_book_seat):
+        """예약 요청 오류 시 더 시도하지 않고 예외를 전달하는지 테스트"""
+        mock_book_seat.side_effect = BookingError("좌석 예약 실패: 연결 오류")
+
+        with self.assertRaises(BookingError):
+            self.api.book_first_available([101, 102])
+        self.assertEqual(mock_book_seat.call_count, 1)
+
     @patch("kgu_library.library.http_client.LibraryHTTPClient.get")
     def test_get_areas(self, mock_get):
         """영역 목록 조회 테스트"""
@@ -363,6 +433,44 @@ class TestLibraryAPIWrapper(unittest.TestCase):
         # 올바른 요청이 전송되었는지 확인
         mock_get.assert_called_with(f"libraries/seats/{area_id}")
 
+    @patch("kgu_library.library.http_client.LibraryHTTPClient.get")
+    def test_get_all_available_seats(self, mock_get):
+        """모든 구역 좌석 동시 조회 테스트 (일부 구역 실패 포함)"""
+        seats = {
+            1: [{"code": 101, "name": "1", "seatTime": None}],
+            2: [
+                {"code": 201, "name": "1", "seatTime": None},
+                {"code": 202, "name": "2", "seatTime": None},
+            ],
+        }
+
+        def fake_get(endpoint):
+            if endpoint == "libraries/lib-status/1":
+                return {
+                    "success": True,
+                    "data": [{"code": 1}, {"code": 2}, {"code": 3}],
+                }
+            area_id = int(endpoint.rsplit("/", 1)[1])
+            if area_id not in seats:
+                raise APIResponseError("API 요청 실패: 상태 코드 500")
+            return {"success": True, "data": seats[area_id]}
+
+        mock_get.side_effect = fake_get
+
+        snapshot = self.api.get_all_available_seats(1)
+
+        # 실패한 구역이 있어도 나머지 구역 결과는 반환
+        self.assertEqual(sorted(snapshot["areas"]), [1, 2, 3])
+        self.assertEqual(snapshot["total_available"], 3)
+        self.assertEqual(
+            [seat["id"] for seat in snapshot["areas"][2]["seats"]], [201, 202]
+        )
+        self.assertEqual(list(snapshot["errors"]), [3])
+        self.assertIn("500", snapshot["errors"][3])
+        self.assertEqual(snapshot["areas"][3]["seats"], [])
+        for result in snapshot["areas"].values():
+            self.assertGreaterEqual(result["latency"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+"""
+AreaCache 테스트 코드
+"""
+
+import unittest
+from unittest.mock import patch
+
+from kgu_library.library.api import LibraryAPIWrapper
+from kgu_library.library.area_cache import AreaCache
+from kgu_library.library.exceptions import APIResponseError
+
+
+def make_area(code, available, in_use):
+    """테스트용 구역 응답 항목 생성"""
+    return {
+        "code": code,
+        "name": f"열람실 {code}",
+        "nameEng": f"Room {code}",
+        "cnt": available + in_use,
+        "available": available,
+        "inUse": in_use,
+        "startTm": "0900",
+        "endTm": "2200",
+        "maxMi": 240,
+        "bgImg": "/img/bg.png",
+    }
+
+
+class TestAreaCache(unittest.TestCase):
+    """AreaCache 테스트 클래스"""
+
+    def setUp(self):
+        self.api = LibraryAPIWrapper()
+        self.data = [make_area(19, 10, 5), make_area(20, 3, 7)]
+        patcher = patch.object(
+            self.api.client,
+            "get",
+            side_effect=lambda endpoint: {"success": True, "data": self.data},
+        )
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_areas_matches_api(self):
+        """캐시가 get_areas()와 같은 결과를 반환하는지 테스트"""
+        cache = AreaCache(self.api)
+        self.assertEqual(cache.get_areas(1), self.api.get_areas(1))
+
+    def test_counters_refresh_keeps_static(self):
+        """TTL 안에서는 좌석 수만 갱신하고 정적 필드는 재사용하는지 테스트"""
+        cache = AreaCache(self.api, ttl=3600)
+        cache.get_areas(1)
+        static = cache.static(1)
+
+        self.data = [make_area(19, 2, 13), make_area(20, 3, 7)]
+        counters = cache.get_counters(1)
+        areas = cache.get_areas(1)
+
+        self.assertIs(cache.static(1), static)
+        self.assertEqual(counters[19]["available"], 2)
+        self.assertEqual(counters[19]["in_use"], 13)
+        self.assertNotIn("name", counters[19])
+        self.assertEqual(areas[0]["available"], 2)
+        self.assertEqual(areas[0]["name"], "열람실 19")
+        self.assertEqual(cache.last_counters(1), counters)
+        self.assertEqual(areas, self.api.get_areas(1))
+
+    def test_static_reloaded(self):
+        """TTL 만료, 구역 구성 변경, refresh 시 정적 필드를 다시 변환하는지 테스트"""
+        cache = AreaCache(self.api, ttl=0)
+        cache.get_counters(1)
+        static = cache.static(1)
+        cache.get_counters(1)
+        self.assertIsNot(cache.static(1), static)
+
+        cache = AreaCache(self.api, ttl=3600)
+        cache.get_areas(1)
+        static = cache.static(1)
+        self.data = self.data + [make_area(21, 1, 1)]
+        self.assertEqual(len(cache.get_areas(1)), 3)
+        self.assertIsNot(cache.static(1), static)
+
+        static = cache.static(1)
+        cache.get_areas(1, refresh=True)
+        self.assertIsNot(cache.static(1), static)
+
+        cache.invalidate()
+        self.assertIsNone(cache.static(1))
+        self.assertIsNone(cache.last_counters(1))
+
+    def test_error(self):
+        """구역 조회 실패 시 예외 테스트"""
+        self.mock_get.side_effect = lambda endpoint: {"success": False}
+        with self.assertRaises(APIResponseError):
+            AreaCache(self.api).get_counters(1)
+        with self.assertRaises(ValueError):
+            AreaCache(self.api, ttl=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
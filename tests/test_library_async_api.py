@@ -0,0 +1,125 @@
+"""
+AsyncLibraryAPIWrapper 테스트 코드
+"""
+
+import asyncio
+import unittest
+
+try:
+    from aiohttp import CookieJar, web
+    from aiohttp.test_utils import TestServer
+except ImportError:  # aiohttp는 선택 의존성
+    web = None
+
+from kgu_library.library import AsyncLibraryAPIWrapper, BookingStatus
+from kgu_library.library.exceptions import SeatError
+
+
+@unittest.skipIf(web is None, "aiohttp가 설치되어 있지 않습니다")
+class TestAsyncLibraryAPIWrapper(unittest.IsolatedAsyncioTestCase):
+    """AsyncLibraryAPIWrapper 테스트 클래스 (로컬 테스트 서버 사용)"""
+
+    async def asyncSetUp(self):
+        """테스트 서버 및 API 래퍼 설정"""
+        self.requests = []
+
+        async def login(request):
+            self.requests.append(("login", await request.text()))
+            response = web.Response(text="<html></html>")
+            response.set_cookie("CLI_ID", "session-1")
+            return response
+
+        async def seats(request):
+            area_id = int(request.match_info["area_id"])
+            self.requests.append(("seats", area_id))
+            await asyncio.sleep(0.05)
+            if area_id == 99:
+                return web.Response(status=500)
+            return web.json_response(
+                {
+                    "success": True,
+                    "data": [
+                        {"code": area_id * 100 + 1, "name": "1", "seatTime": None},
+                        {"code": area_id * 100 + 2, "name": "2", "seatTime": 30},
+                    ],
+                }
+            )
+
+        async def areas(request):
+            return web.json_response(
+                {"success": True, "data": [{"code": 1}, {"code": 2}, {"code": 99}]}
+            )
+
+        async def book(request):
+            body = await request.json()
+            self.requests.append(("book", body, request.cookies.get("CLI_ID")))
+            return web.json_response(
+                {"success": True, "code": 1, "status": 1, "data": 7}
+            )
+
+        app = web.Application()
+        app.router.add_post("/login_library", login)
+        app.router.add_get("/libraries/lib-status/1", areas)
+        app.router.add_get("/libraries/seats/{area_id}", seats)
+        app.router.add_post("/libraries/seat", book)
+
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        # 테스트 서버는 IP 주소이므로 unsafe 쿠키 저장소 사용
+        self.api = AsyncLibraryAPIWrapper(cookie_jar=CookieJar(unsafe=True))
+        self.api.client.BASE_URL = str(self.server.make_url("")).rstrip("/")
+
+    async def asyncTearDown(self):
+        """세션 및 서버 종료"""
+        await self.api.close()
+        await self.server.close()
+
+    async def test_login_with_cookie(self):
+        """JSON이 아닌 응답에서 CLI_ID 쿠키로 로그인 성공 판단"""
+        self.assertTrue(await self.api.login("202400000", "테스트"))
+        self.assertIn("STD_ID=202400000", self.requests[0][1])
+
+    async def test_concurrent_seat_requests(self):
+        """여러 구역 좌석 조회를 동시에 수행"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(
+            *(self.api.get_available_seats(area_id) for area_id in range(1, 11))
+        )
+        elapsed = loop.time() - started
+
+        # 각 요청이 50ms 걸리므로 순차 실행이면 0.5초 이상 소요
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(
+            [r[0]["id"] for r in results], [a * 100 + 1 for a in range(1, 11)]
+        )
+        self.assertTrue(all(len(r) == 1 for r in results))
+
+    async def test_get_all_available_seats(self):
+        """전체 구역 스냅샷 조회 시 실패한 구역은 errors에 기록"""
+        snapshot = await self.api.get_all_available_seats(1)
+
+        self.assertEqual(sorted(snapshot["areas"]), [1, 2, 99])
+        self.assertEqual(snapshot["total_available"], 2)
+        self.assertEqual(list(snapshot["errors"]), [99])
+
+    async def test_seat_request_error(self):
+        """HTTP 오류 시 SeatError 발생"""
+        with self.assertRaises(SeatError):
+            await self.api.get_available_seats(99)
+
+    async def test_book_seat_uses_session_cookie(self):
+        """로그인 쿠키를 유지한 채 좌석 예약"""
+        await self.api.login("202400000", "테스트")
+        status, message = await self.api.book_seat(123, 60)
+
+        self.assertEqual(status, BookingStatus.SEAT_IN_USE)
+        self.assertEqual(message, "SEAT_IN_USE")
+        self.assertEqual(
+            self.requests[-1], ("book", {"seatId": 123, "time": 60}, "session-1")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
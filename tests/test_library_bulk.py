@@ -0,0 +1,159 @@
+"""
+KGU Library 여러 계정 동시 예약 테스트 코드
+"""
+
+import threading
+import time
+import unittest
+
+from kgu_library.core.http import RateLimiter
+from kgu_library.core.session import SessionPool
+from kgu_library.library import BookingStatus, BulkBooker
+from kgu_library.library.exceptions import BookingError, LoginError, RateLimitError
+
+
+class FakeServer:
+    """좌석을 계정에 하나씩 배정하는 가짜 서버"""
+
+    def __init__(self, taken=(), delay=0.01):
+        self.owners = {seat_id: "other" for seat_id in taken}
+        self.requests = []
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def book(self, account, seat_id):
+        time.sleep(self.delay)
+        with self.lock:
+            self.requests.append((account, seat_id))
+            if seat_id in self.owners:
+                return BookingStatus.SEAT_IN_USE, "SEAT_IN_USE"
+            if account in self.owners.values():
+                return BookingStatus.USING_ANOTHER_SEAT, "USING_ANOTHER_SEAT"
+            self.owners[seat_id] = account
+            return BookingStatus.SUCCESS, "SUCCESS"
+
+
+class FakeAPI:
+    """가짜 서버로 예약하는 API 래퍼"""
+
+    def __init__(self, server, account):
+        self.server = server
+        self.account = account
+
+    def book_seat(self, seat_id, time_minutes=30):
+        if seat_id == "broken":
+            raise BookingError("연결 끊김")
+        return self.server.book(self.account, seat_id)
+
+
+class LimitedAPI(FakeAPI):
+    """LibraryAPIWrapper.book_seat처럼 속도 제한 토큰이 없으면 요청하지 않는 API 래퍼"""
+
+    def __init__(self, server, account, limiter):
+        super().__init__(server, account)
+        self.limiter = limiter
+
+    def book_seat(self, seat_id, time_minutes=30):
+        wait = self.limiter.take("libgate.kyonggi.ac.kr", timeout=0)
+        if wait > 0:
+            raise RateLimitError("속도 제한", wait_time=wait)
+        return super().book_seat(seat_id, time_minutes)
+
+
+class TestBulkBooker(unittest.TestCase):
+    """BulkBooker 테스트 클래스"""
+
+    def make_pool(self, server, accounts):
+        def login(api, account, credentials):
+            if credentials == "bad":
+                raise LoginError("로그인 실패")
+
+        pool = SessionPool(lambda account: FakeAPI(server, account), login)
+        for account in accounts:
+            pool.register(account, "bad" if account == "locked" else "pw")
+        return pool
+
+    def test_shared_candidates_get_distinct_seats(self):
+        """같은 후보를 받은 계정들이 서로 다른 좌석을 예약하는지 테스트"""
+        server = FakeServer(taken=[102])
+        accounts = [f"user{i}" for i in range(4)]
+        booker = BulkBooker(self.make_pool(server, accounts), max_workers=4)
+        seats = [101, 102, 103, 104, 105, 106]
+
+        result = booker.book([(account, seats) for account in accounts])
+
+        self.assertEqual(len(result.succeeded), 4)
+        assigned = result.assignments
+        self.assertEqual(sorted(assigned.values()), [101, 103, 104, 105])
+        for account, seat_id in assigned.items():
+            self.assertEqual(server.owners[seat_id], account)
+        # 선점 덕분에 한 좌석에 두 계정이 요청하지 않음
+        requested = [seat_id for _, seat_id in server.requests]
+        self.assertEqual(len(requested), len(set(requested)))
+        self.assertEqual([r.account for r in result], accounts)
+        self.assertGreater(result.elapsed, 0)
+        self.assertLess(result.elapsed, 0.01 * len(server.requests))
+
+    def test_failures(self):
+        """로그인 실패, 계정 사정의 실패, 요청 오류를 계정별로 기록하는지 테스트"""
+        server = FakeServer()
+        server.owners[200] = "busy"  # busy는 이미 다른 좌석 사용 중
+        pool = self.make_pool(server, ["busy", "locked", "broken", "ok"])
+        booker = BulkBooker(pool, max_workers=1)
+
+        result = booker.book(
+            [
+                ("busy", [201, 202]),
+                ("locked", [201]),
+                ("broken", ["broken", 203]),
+                ("ok", [201]),
+            ]
+        )
+
+        self.assertEqual(result["busy"].status, BookingStatus.USING_ANOTHER_SEAT)
+        self.assertEqual(result["busy"].attempts, 1)
+        self.assertEqual(result["locked"].status, BookingStatus.API_ERROR)
+        self.assertIsInstance(result["locked"].error, LoginError)
+        self.assertEqual(result["broken"].status, BookingStatus.API_ERROR)
+        self.assertIsInstance(result["broken"].error, BookingError)
+        # busy가 실패한 좌석은 선점이 풀려 다른 계정이 예약
+        self.assertEqual(result["ok"].seat, 201)
+        self.assertEqual(result.statuses["ok"], BookingStatus.SUCCESS)
+        self.assertEqual(len(result.failed), 3)
+
+        # 선점은 book() 호출 안에서만 유지되므로 오류가 난 좌석도 다음 호출에서 다시 시도
+        again = booker.book([("broken", ["broken"]), ("busy", [201])])
+        self.assertEqual(again["broken"].attempts, 1)
+        self.assertEqual(again["busy"].attempts, 1)
+
+        with self.assertRaises(KeyError):
+            result["unknown"]
+        with self.assertRaises(ValueError):
+            BulkBooker(pool, max_workers=0)
+
+    def test_shared_rate_limit(self):
+        """속도 제한으로 보내지 못한 예약은 선점을 풀고 기다렸다가 다시 시도하는지 테스트"""
+        server = FakeServer(delay=0)
+        limiter = RateLimiter(rate=50, burst=2)
+        accounts = [f"user{i}" for i in range(6)]
+        pool = SessionPool(
+            lambda account: LimitedAPI(server, account, limiter),
+            lambda api, account, credentials: None,
+        )
+        for account in accounts:
+            pool.register(account, "pw")
+        booker = BulkBooker(pool, max_workers=6)
+        seats = [101, 102, 103, 104, 105, 106]
+
+        result = booker.book([(account, seats) for account in accounts])
+
+        self.assertEqual(len(result.succeeded), 6)
+        self.assertEqual(sorted(result.assignments.values()), seats)
+        self.assertEqual(len(server.requests), 6)
+        self.assertTrue(all(r.attempts == 1 for r in result))
+        # 처음 2개 뒤로는 토큰이 찰 때까지 기다림 (초당 50개)
+        self.assertGreaterEqual(result.elapsed, 4 / 50 * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,14 @@ import json
 import requests
 from requests.exceptions import RequestException
 
+from kgu_library.core.http import RateLimiter, RetryPolicy
+from kgu_library.library.api import LibraryAPIWrapper
+from kgu_library.library.enums import BookingStatus
 from kgu_library.library.http_client import LibraryHTTPClient
-from kgu_library.library.exceptions import APIResponseError
+from kgu_library.library.exceptions import (
+    APIResponseError,
+    RateLimitError,
+)
 
 
 class TestLibraryHTTPClient(unittest.TestCase):
@@ -65,6 +71,26 @@ class TestLibraryHTTPClient(unittest.TestCase):
         self.assertIn("Referer", headers)
         self.assertEqual(headers["X-Custom-Header"], "test-value")
 
+    @patch("requests.Session.get")
+    def test_get_coalesce(self, mock_get):
+        """동일한 GET 요청을 합치고 보관하는지 테스트"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True}
+        mock_get.return_value = mock_response
+
+        client = LibraryHTTPClient(coalesce_ttl=60)
+        first = client.get(self.test_endpoint, params=self.test_params)
+        second = client.get("/" + self.test_endpoint, params=dict(self.test_params))
+        client.get(self.test_endpoint, params={"param1": "other"})
+        # 해시할 수 없는 파라미터는 합치지 않음
+        client.get(self.test_endpoint, params={"ids": [1, 2]})
+        client.get(self.test_endpoint, params={"ids": [1, 2]})
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertIsNone(self.client.single_flight)
+
     @patch("requests.Session.get")
     def test_get_json_decode_error(self, mock_get):
         """GET 요청 JSON 디코딩 오류 테스트"""
@@ -192,6 +218,84 @@ class TestLibraryHTTPClient(unittest.TestCase):
         with self.assertRaises(APIResponseError):
             self.client.post(self.test_endpoint)
 
+    @patch("requests.Session.get")
+    def test_get_retry(self, mock_get):
+        """재시도 정책이 있으면 일시적인 오류 후 GET을 다시 보내는지 테스트"""
+        unavailable = Mock(status_code=503, headers={})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"success": True}
+        mock_get.side_effect = [requests.ReadTimeout("timeout"), unavailable, ok]
+
+        client = LibraryHTTPClient(retry=RetryPolicy(max_attempts=3, backoff_base=0))
+        self.assertEqual(client.get(self.test_endpoint), {"success": True})
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(
+            [(r.status_code, r.retried) for r in client.attempt_log],
+            [(None, True), (503, True), (200, False)],
+        )
+
+        # 기본값은 다시 보내지 않음
+        mock_get.reset_mock()
+        mock_get.side_effect = [unavailable]
+        with self.assertRaises(APIResponseError):
+            self.client.get(self.test_endpoint)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.Session.post")
+    def test_post_not_retried_after_possible_success(self, mock_post):
+        """서버가 처리했을 수 있는 POST는 다시 보내지 않는지 테스트"""
+        client = LibraryHTTPClient(retry=RetryPolicy(max_attempts=3, backoff_base=0))
+
+        mock_post.side_effect = requests.ReadTimeout("timeout")
+        with self.assertRaises(APIResponseError):
+            client.post("libraries/seat", json_data={"seatId": 1, "time": 30})
+        self.assertEqual(mock_post.call_count, 1)
+
+        mock_post.reset_mock()
+        mock_post.side_effect = None
+        mock_post.return_value = Mock(status_code=502, headers={})
+        with self.assertRaises(APIResponseError):
+            client.post("libraries/seat", json_data={"seatId": 1, "time": 30})
+        self.assertEqual(mock_post.call_count, 1)
+
+        # 멱등한 POST는 다시 보냄
+        mock_post.reset_mock()
+        with self.assertRaises(APIResponseError):
+            client.post("libraries/leave/1", json_data={}, idempotent=True)
+        self.assertEqual(mock_post.call_count, 3)
+
+    @patch("requests.Session.post")
+    def test_rate_limit(self, mock_post):
+        """속도 제한 토큰이 없으면 예약 요청을 기다리지 않고 실패하는지 테스트"""
+        mock_post.return_value = Mock(status_code=200, headers={})
+        mock_post.return_value.json.return_value = {"success": True}
+        limiter = RateLimiter(rate=0.01, burst=1, account_rate=0.01, account_burst=1)
+        api = LibraryAPIWrapper(rate_limiter=limiter)
+        api.client.account = "202400000"
+
+        api.book_seat(101)
+        # 요청을 보내지 않았으므로 BookingError로 감싸지 않음
+        with self.assertRaises(RateLimitError) as ctx:
+            api.book_seat(102)
+        self.assertGreater(ctx.exception.wait_time, 0)
+        self.assertEqual(mock_post.call_count, 1)
+
+        # 다른 클라이언트도 같은 호스트 버킷을 공유
+        other = LibraryHTTPClient(rate_limiter=limiter)
+        with self.assertRaises(RateLimitError):
+            other.post("libraries/seat", rate_limit_timeout=0)
+        self.assertEqual(mock_post.call_count, 1)
+
+        # 후보를 순서대로 예약할 때는 토큰이 찰 때까지 기다렸다가 같은 후보를 다시 시도
+        api = LibraryAPIWrapper(rate_limiter=RateLimiter(rate=20, burst=1))
+        mock_post.return_value.json.return_value = {"success": True, "data": 7}
+        api.book_seat(101)
+        mock_post.reset_mock()
+        status, _, seat = api.book_first_available([102, 103])
+        self.assertEqual(status, BookingStatus.SEAT_IN_USE)
+        self.assertIsNone(seat)
+        self.assertEqual(mock_post.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
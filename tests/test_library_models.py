@@ -0,0 +1,180 @@
+"""
+Area/Seat 모델 테스트 코드
+"""
+
+import copy
+import pickle
+import unittest
+from unittest.mock import patch
+
+from kgu_library.library import Area, AreaView, LibraryAPIWrapper, Seat, SeatView
+from kgu_library.library.api import _map_area, _map_seat
+
+
+class TestLibraryModels(unittest.TestCase):
+    """Area/Seat 모델 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.area_json = {
+            "code": 19,
+            "name": "제1열람실_충정관 2F",
+            "nameEng": "Reading Room 1",
+            "cnt": 120,
+            "available": 40,
+            "inUse": 80,
+            "maxMi": 240,
+            "vaWkRsrvUseYn": "N",
+        }
+        self.seat_json = {
+            "code": 101,
+            "name": "A-101",
+            "x": 100,
+            "y": 200,
+            "area": {"code": 19, "name": "제1열람실_충정관 2F"},
+            "seatTime": None,
+            "isNotebook": True,
+        }
+
+    def test_area_from_json(self):
+        """구역 응답으로 Area 생성"""
+        area = Area.from_json(self.area_json)
+
+        self.assertEqual(area.id, 19)
+        self.assertEqual(area.total_seats, 120)
+        self.assertEqual(area.max_mi, 240)
+        self.assertEqual(area.fix, 0)  # 없는 숫자 필드는 0
+        self.assertIsNone(area.color)
+        self.assertEqual(area.to_dict(), _map_area(self.area_json))
+
+    def test_seat_from_json(self):
+        """좌석 응답으로 Seat 생성 (중첩된 area 포함)"""
+        seat = Seat.from_json(self.seat_json)
+
+        self.assertEqual(seat.id, 101)
+        self.assertEqual(seat.area_id, 19)
+        self.assertEqual(seat.area_name, "제1열람실_충정관 2F")
+        self.assertTrue(seat.is_available)
+        self.assertEqual(seat.to_dict(), _map_seat(self.seat_json))
+
+        # area 정보가 없으면 기본값 사용
+        self.assertEqual(Seat.from_json({"code": 1}).area_name, "알 수 없음")
+
+    def test_slots_and_immutability(self):
+        """__dict__ 없이 슬롯만 사용하며 수정 불가"""
+        seat = Seat.from_json(self.seat_json)
+
+        self.assertFalse(hasattr(seat, "__dict__"))
+        with self.assertRaises(AttributeError):
+            seat.name = "B-101"
+
+    def test_copy_and_pickle(self):
+        """copy, deepcopy, pickle로 복제해도 같은 값의 모델이 되는지 테스트"""
+        models = [Seat.from_json(self.seat_json), Area.from_json(self.area_json)]
+        for model in models:
+            for clone in (
+                copy.copy(model),
+                copy.deepcopy(model),
+                pickle.loads(pickle.dumps(model)),
+                pickle.loads(pickle.dumps(model, protocol=0)),
+            ):
+                with self.subTest(model=model, clone=type(clone)):
+                    self.assertIsNot(clone, model)
+                    self.assertEqual(clone, model)
+                    self.assertEqual(clone.to_dict(), model.to_dict())
+                    with self.assertRaises(AttributeError):
+                        clone.name = "B-101"
+
+    def test_dict_compatibility(self):
+        """기존 딕셔너리 방식 접근과 비교/해시 지원"""
+        seat = Seat.from_json(self.seat_json)
+
+        self.assertEqual(seat["id"], 101)
+        self.assertEqual(seat.get("x"), 100)
+        self.assertIsNone(seat.get("unknown"))
+        with self.assertRaises(KeyError):
+            seat["unknown"]
+
+        same = Seat.from_json(dict(self.seat_json))
+        self.assertEqual(seat, same)
+        self.assertEqual(len({seat, same}), 1)
+        self.assertNotEqual(seat, Seat.from_json(dict(self.seat_json, x=0)))
+
+    @patch("kgu_library.library.http_client.LibraryHTTPClient.get")
+    def test_api_as_models(self, mock_get):
+        """as_models=True이면 API가 모델 객체 반환"""
+        api = LibraryAPIWrapper()
+        mock_get.return_value = {
+            "success": True,
+            "data": [self.seat_json, dict(self.seat_json, code=102, seatTime=30)],
+        }
+
+        seats = api.get_available_seats(19, as_models=True)
+
+        self.assertEqual(len(seats), 1)
+        self.assertIsInstance(seats[0], Seat)
+        self.assertEqual(seats[0].id, 101)
+
+    def test_views_read_raw_dict(self):
+        """뷰는 원본 딕셔너리를 복사하지 않고 접근할 때 값을 읽음"""
+        area = AreaView(self.area_json)
+        seat = SeatView(self.seat_json)
+
+        self.assertIs(area.raw, self.area_json)
+        self.assertEqual(area.name_eng, "Reading Room 1")
+        self.assertEqual(area.max_mi, 240)
+        self.assertEqual(area.fix, 0)
+        self.assertEqual(seat.area_name, "제1열람실_충정관 2F")
+        self.assertTrue(seat.is_available)
+
+        # 원본이 바뀌면 뷰에도 반영
+        self.seat_json["seatTime"] = 30
+        self.assertEqual(seat.seat_time, 30)
+        self.assertFalse(seat.is_available)
+
+    def test_views_match_models(self):
+        """뷰의 to_dict()/to_model()은 모델과 같은 결과"""
+        self.assertEqual(
+            AreaView(self.area_json).to_dict(), Area.from_json(self.area_json).to_dict()
+        )
+        self.assertEqual(
+            SeatView(self.seat_json).to_model(), Seat.from_json(self.seat_json)
+        )
+
+        view = SeatView(self.seat_json)
+        self.assertEqual(view["id"], 101)
+        self.assertIsNone(view.get("unknown"))
+        with self.assertRaises(AttributeError):
+            view.unknown
+        with self.assertRaises(AttributeError):
+            view.name = "B-101"
+
+    def test_view_copy_and_pickle(self):
+        """뷰를 copy, deepcopy, pickle로 복제할 수 있는지 테스트"""
+        views = [SeatView(self.seat_json), AreaView(self.area_json)]
+        for view in views:
+            with self.subTest(view=view):
+                # 얕은 복사는 같은 원본을 공유
+                self.assertIs(copy.copy(view).raw, view.raw)
+                for clone in (copy.deepcopy(view), pickle.loads(pickle.dumps(view))):
+                    self.assertIs(type(clone), type(view))
+                    self.assertEqual(clone, view)
+                    self.assertIsNot(clone.raw, view.raw)
+                    self.assertEqual(clone.to_dict(), view.to_dict())
+
+    @patch("kgu_library.library.http_client.LibraryHTTPClient.get")
+    def test_api_lazy(self, mock_get):
+        """lazy=True이면 API가 뷰 객체 반환"""
+        api = LibraryAPIWrapper()
+        mock_get.return_value = {"success": True, "data": [self.area_json]}
+
+        areas = api.get_areas(lazy=True)
+
+        self.assertIsInstance(areas[0], AreaView)
+        self.assertIs(areas[0].raw, self.area_json)
+        with self.assertRaises(ValueError):
+            api.get_areas(as_models=True, lazy=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
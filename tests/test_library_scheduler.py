@@ -0,0 +1,175 @@
+"""
+서버 시계 추정 및 예약 시각 예약 테스트 코드
+"""
+
+import math
+import time
+import unittest
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+
+from kgu_library.library.clock import ServerClock, parse_http_date
+from kgu_library.library.enums import BookingStatus
+from kgu_library.library.exceptions import LibraryAPIError, LoginError
+from kgu_library.library.http_client import LibraryHTTPClient
+from kgu_library.library.scheduler import BookingScheduler
+
+
+class FakeClient:
+    """offset만큼 앞선 시계를 가진 서버를 흉내 내는 클라이언트"""
+
+    def __init__(self, true_offset, half_rtt=0.003, with_date=True):
+        self.true_offset = true_offset
+        self.half_rtt = half_rtt
+        self.with_date = with_date
+        self.clock = ServerClock()
+        self.requests = 0
+
+    def get(self, endpoint):
+        self.requests += 1
+        sent = time.time()
+        time.sleep(self.half_rtt)
+        server_time = math.floor(time.time() + self.true_offset)
+        time.sleep(self.half_rtt)
+        if self.with_date:
+            self.clock.add_sample(sent, time.time(), server_time)
+        return {"success": True}
+
+    _get = get
+
+
+class TestServerClock(unittest.TestCase):
+    """ServerClock 테스트 클래스"""
+
+    def test_sample_bounds(self):
+        """표본 하나로 offset 구간을 계산하는지 테스트"""
+        clock = ServerClock()
+        clock.add_sample(sent=100.2, received=100.3, server_time=105.0)
+
+        self.assertEqual(clock.bounds, (105.0 - 100.3, 106.0 - 100.2))
+        self.assertAlmostEqual(clock.offset, 5.25)
+        self.assertAlmostEqual(clock.uncertainty, 0.55)
+        self.assertAlmostEqual(clock.rtt, 0.1)
+
+    def test_samples_intersect(self):
+        """표본마다 구간이 좁아지는지 테스트"""
+        clock = ServerClock()
+        clock.add_sample(100.0, 100.1, 105.0)  # [4.9, 6.0]
+        clock.add_sample(100.6, 100.7, 106.0)  # [5.3, 6.4]
+
+        lower, upper = clock.bounds
+        self.assertAlmostEqual(lower, 5.3)
+        self.assertAlmostEqual(upper, 6.0)
+        self.assertAlmostEqual(clock.server_time(200.0), 200.0 + clock.offset)
+        self.assertAlmostEqual(clock.to_local(clock.server_time(200.0)), 200.0)
+
+    def test_inconsistent_sample_restarts(self):
+        """이전 추정과 맞지 않는 표본이 오면 새로 추정하는지 테스트"""
+        clock = ServerClock()
+        clock.add_sample(100.0, 100.1, 105.0)
+        clock.add_sample(200.0, 200.1, 300.0)
+
+        self.assertAlmostEqual(clock.bounds[0], 99.9)
+        self.assertEqual(clock.samples, 2)
+
+    def test_empty_clock(self):
+        """표본이 없을 때의 값 테스트"""
+        clock = ServerClock()
+        self.assertIsNone(clock.offset)
+        self.assertEqual(clock.uncertainty, float("inf"))
+        self.assertIsNone(clock.rtt)
+        self.assertEqual(clock.server_time(10.0), 10.0)
+
+    def test_parse_http_date(self):
+        """Date 헤더 변환 테스트"""
+        self.assertEqual(parse_http_date("Thu, 01 Jan 1970 00:01:00 GMT"), 60.0)
+        self.assertIsNone(parse_http_date("not a date"))
+        self.assertIsNone(parse_http_date(None))
+
+    @patch("requests.Session.get")
+    def test_http_client_records_date(self, mock_get):
+        """LibraryHTTPClient가 응답 Date 헤더를 서버 시계에 반영하는지 테스트"""
+        server_time = math.floor(time.time()) + 3600
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Date": formatdate(server_time, usegmt=True)}
+        mock_response.json.return_value = {"success": True}
+        mock_get.return_value = mock_response
+
+        client = LibraryHTTPClient()
+        client.get("test/endpoint")
+
+        self.assertEqual(client.clock.samples, 1)
+        lower, upper = client.clock.bounds
+        self.assertLessEqual(lower, 3600)
+        self.assertGreaterEqual(upper, 3599)
+
+
+class TestBookingScheduler(unittest.TestCase):
+    """BookingScheduler 테스트 클래스"""
+
+    def make_api(self, true_offset, **kwargs):
+        api = MagicMock()
+        api.client = FakeClient(true_offset, **kwargs)
+        return api
+
+    def test_sync_narrows_offset(self):
+        """초 경계 탐색으로 offset 구간이 줄어드는지 테스트"""
+        api = self.make_api(7.37)
+        scheduler = BookingScheduler(api, target_uncertainty=0.001)
+
+        offset, uncertainty = scheduler.sync(probes=3)
+
+        lower, upper = scheduler.clock.bounds
+        self.assertTrue(lower <= 7.37 <= upper)
+        self.assertLess(uncertainty, 0.2)
+        self.assertAlmostEqual(offset, 7.37, delta=uncertainty)
+        self.assertEqual(api.client.requests, 4)
+
+    def test_sync_without_date(self):
+        """Date 헤더가 없으면 예외가 발생하는지 테스트"""
+        scheduler = BookingScheduler(self.make_api(0, with_date=False))
+        with self.assertRaises(LibraryAPIError):
+            scheduler.sync()
+
+    def test_book_at_fires_on_time(self):
+        """목표 서버 시각에 맞춰 요청하고 운영 시간 전 응답은 다시 시도하는지 테스트"""
+        api = self.make_api(42.0)
+        # 좁은 구간의 표본을 미리 넣어 sync를 건너뜀
+        now = time.time()
+        api.client.clock.add_sample(now - 0.002, now, now + 42.0)
+        api.client.clock.add_sample(now - 0.002, now, now + 41.01)
+        fired = []
+
+        def fake_book(candidates, time_minutes, max_in_flight):
+            fired.append(time.time())
+            if len(fired) == 1:
+                return BookingStatus.BEFORE_OPERATION_HOURS, "BEFORE", None
+            return BookingStatus.SUCCESS, "SUCCESS", candidates[0]
+
+        api.book_first_available.side_effect = fake_book
+        api.login.return_value = True
+        scheduler = BookingScheduler(api, credentials=("202400000", "테스트"))
+
+        target = time.time() + 42.0 + 0.3
+        expected = scheduler.fire_time(target)
+        result = scheduler.book_at(target, [101], prewarm=0.1, retry_interval=0.01)
+
+        self.assertEqual(result.status, BookingStatus.SUCCESS)
+        self.assertEqual(result.seat, 101)
+        self.assertEqual(result.attempts, 2)
+        self.assertAlmostEqual(fired[0], expected, delta=0.02)
+        self.assertAlmostEqual(result.arrival_error, result.uncertainty, delta=0.02)
+        api.login.assert_called_once_with("202400000", "테스트")
+
+    def test_prewarm_login_failure(self):
+        """예약 전 로그인 실패 테스트"""
+        api = self.make_api(0)
+        api.login.return_value = False
+        scheduler = BookingScheduler(api, credentials=("202400000", "테스트"))
+        with self.assertRaises(LoginError):
+            scheduler.prewarm()
+
+
+if __name__ == "__main__":
+    unittest.main()
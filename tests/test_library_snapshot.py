@@ -0,0 +1,110 @@
+"""
+SeatSnapshotStore 테스트 코드
+"""
+
+import unittest
+
+from kgu_library.library.api import _map_seat
+from kgu_library.library.models import Seat, SeatView
+from kgu_library.library.snapshot import SeatSnapshotStore, seat_fingerprint
+
+
+def seat(code, seat_time=None, **fields):
+    """좌석 응답 항목 생성"""
+    return {
+        "code": code,
+        "name": f"A-{code}",
+        "seatTime": seat_time,
+        "area": {"code": 19, "name": "제1열람실"},
+        **fields,
+    }
+
+
+class TestSeatSnapshotStore(unittest.TestCase):
+    """SeatSnapshotStore 테스트 클래스"""
+
+    def test_first_update_adds_all(self):
+        """처음 저장하면 모든 좌석이 added"""
+        store = SeatSnapshotStore()
+        diff = store.update(19, [seat(1), seat(2)])
+
+        self.assertEqual(sorted(diff.added), [1, 2])
+        self.assertFalse(diff.removed or diff.changed)
+        self.assertEqual(len(store.get(19)), 2)
+        self.assertIsNone(store.get(20))
+
+    def test_diff(self):
+        """추가/삭제/변경 좌석 구분"""
+        store = SeatSnapshotStore()
+        store.update(19, [seat(1), seat(2), seat(3)])
+        diff = store.update(19, [seat(1), seat(2, 30), seat(4)])
+
+        self.assertEqual(list(diff.added), [4])
+        self.assertEqual(list(diff.removed), [3])
+        self.assertEqual(list(diff.changed), [2])
+        old, new = diff.changed[2]
+        self.assertIsNone(old["seatTime"])
+        self.assertEqual(new["seatTime"], 30)
+
+        # 같은 내용이면 변화 없음
+        self.assertFalse(store.update(19, [seat(1), seat(2, 30), seat(4)]))
+
+    def test_fingerprint(self):
+        """같은 값은 같은 지문, 다른 값은 다른 지문"""
+        self.assertEqual(seat_fingerprint(seat(1)), seat_fingerprint(seat(1)))
+        self.assertNotEqual(seat_fingerprint(seat(1)), seat_fingerprint(seat(1, 30)))
+        self.assertNotEqual(
+            seat_fingerprint(seat(1)), seat_fingerprint(seat(1, area={"code": 20}))
+        )
+        # 해시할 수 없는 값도 처리
+        self.assertIsInstance(seat_fingerprint(seat(1, status=[1, 2])), int)
+
+    def test_converted_seats(self):
+        """get_seats()의 딕셔너리, Seat, SeatView 목록도 같은 기준으로 비교하는지 테스트"""
+        before = [seat(1), seat(2), seat(3, userId="x")]
+        after = [seat(1, 30), seat(2), seat(3, userId="y")]
+
+        for convert in (_map_seat, Seat.from_json, SeatView):
+            with self.subTest(convert=convert):
+                store = SeatSnapshotStore()
+                store.update(19, [convert(s) for s in before])
+                self.assertEqual(store.get(19).available_codes(), [1, 2, 3])
+
+                diff = store.update(19, [convert(s) for s in after])
+                self.assertEqual(sorted(diff.changed), [1, 3])
+                self.assertEqual(store.get(19).available_codes(), [2, 3])
+                self.assertFalse(store.update(19, [convert(s) for s in after]))
+
+        # 형식이 달라도 값이 같으면 지문이 같음
+        fingerprints = {
+            seat_fingerprint(convert(seat(1, 30)))
+            for convert in (dict, _map_seat, Seat.from_json, SeatView)
+        }
+        self.assertEqual(len(fingerprints), 1)
+
+    def test_history_ring_buffer(self):
+        """기록은 history_size개까지 보관하고 재생 가능"""
+        store = SeatSnapshotStore(history_size=2)
+        store.update(19, [seat(1)], taken_at=1.0)
+        store.update(19, [seat(1, 30)], taken_at=2.0)
+        store.update(19, [seat(1, 30), seat(2)], taken_at=3.0)
+
+        history = store.history(19)
+        self.assertEqual([s.taken_at for s in history], [2.0, 3.0])
+
+        replay = list(store.replay(19))
+        self.assertEqual(sorted(replay[0][1].added), [1])
+        self.assertEqual(list(replay[1][1].added), [2])
+
+    def test_no_history_by_default(self):
+        """history_size=0이면 최신 스냅샷만 보관"""
+        store = SeatSnapshotStore()
+        store.update(19, [seat(1)])
+
+        self.assertEqual(store.history(19), [])
+        store.clear(19)
+        self.assertIsNone(store.get(19))
+
+
+if __name__ == "__main__":
+    unittest.main()
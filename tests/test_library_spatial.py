@@ -0,0 +1,196 @@
+"""
+좌석 공간 색인 및 가까운 좌석 예약 테스트 코드
+"""
+
+import math
+import random
+import unittest
+from unittest.mock import MagicMock
+
+from kgu_library.library.api import LibraryAPIWrapper
+from kgu_library.library.enums import BookingStatus
+from kgu_library.library.models import Seat, SeatView
+from kgu_library.library.spatial import SeatGridIndex
+
+
+def make_seat(code, x, y, seat_time=None):
+    """테스트용 좌석 응답 항목 생성"""
+    return {
+        "code": code,
+        "name": str(code),
+        "x": x,
+        "y": y,
+        "width": 20,
+        "height": 20,
+        "direction": 0,
+        "seatTime": seat_time,
+        "area": {"code": 19, "name": "열람실"},
+    }
+
+
+def make_row(count, y=0, used=()):
+    """가로 한 줄로 늘어선 좌석 목록 생성 (좌석 간격 30)"""
+    return [
+        make_seat(code, code * 30, y, "10:00" if code in used else None)
+        for code in range(count)
+    ]
+
+
+class TestSeatGridIndex(unittest.TestCase):
+    """SeatGridIndex 테스트 클래스"""
+
+    def setUp(self):
+        random.seed(7)
+        self.raw = [
+            make_seat(code, random.randint(0, 1000), random.randint(0, 600))
+            for code in range(200)
+        ]
+        self.index = SeatGridIndex([SeatView(seat) for seat in self.raw])
+
+    def brute_force(self, x, y):
+        def distance(seat):
+            return math.hypot(seat["x"] + 10 - x, seat["y"] + 10 - y)
+
+        return sorted(self.raw, key=lambda seat: (distance(seat), seat["code"]))
+
+    def test_nearest_matches_brute_force(self):
+        """가까운 좌석 순서가 전체 정렬 결과와 같은지 테스트"""
+        for x, y in [(0, 0), (500, 300), (1200, -50), (333, 777)]:
+            expected = [seat["code"] for seat in self.brute_force(x, y)[:10]]
+            result = [seat.id for seat in self.index.nearest(x, y, k=10)]
+            self.assertEqual(result, expected)
+
+    def test_iter_nearest_returns_all_in_order(self):
+        """모든 좌석이 거리 순서로 한 번씩 반환되는지 테스트"""
+        distances = [distance for distance, _ in self.index.iter_nearest(400, 200)]
+        self.assertEqual(len(distances), len(self.raw))
+        self.assertEqual(distances, sorted(distances))
+
+    def test_nearest_with_predicate(self):
+        """조건 함수로 좌석을 거르는지 테스트"""
+        result = self.index.nearest(0, 0, k=5, predicate=lambda s: s.id % 2 == 0)
+        self.assertEqual(len(result), 5)
+        self.assertTrue(all(seat.id % 2 == 0 for seat in result))
+
+    def test_nearest_to_seat_excludes_itself(self):
+        """기준 좌석은 결과에서 제외되는지 테스트"""
+        result = self.index.nearest_to_seat(5, k=3)
+        self.assertNotIn(5, [seat.id for seat in result])
+        x, y = self.index.center(5)
+        expected = [s["code"] for s in self.brute_force(x, y) if s["code"] != 5][:3]
+        self.assertEqual([seat.id for seat in result], expected)
+
+    def test_within(self):
+        """사각형 범위 검색 테스트"""
+        result = {seat.id for seat in self.index.within(600, 400, 100, 50)}
+        expected = {
+            seat["code"]
+            for seat in self.raw
+            if 100 <= seat["x"] + 10 <= 600 and 50 <= seat["y"] + 10 <= 400
+        }
+        self.assertEqual(result, expected)
+
+        # 색인보다 훨씬 크거나 무한한 범위도 색인 범위의 칸만 확인
+        everything = {seat["code"] for seat in self.raw}
+        huge = self.index.within(-1e12, -1e12, 1e12, 1e12)
+        self.assertEqual({seat.id for seat in huge}, everything)
+        unbounded = self.index.within(-math.inf, -math.inf, math.inf, math.inf)
+        self.assertEqual({seat.id for seat in unbounded}, everything)
+        self.assertEqual(self.index.within(1e12, 1e12, 2e12, 2e12), [])
+
+    def test_accepts_dicts_and_models(self):
+        """딕셔너리와 Seat 모델로도 색인을 만들 수 있는지 테스트"""
+        row = make_row(5)
+        by_model = SeatGridIndex([Seat.from_json(seat) for seat in row])
+        by_dict = SeatGridIndex([Seat.from_json(seat).to_dict() for seat in row])
+        self.assertEqual(by_model.nearest(95, 10)[0].id, 3)
+        self.assertEqual(by_dict.nearest(95, 10)[0]["id"], 3)
+
+    def test_skips_seats_without_position(self):
+        """위치 정보가 없는 좌석은 색인에서 제외되는지 테스트"""
+        row = make_row(3) + [make_seat(99, None, None)]
+        index = SeatGridIndex([SeatView(seat) for seat in row])
+        self.assertEqual(len(index), 3)
+        self.assertNotIn(99, index)
+
+    def test_empty_index(self):
+        """빈 색인 테스트"""
+        index = SeatGridIndex([])
+        self.assertEqual(index.nearest(0, 0), [])
+        self.assertEqual(index.within(0, 0, 10, 10), [])
+
+    def test_invalid_cell_size(self):
+        """잘못된 격자 크기 테스트"""
+        with self.assertRaises(ValueError):
+            SeatGridIndex([], cell_size=0)
+
+
+class TestBookNearestSeat(unittest.TestCase):
+    """LibraryAPIWrapper.book_nearest_seat 테스트 클래스"""
+
+    def setUp(self):
+        self.api = LibraryAPIWrapper()
+        self.api.client.get = MagicMock(
+            return_value={"success": True, "data": make_row(10, used={4, 5})}
+        )
+        self.api.book_seat = MagicMock()
+
+    def booked_ids(self):
+        return [call.args[0] for call in self.api.book_seat.call_args_list]
+
+    def test_books_nearest_free_seat(self):
+        """사용 중인 기준 좌석 옆의 빈 좌석을 예약하는지 테스트"""
+        self.api.book_seat.return_value = (BookingStatus.SUCCESS, "SUCCESS")
+
+        status, _, seat = self.api.book_nearest_seat(19, seat_id=5)
+
+        self.assertEqual(status, BookingStatus.SUCCESS)
+        self.assertEqual(seat.id, 6)
+        self.assertEqual(self.booked_ids(), [6])
+
+    def test_tries_next_seat_on_seat_failure(self):
+        """좌석 문제로 실패하면 다음으로 가까운 좌석을 시도하는지 테스트"""
+        self.api.book_seat.side_effect = [
+            (BookingStatus.SEAT_IN_USE, "SEAT_IN_USE"),
+            (BookingStatus.SUCCESS, "SUCCESS"),
+        ]
+
+        status, _, seat = self.api.book_nearest_seat(19, point=(135, 10))
+
+        self.assertEqual(status, BookingStatus.SUCCESS)
+        self.assertEqual(self.booked_ids(), [3, 6])
+        self.assertEqual(seat.id, 6)
+
+    def test_stops_on_account_failure(self):
+        """계정 문제로 실패하면 바로 중단하는지 테스트"""
+        self.api.book_seat.return_value = (
+            BookingStatus.USING_ANOTHER_SEAT,
+            "USING_ANOTHER_SEAT",
+        )
+
+        status, _, seat = self.api.book_nearest_seat(19, seat_id=5)
+
+        self.assertEqual(status, BookingStatus.USING_ANOTHER_SEAT)
+        self.assertIsNone(seat)
+        self.assertEqual(len(self.booked_ids()), 1)
+
+    def test_max_attempts(self):
+        """최대 시도 횟수 테스트"""
+        self.api.book_seat.return_value = (BookingStatus.SEAT_IN_USE, "SEAT_IN_USE")
+
+        status, _, seat = self.api.book_nearest_seat(19, seat_id=0, max_attempts=3)
+
+        self.assertEqual(status, BookingStatus.SEAT_IN_USE)
+        self.assertIsNone(seat)
+        self.assertEqual(self.booked_ids(), [0, 1, 2])
+
+    def test_requires_one_reference(self):
+        """seat_id와 point 중 하나만 지정해야 하는지 테스트"""
+        with self.assertRaises(ValueError):
+            self.api.book_nearest_seat(19)
+        with self.assertRaises(ValueError):
+            self.api.book_nearest_seat(19, seat_id=1, point=(0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
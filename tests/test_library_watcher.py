@@ -0,0 +1,158 @@
+"""
+SeatWatcher 테스트 코드
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from kgu_library.library import SeatChangeType, SeatView, SeatWatcher
+from kgu_library.library.exceptions import SeatError
+from kgu_library.library.snapshot import SeatSnapshotStore
+from kgu_library.library.watcher import seat_changes
+
+
+def seats(*seat_times):
+    """좌석 코드 1부터 차례로 seatTime을 가진 좌석 응답 목록 생성"""
+    return [
+        {"code": code, "name": str(code), "seatTime": seat_time}
+        for code, seat_time in enumerate(seat_times, start=1)
+    ]
+
+
+class TestSeatChanges(unittest.TestCase):
+    """seat_changes 테스트 클래스"""
+
+    def test_classify(self):
+        """빈 좌석/사용 시작/시간 변경 감지"""
+        store = SeatSnapshotStore()
+        store.update(19, seats(None, 30, 60, None))
+        changes = seat_changes(store.update(19, seats(30, None, 90, None)))
+
+        self.assertEqual(
+            [(change_type, seat["code"], old) for change_type, seat, old in changes],
+            [
+                (SeatChangeType.TAKEN, 1, None),
+                (SeatChangeType.FREED, 2, 30),
+                (SeatChangeType.TIME_CHANGED, 3, 60),
+            ],
+        )
+
+    def test_ignores_other_changes(self):
+        """새 좌석과 seatTime 외 필드 변경은 변화로 보지 않음"""
+        store = SeatSnapshotStore()
+        store.update(19, seats(None))
+        renamed = seats(None, 30)
+        renamed[0]["name"] = "A-1"
+
+        self.assertEqual(seat_changes(store.update(19, renamed)), [])
+
+
+class TestSeatWatcher(unittest.TestCase):
+    """SeatWatcher 테스트 클래스"""
+
+    def setUp(self):
+        """가짜 API와 감시기 설정"""
+        self.responses = []
+        self.api = MagicMock()
+        self.api.get_seats.side_effect = self.next_response
+        self.watcher = SeatWatcher(
+            self.api, area_ids=[19], min_interval=1.0, max_interval=9.0, smoothing=1.0
+        )
+
+    def next_response(self, area_id, lazy=False):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return [SeatView(seat) for seat in response]
+
+    def test_poll_emits_changes(self):
+        """기준 스냅샷 이후 변화만 구독자에게 전달"""
+        received = []
+        freed = []
+        self.watcher.subscribe(received.append)
+        self.watcher.subscribe(freed.append, change_types=[SeatChangeType.FREED])
+        self.responses = [seats(None, 30), seats(None, 30), seats(30, None)]
+
+        self.assertEqual(self.watcher.poll(19), [])  # 기준 스냅샷
+        self.assertEqual(self.watcher.poll(19), [])  # 변화 없음
+        changes = self.watcher.poll(19)
+
+        self.assertEqual(
+            [(c.type, c.seat_id) for c in received],
+            [(SeatChangeType.TAKEN, 1), (SeatChangeType.FREED, 2)],
+        )
+        self.assertEqual([c.seat_id for c in freed], [2])
+        self.assertEqual(changes, received)
+        self.api.get_seats.assert_called_with(19, lazy=True)
+
+    def test_unsubscribe_and_callback_errors(self):
+        """구독 취소 및 구독자 예외는 다른 구독자에 영향 없음"""
+        received = []
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        self.watcher.subscribe(failing)
+        unsubscribe = self.watcher.subscribe(received.append)
+        self.responses = [seats(None), seats(30), seats(None)]
+
+        self.watcher.poll(19)
+        with self.assertLogs("kgu_library.library.watcher", level="ERROR"):
+            self.watcher.poll(19)
+        unsubscribe()
+        with self.assertLogs("kgu_library.library.watcher", level="ERROR"):
+            self.watcher.poll(19)
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(failing.call_count, 2)
+
+    def test_adaptive_interval(self):
+        """변동성이 높으면 간격을 줄이고, 조용하면 늘림"""
+        self.responses = [seats(None), seats(None), seats(30), seats(None)]
+
+        self.watcher.poll(19)
+        self.watcher.poll(19)  # 변화 없음 -> 변동성 0
+        self.assertEqual(self.watcher.interval(19), 9.0)
+
+        self.watcher.poll(19)  # 변화 -> 변동성 1/2
+        self.assertEqual(self.watcher.volatility(19), 0.5)
+        self.assertEqual(self.watcher.interval(19), 5.0)
+
+        self.watcher.poll(19)  # 변화 -> 변동성 2/3
+        self.assertAlmostEqual(self.watcher.interval(19), 9.0 - 8.0 * 2 / 3)
+
+    def test_poll_error_keeps_snapshot(self):
+        """조회 실패 시 스냅샷을 유지하고 간격을 늘림"""
+        self.responses = [seats(None), SeatError("실패"), seats(30)]
+
+        self.watcher.poll(19)
+        with self.assertLogs("kgu_library.library.watcher", level="WARNING"):
+            self.assertEqual(self.watcher.poll(19), [])
+        self.assertEqual(self.watcher.interval(19), 2.0)
+
+        changes = self.watcher.poll(19)
+        self.assertEqual([c.type for c in changes], [SeatChangeType.TAKEN])
+
+    def test_start_stop(self):
+        """백그라운드 스레드에서 감시 후 stop()으로 종료"""
+        polled = threading.Event()
+
+        def respond(area_id, lazy=False):
+            polled.set()
+            return [SeatView(seat) for seat in seats(None)]
+
+        self.api.get_seats.side_effect = respond
+        self.watcher.start()
+        self.assertTrue(polled.wait(2))
+        self.watcher.stop(timeout=2)
+
+        self.assertIsNone(self.watcher._thread)
+
+    def test_invalid_intervals(self):
+        """간격 설정 검증"""
+        with self.assertRaises(ValueError):
+            SeatWatcher(self.api, [1], min_interval=5, max_interval=1)
+        with self.assertRaises(ValueError):
+            SeatWatcher(self.api, [1], smoothing=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+다중 계정 세션 풀 테스트 코드
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kgu_library.core.session import MemorySessionStore, SessionPool
+from kgu_library.library.api import LibraryAPIWrapper
+from kgu_library.library.exceptions import LoginError
+
+
+class FakeClient:
+    """로그인 횟수를 기록하는 클라이언트"""
+
+    def __init__(self, account):
+        self.account = account
+        self.logins = 0
+        self.closed = False
+
+
+class TestSessionPool(unittest.TestCase):
+    """SessionPool 테스트 클래스"""
+
+    def make_pool(self, **kwargs):
+        def login(client, account, credentials):
+            if credentials == "bad":
+                raise LoginError("로그인 실패")
+            client.logins += 1
+
+        def close(client):
+            client.closed = True
+
+        pool = SessionPool(FakeClient, login, close=close, **kwargs)
+        for account in ("a", "b", "c"):
+            pool.register(account, "pw")
+        return pool
+
+    def test_lazy_login_and_reuse(self):
+        """처음 빌릴 때만 로그인하고 같은 클라이언트를 재사용하는지 테스트"""
+        pool = self.make_pool()
+        self.assertEqual(len(pool), 0)
+
+        with pool.session("a") as client:
+            self.assertEqual(client.logins, 1)
+        with pool.session("a") as again:
+            self.assertIs(again, client)
+        self.assertEqual(client.logins, 1)
+        self.assertEqual(pool.logins, 1)
+
+        pool.invalidate("a")
+        with pool.session("a"):
+            pass
+        self.assertEqual(client.logins, 2)
+
+        with self.assertRaises(KeyError):
+            pool.checkout("unknown")
+
+    def test_lru_eviction(self):
+        """가장 오래 사용하지 않은 클라이언트부터 내보내는지 테스트"""
+        pool = self.make_pool(max_size=2)
+        clients = {}
+        for account in ("a", "b", "a", "c"):
+            with pool.session(account) as client:
+                clients[account] = client
+
+        self.assertNotIn("b", pool)
+        self.assertIn("a", pool)
+        self.assertIn("c", pool)
+        self.assertTrue(clients["b"].closed)
+        self.assertEqual(pool.evictions, 1)
+
+        # 사용 중인 클라이언트는 내보내지 않고, 돌려받은 뒤 정리
+        client_a = pool.checkout("a")
+        client_c = pool.checkout("c")
+        with pool.session("b"):
+            self.assertEqual(len(pool), 3)
+        self.assertEqual(len(pool), 2)
+        self.assertNotIn("b", pool)
+        pool.checkin("a")
+        pool.checkin("c")
+        self.assertFalse(client_a.closed or client_c.closed)
+
+        pool.unregister("a")
+        self.assertNotIn("a", pool)
+        self.assertNotIn("a", pool.accounts)
+
+    def test_exclusive_checkout(self):
+        """한 클라이언트를 한 스레드만 빌리는지 테스트"""
+        pool = self.make_pool()
+        pool.checkout("a")
+
+        with self.assertRaises(TimeoutError):
+            pool.checkout("a", timeout=0.01)
+
+        acquired = threading.Event()
+
+        def borrow():
+            with pool.session("a"):
+                acquired.set()
+
+        thread = threading.Thread(target=borrow)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        pool.checkin("a")
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+
+    def test_login_failure_releases(self):
+        """로그인 실패 시 예외를 전달하고 클라이언트를 돌려놓는지 테스트"""
+        pool = self.make_pool()
+        pool.register("x", "bad")
+        with self.assertRaises(LoginError):
+            pool.checkout("x")
+
+        pool.register("x", "pw")
+        with pool.session("x", timeout=0.01) as client:
+            self.assertEqual(client.logins, 1)
+
+    def test_refresh_due(self):
+        """유효 시간이 끝나가는 유휴 클라이언트만 다시 로그인하는지 테스트"""
+        pool = self.make_pool(session_ttl=0.2, refresh_margin=0.15)
+        with pool.session("a") as client_a:
+            pass
+        client_b = pool.checkout("b")
+
+        self.assertEqual(pool.refresh_due(), 0)
+        time.sleep(0.06)
+        self.assertEqual(pool.refresh_due(), 1)  # b는 사용 중이라 건너뜀
+        self.assertEqual(client_a.logins, 2)
+        self.assertEqual(client_b.logins, 1)
+        pool.checkin("b")
+
+        pool.start(interval=0.01)
+        try:
+            deadline = time.monotonic() + 1
+            while client_b.logins < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            pool.stop(timeout=1)
+        self.assertGreaterEqual(client_b.logins, 2)
+
+        with self.assertRaises(ValueError):
+            SessionPool(FakeClient, None, session_ttl=10, refresh_margin=10)
+
+
+class TestLibraryPool(unittest.TestCase):
+    """LibraryAPIWrapper.create_pool 테스트 클래스"""
+
+    def test_shared_transport_and_restore(self):
+        """래퍼들이 연결 풀을 공유하고, 내보낸 계정은 저장된 세션을 쓰는지 테스트"""
+        store = MemorySessionStore()
+        pool = LibraryAPIWrapper.create_pool(session_store=store, max_size=1)
+        pool.register("1", "일")
+        pool.register("2", "이")
+
+        login_response = MagicMock(status_code=200)
+        login_response.json.return_value = {"success": True}
+        with patch("requests.Session.post", return_value=login_response) as post:
+            with pool.session("1") as api_1:
+                pass
+            with pool.session("2") as api_2:
+                self.assertIs(api_2.client.transport, api_1.client.transport)
+            self.assertEqual(post.call_count, 2)
+        self.assertNotIn("1", pool)
+
+        # 내보낸 계정: 저장된 세션을 확인만 하고 로그인하지 않음
+        with patch.object(
+            LibraryAPIWrapper, "validate_session", return_value=True
+        ), patch.object(LibraryAPIWrapper, "login") as mock_login:
+            with pool.session("1") as api:
+                self.assertEqual(api.user_id, "1")
+        mock_login.assert_not_called()
+
+        with patch.object(LibraryAPIWrapper, "login", return_value=False):
+            pool.invalidate("1")
+            with patch.object(
+                LibraryAPIWrapper, "validate_session", return_value=False
+            ):
+                with self.assertRaises(LoginError):
+                    pool.checkout("1")
+
+
+if __name__ == "__main__":
+    unittest.main()
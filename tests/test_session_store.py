@@ -0,0 +1,191 @@
+"""
+로그인 세션 저장소 테스트 코드
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from requests.cookies import RequestsCookieJar
+
+from kgu_library.attendance.api import AttendanceAPI
+from kgu_library.core.session import (
+    FileSessionStore,
+    MemorySessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+    dump_cookies,
+    load_cookies,
+)
+from kgu_library.library.api import LibraryAPIWrapper
+
+
+class TestSessionStores(unittest.TestCase):
+    """세션 저장소 테스트 클래스"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def make_stores(self):
+        sqlite_store = SQLiteSessionStore(os.path.join(self.tempdir.name, "s.db"))
+        self.addCleanup(sqlite_store.close)
+        return [
+            MemorySessionStore(),
+            FileSessionStore(os.path.join(self.tempdir.name, "sessions")),
+            sqlite_store,
+        ]
+
+    def test_round_trip(self):
+        """저장, 불러오기, 삭제 테스트"""
+        for store in self.make_stores():
+            with self.subTest(store=type(store).__name__):
+                self.assertIsNone(store.load("library:1"))
+
+                store.save("library:1", {"user_id": "1", "cookies": []})
+                state = store.load("library:1")
+                self.assertEqual(state["user_id"], "1")
+                self.assertIn("saved_at", state)
+
+                store.save("library:1", {"user_id": "1", "cookies": [{"a": 1}]})
+                self.assertEqual(store.load("library:1")["cookies"], [{"a": 1}])
+
+                store.delete("library:1")
+                store.delete("library:1")
+                self.assertIsNone(store.load("library:1"))
+
+    def test_max_age(self):
+        """오래된 세션을 무시하는지 테스트"""
+        for store in self.make_stores():
+            with self.subTest(store=type(store).__name__):
+                store.save("key", {"saved_at": time.time() - 100})
+                self.assertIsNone(store.load("key", max_age=10))
+                self.assertIsNotNone(store.load("key", max_age=1000))
+
+    def test_corrupt_file_ignored(self):
+        """읽을 수 없는 세션 파일은 없는 것으로 보는지 테스트"""
+        store = FileSessionStore(self.tempdir.name)
+        store.save("attendance:2024/../x", {"user_id": "x"})
+        self.assertEqual(
+            os.listdir(self.tempdir.name), ["attendance%3A2024%2F..%2Fx.json"]
+        )
+        with open(os.path.join(self.tempdir.name, "broken.json"), "w") as f:
+            f.write("{")
+        self.assertIsNone(store.load("broken"))
+
+    def test_file_names_distinct(self):
+        """특수 문자만 다른 키가 서로 다른 파일에 저장되는지 테스트"""
+        store = FileSessionStore(self.tempdir.name)
+        keys = ["a:b", "a_b", "a/b", "a%3Ab"]
+        for key in keys:
+            store.save(key, {"key": key})
+        for key in keys:
+            self.assertEqual(store.load(key)["key"], key)
+        self.assertEqual(len(os.listdir(self.tempdir.name)), len(keys))
+
+    def test_abstract_interface(self):
+        """일부 메서드만 구현한 저장소는 만들 수 없는지 테스트"""
+
+        class PartialStore(SessionStore):
+            def load_raw(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            PartialStore()
+
+    def test_cookies(self):
+        """쿠키 직렬화 테스트 (만료된 쿠키 제외)"""
+        jar = RequestsCookieJar()
+        jar.set("CLI_ID", "abc", domain="libgate.kyonggi.ac.kr", path="/")
+        jar.set("old", "x", domain="libgate.kyonggi.ac.kr", expires=1)
+        jar.set(
+            "PHPSESSID", "s", domain="example.com", secure=True, rest={"HttpOnly": None}
+        )
+
+        restored = RequestsCookieJar()
+        self.assertEqual(load_cookies(restored, dump_cookies(jar)), 2)
+        self.assertEqual(restored.get("CLI_ID"), "abc")
+        self.assertIsNone(restored.get("old"))
+        cookie = next(c for c in restored if c.name == "PHPSESSID")
+        self.assertTrue(cookie.secure)
+        self.assertTrue(cookie.has_nonstandard_attr("HttpOnly"))
+
+
+class TestEnsureLogin(unittest.TestCase):
+    """저장된 세션을 사용하는 로그인 테스트 클래스"""
+
+    def test_library_restores_session(self):
+        """도서관: 저장된 세션이 유효하면 로그인하지 않는지 테스트"""
+        store = MemorySessionStore()
+        api = LibraryAPIWrapper(session_store=store)
+        login_response = MagicMock(status_code=200)
+        login_response.json.return_value = {"success": True}
+
+        def fake_login(*args, **kwargs):
+            api.client.session.cookies.set("CLI_ID", "cookie", domain="libgate")
+            return login_response
+
+        with patch.object(api.client.session, "post", side_effect=fake_login):
+            self.assertTrue(api.ensure_login("202400000", "테스트"))
+        self.assertEqual(store.load("library:202400000")["user_id"], "202400000")
+
+        # 새 프로세스: 생성할 때 세션을 불러오고, 확인 요청만 보냄
+        restored = LibraryAPIWrapper(session_store=store, user_id="202400000")
+        self.assertEqual(restored.client.session.cookies.get("CLI_ID"), "cookie")
+        with patch.object(
+            restored.client, "_get", return_value={"success": True}
+        ) as mock_get, patch.object(restored, "login") as mock_login:
+            self.assertTrue(restored.ensure_login("202400000", "테스트"))
+        mock_get.assert_called_once_with("user/my-status")
+        mock_login.assert_not_called()
+
+        # 세션이 만료되었으면 다시 로그인
+        with patch.object(
+            restored.client, "_get", return_value={"success": False}
+        ), patch.object(restored, "login", return_value=True) as mock_login:
+            self.assertTrue(restored.ensure_login("202400000", "테스트"))
+        mock_login.assert_called_once_with("202400000", "테스트")
+
+    def test_attendance_restores_session(self):
+        """전자출결: 저장된 세션과 사용자 정보를 불러오는지 테스트"""
+        store = MemorySessionStore()
+        api = AttendanceAPI(session_store=store)
+        api.client.session.cookies.set("PHPSESSID", "sess", domain="example.com")
+
+        def fake_client_login(user_id, password):
+            api.client.user_id = user_id
+            api.client.user_name = "홍길동"
+            api.client._token = user_id
+            api.client._is_logged_in = True
+            return {"success": True, "user_id": user_id, "user_name": "홍길동"}
+
+        with patch.object(api.client, "login", side_effect=fake_client_login):
+            api.login("202400000", "pw")
+
+        restored = AttendanceAPI(session_store=store, user_id="202400000")
+        self.assertTrue(restored.is_logged_in)
+        self.assertEqual(restored.user_info["user_name"], "홍길동")
+        self.assertEqual(restored.client.session.cookies.get("PHPSESSID"), "sess")
+
+        with patch.object(restored, "login") as mock_login:
+            with patch.object(restored, "validate_session", return_value=True):
+                self.assertEqual(
+                    restored.ensure_login("202400000", "pw"), restored.user_info
+                )
+            # 확인 요청 없이 사용
+            with patch.object(restored, "validate_session") as mock_validate:
+                restored.ensure_login("202400000", "pw", validate=False)
+            mock_validate.assert_not_called()
+        mock_login.assert_not_called()
+
+        # 오래된 세션은 다시 로그인
+        fresh = AttendanceAPI(session_store=store)
+        with patch.object(fresh, "login", return_value={}) as mock_login:
+            fresh.ensure_login("202400000", "pw", max_age=-1)
+        mock_login.assert_called_once_with("202400000", "pw")
+
+
+if __name__ == "__main__":
+    unittest.main()